@@ -0,0 +1,154 @@
+"""
+Region-based access policies of users
+A UserProfile's comma-separated assignments are compiled into an immutable AccessPolicy that is kept in
+Django's cache per user and dropped when the profile is saved or deleted, so access checks neither query
+the profile nor re-parse it. What a customer name contains (operator, region, technology, location) is
+memoized per name, which keeps filter_accessible() cheap over hundreds of networks.
+"""
+
+import hashlib
+from collections import namedtuple
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+
+ACCESS_POLICY_KEY_PREFIX = 'healthcheck:access_policy'
+# Profiles are invalidated on save; the timeout only bounds changes made with queryset.update()
+ACCESS_POLICY_TIMEOUT = 3600
+
+OPERATOR_TERMS = frozenset({'BSNL', 'AIRTEL', 'JIO', 'VI', 'VODAFONE', 'IDEA', 'RELIANCE', 'TATA', 'BHARTI'})
+REGION_TERMS = frozenset({'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL', 'NORTHEAST'})
+TECHNOLOGY_TERMS = frozenset({'DWDM', 'SDH', 'MPLS', 'OTN', 'SONET', 'IP', 'ETHERNET', 'FIBER', 'OPTICAL'})
+LOCATION_TERMS = frozenset({
+    'MUMBAI', 'DELHI', 'KOLKATA', 'CHENNAI', 'BANGALORE', 'HYDERABAD', 'PUNE', 'AHMEDABAD',
+    'JAIPUR', 'LUCKNOW', 'KANPUR', 'NAGPUR', 'INDORE', 'THANE', 'BHOPAL', 'VISAKHAPATNAM',
+    'PATNA', 'VADODARA', 'GHAZIABAD', 'LUDHIANA', 'RAJKOT', 'KOCHI', 'AURANGABAD', 'COIMBATORE',
+    'MAHARASHTRA', 'GUJARAT', 'KARNATAKA', 'TAMILNADU', 'TELANGANA', 'RAJASTHAN', 'PUNJAB',
+    'HARYANA', 'UP', 'UTTARPRADESH', 'MP', 'MADHYAPRADESH', 'WB', 'WESTBENGAL'
+})
+
+# Why a policy grants access to everything, and the reason given for it
+EXEMPT_REASONS = {
+    'staff': 'Staff or superuser',
+    'no_profile': 'No region profile',
+    'super_user': 'Super user or strict validation disabled',
+    'not_strict': 'Super user or strict validation disabled',
+}
+
+
+def parse_assignments(value):
+    """Upper-cased entries of a comma-separated assignment field"""
+    return frozenset(entry.strip().upper() for entry in (value or '').split(',') if entry.strip())
+
+
+@lru_cache(maxsize=4096)
+def customer_terms(customer_name):
+    """(operators, regions, technologies, locations) named in a customer name, as whole words"""
+    words = frozenset(customer_name.upper().replace('_', ' ').replace('-', ' ').split())
+    return (
+        words & OPERATOR_TERMS,
+        words & REGION_TERMS,
+        words & TECHNOLOGY_TERMS,
+        words & LOCATION_TERMS,
+    )
+
+
+class AccessPolicy(namedtuple('AccessPolicy', 'exempt operators regions technologies locations')):
+    """
+    Compiled access of one user. exempt is a key of EXEMPT_REASONS for users who may access
+    every customer, otherwise None; the assignment sets are empty when not restricted.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def unrestricted(cls, exempt):
+        return cls(exempt, frozenset(), frozenset(), frozenset(), frozenset())
+
+    @classmethod
+    def from_profile(cls, profile):
+        if profile.is_super_user:
+            return cls.unrestricted('super_user')
+        if not profile.enforce_strict_validation:
+            return cls.unrestricted('not_strict')
+        return cls(
+            None,
+            parse_assignments(profile.assigned_operators),
+            parse_assignments(profile.assigned_regions),
+            parse_assignments(profile.assigned_technologies),
+            parse_assignments(profile.assigned_locations),
+        )
+
+    @property
+    def scope(self):
+        """Cache scope: users with equal policies share cached responses, unrestricted users share 'all'"""
+        if self.exempt:
+            return 'all'
+        assignments = '|'.join(
+            ','.join(sorted(assigned))
+            for assigned in (self.operators, self.regions, self.technologies, self.locations)
+        )
+        return 'profile:' + hashlib.sha1(assignments.encode('utf-8')).hexdigest()[:16]
+
+    def check(self, customer_name):
+        """(can access, reason) for a customer name"""
+        if self.exempt:
+            return True, EXEMPT_REASONS[self.exempt]
+
+        customer_operators, customer_regions, customer_technologies, customer_locations = customer_terms(customer_name)
+        if self.operators and customer_operators and not customer_operators & self.operators:
+            return False, f"User assigned to {'/'.join(self.operators)} but customer is {'/'.join(customer_operators)}"
+        if self.regions and customer_regions and not customer_regions & self.regions:
+            return False, f"User assigned to {'/'.join(self.regions)} but customer is {'/'.join(customer_regions)}"
+        if self.technologies and customer_technologies and not customer_technologies & self.technologies:
+            return False, f"User assigned to {'/'.join(self.technologies)} but customer uses {'/'.join(customer_technologies)}"
+        if self.locations and customer_locations and not customer_locations & self.locations:
+            return False, f"User assigned to {'/'.join(self.locations)} but customer is in {'/'.join(customer_locations)}"
+        return True, "Access granted"
+
+    def filter_accessible(self, customers):
+        """
+        The customers (Customer objects or names) this policy can access, in their original order.
+        Each distinct name is checked once.
+        """
+        customers = list(customers)
+        if self.exempt:
+            return customers
+        verdicts = {}
+        accessible = []
+        for customer in customers:
+            name = getattr(customer, 'name', customer)
+            if name not in verdicts:
+                verdicts[name] = self.check(name)[0]
+            if verdicts[name]:
+                accessible.append(customer)
+        return accessible
+
+
+def access_policy_key(user_id):
+    return f'{ACCESS_POLICY_KEY_PREFIX}:{user_id}'
+
+
+def get_access_policy(user):
+    """Policy of an authenticated user; the profile is only read when no compiled policy is cached"""
+    if user.is_staff or user.is_superuser:
+        return AccessPolicy.unrestricted('staff')
+    key = access_policy_key(user.pk)
+    policy = cache.get(key)
+    if policy is None:
+        try:
+            policy = AccessPolicy.from_profile(user.health_check_profile)
+        except ObjectDoesNotExist:
+            policy = AccessPolicy.unrestricted('no_profile')
+        cache.set(key, policy, ACCESS_POLICY_TIMEOUT)
+    return policy
+
+
+def invalidate_access_policy(user_id):
+    cache.delete(access_policy_key(user_id))
+
+
+def filter_accessible(user, customers):
+    """The customers (Customer objects or names) a user may access"""
+    return get_access_policy(user).filter_accessible(customers)
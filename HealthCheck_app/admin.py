@@ -6,7 +6,9 @@ from .models import (
     HealthCheckSession, 
     HealthCheckFile, 
     NodeCoverage, 
-    ServiceCheck
+    ServiceCheck,
+    ChunkedUpload,
+    NetworkMonthlyRuns
 )
 
 
@@ -50,3 +52,19 @@ class ServiceCheckAdmin(ImportExportModelAdmin):
     readonly_fields = ['checked_at']
 
 
+
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    list_display = ['filename', 'customer', 'upload_type', 'status', 'offset', 'total_size', 'updated_at']
+    list_filter = ['upload_type', 'status', 'created_at']
+    search_fields = ['upload_id', 'filename', 'customer__name']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(NetworkMonthlyRuns)
+class NetworkMonthlyRunsAdmin(admin.ModelAdmin):
+    list_display = ['customer', 'month', 'session_count', 'completed_count', 'last_session_at', 'node_count', 'recorded_run']
+    list_filter = ['month']
+    search_fields = ['customer__name', 'customer__network_name']
+    readonly_fields = ['updated_at']
@@ -0,0 +1,72 @@
+"""
+Country detection for customer networks
+Pure rules over uploaded report filenames, NodeCoverage locations and customer/network names.
+Customer.reconcile_countries() applies them when reports are uploaded, networks are created and
+sessions complete, storing the result on Customer.country so requests never scan report folders.
+"""
+
+from collections import Counter
+
+# Filename fragments of uploaded TEC reports that point to a country
+COUNTRY_FILENAME_INDICATORS = {
+    'Malaysia': ['malaysia', 'maxis', 'telekom', 'timedotcom', 'time.com', 'kuala', 'lumpur', 'kl'],
+    'Indonesia': ['indonesia', 'moratelindo', 'pss24', 'pss', 'jakarta', 'indo'],
+    'New Caledonia': ['caledonia', 'nouvelle', 'opt_nc', 'opt', 'noumea'],
+    'Singapore': ['singapore', 'singtel', 'starhub', 'sg'],
+    'India': ['india', 'bsnl', 'airtel', 'reliance', 'tata', 'delhi', 'mumbai', 'bangalore'],
+}
+
+DEFAULT_COUNTRY = 'India'
+
+
+def detect_country_from_filenames(filenames):
+    """Country with the most indicator matches in the report filenames, or None"""
+    country_scores = Counter()
+    for filename in filenames:
+        filename = filename.lower()
+        for country, indicators in COUNTRY_FILENAME_INDICATORS.items():
+            country_scores[country] += sum(1 for indicator in indicators if indicator in filename)
+
+    if not any(country_scores.values()):
+        return None
+    # Ties go to the first country listed, as in the original folder scan
+    best_score = max(country_scores.values())
+    return next(country for country in COUNTRY_FILENAME_INDICATORS if country_scores[country] == best_score)
+
+
+def detect_country_from_name(customer_name, network_names=()):
+    """Country from customer and network name patterns; never unknown"""
+    name = customer_name.upper().strip()
+    network_text = ' '.join(network_name.upper() for network_name in network_names if network_name)
+
+    if any(pattern in name for pattern in ['MORATELINDO', 'PSS24', 'PSS', 'INDONESIA', 'JAKARTA']):
+        return 'Indonesia'
+    if any(pattern in name for pattern in ['OPT_NC', 'OPT', 'CALEDONIA', 'NOUVELLE']):
+        return 'New Caledonia'
+    if any(pattern in name for pattern in ['MALAYSIA', 'MAXIS', 'TELEKOM', 'TIMEDOTCOM', 'TIME', 'DOTCOM', 'KUALA', 'LUMPUR']):
+        return 'Malaysia'
+    if any(pattern in network_text for pattern in ['MALAYSIA', 'DEFAULT']):
+        return 'Malaysia'
+    if any(pattern in name for pattern in ['INDIA', 'BSNL', 'AIRTEL', 'RELIANCE', 'TATA', 'DELHI', 'MUMBAI', 'BANGALORE']):
+        return 'India'
+    if any(pattern in name for pattern in ['SINGAPORE', 'SINGTEL', 'STARHUB']):
+        return 'Singapore'
+    if any(word in name for word in ['TELECOM', 'TELEKOM', 'NETWORK']):
+        return 'Malaysia'  # Many Asian telecoms are Malaysian in this data
+    return DEFAULT_COUNTRY
+
+
+def detect_customer_country(customer_name, network_names=(), report_filenames=(), locations=None):
+    """
+    Country of a customer: uploaded report filenames first, then the most common NodeCoverage
+    location (a Counter of location -> rows), then name patterns.
+    """
+    country = detect_country_from_filenames(report_filenames)
+    # Filenames only win when they point away from the default; 'India' matches many generic names
+    if country and country != DEFAULT_COUNTRY:
+        return country
+
+    if locations:
+        return locations.most_common(1)[0][0]
+
+    return detect_country_from_name(customer_name, network_names)
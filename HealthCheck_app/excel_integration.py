@@ -1,12 +1,53 @@
 """
 Excel Data Integration Utility
 Integrates Excel tracker files with the customer/network management system
+Tracker discovery and the customers read from Health_Check_Tracker_1.xlsx are indexed by modification
+time, in-process and in Django's cache (file-based, so on disk, in production). A directory is only
+rescanned after files were added, removed or renamed in it and the workbook is only read again after it
+changed, so rendering forms and selection pages costs a few stat() calls.
 """
 import os
 import re
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from django.conf import settings
+from django.core.cache import cache
+
+EXCEL_INDEX_KEY_PREFIX = 'healthcheck:excel_index'
+# Entries are checked against mtimes on every read; the timeout only evicts unused ones
+EXCEL_INDEX_TIMEOUT = 7 * 24 * 3600
+
+TRACKER_PATTERNS = [
+    "*HC_Issues_Tracker*.xlsx",
+    "*Issues_Tracker*.xlsx",
+    "*HC_Tracker*.xlsx",
+    "*health*check*.xlsx",
+]
+
+# key -> (signature, value), shared by all readers of the process
+_excel_index = {}
+
+
+def indexed(kind: str, path: Path, signature, build):
+    """
+    Value of build() for path as long as its signature (e.g. mtime) is unchanged.
+    Looked up in the process first, then in Django's cache; built and stored in both otherwise.
+    """
+    key = f"{EXCEL_INDEX_KEY_PREFIX}:{kind}:{hashlib.sha1(str(path).encode('utf-8')).hexdigest()}"
+    entry = _excel_index.get(key)
+    if entry is None or entry[0] != signature:
+        entry = cache.get(key)
+        if entry is None or entry[0] != signature:
+            entry = (signature, build())
+            cache.set(key, entry, EXCEL_INDEX_TIMEOUT)
+        _excel_index[key] = entry
+    return entry[1]
+
+
+def clear_excel_index():
+    _excel_index.clear()
+
 
 class ExcelDataReader:
     """Utility class to read customer and network data from Excel files"""
@@ -22,22 +63,32 @@ class ExcelDataReader:
         
     def get_excel_files(self) -> List[Path]:
         """Get all Excel tracker files from project directories"""
-        excel_files = []
-        
+        return [directory / entry['filename'] for directory, entry in self._indexed_tracker_files()]
+    
+    def get_tracker_files_metadata(self) -> List[Dict]:
+        """Parsed customer/network metadata of every tracker file, with its path"""
+        return [
+            dict(entry, file_path=str(directory / entry['filename']))
+            for directory, entry in self._indexed_tracker_files()
+        ]
+    
+    def _indexed_tracker_files(self):
+        """(directory, parsed filename) of the tracker files; directories are rescanned when their mtime changes"""
         for directory in self.excel_directories:
-            if directory.exists():
-                # Look for Excel files with health check patterns
-                patterns = [
-                    "*HC_Issues_Tracker*.xlsx",
-                    "*Issues_Tracker*.xlsx", 
-                    "*HC_Tracker*.xlsx",
-                    "*health*check*.xlsx",
-                ]
-                
-                for pattern in patterns:
-                    excel_files.extend(directory.glob(pattern))
-        
-        return list(set(excel_files))  # Remove duplicates
+            try:
+                directory_mtime = directory.stat().st_mtime_ns
+            except OSError:
+                continue
+            entries = indexed('trackers', directory, directory_mtime, lambda: self._scan_tracker_directory(directory))
+            for entry in entries:
+                yield directory, entry
+    
+    def _scan_tracker_directory(self, directory: Path) -> List[Dict]:
+        # Look for Excel files with health check patterns
+        filenames = set()
+        for pattern in TRACKER_PATTERNS:
+            filenames.update(path.name for path in directory.glob(pattern))
+        return [self.parse_customer_network_from_filename(filename) for filename in sorted(filenames)]
     
     def parse_customer_network_from_filename(self, filename: str) -> Dict[str, str]:
         """Parse customer name and network type from Excel filename"""
@@ -110,18 +161,28 @@ class ExcelDataReader:
     
     def get_excel_customers_networks(self) -> Dict[str, List[Dict]]:
         """Get all customer-network combinations from Health_Check_Tracker_1.xlsx"""
+        excel_path = self.base_dir / "Script" / "Health_Check_Tracker_1.xlsx"
+        try:
+            stat = excel_path.stat()
+        except OSError:
+            print(f"Warning: Excel file not found at {excel_path}")
+            return {}
+        
+        # The workbook is only read again after it changed
+        customers_networks = indexed(
+            'customers', excel_path, (stat.st_mtime_ns, stat.st_size),
+            lambda: self._read_customers_networks(excel_path),
+        )
+        return {
+            customer_name: [dict(network) for network in networks]
+            for customer_name, networks in customers_networks.items()
+        }
+    
+    def _read_customers_networks(self, excel_path: Path) -> Dict[str, List[Dict]]:
         customers_networks = {}
         
         try:
             import pandas as pd
-            from pathlib import Path
-            
-            # Read the main Excel tracker file
-            excel_path = self.base_dir / "Script" / "Health_Check_Tracker_1.xlsx"
-            
-            if not excel_path.exists():
-                print(f"Warning: Excel file not found at {excel_path}")
-                return customers_networks
             
             # Read from Summary sheet
             df = pd.read_excel(excel_path, sheet_name='Summary')
@@ -0,0 +1,111 @@
+"""
+Background jobs for the customer dashboard export
+Each export is written once per (format, date range, data version) to HEALTHCHECK_EXPORT_DIR and
+served from disk afterwards. Session and customer changes bump the data version, so an artefact is
+never served after its data changed; artefacts of older versions are deleted as new ones are written.
+"""
+
+import os
+import re
+import hashlib
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from .response_cache import get_data_version
+
+EXPORT_FORMATS = ('xlsx', 'csv')
+EXPORT_JOB_KEY_PREFIX = 'healthcheck:export_job'
+# A job that has not finished by then is considered dead and may be started again
+EXPORT_JOB_TIMEOUT = 1800
+
+EXPORT_JOB_ID = re.compile(r'^(xlsx|csv)-(\d+)-([0-9a-f]{16})$')
+
+
+def export_artefact_dir():
+    return Path(getattr(settings, 'HEALTHCHECK_EXPORT_DIR', Path(settings.BASE_DIR) / 'exports'))
+
+
+def export_job_id(export_format, range_start=None, range_end=None):
+    """Job/artefact id of an export: format, current data version and a hash of the date range"""
+    date_range = hashlib.sha1(f'{range_start}|{range_end}'.encode('utf-8')).hexdigest()[:16]
+    return f'{export_format}-{get_data_version()}-{date_range}'
+
+
+def export_artefact_path(job_id):
+    """Path of a job's artefact, or None for ids that are not well-formed"""
+    match = EXPORT_JOB_ID.match(job_id)
+    if not match:
+        return None
+    return export_artefact_dir() / f'customer_dashboard_{job_id}.{match.group(1)}'
+
+
+def find_export_artefact(job_id):
+    path = export_artefact_path(job_id)
+    return path if path is not None and path.exists() else None
+
+
+def export_job_status(job_id):
+    """'ready', 'running', 'failed' (with 'error') or 'missing'"""
+    if find_export_artefact(job_id):
+        return {'status': 'ready'}
+    return cache.get(f'{EXPORT_JOB_KEY_PREFIX}:{job_id}') or {'status': 'missing'}
+
+
+def start_export_job(job_id, write_chunks):
+    """
+    Generate an artefact unless it exists or is already being generated.
+    write_chunks() returns an iterable of the export's bytes. Runs in a background thread
+    unless HEALTHCHECK_EXPORT_JOBS_IN_BACKGROUND is False.
+    """
+    if find_export_artefact(job_id):
+        return export_job_status(job_id)
+    if not cache.add(f'{EXPORT_JOB_KEY_PREFIX}:{job_id}', {'status': 'running'}, EXPORT_JOB_TIMEOUT):
+        return export_job_status(job_id)
+
+    if getattr(settings, 'HEALTHCHECK_EXPORT_JOBS_IN_BACKGROUND', True):
+        threading.Thread(target=_run_export_job, args=(job_id, write_chunks, True), daemon=True).start()
+    else:
+        _run_export_job(job_id, write_chunks)
+    return export_job_status(job_id)
+
+
+def _run_export_job(job_id, write_chunks, in_thread=False):
+    path = export_artefact_path(job_id)
+    partial = path.with_name(path.name + '.part')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(partial, 'wb') as artefact:
+            for chunk in write_chunks():
+                artefact.write(chunk)
+        os.replace(partial, path)
+        cache.delete(f'{EXPORT_JOB_KEY_PREFIX}:{job_id}')
+        prune_export_artefacts(keep_version=EXPORT_JOB_ID.match(job_id).group(2))
+    except Exception as e:
+        print(f"❌ Export job {job_id} failed: {e}")
+        cache.set(f'{EXPORT_JOB_KEY_PREFIX}:{job_id}', {'status': 'failed', 'error': str(e)}, EXPORT_JOB_TIMEOUT)
+        if partial.exists():
+            partial.unlink()
+    finally:
+        if in_thread:
+            # The worker thread opened its own database connection
+            connection.close()
+
+
+def prune_export_artefacts(keep_version=None):
+    """Delete artefacts of data versions other than keep_version (all of them when None)"""
+    directory = export_artefact_dir()
+    if not directory.exists():
+        return 0
+    removed = 0
+    for path in directory.glob('customer_dashboard_*'):
+        if path.name.endswith('.part'):
+            continue
+        match = EXPORT_JOB_ID.match(path.stem.replace('customer_dashboard_', '', 1))
+        if match and match.group(2) != str(keep_version):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
@@ -0,0 +1,202 @@
+"""
+File downloads for trackers, reports, inventory and host files
+Resolved paths are cached per request parameters and data version, so repeated downloads skip the
+database lookups and directory probing. The transfer is handed to the front-end server with
+X-Accel-Redirect (nginx) or X-Sendfile (Apache/lighttpd) when HEALTHCHECK_DOWNLOAD_BACKEND says so;
+otherwise Django returns the open file to the WSGI server's file wrapper, which servers such as
+gunicorn send with os.sendfile. Range and conditional (ETag / Last-Modified) requests work either way.
+Several files can also be sent as one ZIP that is built while it streams.
+"""
+
+import re
+import zipfile
+import hashlib
+import mimetypes
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from .response_cache import get_data_version
+from .xlsx_stream import ZipStreamBuffer
+
+DOWNLOAD_PATH_KEY_PREFIX = 'healthcheck:download_path'
+DOWNLOAD_PATH_TIMEOUT = 3600
+
+# Already-compressed formats are stored as they are; deflating them again costs CPU for nothing
+STORED_SUFFIXES = {'.xlsx', '.xlsm', '.docx', '.zip', '.gz', '.png', '.jpg'}
+ZIP_READ_SIZE = 1024 * 1024
+
+BYTE_RANGE = re.compile(r'^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$', re.IGNORECASE)
+
+
+def cached_download_path(key_parts, resolve):
+    """
+    (path, download filename) for a download, or None when resolve() finds nothing.
+    resolve() only runs when no cached path exists or the cached file has gone.
+    """
+    key_hash = hashlib.sha1('|'.join(str(part) for part in key_parts).encode('utf-8')).hexdigest()
+    key = f'{DOWNLOAD_PATH_KEY_PREFIX}:{key_hash}:{get_data_version()}'
+    cached = cache.get(key)
+    if cached is not None and Path(cached[0]).is_file():
+        return Path(cached[0]), cached[1]
+
+    resolved = resolve()
+    if resolved is None:
+        return None
+    path, filename = resolved
+    cache.set(key, (str(path), filename), DOWNLOAD_PATH_TIMEOUT)
+    return Path(path), filename
+
+
+def parse_byte_range(header, size):
+    """
+    Inclusive (start, end) of a single-range Range header, or None to send the whole file
+    (no header, other units or several ranges). Raises ValueError when the range cannot be satisfied.
+    """
+    match = BYTE_RANGE.match(header or '')
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None  # Invalid ranges are ignored, not refused
+        if start >= size:
+            raise ValueError(f'Range starts after the end of the file ({size} bytes)')
+        return start, end
+    suffix = int(last)
+    if suffix == 0 or size == 0:
+        raise ValueError('Empty suffix range')
+    return max(size - suffix, 0), size - 1
+
+
+def _range_applies(request, etag, last_modified):
+    """Range is honoured for GET requests unless an If-Range validator no longer matches"""
+    if request.method != 'GET' or 'HTTP_RANGE' not in request.META:
+        return False
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.strip().startswith(('"', 'W/')):
+        return if_range.strip() == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def _accel_redirect_url(path):
+    """Internal nginx location of a path from HEALTHCHECK_DOWNLOAD_ACCEL_LOCATIONS, or None"""
+    path = Path(path).resolve()
+    for root, location in getattr(settings, 'HEALTHCHECK_DOWNLOAD_ACCEL_LOCATIONS', {}).items():
+        try:
+            relative = path.relative_to(Path(root).resolve())
+        except ValueError:
+            continue
+        return location.rstrip('/') + '/' + relative.as_posix()
+    return None
+
+
+class _FileRange:
+    """Reads at most length bytes from the file's current position; fileno() is kept for sendfile"""
+
+    def __init__(self, file, length):
+        self.file = file
+        self.name = file.name
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b''
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def _set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def serve_file(request, path, filename=None, content_type=None, as_attachment=True):
+    """Download response for a file on disk, answering conditional and Range requests"""
+    path = Path(path)
+    stat = path.stat()
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    last_modified = int(stat.st_mtime)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return _set_validators(not_modified, etag, last_modified)
+
+    filename = filename or path.name
+    content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    backend = getattr(settings, 'HEALTHCHECK_DOWNLOAD_BACKEND', 'django')
+    accel_url = _accel_redirect_url(path) if backend == 'nginx' else None
+    if accel_url or backend == 'xsendfile':
+        # The front-end server sends the body and handles Range itself
+        response = HttpResponse(content_type=content_type)
+        if accel_url:
+            response['X-Accel-Redirect'] = accel_url
+        else:
+            response['X-Sendfile'] = str(path.resolve())
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+        return _set_validators(response, etag, last_modified)
+
+    byte_range = None
+    if _range_applies(request, etag, last_modified):
+        try:
+            byte_range = parse_byte_range(request.META['HTTP_RANGE'], stat.st_size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+            return _set_validators(response, etag, last_modified)
+
+    start, end = byte_range or (0, stat.st_size - 1)
+    file = open(path, 'rb')
+    file.seek(start)
+    response = FileResponse(
+        _FileRange(file, end - start + 1),
+        as_attachment=as_attachment,
+        filename=filename,
+        content_type=content_type,
+        status=206 if byte_range else 200,
+    )
+    response['Content-Length'] = end - start + 1
+    if byte_range:
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+    return _set_validators(response, etag, last_modified)
+
+
+def iter_zip(files):
+    """
+    Yield the bytes of a ZIP of (path, name in archive) pairs, built while it is sent.
+    Nothing is written to disk and at most one read block is held in memory.
+    """
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for path, arcname in files:
+            path = Path(path)
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            if path.suffix.lower() in STORED_SUFFIXES:
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, 'rb') as source, \
+                    archive.open(info, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as entry:
+                yield buffer.drain()
+                for block in iter(lambda: source.read(ZIP_READ_SIZE), b''):
+                    entry.write(block)
+                    yield buffer.drain()
+    yield buffer.drain()
@@ -6,6 +6,7 @@ Enhanced file management functions for Health Check application
 import os
 import hashlib
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
 from django.conf import settings
@@ -13,12 +14,12 @@ from django.utils import timezone
 from .models import Customer, HealthCheckFile
 
 
-def calculate_file_hash(file_path):
+def calculate_file_hash(file_path, chunk_size=4096):
     """Calculate SHA256 hash of a file for duplicate detection"""
     hash_sha256 = hashlib.sha256()
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(chunk_size), b""):
                 hash_sha256.update(chunk)
         return hash_sha256.hexdigest()
     except Exception as e:
@@ -26,33 +27,216 @@ def calculate_file_hash(file_path):
         return None
 
 
+# Partial files in the store's tmp directory belong to uploads still being written; only files older
+# than this are leftovers of crashed requests
+CONTENT_STORE_TMP_MAX_AGE = timedelta(days=1)
+
+
+def get_content_store_dir():
+    """Root of the content-addressed file store (one blob per unique SHA-256)"""
+    return Path(settings.BASE_DIR) / "Script" / "customer_files" / "_content_store"
+
+
+def get_chunked_upload_dir():
+    """Staging directory for resumable chunked uploads (same filesystem as the store)"""
+    return get_content_store_dir() / "incoming"
+
+
+def content_store_path(file_hash):
+    """Path of the blob holding content with the given SHA-256"""
+    return get_content_store_dir() / file_hash[:2] / file_hash
+
+
+def store_uploaded_file(uploaded_file, dest_path, allow_hardlink=True):
+    """
+    Stream an upload into the content store in a single pass, hashing it on the way,
+    and expose it at dest_path. Identical content uploaded again reuses the existing blob.
+    """
+    store_dir = get_content_store_dir()
+    tmp_dir = store_dir / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    
+    hash_sha256 = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix='.part')
+    try:
+        uploaded_file.seek(0)
+        with os.fdopen(fd, 'wb') as destination:
+            for chunk in uploaded_file.chunks():
+                hash_sha256.update(chunk)
+                destination.write(chunk)
+        
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    
+    return store_local_file(tmp_path, dest_path, hash_sha256.hexdigest(), allow_hardlink=allow_hardlink)
+
+
+def store_local_file(source_path, dest_path, file_hash, allow_hardlink=True):
+    """
+    Move a fully written file (already hashed) into the content store and expose it at dest_path.
+    source_path must be on the same filesystem as the store; it is consumed.
+    """
+    written = os.path.getsize(source_path)
+    blob_path = content_store_path(file_hash)
+    deduplicated = blob_path.exists()
+    try:
+        if deduplicated:
+            os.unlink(source_path)
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source_path, blob_path)
+    except Exception:
+        if os.path.exists(source_path):
+            os.unlink(source_path)
+        raise
+    
+    link_or_copy_file(blob_path, dest_path, allow_hardlink=allow_hardlink)
+    return {
+        'sha256': file_hash,
+        'size': written,
+        'path': Path(dest_path),
+        'deduplicated': deduplicated
+    }
+
+
+def _reflink_file(source_path, dest_path):
+    """Clone source into dest with a copy-on-write reflink (Linux FICLONE), if supported"""
+    import fcntl
+    FICLONE = 0x40049409
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def link_or_copy_file(source_path, dest_path, allow_hardlink=True):
+    """
+    Place source_path at dest_path without rewriting its bytes when possible.
+    Tries a hardlink first, then a reflink, and falls back to a plain copy.
+    Pass allow_hardlink=False when dest_path will be modified in place, since a
+    hardlink shares the inode (a reflink is copy-on-write and stays independent).
+    Returns the method used ('hardlink', 'reflink' or 'copy').
+    """
+    source_path = Path(source_path)
+    dest_path = Path(dest_path)
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if dest_path.exists() or dest_path.is_symlink():
+        if allow_hardlink and dest_path.exists() and os.path.samefile(source_path, dest_path):
+            return 'hardlink'
+        dest_path.unlink()
+    
+    if allow_hardlink:
+        try:
+            os.link(source_path, dest_path)
+            return 'hardlink'
+        except (OSError, NotImplementedError, AttributeError):
+            pass
+    
+    try:
+        _reflink_file(source_path, dest_path)
+        return 'reflink'
+    except (OSError, ImportError):
+        if dest_path.exists():
+            dest_path.unlink()
+    
+    shutil.copyfile(source_path, dest_path)
+    return 'copy'
+
+
+def clear_directory_files(directory_path):
+    """Remove every regular file directly inside directory_path in one scandir pass"""
+    removed = 0
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                    os.unlink(entry.path)
+                    removed += 1
+    except FileNotFoundError:
+        os.makedirs(directory_path, exist_ok=True)
+    return removed
+
+
+def prune_content_store():
+    """Delete store blobs no longer linked from any customer folder, plus stale partial uploads"""
+    store_dir = get_content_store_dir()
+    removed = []
+    if not store_dir.exists():
+        return removed
+    
+    for blob_path in store_dir.glob("*/*"):
+        try:
+            if blob_path.parent.name == "tmp":
+                if blob_path.stat().st_mtime < (timezone.now() - CONTENT_STORE_TMP_MAX_AGE).timestamp():
+                    blob_path.unlink()
+                    removed.append(str(blob_path))
+            elif len(blob_path.parent.name) == 2 and blob_path.is_file() and blob_path.stat().st_nlink <= 1 and \
+                    not HealthCheckFile.objects.filter(sha256=blob_path.name).exists():
+                blob_path.unlink()
+                removed.append(str(blob_path))
+        except Exception as e:
+            print(f"Error pruning {blob_path}: {e}")
+    
+    removed.extend(expire_stale_chunked_uploads())
+    return removed
+
+
+def expire_stale_chunked_uploads(max_age_hours=48):
+    """Fail chunked uploads that stopped receiving chunks and delete their partial files"""
+    from .models import ChunkedUpload
+    
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    removed = []
+    for upload in ChunkedUpload.objects.filter(status='UPLOADING', updated_at__lt=cutoff):
+        part_path = upload.get_part_path()
+        if part_path.exists():
+            part_path.unlink()
+            removed.append(str(part_path))
+        upload.status = 'EXPIRED'
+        upload.save(update_fields=['status', 'updated_at'])
+    return removed
+
+
+def backfill_file_hashes(files_query):
+    """Hash files recorded before hashes were stored; each file is read once, ever"""
+    updated = 0
+    for file_obj in files_query.filter(sha256=''):
+        if file_obj.file_path and Path(file_obj.file_path).exists():
+            file_hash = calculate_file_hash(file_obj.file_path)
+            if file_hash:
+                HealthCheckFile.objects.filter(id=file_obj.id).update(sha256=file_hash)
+                updated += 1
+    return updated
+
+
 def find_duplicate_files(customer, file_type=None):
-    """Find duplicate files for a customer based on file hash"""
+    """Find duplicate files for a customer based on the stored file hash"""
     from collections import defaultdict
+    from django.db.models import Count
     
     # Get all files for customer
     files_query = HealthCheckFile.objects.filter(customer=customer)
     if file_type:
         files_query = files_query.filter(file_type=file_type)
     
-    files = files_query.order_by('uploaded_at')
-    
-    # Group files by their hash
-    hash_groups = defaultdict(list)
+    # Legacy rows without a stored hash are hashed once and persisted
+    backfill_file_hashes(files_query)
     
-    for file_obj in files:
-        if file_obj.file_path and Path(file_obj.file_path).exists():
-            file_hash = calculate_file_hash(file_obj.file_path)
-            if file_hash:
-                hash_groups[file_hash].append(file_obj)
+    # Group by hash in the database (uses the customer/sha256 index)
+    duplicate_hashes = list(
+        files_query.exclude(sha256='')
+        .values('sha256')
+        .annotate(copies=Count('id'))
+        .filter(copies__gt=1)
+        .values_list('sha256', flat=True)
+    )
     
-    # Return groups that have duplicates
-    duplicates = {}
-    for file_hash, file_list in hash_groups.items():
-        if len(file_list) > 1:
-            duplicates[file_hash] = file_list
+    duplicates = defaultdict(list)
+    for file_obj in files_query.filter(sha256__in=duplicate_hashes).order_by('uploaded_at'):
+        duplicates[file_obj.sha256].append(file_obj)
     
-    return duplicates
+    return dict(duplicates)
 
 
 def cleanup_old_files(customer, file_type=None, days_old=30):
@@ -88,26 +272,61 @@ def cleanup_old_files(customer, file_type=None, days_old=30):
     return cleaned_up
 
 
-def verify_file_integrity(customer):
-    """Verify that all database file records have corresponding physical files"""
-    files = HealthCheckFile.objects.filter(customer=customer)
+def verify_file_integrity(customer, deep=False):
+    """
+    Verify that all database file records have corresponding physical files of the recorded size.
+    With deep=True, files of the right size are also rehashed against the sha256 recorded at upload.
+    """
+    files = HealthCheckFile.objects.filter(customer=customer).exclude(file_path='').only(
+        'id', 'stored_filename', 'file_path', 'file_type', 'file_size', 'sha256'
+    )
     
     missing_files = []
-    orphaned_files = []
+    corrupted_files = []
     
     for file_obj in files:
-        if file_obj.file_path:
-            if not Path(file_obj.file_path).exists():
-                missing_files.append({
+        try:
+            size_on_disk = os.stat(file_obj.file_path).st_size
+        except OSError:
+            missing_files.append({
+                'id': file_obj.id,
+                'filename': file_obj.stored_filename,
+                'path': file_obj.file_path,
+                'type': file_obj.file_type
+            })
+            continue
+        
+        if not file_obj.sha256:
+            continue
+        
+        # A size mismatch means the content no longer matches the hash recorded at upload
+        if file_obj.file_size and size_on_disk != file_obj.file_size:
+            corrupted_files.append({
+                'id': file_obj.id,
+                'filename': file_obj.stored_filename,
+                'path': file_obj.file_path,
+                'type': file_obj.file_type,
+                'expected_size': file_obj.file_size,
+                'actual_size': size_on_disk
+            })
+        elif deep:
+            actual_sha256 = calculate_file_hash(file_obj.file_path, chunk_size=1024 * 1024)
+            if actual_sha256 != file_obj.sha256:
+                corrupted_files.append({
                     'id': file_obj.id,
                     'filename': file_obj.stored_filename,
                     'path': file_obj.file_path,
-                    'type': file_obj.file_type
+                    'type': file_obj.file_type,
+                    'expected_sha256': file_obj.sha256,
+                    'actual_sha256': actual_sha256
                 })
     
     return {
         'missing_files': missing_files,
-        'missing_count': len(missing_files)
+        'missing_count': len(missing_files),
+        'corrupted_files': corrupted_files,
+        'corrupted_count': len(corrupted_files),
+        'unhashed_count': HealthCheckFile.objects.filter(customer=customer, sha256='').count()
     }
 
 
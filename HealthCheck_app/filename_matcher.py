@@ -0,0 +1,170 @@
+"""
+Customer / filename matching for upload validation
+A file belongs to a customer when it names the customer's region and technology and shares at least one
+word with the customer name. The operator, region and technology terms are fixed tables; what a customer
+name contains is worked out once per name and kept in memory, so a renamed or new customer simply gets a
+new entry. Verdicts are pure functions of (customer name, filename) and are memoized as well, which makes
+the validate-then-upload round trip of the upload pages pay for the matching only once.
+"""
+
+import re
+from functools import lru_cache
+
+# Telecom operators
+OPERATORS = (
+    'BSNL', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'RELIANCE',
+    'BHARTI', 'TATA', 'TTML', 'TTSL', 'RAILTEL', 'POWERGRID',
+)
+
+REGIONS = (
+    'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
+    'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
+    'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
+    'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD',
+)
+
+TECHNOLOGIES = (
+    'OTN', 'DWDM', 'SDH', 'SONET', 'PDH', 'MPLS', 'IP', 'ETHERNET',
+    'OPTICAL', 'FIBER', 'TRANSPORT', 'BACKBONE', 'METRO', 'ACCESS',
+    '1830PSS', 'CIENA', 'NOKIA', 'HUAWEI', 'ZTE', 'ERICSSON',
+)
+
+# Common words that say nothing about which customer a file belongs to
+EXCLUDED_WORDS = frozenset({
+    'NETWORK', 'NETWORKS', 'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA',
+    'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEC', 'CSV', 'XLSX',
+    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
+    'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
+    'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC',
+})
+
+WORD = re.compile(r'\b\w{3,}\b')
+
+# Words cannot contain it, so a word occurs inside one of the joined words iff it occurs in the join
+WORD_SEPARATOR = '\n'
+
+MATCH_CACHE_SIZE = 4096
+
+
+def terms_in(text, terms):
+    """Terms (in table order) that occur anywhere in text"""
+    return tuple(term for term in terms if term in text)
+
+
+def significant_words(text):
+    return tuple(word for word in WORD.findall(text) if word not in EXCLUDED_WORDS)
+
+
+@lru_cache(maxsize=1024)
+def customer_profile(customer_name):
+    """Operators, regions, technologies and significant words of a customer name"""
+    customer_upper = customer_name.upper().strip()
+    return {
+        'operators': terms_in(customer_upper, OPERATORS),
+        'regions': terms_in(customer_upper, REGIONS),
+        'technologies': terms_in(customer_upper, TECHNOLOGIES),
+        'words': significant_words(customer_upper),
+    }
+
+
+def _mismatch_error(customer_name, filename, profile, validation_errors):
+    error_message = f"?? **CUSTOMER-FILE MISMATCH**\n\n"
+    error_message += f"File '{filename}' does not belong to customer '{customer_name}'.\n\n"
+    error_message += f"**? Validation Errors:**\n"
+    for i, error in enumerate(validation_errors, 1):
+        error_message += f"{i}. {error}\n"
+    error_message += f"\n**?? SOLUTION:**\n"
+    error_message += f" Upload files specifically for '{customer_name}'\n"
+    error_message += f" Ensure filename contains all customer-specific identifiers\n"
+    error_message += f" Double-check you selected the correct customer\n"
+
+    # Expected filename format
+    expected_parts = [
+        components[0]
+        for components in (profile['operators'], profile['regions'], profile['technologies'])
+        if components
+    ]
+    if expected_parts:
+        error_message += f"\n**?? Expected filename format:** {'_'.join(expected_parts)}_filename.ext"
+    return error_message
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match(customer_name, filename):
+    profile = customer_profile(customer_name)
+    filename_upper = filename.upper().strip()
+    validation_errors = []
+
+    # Operators are not looked up in the filename: an operator customer accepts any operator's file.
+    # The operator still goes into the expected filename format below.
+
+    # Region - strict if the customer has one; a generic customer accepts region-specific files
+    customer_regions = profile['regions']
+    if customer_regions:
+        file_regions = terms_in(filename_upper, REGIONS)
+        if not file_regions:
+            validation_errors.append(f"MISSING REGION: Customer '{customer_name}' is '{'/'.join(customer_regions)}' region but file doesn't specify any region")
+        elif not set(customer_regions) & set(file_regions):
+            validation_errors.append(f"WRONG REGION: Customer is '{'/'.join(customer_regions)}' region but file is for '{'/'.join(file_regions)}' region")
+
+    # Technology - must match if the customer has one
+    customer_technologies = profile['technologies']
+    if customer_technologies:
+        file_technologies = terms_in(filename_upper, TECHNOLOGIES)
+        if not file_technologies:
+            validation_errors.append(f"MISSING TECHNOLOGY: Customer '{customer_name}' uses '{'/'.join(customer_technologies)}' but file doesn't specify any technology")
+        elif not set(customer_technologies) & set(file_technologies):
+            validation_errors.append(f"WRONG TECHNOLOGY: Customer uses '{'/'.join(customer_technologies)}' but file is for '{'/'.join(file_technologies)}'")
+
+    if validation_errors:
+        return False, _mismatch_error(customer_name, filename, profile, validation_errors), None
+
+    # Customer name - at least one significant customer word inside a filename word
+    customer_words = profile['words']
+    if not customer_words:
+        return True, None, 'Generic customer with valid components'
+    filename_words = WORD_SEPARATOR.join(significant_words(filename_upper))
+    if any(word in filename_words for word in customer_words):
+        return True, None, 'Customer match with valid components'
+
+    return False, (
+        f"?? **CUSTOMER NAME MISMATCH**\n\n"
+        f"Customer '{customer_name}' contains: **{', '.join(customer_words)}**\n"
+        f"But file '{filename}' doesn't contain any of these identifiers.\n\n"
+        f"**?? SOLUTION:**\n"
+        f" Ensure filename contains customer name or identifiers\n"
+        f" Double-check you selected the correct customer\n\n"
+        f"**?? Expected patterns:** {', '.join([f'*{word.lower()}*' for word in customer_words[:3]])}"
+    ), None
+
+
+def match_customer_filename(customer_name, filename):
+    """{'valid', 'error'} (plus 'match_info' when valid) for a file uploaded for a customer"""
+    valid, error, match_info = _match(customer_name, filename)
+    if not valid:
+        return {'valid': False, 'error': error}
+    return {'valid': True, 'error': None, 'match_info': match_info}
+
+
+def edit_distance(s1, s2, limit=None):
+    """
+    Levenshtein distance between two strings. With a limit, rows stop being computed as soon as the
+    distance is known to exceed it and limit + 1 is returned instead.
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    if limit is not None and len(s2) - len(s1) > limit:
+        return limit + 1
+
+    distances = list(range(len(s1) + 1))
+    for i2, c2 in enumerate(s2):
+        row = [i2 + 1]
+        for i1, c1 in enumerate(s1):
+            if c1 == c2:
+                row.append(distances[i1])
+            else:
+                row.append(1 + min(distances[i1], distances[i1 + 1], row[-1]))
+        if limit is not None and min(row) > limit:
+            return limit + 1
+        distances = row
+    return distances[-1]
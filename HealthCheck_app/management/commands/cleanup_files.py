@@ -11,6 +11,7 @@ from HealthCheck_app.file_utils import (
     find_duplicate_files,
     verify_file_integrity,
     cleanup_empty_directories,
+    prune_content_store,
     generate_file_management_report
 )
 from HealthCheck_app.views import SCRIPT_DIR
@@ -58,12 +59,24 @@ class Command(BaseCommand):
             help='Verify file integrity (check if database records match physical files)'
         )
         
+        parser.add_argument(
+            '--deep',
+            action='store_true',
+            help='With --verify-integrity, rehash files against the checksum recorded at upload'
+        )
+        
         parser.add_argument(
             '--cleanup-empty-dirs',
             action='store_true',
             help='Remove empty directories'
         )
         
+        parser.add_argument(
+            '--prune-store',
+            action='store_true',
+            help='Remove content store blobs no longer referenced by any customer file'
+        )
+        
         parser.add_argument(
             '--generate-report',
             action='store_true',
@@ -146,7 +159,7 @@ class Command(BaseCommand):
             # Verify integrity if requested
             if options['verify_integrity']:
                 self.stdout.write('🔧 Verifying file integrity...')
-                integrity = verify_file_integrity(customer)
+                integrity = verify_file_integrity(customer, deep=options['deep'])
                 
                 if integrity['missing_count'] > 0:
                     self.stdout.write(
@@ -156,9 +169,23 @@ class Command(BaseCommand):
                         self.stdout.write(f'  - {missing["filename"]} (Type: {missing["type"]})')
                 else:
                     self.stdout.write('✅ All files are present and accounted for')
+                
+                if integrity['corrupted_count'] > 0:
+                    self.stdout.write(
+                        self.style.WARNING(f'⚠️  Found {integrity["corrupted_count"]} files that changed since upload:')
+                    )
+                    for corrupted in integrity['corrupted_files']:
+                        if 'expected_size' in corrupted:
+                            self.stdout.write(
+                                f'  - {corrupted["filename"]} (expected {corrupted["expected_size"]} bytes, '
+                                f'found {corrupted["actual_size"]})'
+                            )
+                        else:
+                            self.stdout.write(f'  - {corrupted["filename"]} (content differs from the upload checksum)')
 
             # Clean up old files if not just finding duplicates or verifying
-            if not (options['find_duplicates'] or options['verify_integrity'] or options['generate_report']):
+            if not (options['find_duplicates'] or options['verify_integrity'] or options['generate_report']
+                    or options['prune_store']):
                 if options['dry_run']:
                     self.stdout.write('🧪 DRY RUN - Would clean up old files...')
                 else:
@@ -193,6 +220,20 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write('✅ No empty directories found')
 
+        # Prune unreferenced content store blobs if requested
+        if options['prune_store']:
+            self.stdout.write('\n📦 Pruning unreferenced content store blobs...')
+            
+            if options['dry_run']:
+                self.stdout.write('🧪 DRY RUN - Would prune the content store...')
+            else:
+                removed_blobs = prune_content_store()
+                
+                if removed_blobs:
+                    self.stdout.write(f'🗑️  Removed {len(removed_blobs)} unreferenced blobs')
+                else:
+                    self.stdout.write('✅ No unreferenced blobs found')
+
         self.stdout.write(
             self.style.SUCCESS('\n🎉 File cleanup operations completed!')
         )
@@ -0,0 +1,169 @@
+import os
+import sys
+import time
+import subprocess
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from HealthCheck_app import filename_matcher
+from HealthCheck_app.models import Customer, HealthCheckFile
+
+# Libraries that should only be imported by the code paths that use them, never at start-up
+HEAVY_MODULES = ('pandas', 'openpyxl', 'numpy')
+
+COLD_START_CODE = (
+    'import importlib, django; django.setup(); '
+    'from django.conf import settings; importlib.import_module(settings.ROOT_URLCONF)'
+)
+
+
+def parse_importtime(output):
+    """
+    (module, cumulative microseconds, top-level import it was loaded by) for every line of
+    `python -X importtime` output. Nested imports are listed before the import that caused them.
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append([name.strip(), int(cumulative), depth, None])
+    top_level = None
+    for entry in reversed(entries):
+        if entry[2] == 0:
+            top_level = entry[0]
+        entry[3] = top_level
+    return [(name, cumulative, depth, parent) for name, cumulative, depth, parent in entries]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark hot code paths of the 1830PSS Health Check app against the stored data'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            type=str,
+            choices=['matcher', 'imports'],
+            default='matcher',
+            help='What to benchmark: matcher (customer/filename upload validation over all historical filenames) '
+                 'or imports (cold start of the project, measured with python -X importtime)'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=200000,
+            help='Maximum number of customer/filename pairs (default: 200000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Timed passes over the pairs, or cold starts (default: 3)'
+        )
+        parser.add_argument(
+            '--budget-ms',
+            type=int,
+            default=getattr(settings, 'HEALTHCHECK_COLD_START_BUDGET_MS', 800),
+            help='imports: fail when the fastest cold start imports for longer (default: 800)'
+        )
+
+    def handle(self, *args, **options):
+        target = options['target']
+        try:
+            if target == 'matcher':
+                self.benchmark_matcher(options['limit'], max(options['repeat'], 1))
+            elif target == 'imports':
+                self.benchmark_imports(options['budget_ms'], max(options['repeat'], 1))
+        except CommandError:
+            raise
+        except Exception as e:
+            raise CommandError(f'Error benchmarking {target}: {str(e)}')
+
+    def matcher_pairs(self, limit):
+        """Every stored filename checked against its own customer, then against every other customer"""
+        owned = list(
+            HealthCheckFile.objects.values_list('customer__name', 'original_filename').distinct()
+        )
+        filenames = sorted({filename for _, filename in owned})
+        customers = list(Customer.objects.filter(is_deleted=False).values_list('name', flat=True).distinct())
+
+        pairs = owned[:limit]
+        seen = set(pairs)
+        for filename in filenames:
+            for customer_name in customers:
+                if len(pairs) >= limit:
+                    return pairs
+                if (customer_name, filename) not in seen:
+                    pairs.append((customer_name, filename))
+        return pairs
+
+    def benchmark_matcher(self, limit, repeat):
+        pairs = self.matcher_pairs(limit)
+        if not pairs:
+            self.stdout.write(self.style.WARNING('No stored files to benchmark against'))
+            return
+
+        self.stdout.write(f'Customer/filename matcher: {len(pairs)} pairs')
+
+        filename_matcher.customer_profile.cache_clear()
+        filename_matcher._match.cache_clear()
+        start = time.perf_counter()
+        verdicts = Counter(
+            filename_matcher.match_customer_filename(customer_name, filename)['valid']
+            for customer_name, filename in pairs
+        )
+        cold = time.perf_counter() - start
+
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for customer_name, filename in pairs:
+                filename_matcher.match_customer_filename(customer_name, filename)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        self.stdout.write(f'  Accepted: {verdicts[True]}  Rejected: {verdicts[False]}')
+        self.stdout.write(f'  First pass:  {cold:.3f}s ({cold / len(pairs) * 1e6:.1f} us per pair)')
+        self.stdout.write(f'  Memoized:    {best:.3f}s ({best / len(pairs) * 1e6:.1f} us per pair)')
+        cache_info = filename_matcher._match.cache_info()
+        if cache_info.currsize >= cache_info.maxsize:
+            self.stdout.write(
+                f'  Note: {len(pairs)} pairs exceed the verdict cache ({cache_info.maxsize}); '
+                'memoized timings include recomputation'
+            )
+
+    def benchmark_imports(self, budget_ms, repeat):
+        """Import the URLconf (and with it every view) in fresh interpreters; the fastest run counts"""
+        best = None
+        for _ in range(repeat):
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', COLD_START_CODE],
+                capture_output=True, text=True, env=os.environ.copy(), cwd=settings.BASE_DIR,
+            )
+            if result.returncode != 0:
+                raise CommandError(f'Cold start failed:\n{result.stderr[-2000:]}')
+            entries = parse_importtime(result.stderr)
+            total = sum(cumulative for _, cumulative, depth, _ in entries if depth == 0)
+            if best is None or total < best[0]:
+                best = (total, entries)
+
+        total, entries = best
+        self.stdout.write(f'Cold start imports: {total / 1000:.0f} ms (target {budget_ms} ms, best of {repeat})')
+        self.stdout.write('  Slowest top-level imports:')
+        top_level = sorted((e for e in entries if e[2] == 0), key=lambda e: e[1], reverse=True)
+        for name, cumulative, _, _ in top_level[:10]:
+            self.stdout.write(f'    {cumulative / 1000:8.1f} ms  {name}')
+
+        heavy = [(name, parent) for name, _, _, parent in entries if name in HEAVY_MODULES]
+        if heavy:
+            self.stdout.write('  Heavy libraries loaded at start-up: ' + ', '.join(
+                f'{name} (via {parent})' for name, parent in heavy
+            ))
+        else:
+            self.stdout.write('  Heavy libraries loaded at start-up: none')
+
+        if total / 1000 > budget_ms:
+            raise CommandError(f'Cold start imports took {total / 1000:.0f} ms, over the {budget_ms} ms target')
@@ -5,7 +5,7 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 from django.utils import timezone
-from HealthCheck_app.models import Customer, HealthCheckSession
+from HealthCheck_app.models import Customer, HealthCheckSession, NetworkMonthlyRuns
 
 class Command(BaseCommand):
     help = 'Monitor and maintain 1830PSS Health Check operations'
@@ -14,9 +14,9 @@ class Command(BaseCommand):
         parser.add_argument(
             '--action',
             type=str,
-            choices=['status', 'cleanup', 'stats', 'failed'],
+            choices=['status', 'cleanup', 'stats', 'failed', 'aggregates', 'countries'],
             default='status',
-            help='Action: status, cleanup old files, stats, or show failed sessions'
+            help='Action: status, cleanup old files, stats, show failed sessions, rebuild monthly aggregates or reconcile countries'
         )
         parser.add_argument(
             '--days',
@@ -50,6 +50,10 @@ class Command(BaseCommand):
                 self.show_statistics(days, network)
             elif action == 'failed':
                 self.show_failed_sessions(network)
+            elif action == 'aggregates':
+                self.rebuild_monthly_aggregates(network)
+            elif action == 'countries':
+                self.reconcile_countries(network)
         except Exception as e:
             raise CommandError(f'Error executing {action}: {str(e)}')
 
@@ -108,6 +112,26 @@ class Command(BaseCommand):
             output_size = sum(f.stat().st_size for f in output_dir.rglob('*') if f.is_file())
             self.stdout.write(f"Output directory size: {output_size / (1024*1024):.1f} MB")
 
+    def rebuild_monthly_aggregates(self, network_filter=None):
+        """Rebuild the per-network monthly run aggregates used by the dashboard"""
+        customers = None
+        if network_filter:
+            customers = list(Customer.objects.filter(name=network_filter, is_deleted=False))
+            if not customers:
+                self.stdout.write(f"Network '{network_filter}' not found")
+                return
+
+        rows = NetworkMonthlyRuns.rebuild(customers)
+        scope = f"network '{network_filter}'" if network_filter else "all networks"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} monthly aggregate rows for {scope}"))
+
+    def reconcile_countries(self, network_filter=None):
+        """Re-detect automatically detected network countries from reports, locations and names"""
+        customer_names = [network_filter] if network_filter else None
+        updated = Customer.reconcile_countries(customer_names)
+        scope = f"network '{network_filter}'" if network_filter else "all networks"
+        self.stdout.write(self.style.SUCCESS(f"Updated the country of {updated} networks for {scope}"))
+
     def cleanup_old_files(self, days, dry_run=False):
         """Clean up old session files"""
         cutoff_date = timezone.now() - timedelta(days=days)
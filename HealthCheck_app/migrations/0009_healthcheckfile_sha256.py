@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0008_customer_country_customer_gtac_customer_monthly_runs_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='sha256',
+            field=models.CharField(blank=True, default='', help_text='SHA-256 of the file content, computed during upload', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='healthcheckfile',
+            index=models.Index(fields=['customer', 'sha256'], name='hc_file_customer_sha256_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='healthcheckfile',
+            index=models.Index(fields=['sha256'], name='hc_file_sha256_idx'),
+        ),
+    ]
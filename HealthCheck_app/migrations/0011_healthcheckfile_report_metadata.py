@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0010_chunkedupload'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='report_network_name',
+            field=models.CharField(blank=True, default='', help_text='Network name parsed from the report', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='report_date',
+            field=models.DateField(blank=True, help_text='Report date parsed from the report filename', null=True),
+        ),
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='report_node_count',
+            field=models.IntegerField(blank=True, help_text='Nodes listed in the Network Report Summary sheet', null=True),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.5 on 2026-10-19 14:20
+
+from datetime import date, datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def month_of(value):
+    """First day of the (local) month of a date or datetime"""
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return date(value.year, value.month, 1)
+
+
+def parse_month_key(month_key):
+    """Month of a monthly_runs key: '2025-05' or a bare month number (taken as the current year)"""
+    try:
+        if '-' in str(month_key):
+            year, month = str(month_key).split('-')[:2]
+            return date(int(year), int(month), 1)
+        return date(timezone.localdate().year, int(month_key), 1)
+    except (ValueError, TypeError):
+        return None
+
+
+def backfill_monthly_runs(apps, schema_editor):
+    """
+    Aggregate existing sessions, TEC report node counts and monthly_runs entries per network and month.
+    Self-contained on purpose: the live rebuild helper follows the current models, this follows 0012's.
+    """
+    NetworkMonthlyRuns = apps.get_model('HealthCheck_app', 'NetworkMonthlyRuns')
+    HealthCheckSession = apps.get_model('HealthCheck_app', 'HealthCheckSession')
+    HealthCheckFile = apps.get_model('HealthCheck_app', 'HealthCheckFile')
+    Customer = apps.get_model('HealthCheck_app', 'Customer')
+
+    rows = {}
+
+    def row_for(customer_id, month):
+        if (customer_id, month) not in rows:
+            rows[customer_id, month] = NetworkMonthlyRuns(customer_id=customer_id, month=month)
+        return rows[customer_id, month]
+
+    sessions = HealthCheckSession.objects.values_list('customer_id', 'created_at', 'status')
+    for customer_id, created_at, status in sessions.iterator():
+        row = row_for(customer_id, month_of(created_at))
+        row.session_count += 1
+        row.completed_count += int(status == 'COMPLETED')
+        if row.last_session_at is None or created_at > row.last_session_at:
+            row.last_session_at = created_at
+
+    reports = HealthCheckFile.objects.filter(
+        session__status='COMPLETED', file_type='TEC_REPORT', report_node_count__isnull=False,
+    ).order_by('uploaded_at').values_list('session__customer_id', 'session__created_at', 'report_node_count')
+    for customer_id, created_at, node_count in reports.iterator():
+        row_for(customer_id, month_of(created_at)).node_count = node_count
+
+    for customer_id, monthly_runs in Customer.objects.values_list('pk', 'monthly_runs').iterator():
+        if not isinstance(monthly_runs, dict):
+            continue
+        for month_key, value in monthly_runs.items():
+            month = parse_month_key(month_key)
+            if month is not None and value:
+                row_for(customer_id, month).recorded_run = str(value).strip()[:50]
+
+    NetworkMonthlyRuns.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0011_healthcheckfile_report_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NetworkMonthlyRuns',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month, in local time')),
+                ('session_count', models.IntegerField(default=0, help_text='Sessions started in this month')),
+                ('completed_count', models.IntegerField(default=0, help_text='Sessions started in this month that completed')),
+                ('last_session_at', models.DateTimeField(blank=True, help_text='Start time of the latest session in this month', null=True)),
+                ('node_count', models.IntegerField(default=0, help_text='Node count reported by the latest completed run')),
+                ('recorded_run', models.CharField(blank=True, default='', help_text='Run date recorded in monthly_runs', max_length=50)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_aggregates', to='HealthCheck_app.customer')),
+            ],
+            options={
+                'verbose_name': 'Network Monthly Runs',
+                'verbose_name_plural': 'Network Monthly Runs',
+                'indexes': [models.Index(fields=['month', 'customer'], name='network_monthly_runs_month_idx')],
+                'constraints': [models.UniqueConstraint(fields=('customer', 'month'), name='network_monthly_runs_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_monthly_runs, migrations.RunPython.noop),
+    ]
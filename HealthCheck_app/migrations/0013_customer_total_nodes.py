@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0012_networkmonthlyruns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='total_nodes',
+            field=models.IntegerField(blank=True, help_text='Nodes in the NODE COVERAGE sheet of the latest completed run', null=True),
+        ),
+    ]
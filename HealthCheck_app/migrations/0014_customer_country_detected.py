@@ -0,0 +1,42 @@
+# Generated by Django 5.2.5 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+def detect_missing_countries(apps, schema_editor):
+    """Networks created without a country get one detected from their reports, locations and names"""
+    from collections import Counter
+    from django.db.models import Q
+    from HealthCheck_app.country_detection import detect_customer_country
+
+    Customer = apps.get_model('HealthCheck_app', 'Customer')
+    HealthCheckFile = apps.get_model('HealthCheck_app', 'HealthCheckFile')
+    NodeCoverage = apps.get_model('HealthCheck_app', 'NodeCoverage')
+
+    networks = Customer.objects.filter(Q(country__isnull=True) | Q(country=''), is_deleted=False)
+    for name in set(networks.values_list('name', flat=True)):
+        name_networks = networks.filter(name=name)
+        filenames = HealthCheckFile.objects.filter(customer__name=name, file_type='TEC_REPORT').values_list('original_filename', flat=True)
+        locations = Counter(
+            NodeCoverage.objects.filter(customer__name=name, location__isnull=False).exclude(location='').values_list('location', flat=True)
+        )
+        country = detect_customer_country(
+            name, list(name_networks.values_list('network_name', flat=True)), list(filenames), locations
+        )
+        name_networks.update(country=country, country_detected=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0013_customer_total_nodes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='country_detected',
+            field=models.BooleanField(default=False, help_text='Country was detected automatically and is refreshed by the reconciler'),
+        ),
+        migrations.RunPython(detect_missing_countries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.5 on 2026-10-19 17:05
+
+from django.db import migrations, models
+from django.utils import timezone
+from django.utils.http import urlencode
+
+
+# Snapshot of the tracker history tables when these fields were added. The migration must not follow
+# later changes to models.file_history_metadata or to the URLconf, so download paths are spelled out.
+HISTORY_CATEGORIES = {
+    'HOST': 'host_files',
+    'INVENTORY_CSV': 'inventory_files',
+    'TEC_REPORT': 'reports',
+    'TRACKER_GENERATED': 'tracker_generated',
+    'HC_TRACKER': 'old_trackers',
+    'GLOBAL_IGNORE_TXT': 'old_trackers',
+    'SELECTIVE_IGNORE_XLSX': 'old_trackers',
+}
+HISTORY_DOWNLOAD_PATHS = {
+    'HOST': '/download/host/',
+    'INVENTORY_CSV': '/download/inventory/',
+    'TEC_REPORT': '/download/report/',
+}
+TRACKER_DOWNLOAD_PATH = '/download/tracker/'
+
+
+def fill_history_metadata(apps, schema_editor):
+    """Existing files get the tracker history metadata new files get on save"""
+    HealthCheckFile = apps.get_model('HealthCheck_app', 'HealthCheckFile')
+    fields = ['history_category', 'download_url', 'upload_date_display']
+    batch = []
+    for file_obj in HealthCheckFile.objects.only('file_type', 'stored_filename', 'uploaded_at').iterator(chunk_size=1000):
+        category = HISTORY_CATEGORIES.get(file_obj.file_type, '')
+        if file_obj.file_type in ('TRACKER_GENERATED', 'HC_TRACKER') and 'HC_Issues_Tracker' not in file_obj.stored_filename:
+            category = ''
+        download_path = HISTORY_DOWNLOAD_PATHS.get(file_obj.file_type, TRACKER_DOWNLOAD_PATH)
+        file_obj.history_category = category
+        file_obj.download_url = f"{download_path}?{urlencode({'filename': file_obj.stored_filename})}"
+        file_obj.upload_date_display = (
+            timezone.localtime(file_obj.uploaded_at).strftime('%d/%m/%Y %I:%M %p') if file_obj.uploaded_at else ''
+        )
+        batch.append(file_obj)
+        if len(batch) >= 1000:
+            HealthCheckFile.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        HealthCheckFile.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('HealthCheck_app', '0014_customer_country_detected'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='history_category',
+            field=models.CharField(blank=True, default='', help_text='Tracker history folder; empty when hidden', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='download_url',
+            field=models.CharField(blank=True, default='', max_length=600),
+        ),
+        migrations.AddField(
+            model_name='healthcheckfile',
+            name='upload_date_display',
+            field=models.CharField(blank=True, default='', max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name='healthcheckfile',
+            index=models.Index(fields=['customer', 'file_type', 'uploaded_at'], name='hc_file_customer_type_date_idx'),
+        ),
+        migrations.RunPython(fill_history_metadata, migrations.RunPython.noop),
+    ]
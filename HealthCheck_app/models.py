@@ -1,6 +1,17 @@
-from django.db import models
+from datetime import date, datetime, timedelta
+
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import urlencode
+
+from .access_policy import AccessPolicy, invalidate_access_policy
+from .response_cache import bump_data_version, bump_scoped_version
+from .session_progress import publish_progress
+from .country_detection import detect_country_from_name, detect_customer_country
 
 
 class UserProfile(models.Model):
@@ -69,59 +80,30 @@ class UserProfile(models.Model):
             return []
         return [loc.strip().upper() for loc in self.assigned_locations.split(',') if loc.strip()]
     
+    def access_policy(self):
+        """Assignments compiled into an AccessPolicy (get_access_policy(user) serves the cached one)"""
+        return AccessPolicy.from_profile(self)
+    
     def can_access_customer(self, customer_name):
         """
         Check if user can access a specific customer based on region assignments
         """
-        if self.is_super_user or not self.enforce_strict_validation:
-            return True, "Super user or strict validation disabled"
-        
-        customer_upper = customer_name.upper()
-        customer_words = set(customer_upper.replace('_', ' ').replace('-', ' ').split())
-        
-        # Check operator access
-        assigned_operators = self.get_assigned_operators_list()
-        if assigned_operators:
-            user_operators = set(assigned_operators)
-            customer_operators = customer_words.intersection({'BSNL', 'AIRTEL', 'JIO', 'VI', 'VODAFONE', 'IDEA', 'RELIANCE', 'TATA', 'BHARTI'})
-            
-            if customer_operators and not customer_operators.intersection(user_operators):
-                return False, f"User assigned to {'/'.join(user_operators)} but customer is {'/'.join(customer_operators)}"
-        
-        # Check region access
-        assigned_regions = self.get_assigned_regions_list()
-        if assigned_regions:
-            user_regions = set(assigned_regions)
-            customer_regions = customer_words.intersection({'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL', 'NORTHEAST'})
-            
-            if customer_regions and not customer_regions.intersection(user_regions):
-                return False, f"User assigned to {'/'.join(user_regions)} but customer is {'/'.join(customer_regions)}"
-        
-        # Check technology access
-        assigned_technologies = self.get_assigned_technologies_list()
-        if assigned_technologies:
-            user_technologies = set(assigned_technologies)
-            customer_technologies = customer_words.intersection({'DWDM', 'SDH', 'MPLS', 'OTN', 'SONET', 'IP', 'ETHERNET', 'FIBER', 'OPTICAL'})
-            
-            if customer_technologies and not customer_technologies.intersection(user_technologies):
-                return False, f"User assigned to {'/'.join(user_technologies)} but customer uses {'/'.join(customer_technologies)}"
-        
-        # Check location access
-        assigned_locations = self.get_assigned_locations_list()
-        if assigned_locations:
-            user_locations = set(assigned_locations)
-            customer_locations = customer_words.intersection({
-                'MUMBAI', 'DELHI', 'KOLKATA', 'CHENNAI', 'BANGALORE', 'HYDERABAD', 'PUNE', 'AHMEDABAD',
-                'JAIPUR', 'LUCKNOW', 'KANPUR', 'NAGPUR', 'INDORE', 'THANE', 'BHOPAL', 'VISAKHAPATNAM',
-                'PATNA', 'VADODARA', 'GHAZIABAD', 'LUDHIANA', 'RAJKOT', 'KOCHI', 'AURANGABAD', 'COIMBATORE',
-                'MAHARASHTRA', 'GUJARAT', 'KARNATAKA', 'TAMILNADU', 'TELANGANA', 'RAJASTHAN', 'PUNJAB',
-                'HARYANA', 'UP', 'UTTARPRADESH', 'MP', 'MADHYAPRADESH', 'WB', 'WESTBENGAL'
-            })
-            
-            if customer_locations and not customer_locations.intersection(user_locations):
-                return False, f"User assigned to {'/'.join(user_locations)} but customer is in {'/'.join(customer_locations)}"
-        
-        return True, "Access granted"
+        return self.access_policy().check(customer_name)
+    
+    def filter_accessible(self, customers):
+        """Customers (objects or names) this profile may access, checked in one pass"""
+        return self.access_policy().filter_accessible(customers)
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        user_id = self.user_id
+        transaction.on_commit(lambda: invalidate_access_policy(user_id))
+    
+    def delete(self, *args, **kwargs):
+        user_id = self.user_id
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: invalidate_access_policy(user_id))
+        return result
     
     def __str__(self):
         return f"{self.user.username} - Profile"
@@ -137,7 +119,9 @@ class Customer(models.Model):
     
     # Extended fields for Excel dashboard data
     country = models.CharField(max_length=100, null=True, blank=True, help_text="Country where network is located")
+    country_detected = models.BooleanField(default=False, help_text="Country was detected automatically and is refreshed by the reconciler")
     node_qty = models.IntegerField(default=0, help_text="Number of nodes in network")
+    total_nodes = models.IntegerField(null=True, blank=True, help_text="Nodes in the NODE COVERAGE sheet of the latest completed run")
     ne_type = models.CharField(max_length=100, null=True, blank=True, help_text="Network Element type (e.g., 1830 PSS)")
     gtac = models.CharField(max_length=100, null=True, blank=True, help_text="Global Technical Assistance Center")
     
@@ -161,6 +145,77 @@ class Customer(models.Model):
             return f"{self.name} - {self.network_name}"
         return self.name
     
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if adding and not self.country:
+            # Resolved once at creation from the name; refined by reconcile_countries as reports arrive
+            self.country = detect_country_from_name(self.name, [self.network_name])
+            self.country_detected = True
+        super().save(*args, **kwargs)
+        bump_data_version()
+        
+        # Keep the materialised monthly aggregates in step with edits to monthly_runs
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'monthly_runs' not in update_fields:
+            return
+        if adding and not self.monthly_runs:
+            return
+        NetworkMonthlyRuns.sync_recorded_runs(self)
+    
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_data_version()
+        return result
+    
+    @classmethod
+    def reconcile_countries(cls, customer_names=None):
+        """
+        Re-detect the country of networks whose country is empty or was detected automatically, from
+        uploaded TEC report filenames, NodeCoverage locations and names. Manually entered or migrated
+        countries are kept. Returns the number of networks updated.
+        """
+        from collections import Counter, defaultdict
+        from django.db.models import Count, Q
+        
+        networks = cls.objects.filter(is_deleted=False).filter(
+            Q(country_detected=True) | Q(country__isnull=True) | Q(country='')
+        )
+        if customer_names is not None:
+            networks = networks.filter(name__in=list(customer_names))
+        
+        networks_by_name = defaultdict(list)
+        for network in networks.only('id', 'name', 'network_name', 'country', 'country_detected'):
+            networks_by_name[network.name].append(network)
+        if not networks_by_name:
+            return 0
+        
+        # Evidence is shared by all networks of a customer name
+        report_filenames = defaultdict(list)
+        for name, filename in HealthCheckFile.objects.filter(
+            customer__name__in=list(networks_by_name), file_type='TEC_REPORT'
+        ).values_list('customer__name', 'original_filename'):
+            report_filenames[name].append(filename)
+        
+        locations = defaultdict(Counter)
+        for row in NodeCoverage.objects.filter(
+            customer__name__in=list(networks_by_name), location__isnull=False
+        ).exclude(location='').values('customer__name', 'location').annotate(count=Count('id')):
+            locations[row['customer__name']][row['location']] += row['count']
+        
+        updated = 0
+        for name, name_networks in networks_by_name.items():
+            country = detect_customer_country(
+                name, [network.network_name for network in name_networks],
+                report_filenames[name], locations[name]
+            )
+            stale = [network.id for network in name_networks if network.country != country or not network.country_detected]
+            if stale:
+                updated += cls.objects.filter(id__in=stale).update(country=country, country_detected=True)
+        
+        if updated:
+            bump_data_version()
+        return updated
+    
     @classmethod
     def get_customers_with_networks(cls):
         """Get customers grouped by name with their networks"""
@@ -231,53 +286,79 @@ class HealthCheckSession(models.Model):
         verbose_name = 'Health Check Session'
         verbose_name_plural = 'Health Check Sessions'
     
-    def update_status(self, status, message=''):
-        self.status = status
-        self.status_message = message
-        if status == 'COMPLETED':
-            self.completed_at = timezone.now()
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # Open progress streams pick the change up from the cache
+        transaction.on_commit(lambda: publish_progress(self))
+        if adding:
+            NetworkMonthlyRuns.record_session(self)
+            bump_data_version()
+    
+    def delete(self, *args, **kwargs):
+        customer_id, created_at = self.customer_id, self.created_at
+        result = super().delete(*args, **kwargs)
+        NetworkMonthlyRuns.refresh_month(customer_id, NetworkMonthlyRuns.month_of(created_at))
+        bump_data_version()
+        return result
+    
+    def update_status(self, status, message='', total_nodes=None):
+        """
+        Set the session status. On completion, total_nodes (the node count reported by Script/main.py)
+        is stored on the customer network so dashboards read it instead of estimating.
+        """
+        # Session status and the run counters change together or not at all
+        with transaction.atomic():
+            # Decide on the locked row, not this instance: another copy of the session may have completed it
+            stored_status = HealthCheckSession.objects.select_for_update().filter(
+                pk=self.pk
+            ).values_list('status', flat=True).first()
+            first_completion = status == 'COMPLETED' and stored_status != 'COMPLETED'
+            
+            self.status = status
+            self.status_message = message
+            if status == 'COMPLETED':
+                self.completed_at = timezone.now()
+            self.save()
+            
+            if status == 'COMPLETED' and total_nodes is not None:
+                self.customer.total_nodes = total_nodes
+                Customer.objects.filter(pk=self.customer_id).update(total_nodes=total_nodes)
+            if first_completion:
+                NetworkMonthlyRuns.record_completion(self)
+                self._update_customer_monthly_runs()
         
-        # Save session FIRST to avoid race condition
-        self.save()
+        if first_completion:
+            # The run added NodeCoverage locations
+            Customer.reconcile_countries([self.customer.name])
         
-        # Then update customer data AFTER session is saved
-        if status == 'COMPLETED':
-            self._update_customer_monthly_runs()
+        # Cached dashboard/statistics responses are stale now
+        bump_data_version()
     
     def _update_customer_monthly_runs(self):
-        """Update customer's monthly_runs field when session completes - RACE CONDITION FIXED"""
+        """
+        Count this completion on the customer network: increment total_runs and record the completion
+        date in monthly_runs and its NetworkMonthlyRuns row. The customer row is locked for the
+        caller's transaction, so concurrent completions never overwrite each other's updates.
+        """
+        completion_date = timezone.localtime(self.completed_at or timezone.now())
+        current_month_key = completion_date.strftime('%Y-%m')  # e.g., '2025-10'
+        current_date_value = completion_date.strftime('%Y-%m-%d')  # e.g., '2025-10-08'
+        
         try:
-            # Get current date in YYYY-MM-DD format
-            completion_date = self.completed_at or timezone.now()
-            current_month_key = completion_date.strftime('%Y-%m')  # e.g., '2025-10'
-            current_date_value = completion_date.strftime('%Y-%m-%d')  # e.g., '2025-10-08'
-            
-            # Initialize monthly_runs if it doesn't exist
-            if not self.customer.monthly_runs:
-                self.customer.monthly_runs = {}
+            with transaction.atomic():
+                locked = Customer.objects.select_for_update().only('monthly_runs', 'total_runs').get(pk=self.customer_id)
+                monthly_runs = locked.monthly_runs if isinstance(locked.monthly_runs, dict) else {}
+                monthly_runs[current_month_key] = current_date_value
+                
+                Customer.objects.filter(pk=self.customer_id).update(
+                    total_runs=F('total_runs') + 1, monthly_runs=monthly_runs
+                )
+                NetworkMonthlyRuns.record_run_date(self.customer_id, completion_date, current_date_value)
             
-            # Update the current month with today's date
-            self.customer.monthly_runs[current_month_key] = current_date_value
-            
-            # FIXED RACE CONDITION: Count completed sessions INCLUDING this current session
-            # Since this session is being marked as COMPLETED right now
-            actual_completed_sessions = HealthCheckSession.objects.filter(
-                customer=self.customer,
-                status='COMPLETED'
-            ).count()
-            
-            # Add 1 because this current session is now COMPLETED (race condition fix)
-            if self.status == 'COMPLETED':
-                actual_completed_sessions = actual_completed_sessions  # Already included in count since save() happens after
-            
-            # Update total_runs to reflect actual completed sessions
-            self.customer.total_runs = actual_completed_sessions
-            
-            # Save the customer
-            self.customer.save()
-            
-            print(f"Updated {self.customer.name} monthly_runs: {current_month_key} = {current_date_value}")
-            print(f"Updated total_runs to {actual_completed_sessions} (including current session)")
+            self.customer.monthly_runs = monthly_runs
+            self.customer.total_runs = locked.total_runs + 1
+            print(f"Updated {self.customer.name} monthly_runs: {current_month_key} = {current_date_value}, total_runs = {self.customer.total_runs}")
             
         except Exception as e:
             print(f"Error updating monthly_runs for {self.customer.name}: {e}")
@@ -307,6 +388,280 @@ class HealthCheckSession(models.Model):
         return f"{self.customer.name} - {self.session_id}"
 
 
+class NetworkMonthlyRuns(models.Model):
+    """
+    Materialised run aggregates per network (Customer row) and calendar month.
+    Session counters are maintained incrementally as sessions start and complete;
+    recorded_run mirrors the network's monthly_runs entry for the month.
+    The customer dashboard reads this table instead of counting sessions per network.
+    """
+    # monthly_runs values that do not count as a run
+    EMPTY_RUN_VALUES = ('-', '', 'null', 'None')
+    
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE, related_name='monthly_aggregates')
+    month = models.DateField(help_text="First day of the month, in local time")
+    session_count = models.IntegerField(default=0, help_text="Sessions started in this month")
+    completed_count = models.IntegerField(default=0, help_text="Sessions started in this month that completed")
+    last_session_at = models.DateTimeField(null=True, blank=True, help_text="Start time of the latest session in this month")
+    node_count = models.IntegerField(default=0, help_text="Node count reported by the latest completed run")
+    recorded_run = models.CharField(max_length=50, blank=True, default='', help_text="Run date recorded in monthly_runs")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Network Monthly Runs'
+        verbose_name_plural = 'Network Monthly Runs'
+        constraints = [
+            models.UniqueConstraint(fields=['customer', 'month'], name='network_monthly_runs_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['month', 'customer'], name='network_monthly_runs_month_idx'),
+        ]
+    
+    @staticmethod
+    def month_of(value):
+        """First day of the (local) month of a date or datetime"""
+        if isinstance(value, datetime) and timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return date(value.year, value.month, 1)
+    
+    @staticmethod
+    def month_bounds(month):
+        """Aware [start, end) datetimes of a month"""
+        start = timezone.make_aware(datetime(month.year, month.month, 1))
+        if month.month == 12:
+            end = timezone.make_aware(datetime(month.year + 1, 1, 1))
+        else:
+            end = timezone.make_aware(datetime(month.year, month.month + 1, 1))
+        return start, end
+    
+    @staticmethod
+    def parse_month_key(month_key):
+        """Month of a monthly_runs key: '2025-05' or a bare month number (taken as the current year)"""
+        try:
+            if '-' in str(month_key):
+                year, month = str(month_key).split('-')[:2]
+                return date(int(year), int(month), 1)
+            return date(timezone.localdate().year, int(month_key), 1)
+        except (ValueError, TypeError):
+            return None
+    
+    @classmethod
+    def _update_row(cls, customer_id, month, **updates):
+        row, _ = cls.objects.get_or_create(customer_id=customer_id, month=month)
+        cls.objects.filter(pk=row.pk).update(**updates)
+    
+    @classmethod
+    def record_session(cls, session):
+        """Count a newly created session in its month"""
+        started = Value(session.created_at, output_field=models.DateTimeField())
+        cls._update_row(
+            session.customer_id,
+            cls.month_of(session.created_at),
+            session_count=F('session_count') + 1,
+            last_session_at=Greatest(Coalesce('last_session_at', started), started),
+        )
+    
+    @classmethod
+    def record_completion(cls, session):
+        """Count a session that has just completed, with the node count of its TEC report"""
+        updates = {'completed_count': F('completed_count') + 1}
+        node_count = HealthCheckFile.objects.filter(
+            session=session, file_type='TEC_REPORT', report_node_count__isnull=False
+        ).order_by('-uploaded_at').values_list('report_node_count', flat=True).first()
+        if node_count:
+            updates['node_count'] = node_count
+        cls._update_row(session.customer_id, cls.month_of(session.created_at), **updates)
+    
+    @classmethod
+    def record_run_date(cls, customer_id, completed_at, run_date):
+        """Record a completion date as the recorded run of its month (mirrors Customer.monthly_runs)"""
+        cls._update_row(customer_id, cls.month_of(completed_at), recorded_run=run_date)
+    
+    @classmethod
+    def refresh_month(cls, customer_id, month):
+        """Recount one network month from the sessions table (used when sessions are deleted)"""
+        start, end = cls.month_bounds(month)
+        sessions = HealthCheckSession.objects.filter(customer_id=customer_id, created_at__gte=start, created_at__lt=end)
+        stats = sessions.aggregate(
+            session_count=models.Count('id'),
+            completed_count=models.Count('id', filter=models.Q(status='COMPLETED')),
+            last_session_at=models.Max('created_at'),
+        )
+        cls.objects.filter(customer_id=customer_id, month=month).update(**stats)
+    
+    @classmethod
+    def sync_recorded_runs(cls, customer):
+        """Mirror customer.monthly_runs into the recorded_run column of the customer's rows"""
+        monthly_runs = customer.monthly_runs if isinstance(customer.monthly_runs, dict) else {}
+        recorded = {}
+        for month_key, value in monthly_runs.items():
+            month = cls.parse_month_key(month_key)
+            if month is not None:
+                recorded[month] = str(value).strip()[:50] if value else ''
+        
+        existing = {row.month: row for row in cls.objects.filter(customer=customer)}
+        for month, row in existing.items():
+            value = recorded.pop(month, '')
+            if row.recorded_run != value:
+                cls.objects.filter(pk=row.pk).update(recorded_run=value)
+        cls.objects.bulk_create([
+            cls(customer=customer, month=month, recorded_run=value)
+            for month, value in recorded.items() if value
+        ])
+    
+    @classmethod
+    def rebuild(cls, customers=None):
+        """Recompute the aggregates from scratch for the given networks (all networks by default)"""
+        rows = rebuild_network_monthly_runs(cls, HealthCheckSession, HealthCheckFile, Customer, customers)
+        bump_data_version()
+        return rows
+    
+    @classmethod
+    def summarise(cls, customer_ids, start_date=None, end_date=None):
+        """
+        Per-network run summary for the dashboard. With start_date and end_date (inclusive local
+        dates) only sessions started in that range are counted: whole months come from this table,
+        the partial months at either end of the range from the sessions table in a single query.
+        Returns {customer_id: {'runs', 'completed', 'last_run_at', 'months', 'month_runs', 'recorded', 'node_count'}}
+        where 'months' maps month -> latest session start, 'month_runs' month -> session count
+        and 'recorded' lists (month, recorded_run).
+        """
+        summaries = {
+            customer_id: {
+                'runs': 0, 'completed': 0, 'last_run_at': None, 'months': {}, 'month_runs': {},
+                'recorded': [], 'node_count': 0,
+            }
+            for customer_id in customer_ids
+        }
+        
+        def add(summary, month, runs, completed, last_run_at):
+            if not runs:
+                return
+            summary['runs'] += runs
+            summary['completed'] += completed
+            summary['month_runs'][month] = summary['month_runs'].get(month, 0) + runs
+            if last_run_at and (summary['last_run_at'] is None or last_run_at > summary['last_run_at']):
+                summary['last_run_at'] = last_run_at
+            if last_run_at and (month not in summary['months'] or last_run_at > summary['months'][month]):
+                summary['months'][month] = last_run_at
+        
+        filtered = bool(start_date and end_date)
+        if filtered:
+            # Whole months inside the range; first_full > last_full when there are none
+            first_full = cls.month_of(start_date)
+            if start_date.day != 1:
+                first_full = cls.month_bounds(first_full)[1].date()
+            last_full = cls.month_of(end_date)
+            if (end_date + timedelta(days=1)).day != 1:
+                last_full = cls.month_of(last_full - timedelta(days=1))
+        
+        for row in cls.objects.filter(customer_id__in=customer_ids).order_by('month'):
+            summary = summaries[row.customer_id]
+            if row.recorded_run:
+                summary['recorded'].append((row.month, row.recorded_run))
+            if row.node_count:
+                summary['node_count'] = row.node_count
+            if filtered and not (first_full <= row.month <= last_full):
+                continue
+            add(summary, row.month, row.session_count, row.completed_count, row.last_session_at)
+        
+        if filtered:
+            range_start = timezone.make_aware(datetime.combine(start_date, datetime.min.time()))
+            range_end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+            sessions = HealthCheckSession.objects.filter(
+                customer_id__in=customer_ids, created_at__gte=range_start, created_at__lt=range_end
+            )
+            if first_full <= last_full:
+                sessions = sessions.exclude(
+                    created_at__gte=cls.month_bounds(first_full)[0],
+                    created_at__lt=cls.month_bounds(last_full)[1],
+                )
+            for customer_id, created_at, status in sessions.values_list('customer_id', 'created_at', 'status'):
+                add(summaries[customer_id], cls.month_of(created_at), 1, int(status == 'COMPLETED'), created_at)
+        
+        return summaries
+    
+    def __str__(self):
+        return f"{self.customer} - {self.month:%Y-%m}: {self.session_count} runs"
+
+
+def rebuild_network_monthly_runs(aggregate_model, session_model, file_model, customer_model, customers=None):
+    """
+    Rebuild NetworkMonthlyRuns rows from sessions, TEC report metadata and monthly_runs.
+    Migration 0012 keeps its own copy of this aggregation; changes here do not affect it.
+    """
+    customer_qs = customer_model.objects.all()
+    if customers is not None:
+        customer_qs = customer_qs.filter(pk__in=[getattr(c, 'pk', c) for c in customers])
+    customer_ids = list(customer_qs.values_list('pk', flat=True))
+    
+    rows = {}
+    
+    def row_for(customer_id, month):
+        if (customer_id, month) not in rows:
+            rows[customer_id, month] = aggregate_model(customer_id=customer_id, month=month)
+        return rows[customer_id, month]
+    
+    sessions = session_model.objects.filter(customer_id__in=customer_ids).values_list('customer_id', 'created_at', 'status')
+    for customer_id, created_at, status in sessions.iterator():
+        row = row_for(customer_id, NetworkMonthlyRuns.month_of(created_at))
+        row.session_count += 1
+        row.completed_count += int(status == 'COMPLETED')
+        if row.last_session_at is None or created_at > row.last_session_at:
+            row.last_session_at = created_at
+    
+    reports = file_model.objects.filter(
+        session__customer_id__in=customer_ids, session__status='COMPLETED',
+        file_type='TEC_REPORT', report_node_count__isnull=False,
+    ).order_by('uploaded_at').values_list('session__customer_id', 'session__created_at', 'report_node_count')
+    for customer_id, created_at, node_count in reports.iterator():
+        row_for(customer_id, NetworkMonthlyRuns.month_of(created_at)).node_count = node_count
+    
+    for customer_id, monthly_runs in customer_qs.values_list('pk', 'monthly_runs').iterator():
+        if not isinstance(monthly_runs, dict):
+            continue
+        for month_key, value in monthly_runs.items():
+            month = NetworkMonthlyRuns.parse_month_key(month_key)
+            if month is not None and value:
+                row_for(customer_id, month).recorded_run = str(value).strip()[:50]
+    
+    aggregate_model.objects.filter(customer_id__in=customer_ids).delete()
+    aggregate_model.objects.bulk_create(rows.values(), batch_size=1000)
+    return len(rows)
+
+
+# Tracker history folder of each file type; tracker types only list the HC_Issues_Tracker files
+HISTORY_CATEGORIES = {
+    'HOST': 'host_files',
+    'INVENTORY_CSV': 'inventory_files',
+    'TEC_REPORT': 'reports',
+    'TRACKER_GENERATED': 'tracker_generated',
+    'HC_TRACKER': 'old_trackers',
+    # Ignore files are listed with the old trackers for reference
+    'GLOBAL_IGNORE_TXT': 'old_trackers',
+    'SELECTIVE_IGNORE_XLSX': 'old_trackers',
+}
+HISTORY_DOWNLOAD_VIEWS = {
+    'HOST': 'download_host_file',
+    'INVENTORY_CSV': 'download_inventory_file',
+    'TEC_REPORT': 'download_report_file',
+}
+
+
+def file_history_metadata(file_type, stored_filename, uploaded_at):
+    """Tracker history category, download URL and local upload date of a file, stored when it is saved"""
+    category = HISTORY_CATEGORIES.get(file_type, '')
+    if file_type in ('TRACKER_GENERATED', 'HC_TRACKER') and 'HC_Issues_Tracker' not in stored_filename:
+        category = ''
+    # Tracker files and others use the tracker download view
+    view_name = HISTORY_DOWNLOAD_VIEWS.get(file_type, 'download_tracker_file')
+    return {
+        'history_category': category,
+        'download_url': f"{reverse(view_name)}?{urlencode({'filename': stored_filename})}",
+        'upload_date_display': timezone.localtime(uploaded_at).strftime('%d/%m/%Y %I:%M %p') if uploaded_at else '',
+    }
+
+
 class HealthCheckFile(models.Model):
     FILE_TYPES = [
         ('CONFIG', 'Configuration File'),
@@ -331,14 +686,90 @@ class HealthCheckFile(models.Model):
     file_path = models.CharField(max_length=500)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     file_size = models.IntegerField(default=0)
+    sha256 = models.CharField(max_length=64, blank=True, default='', help_text="SHA-256 of the file content, computed during upload")
     is_processed = models.BooleanField(default=False)
     
+    # TEC report metadata cached by the upload-time pre-flight check
+    report_network_name = models.CharField(max_length=255, blank=True, default='', help_text="Network name parsed from the report")
+    report_date = models.DateField(null=True, blank=True, help_text="Report date parsed from the report filename")
+    report_node_count = models.IntegerField(null=True, blank=True, help_text="Nodes listed in the Network Report Summary sheet")
+    
+    # Tracker history metadata, computed on save (see file_history_metadata)
+    history_category = models.CharField(max_length=30, blank=True, default='', help_text="Tracker history folder; empty when hidden")
+    download_url = models.CharField(max_length=600, blank=True, default='')
+    upload_date_display = models.CharField(max_length=32, blank=True, default='')
+    
     class Meta:
         verbose_name = 'Health Check File'
         verbose_name_plural = 'Health Check Files'
+        indexes = [
+            models.Index(fields=['customer', 'sha256'], name='hc_file_customer_sha256_idx'),
+            models.Index(fields=['sha256'], name='hc_file_sha256_idx'),
+            models.Index(fields=['customer', 'file_type', 'uploaded_at'], name='hc_file_customer_type_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.customer.name} - {self.original_filename}"
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # uploaded_at is only final after saving (auto_now_add, or changed by callers afterwards)
+        metadata = file_history_metadata(self.file_type, self.stored_filename, self.uploaded_at)
+        if any(getattr(self, field) != value for field, value in metadata.items()):
+            for field, value in metadata.items():
+                setattr(self, field, value)
+            HealthCheckFile.objects.filter(pk=self.pk).update(**metadata)
+        bump_scoped_version(f'files:{self.customer_id}')
+    
+    def delete(self, *args, **kwargs):
+        customer_id = self.customer_id
+        result = super().delete(*args, **kwargs)
+        bump_scoped_version(f'files:{customer_id}')
+        return result
+
+
+class ChunkedUpload(models.Model):
+    """
+    Resumable upload of a large file sent in sequential chunks.
+    Chunks are appended straight to a part file on disk; the client resumes from `offset`.
+    """
+    UPLOAD_TYPES = [
+        ('REPORT', 'TEC Health Check Report'),
+        ('INVENTORY', 'Inventory CSV'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('UPLOADING', 'Uploading'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+        ('EXPIRED', 'Expired'),
+    ]
+    
+    upload_id = models.CharField(max_length=64, unique=True)
+    customer = models.ForeignKey(Customer, on_delete=models.CASCADE)
+    initiated_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    upload_type = models.CharField(max_length=20, choices=UPLOAD_TYPES)
+    filename = models.CharField(max_length=255)
+    total_size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0, help_text="Number of bytes received so far")
+    expected_sha256 = models.CharField(max_length=64, blank=True, help_text="SHA-256 announced by the client")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='UPLOADING')
+    error_message = models.TextField(blank=True)
+    stored_file = models.ForeignKey(HealthCheckFile, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = 'Chunked Upload'
+        verbose_name_plural = 'Chunked Uploads'
+    
+    def get_part_path(self):
+        """Path of the partially assembled file on disk"""
+        from .file_utils import get_chunked_upload_dir
+        return get_chunked_upload_dir() / f"{self.upload_id}.part"
+    
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.total_size})"
 
 
 class NodeCoverage(models.Model):
@@ -380,3 +811,18 @@ class ServiceCheck(models.Model):
         return f"{self.node.node_name} - {self.service_name}"
 
 
+class DataVersion(models.Model):
+    """
+    Counters behind the response cache's data versions (see response_cache).
+    Bumped with an UPDATE ... SET version = version + 1, so concurrent changes never share a version;
+    Django's cache only holds a copy of the current value.
+    """
+    key = models.CharField(max_length=200, unique=True)
+    version = models.BigIntegerField()
+    
+    class Meta:
+        verbose_name = 'Data Version'
+        verbose_name_plural = 'Data Versions'
+    
+    def __str__(self):
+        return f"{self.key} = {self.version}"
@@ -0,0 +1,235 @@
+"""
+Pre-flight validation of TEC Health Check report workbooks
+Streams only the workbook's sheet index and the first rows of the sheets Script/main.py needs,
+so malformed reports are rejected at upload time instead of minutes into a processing run.
+"""
+
+import re
+import zipfile
+import posixpath
+from datetime import date
+from xml.etree.ElementTree import iterparse
+
+SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+CWBP_SHEET = 'CWBP'
+SUMMARY_SHEET = 'Network Report Summary'
+SUMMARY_END_MARKER = 'Total Network Issues'
+
+# main.py reads CWBP columns HCID (0) .. Task (12)
+CWBP_MIN_COLUMNS = 13
+CWBP_FIRST_HEADER = 'HCID'
+
+# The marker sits right after the node list; stop streaming if a sheet is far larger than any network
+SUMMARY_MAX_ROWS = 50000
+
+# Declared sizes are checked before anything is decompressed. Worksheet XML compresses well, but not
+# by more than ~100x; far higher ratios on large members are decompression bombs.
+REPORT_MAX_MEMBER_SIZE = 1024 * 1024 * 1024
+REPORT_MAX_COMPRESSION_RATIO = 200
+REPORT_RATIO_CHECK_MIN_SIZE = 10 * 1024 * 1024
+
+REPORT_FILENAME_DATE = re.compile(r'_(\d{4})(\d{2})(\d{2})\.xlsx$', re.IGNORECASE)
+
+
+class _SharedStrings:
+    """Shared string table parsed lazily, only as far as the highest index requested"""
+
+    def __init__(self, archive):
+        self._strings = []
+        self._parser = None
+        if 'xl/sharedStrings.xml' in archive.namelist():
+            self._parser = iterparse(archive.open('xl/sharedStrings.xml'), events=('end',))
+
+    def get(self, index):
+        while index >= len(self._strings) and self._parser is not None:
+            try:
+                event, element = next(self._parser)
+            except StopIteration:
+                self._parser = None
+                break
+            if element.tag == f'{SPREADSHEET_NS}si':
+                self._strings.append(''.join(t.text or '' for t in element.iter(f'{SPREADSHEET_NS}t')))
+                element.clear()
+        return self._strings[index] if index < len(self._strings) else None
+
+
+def _column_index(cell_ref):
+    """Zero-based column index of a cell reference such as 'AB12'"""
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + (ord(char.upper()) - 64)
+    return index - 1
+
+
+def _cell_value(cell, shared_strings):
+    cell_type = cell.get('t')
+    if cell_type == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{SPREADSHEET_NS}t'))
+    value = cell.find(f'{SPREADSHEET_NS}v')
+    if value is None or value.text is None:
+        return None
+    if cell_type == 's':
+        return shared_strings.get(int(value.text))
+    return value.text
+
+
+def _iter_rows(archive, sheet_path, shared_strings, columns=None):
+    """Yield rows of a worksheet as lists, streaming the XML; optionally only the given column indexes"""
+    with archive.open(sheet_path) as sheet_xml:
+        for event, element in iterparse(sheet_xml, events=('end',)):
+            if element.tag != f'{SPREADSHEET_NS}row':
+                continue
+            values = {}
+            for cell in element.iter(f'{SPREADSHEET_NS}c'):
+                column = _column_index(cell.get('r', 'A'))
+                if columns is None or column in columns:
+                    values[column] = _cell_value(cell, shared_strings)
+            element.clear()
+            width = max(values) + 1 if values else 0
+            yield [values.get(i) for i in range(width)]
+
+
+def _oversized_member(archive):
+    """Error message for the first member too large (or too compressed) to decompress safely, else None"""
+    for info in archive.infolist():
+        if info.file_size > REPORT_MAX_MEMBER_SIZE:
+            return f"Report member '{info.filename}' is too large ({info.file_size} bytes uncompressed)"
+        if info.file_size > REPORT_RATIO_CHECK_MIN_SIZE and \
+                info.file_size > REPORT_MAX_COMPRESSION_RATIO * max(info.compress_size, 1):
+            return (f"Report member '{info.filename}' expands {info.file_size // max(info.compress_size, 1)}x "
+                    f"when decompressed and is rejected")
+    return None
+
+
+def _sheet_paths(archive):
+    """Map sheet name -> worksheet XML path using only workbook.xml and its relationships"""
+    targets = {}
+    with archive.open('xl/_rels/workbook.xml.rels') as rels_xml:
+        for event, element in iterparse(rels_xml, events=('end',)):
+            if element.tag == f'{PACKAGE_REL_NS}Relationship':
+                target = element.get('Target', '')
+                if target.startswith('/'):
+                    targets[element.get('Id')] = target.lstrip('/')
+                else:
+                    targets[element.get('Id')] = posixpath.normpath(posixpath.join('xl', target))
+            element.clear()
+
+    sheets = {}
+    with archive.open('xl/workbook.xml') as workbook_xml:
+        for event, element in iterparse(workbook_xml, events=('end',)):
+            if element.tag == f'{SPREADSHEET_NS}sheet':
+                sheets[element.get('name')] = targets.get(element.get(f'{RELATIONSHIP_NS}id'))
+                element.clear()
+            elif element.tag == f'{SPREADSHEET_NS}sheets':
+                break
+    return sheets
+
+
+def parse_report_filename(filename):
+    """Network name and report date from '<Network>_Reports_YYYYMMDD.xlsx', mirroring main.py"""
+    parts = filename.replace('.xlsx', '').split('_')
+    if 'Reports' in parts:
+        network_name = '_'.join(parts[:parts.index('Reports')])
+    elif len(parts) >= 3:
+        network_name = '_'.join(parts[:-2])
+    else:
+        network_name = parts[0]
+
+    report_date = None
+    match = REPORT_FILENAME_DATE.search(filename)
+    if match:
+        try:
+            report_date = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            report_date = None
+
+    return network_name.strip(), report_date
+
+
+def preflight_validate_report(report_file, filename):
+    """
+    Validate a TEC HC report without loading the workbook.
+    report_file may be a path or a seekable file object (e.g. a Django UploadedFile).
+    Returns {'valid': bool, 'error': str, 'metadata': {'network_name', 'report_date', 'node_count'}}
+    """
+    network_name, report_date = parse_report_filename(filename)
+    metadata = {'network_name': network_name, 'report_date': report_date, 'node_count': None}
+
+    def invalid(message):
+        return {'valid': False, 'error': message, 'metadata': metadata}
+
+    if report_date is None:
+        return invalid(f"Report filename '{filename}' must end with the report date as _YYYYMMDD.xlsx")
+
+    if hasattr(report_file, 'seek'):
+        report_file.seek(0)
+
+    try:
+        with zipfile.ZipFile(report_file) as archive:
+            oversized = _oversized_member(archive)
+            if oversized:
+                return invalid(oversized)
+
+            sheets = _sheet_paths(archive)
+
+            missing_sheets = [name for name in (CWBP_SHEET, SUMMARY_SHEET) if not sheets.get(name)]
+            if missing_sheets:
+                return invalid(f"Report is missing required sheet(s): {', '.join(missing_sheets)}")
+
+            shared_strings = _SharedStrings(archive)
+
+            # CWBP: only the header row is needed to check the column layout
+            cwbp_header = next(_iter_rows(archive, sheets[CWBP_SHEET], shared_strings), [])
+            header_columns = len([value for value in cwbp_header if value not in (None, '')])
+            if header_columns < CWBP_MIN_COLUMNS:
+                return invalid(
+                    f"CWBP sheet has {header_columns} columns; at least {CWBP_MIN_COLUMNS} "
+                    f"(HCID .. Task) are required"
+                )
+            if str(cwbp_header[0]).strip().upper() != CWBP_FIRST_HEADER:
+                return invalid(f"CWBP sheet must start with a '{CWBP_FIRST_HEADER}' column, found '{cwbp_header[0]}'")
+
+            # Network Report Summary: count node rows (HCID in column B) up to the end marker
+            node_count = 0
+            marker_found = False
+            summary_rows = _iter_rows(archive, sheets[SUMMARY_SHEET], shared_strings, columns={0, 1})
+            for row_number, row in enumerate(summary_rows, start=1):
+                first_cell = row[0] if row else None
+                if first_cell == SUMMARY_END_MARKER:
+                    marker_found = True
+                    break
+                if row_number > 1 and len(row) > 1 and row[1] not in (None, ''):
+                    node_count += 1
+                if row_number >= SUMMARY_MAX_ROWS:
+                    break
+
+            if not marker_found:
+                return invalid(f"'{SUMMARY_SHEET}' sheet has no '{SUMMARY_END_MARKER}' row")
+            if node_count == 0:
+                return invalid(f"'{SUMMARY_SHEET}' sheet lists no nodes")
+            metadata['node_count'] = node_count
+
+    except (zipfile.BadZipFile, KeyError) as e:
+        return invalid(f"File is not a valid Excel workbook: {str(e)}")
+    except Exception as e:
+        return invalid(f"Report could not be read: {str(e)}")
+    finally:
+        if hasattr(report_file, 'seek'):
+            report_file.seek(0)
+
+    return {'valid': True, 'error': '', 'metadata': metadata}
+
+
+def report_file_fields(metadata):
+    """HealthCheckFile field values for the metadata extracted by preflight_validate_report"""
+    metadata = metadata or {}
+    return {
+        'report_network_name': metadata.get('network_name') or '',
+        'report_date': metadata.get('report_date'),
+        'report_node_count': metadata.get('node_count'),
+    }
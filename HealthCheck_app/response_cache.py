@@ -0,0 +1,192 @@
+"""
+Versioned response cache for the dashboard, statistics, monthly and export endpoints
+Responses are cached per (endpoint, request parameters, user scope, data version). The data version
+is a counter bumped whenever sessions or customers change, so stale entries are never read again and
+simply expire. The counter is incremented in the database (DataVersion), because incr() on the
+file-based cache is a get-then-set that lets two concurrent bumps land on the same version; the
+cache holds a copy of the current value so requests do not query it. Works with the local-memory or
+file-based cache.
+The same key doubles as an ETag, so unchanged GET requests are answered with 304 before the view runs.
+"""
+
+import time
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .access_policy import get_access_policy
+
+DATA_VERSION_KEY = 'healthcheck:data_version'
+DATA_CHANGED_AT_KEY = 'healthcheck:data_changed_at'
+RESPONSE_KEY_PREFIX = 'healthcheck:response'
+
+# Entries of old data versions are never read again; the timeout only bounds their lifetime
+# and the staleness of time-relative values such as "current month runs"
+RESPONSE_CACHE_TIMEOUT = getattr(settings, 'HEALTHCHECK_RESPONSE_CACHE_TIMEOUT', 600)
+
+
+def _next_version(key):
+    """Increment a version counter in the database; no two calls ever return the same value"""
+    from .models import DataVersion
+
+    with transaction.atomic():
+        if not DataVersion.objects.filter(key=key).update(version=F('version') + 1):
+            # Start from the clock so versions never repeat ones cached before the counter existed
+            _, created = DataVersion.objects.get_or_create(key=key, defaults={'version': time.time_ns() // 1000})
+            if not created:
+                DataVersion.objects.filter(key=key).update(version=F('version') + 1)
+        return DataVersion.objects.filter(key=key).values_list('version', flat=True).get()
+
+
+def _cached_version(key):
+    """Current value of a version counter, read from the database only when the cache lost it"""
+    from .models import DataVersion
+
+    version = cache.get(key)
+    if version is None:
+        version = DataVersion.objects.filter(key=key).values_list('version', flat=True).first()
+        if version is None:
+            # Never bumped: any clock value works, the first bump starts the counter from a later clock
+            version = time.time_ns() // 1000
+        cache.add(key, version, timeout=None)
+        version = cache.get(key, version)
+    return version
+
+
+def _publish_version(key):
+    """
+    Bump a counter and copy the new value into the cache. Racing bumps may copy their values in
+    either order; each value is new, so anything cached under an older version stays unreachable.
+    """
+    cache.set(key, _next_version(key), timeout=None)
+
+
+def get_data_version():
+    """Current data version, initialised on first use"""
+    return _cached_version(DATA_VERSION_KEY)
+
+
+def get_data_changed_at():
+    """Unix time of the last data change, for Last-Modified headers"""
+    changed_at = cache.get(DATA_CHANGED_AT_KEY)
+    if changed_at is None:
+        cache.add(DATA_CHANGED_AT_KEY, int(time.time()), timeout=None)
+        changed_at = cache.get(DATA_CHANGED_AT_KEY)
+    return changed_at
+
+
+def _bump():
+    _publish_version(DATA_VERSION_KEY)
+    cache.set(DATA_CHANGED_AT_KEY, int(time.time()), timeout=None)
+
+
+def bump_data_version():
+    """Invalidate all cached responses once the current transaction commits"""
+    transaction.on_commit(_bump)
+
+
+def scoped_version_key(scope):
+    return f'{DATA_VERSION_KEY}:{scope}'
+
+
+def get_scoped_version(scope):
+    """Version of one slice of data (e.g. one customer's files), independent of the global data version"""
+    return _cached_version(scoped_version_key(scope))
+
+
+def bump_scoped_version(scope):
+    """Invalidate responses cached for a scope once the current transaction commits"""
+    transaction.on_commit(lambda: _publish_version(scoped_version_key(scope)))
+
+
+def user_scope(user):
+    """
+    Cache scope of a user: users with the same access share cached responses.
+    Staff, superusers and unrestricted profiles share the 'all' scope.
+    """
+    if not user.is_authenticated:
+        return 'anonymous'
+    return get_access_policy(user).scope
+
+
+def response_cache_key(endpoint, request, per_user=False):
+    """Cache key of a request: endpoint, path, query string / POST body, user scope and data version"""
+    params = hashlib.sha1()
+    params.update(request.path.encode('utf-8'))
+    params.update(b'?')
+    params.update('&'.join(f'{key}={value}' for key, value in sorted(request.GET.lists())).encode('utf-8'))
+    if request.method == 'POST':
+        params.update(b'\0')
+        params.update(request.body)
+    scope = f'user:{request.user.pk}' if per_user else user_scope(request.user)
+    return f'{RESPONSE_KEY_PREFIX}:{endpoint}:{request.method}:{params.hexdigest()}:{scope}:{get_data_version()}'
+
+
+def _is_cacheable(response):
+    """Only complete 200 responses, and not JSON error payloads (some endpoints report errors with 200)"""
+    if response.status_code != 200 or getattr(response, 'streaming', False):
+        return False
+    if response.get('Content-Type', '').startswith('application/json'):
+        return b'"status": "error"' not in response.content[:200]
+    return True
+
+
+def _set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Browsers keep the body but must revalidate (a cheap 304) before every reuse
+    response['Cache-Control'] = 'private, no-cache'
+
+
+def cached_response(endpoint, per_user=False, timeout=None):
+    """
+    Cache successful responses of a view until the data version changes.
+    GET requests carrying a matching If-None-Match / If-Modified-Since get a 304 without running the view.
+    per_user=True keys entries by user instead of access scope, for responses that embed the user.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD', 'POST'):
+                return view_func(request, *args, **kwargs)
+
+            key = response_cache_key(endpoint, request, per_user)
+            conditional = request.method in ('GET', 'HEAD')
+            if conditional:
+                # The date is part of the validator because payloads hold "current month" values
+                validator = f'{key}:{timezone.localdate()}'
+                etag = '"' + hashlib.sha1(validator.encode('utf-8')).hexdigest()[:32] + '"'
+                last_modified = get_data_changed_at()
+                not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if not_modified is not None:
+                    _set_validators(not_modified, etag, last_modified)
+                    return not_modified
+
+            response = cache.get(key)
+            if response is not None:
+                response['X-Cache'] = 'HIT'
+            else:
+                response = view_func(request, *args, **kwargs)
+                if not _is_cacheable(response):
+                    # Streamed exports are not stored, but the data-version ETag does not need the body,
+                    # so a repeated download can still be answered with 304. Files served from disk keep
+                    # their own validators, which Range requests rely on.
+                    if conditional and response.status_code == 200 and getattr(response, 'streaming', False) \
+                            and not response.has_header('ETag'):
+                        _set_validators(response, etag, last_modified)
+                    return response
+                cache.set(key, response, RESPONSE_CACHE_TIMEOUT if timeout is None else timeout)
+                response['X-Cache'] = 'MISS'
+
+            if conditional:
+                _set_validators(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
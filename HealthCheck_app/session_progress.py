@@ -0,0 +1,96 @@
+"""
+Live progress of health check sessions
+Every save of a session publishes a snapshot (status, progress, current step and per-step timings)
+to Django's cache. The processing page listens with Server-Sent Events; the stream reads the snapshot
+from the cache and never touches the database, so watching a long run costs no queries. Serve the
+project through hc_final_project/asgi.py so open streams do not each hold a worker thread.
+"""
+
+import json
+import time
+import asyncio
+
+from django.conf import settings
+from django.core.cache import cache
+
+PROGRESS_KEY_PREFIX = 'healthcheck:session_progress'
+# Snapshots outlive any run; they are only a fallback for reconnecting clients after that
+PROGRESS_TIMEOUT = 24 * 3600
+FINISHED_STATUSES = ('COMPLETED', 'FAILED')
+
+# Seconds between keep-alive comments of an idle stream
+PROGRESS_KEEPALIVE = 15
+
+
+def progress_key(session_id):
+    return f'{PROGRESS_KEY_PREFIX}:{session_id}'
+
+
+def progress_snapshot(session, previous=None):
+    """
+    Progress payload of a session. Step timings continue from the previous snapshot:
+    a new current_step closes the running step and starts the next one.
+    """
+    now = time.time()
+    stages = [dict(stage) for stage in (previous or {}).get('stages', [])]
+    step = session.current_step or ''
+    if step and (not stages or stages[-1]['step'] != step):
+        if stages:
+            stages[-1]['seconds'] = round(now - stages[-1]['started'], 1)
+        stages.append({'step': step, 'started': now, 'seconds': None})
+    finished = session.status in FINISHED_STATUSES
+    if finished and stages and stages[-1]['seconds'] is None:
+        stages[-1]['seconds'] = round(now - stages[-1]['started'], 1)
+
+    return {
+        'sequence': (previous or {}).get('sequence', 0) + 1,
+        'session_status': session.status,
+        'status_message': session.status_message,
+        'progress_percentage': session.progress_percentage,
+        'current_step': session.current_step,
+        'processing_duration': session.get_processing_duration_str() if session.created_at else '',
+        'started_at': session.created_at.timestamp() if session.created_at else now,
+        'stages': stages,
+        'finished': finished,
+    }
+
+
+def publish_progress(session):
+    """Store the session's current progress for open streams and status requests"""
+    key = progress_key(session.session_id)
+    snapshot = progress_snapshot(session, cache.get(key))
+    cache.set(key, snapshot, PROGRESS_TIMEOUT)
+    return snapshot
+
+
+def get_progress(session_id):
+    return cache.get(progress_key(session_id))
+
+
+def sse_event(snapshot):
+    """One Server-Sent Event carrying a snapshot; the sequence lets clients resume with Last-Event-ID"""
+    return f"id: {snapshot['sequence']}\nevent: progress\ndata: {json.dumps(snapshot)}\n\n"
+
+
+async def stream_progress(session_id, initial=None, last_sequence=0):
+    """
+    Server-Sent Events for a session until it finishes: a 'progress' event per new snapshot and a
+    comment line as keep-alive. initial is sent first when the cache holds no snapshot yet.
+    """
+    key = progress_key(session_id)
+    # Cache reads are cheap; this only bounds how late an update reaches the page
+    poll_interval = getattr(settings, 'HEALTHCHECK_PROGRESS_POLL_INTERVAL', 0.5)
+    idle = 0.0
+    while True:
+        snapshot = await cache.aget(key) or initial
+        if snapshot and snapshot['sequence'] > last_sequence:
+            last_sequence = snapshot['sequence']
+            idle = 0.0
+            yield sse_event(snapshot)
+            if snapshot['finished']:
+                return
+        elif idle >= PROGRESS_KEEPALIVE:
+            idle = 0.0
+            yield ': keep-alive\n\n'
+        await asyncio.sleep(poll_interval)
+        idle += poll_interval
@@ -1,3 +1,1644 @@
-from django.test import TestCase
+import io
+import hashlib
+import os
+import re
+import sys
+import json
+import pickle
+import subprocess
+import tempfile
+import zipfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
-# Create your tests here.
+from unittest import mock, skipIf
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.http import FileResponse
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import filename_matcher, report_preflight
+from .access_policy import filter_accessible, get_access_policy
+from .excel_integration import ExcelDataReader, clear_excel_index
+from .file_utils import (
+    content_store_path, get_content_store_dir, link_or_copy_file, prune_content_store, store_uploaded_file,
+    verify_file_integrity,
+)
+from .management.commands.hc_benchmark import parse_importtime
+from .models import (
+    ChunkedUpload, Customer, DataVersion, HealthCheckFile, HealthCheckSession, NodeCoverage, NetworkMonthlyRuns, UserProfile,
+    file_history_metadata,
+)
+from .response_cache import DATA_VERSION_KEY, get_data_version
+from .session_progress import get_progress, publish_progress, stream_progress
+from .views import (
+    get_customer_file_path, monthly_session_counts, parse_script_total_nodes, validate_customer_technology_match, validate_user_region_access,
+)
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:
+    import matplotlib
+except ImportError:
+    matplotlib = None
+
+
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class DashboardQueryBudgetTests(TestCase):
+    """Dashboard APIs must run a fixed number of queries however many customers exist"""
+
+    # Upper bound per endpoint, including the session/user lookups of the logged-in request
+    QUERY_BUDGET = 10
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        self.created = 0
+
+        today = timezone.localdate()
+        date_range = {'start_date': str(today - timedelta(days=45)), 'end_date': str(today)}
+        self.endpoints = [
+            ('GET', 'api_customer_dashboard_customers', {}),
+            ('GET', 'api_customer_dashboard_customers', date_range),
+            ('GET', 'api_dashboard_statistics', {}),
+            ('GET', 'api_dashboard_statistics', date_range),
+            ('GET', 'api_export_excel', {}),
+            ('GET', 'api_export_excel', date_range),
+            ('POST', 'api_customer_dashboard_export', {}),
+            ('GET', 'api_customer_dashboard_snapshot', {}),
+            ('GET', 'api_customer_dashboard_snapshot', date_range),
+            ('GET', 'api_customer_dashboard_customers_v2', {}),
+            ('GET', 'api_customer_dashboard_customers_v2', {'expand': 'networks', **date_range}),
+        ]
+
+    def add_customers(self, count):
+        """Customers with two networks each, a completed and a running session, and node coverage"""
+        customers = []
+        for i in range(self.created, self.created + count):
+            for network_name in ('North', 'South'):
+                customers.append(Customer(name=f'Operator{i:04d}', network_name=network_name, total_nodes=3))
+        customers = Customer.objects.bulk_create(customers)
+
+        now = timezone.now()
+        sessions = []
+        for i, customer in enumerate(customers):
+            sessions.append(HealthCheckSession(
+                customer=customer, session_id=f'{customer.name}-{customer.network_name}-1',
+                session_type='REGULAR_PROCESSING', status='COMPLETED', initiated_by=self.user,
+            ))
+            sessions.append(HealthCheckSession(
+                customer=customer, session_id=f'{customer.name}-{customer.network_name}-2',
+                session_type='REGULAR_PROCESSING', status='PROCESSING', initiated_by=self.user,
+            ))
+        sessions = HealthCheckSession.objects.bulk_create(sessions)
+        for i, session in enumerate(sessions):
+            HealthCheckSession.objects.filter(pk=session.pk).update(created_at=now - timedelta(days=i % 90))
+
+        NodeCoverage.objects.bulk_create([
+            NodeCoverage(customer=session.customer, session=session, node_name=f'NODE-{n}', location='Jakarta')
+            for session in sessions[::2] for n in range(3)
+        ])
+        NetworkMonthlyRuns.rebuild(customers)
+        self.created += count
+
+    def count_queries(self, method, url_name, params):
+        url = reverse(url_name)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            if method == 'POST':
+                response = self.client.post(url, params)
+            else:
+                response = self.client.get(url, params)
+            if response.streaming:
+                # Streamed exports run their queries while the body is produced
+                b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200, url_name)
+        return len(queries)
+
+    def test_query_count_independent_of_customer_count(self):
+        self.add_customers(5)
+        small = [self.count_queries(*endpoint) for endpoint in self.endpoints]
+
+        self.add_customers(495)
+        large = [self.count_queries(*endpoint) for endpoint in self.endpoints]
+
+        for endpoint, small_count, large_count in zip(self.endpoints, small, large):
+            with self.subTest(endpoint=endpoint):
+                self.assertEqual(small_count, large_count)
+                self.assertLessEqual(large_count, self.QUERY_BUDGET)
+
+    def test_dashboard_customers_counts_runs_per_network(self):
+        self.add_customers(5)
+        response = self.client.get(reverse('api_customer_dashboard_customers'))
+        customer = response.json()['customers']['Operator0000']
+
+        self.assertEqual(customer['runs'], 4)
+        self.assertEqual(customer['trackers'], 2)
+        self.assertEqual(customer['node_count'], 6)
+        self.assertEqual(customer['country'], 'Jakarta')
+        self.assertEqual([network['runs'] for network in customer['networks']], [2, 2])
+        self.assertEqual([network['node_count'] for network in customer['networks']], [3, 3])
+
+    def test_snapshot_contains_customer_network_tree(self):
+        self.add_customers(5)
+        response = self.client.get(reverse('api_customer_dashboard_snapshot'))
+        data = response.json()
+
+        self.assertEqual(data['totals'], {'customers': 5, 'networks': 10, 'runs': 20, 'trackers': 10})
+        customer = data['customers'][0]
+        self.assertEqual(customer['name'], 'Operator0000')
+        self.assertEqual([network['name'] for network in customer['networks']], ['North', 'South'])
+        self.assertEqual(len(customer['monthly_runs']), 12)
+        self.assertEqual(sum(customer['monthly_sessions']), sum(
+            sum(network['monthly_sessions']) for network in customer['networks']
+        ))
+
+    def test_exports_are_streamed(self):
+        self.add_customers(3)
+        response = self.client.get(reverse('api_export_excel'), {'format': 'csv'})
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertTrue(lines[0].startswith('Customer,Country,Networks'))
+        self.assertTrue(lines[1].startswith('Operator0000,Jakarta,2 NETWORKS,6,'))
+        self.assertTrue(lines[2].startswith('    North,Jakarta,2 runs,3,'))
+        self.assertEqual(len(lines), 1 + 3 * 3)
+
+        response = self.client.post(reverse('api_customer_dashboard_export'))
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertTrue(lines[4].startswith('Operator0000,Jakarta,2 networks,6,'))
+
+    @skipIf(openpyxl is None, 'openpyxl is not installed')
+    def test_xlsx_export_is_a_valid_workbook(self):
+        self.add_customers(3)
+        response = self.client.get(reverse('api_export_excel'))
+        self.assertTrue(response.streaming)
+        workbook = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(rows[3][0], 'Customer')
+        self.assertEqual(rows[4][:4], ('Operator0000', 'Jakarta', '2 NETWORKS', 6))
+        self.assertEqual(rows[4][-1], 4)
+        self.assertEqual(rows[-4], ('👥 Total Customers:', 3) + (None,) * 17)
+
+    def test_v2_payload_projects_requested_fields(self):
+        self.add_customers(5)
+        url = reverse('api_customer_dashboard_customers_v2')
+        data = self.client.get(url, {'fields': 'name,runs,node_count'}).json()
+
+        self.assertEqual(data['version'], 2)
+        self.assertEqual(data['fields'], ['name', 'runs', 'node_count'])
+        self.assertEqual(data['customers'][0], ['Operator0000', 4, 6])
+        self.assertNotIn('network_fields', data)
+
+        expanded = self.client.get(url, {'fields': 'name', 'expand': 'networks', 'network_fields': 'name,runs'}).json()
+        self.assertEqual(expanded['fields'], ['name', 'networks'])
+        self.assertEqual(expanded['customers'][0], ['Operator0000', [['North', 2], ['South', 2]]])
+
+        v1 = self.client.get(reverse('api_customer_dashboard_customers')).content
+        self.assertLess(len(self.client.get(url).content) * 5, len(v1))
+
+    def test_node_count_is_stored_at_session_completion(self):
+        customer = Customer.objects.create(name='Fresh Operator', network_name='East')
+        session = HealthCheckSession.objects.create(
+            customer=customer, session_id='fresh-1', session_type='REGULAR_PROCESSING', initiated_by=self.user
+        )
+        stdout = '>> Network Size Detected: SMALL (42 nodes)\nHC_TOTAL_NODES=42\nDone\n'
+        session.update_status('COMPLETED', 'done', total_nodes=parse_script_total_nodes(stdout))
+
+        customer.refresh_from_db()
+        self.assertEqual(customer.total_nodes, 42)
+        customer_data = self.client.get(reverse('api_customer_dashboard_customers')).json()['customers']['Fresh Operator']
+        self.assertEqual(customer_data['node_count'], 42)
+        self.assertIsNone(parse_script_total_nodes('no marker here'))
+
+    def test_v2_rejects_unknown_fields(self):
+        response = self.client.get(reverse('api_customer_dashboard_customers_v2'), {'fields': 'name,_debug_monthly_array'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('_debug_monthly_array', response.json()['message'])
+
+    def test_v2_networks_expand_lazily_per_customer(self):
+        self.add_customers(5)
+        url = reverse('api_customer_dashboard_networks_v2', args=['Operator0003'])
+        data = self.client.get(url, {'network_fields': 'name,runs'}).json()
+
+        self.assertEqual(data['customer'], 'Operator0003')
+        self.assertEqual(data['networks'], [['North', 2], ['South', 2]])
+        missing = self.client.get(reverse('api_customer_dashboard_networks_v2', args=['Nobody']))
+        self.assertEqual(missing.status_code, 404)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ResponseCacheTests(TestCase):
+    """Cached dashboard responses are reused until the data version changes"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name='Operator', network_name='North')
+
+    def get_statistics(self, **params):
+        return self.client.get(reverse('api_dashboard_statistics'), params)
+
+    def test_repeated_request_is_served_from_cache(self):
+        first = self.get_statistics()
+        with CaptureQueriesContext(connection) as queries:
+            second = self.get_statistics()
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.json(), second.json())
+        self.assertFalse([q for q in queries if 'healthchecksession' in q['sql'].lower()])
+
+    def test_date_range_is_part_of_the_key(self):
+        self.get_statistics()
+        filtered = self.get_statistics(start_date='2025-01-01', end_date='2025-01-31')
+        self.assertEqual(filtered['X-Cache'], 'MISS')
+
+    def test_session_changes_invalidate_cached_responses(self):
+        self.assertEqual(self.get_statistics().json()['total_runs'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            session = HealthCheckSession.objects.create(
+                customer=self.customer, session_id='run-1', session_type='REGULAR_PROCESSING', initiated_by=self.user
+            )
+        response = self.get_statistics()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['total_runs'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            session.update_status('COMPLETED')
+        self.assertEqual(self.get_statistics().json()['total_trackers'], 1)
+
+    def test_customer_edits_invalidate_cached_responses(self):
+        self.get_statistics()
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.create(name='Second Operator', network_name='South')
+        self.assertEqual(self.get_statistics().json()['total_customers'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer.delete()
+        self.assertEqual(self.get_statistics().json()['total_customers'], 1)
+
+    def test_racing_bumps_never_reuse_a_version(self):
+        stale_version = get_data_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.create(name='Second Operator', network_name='South')
+        self.assertEqual(self.get_statistics().json()['total_customers'], 2)
+
+        # A racing get-then-set bump that read the version before the first one would put back
+        # stale_version + 1. Versions come from the database, so the next change still gets a new one.
+        cache.set(DATA_VERSION_KEY, stale_version)
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.objects.create(name='Third Operator', network_name='East')
+        response = self.get_statistics()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['total_customers'], 3)
+        self.assertEqual(DataVersion.objects.get(key=DATA_VERSION_KEY).version, get_data_version())
+
+    def test_matching_etag_returns_not_modified_without_building_payload(self):
+        first = self.get_statistics()
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('api_dashboard_statistics'), HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+        self.assertFalse([q for q in queries if 'healthchecksession' in q['sql'].lower()])
+
+    def test_streamed_export_gets_validators(self):
+        first = self.client.get(reverse('api_export_excel'), {'format': 'csv'})
+        self.assertTrue(first.streaming)
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+        self.assertIn(b'Operator', b''.join(first.streaming_content))
+
+        response = self.client.get(reverse('api_export_excel'), {'format': 'csv'}, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer.save()
+        response = self.client.get(reverse('api_export_excel'), {'format': 'csv'}, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_with_filters_and_data(self):
+        etag = self.get_statistics()['ETag']
+        filtered = self.client.get(
+            reverse('api_dashboard_statistics'), {'start_date': '2025-01-01', 'end_date': '2025-01-31'},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(filtered.status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer.save()
+        response = self.client.get(reverse('api_dashboard_statistics'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MonthlySessionCountTests(TestCase):
+    """Monthly session counts are bucketed in local time by one grouped query"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        north = Customer.objects.create(name='Operator', network_name='North')
+        south = Customer.objects.create(name='Operator', network_name='South')
+
+        created = [
+            (north, datetime(2025, 3, 31, 23, 30)),  # Still March locally, already the 31st in UTC
+            (south, datetime(2025, 4, 1, 0, 30)),    # April locally, March in UTC
+            (north, datetime(2025, 7, 15, 12, 0)),
+            (north, datetime(2024, 7, 15, 12, 0)),   # Other year
+        ]
+        for i, (customer, local_time) in enumerate(created):
+            session = HealthCheckSession.objects.create(
+                customer=customer, session_id=f'run-{i}', session_type='REGULAR_PROCESSING', initiated_by=self.user
+            )
+            HealthCheckSession.objects.filter(pk=session.pk).update(created_at=timezone.make_aware(local_time))
+
+    def post_monthly_sessions(self, **params):
+        return self.client.post(
+            reverse('api_customer_monthly_sessions'),
+            json.dumps({'customer_name': 'Operator', **params}),
+            content_type='application/json',
+        ).json()
+
+    def test_customer_months_are_dense_and_local(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.post_monthly_sessions(year=2025)
+
+        self.assertEqual(data['monthly_counts'], [0, 0, 1, 1, 0, 0, 1, 0, 0, 0, 0, 0])
+        self.assertEqual(data['monthly_sessions']['4'], 1)
+        self.assertEqual(data['total_sessions'], 3)
+        self.assertEqual(len([q for q in queries if 'healthchecksession' in q['sql'].lower()]), 1)
+
+    def test_customer_months_respect_date_range(self):
+        data = self.post_monthly_sessions(start_date='2025-04-01', end_date='2025-12-31')
+        self.assertEqual(data['monthly_counts'][2:7], [0, 1, 0, 0, 1])
+        self.assertEqual(data['total_sessions'], 2)
+
+    def test_counts_span_year_boundary(self):
+        HealthCheckSession.objects.filter(session_id='run-3').update(
+            created_at=timezone.make_aware(datetime(2024, 12, 5, 9, 0))
+        )
+        sessions = HealthCheckSession.objects.all()
+        self.assertEqual(monthly_session_counts(sessions, date(2024, 11, 1), 6), [0, 1, 0, 0, 1, 1])
+
+
+class CountryReconcileTests(TestCase):
+    """Network countries are detected once and stored; manual countries are kept"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+
+    def test_country_detected_at_network_creation(self):
+        network = Customer.objects.create(name='Maxis', network_name='Central')
+        self.assertEqual(network.country, 'Malaysia')
+        self.assertTrue(network.country_detected)
+
+        migrated = Customer.objects.create(name='Maxis', network_name='North', country='Brunei')
+        self.assertFalse(migrated.country_detected)
+
+    def test_reconcile_uses_reports_and_locations(self):
+        north = Customer.objects.create(name='Operator', network_name='North')
+        south = Customer.objects.create(name='Operator', network_name='South', country='Fiji')
+        session = HealthCheckSession.objects.create(
+            customer=north, session_id='run-1', session_type='REGULAR_PROCESSING', initiated_by=self.user
+        )
+        NodeCoverage.objects.create(customer=north, session=session, node_name='NODE-1', location='Jakarta')
+        self.assertEqual(Customer.reconcile_countries(), 1)
+        north.refresh_from_db()
+        self.assertEqual(north.country, 'Jakarta')
+
+        HealthCheckFile.objects.create(
+            customer=north, file_type='TEC_REPORT', original_filename='Telekom_Malaysia_Reports_20250101.xlsx',
+            stored_filename='report.xlsx', file_path='report.xlsx', file_size=1,
+        )
+        Customer.reconcile_countries(['Operator'])
+        north.refresh_from_db()
+        south.refresh_from_db()
+        self.assertEqual(north.country, 'Malaysia')
+        self.assertEqual(south.country, 'Fiji')
+        self.assertEqual(Customer.reconcile_countries(), 0)
+
+
+class RunCounterTests(TestCase):
+    """Completing a session increments the run counters instead of recounting sessions"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.customer = Customer.objects.create(name='Operator', network_name='North', total_runs=5)
+
+    def complete_session(self, session_id):
+        session = HealthCheckSession.objects.create(
+            customer=self.customer, session_id=session_id, session_type='REGULAR_PROCESSING', initiated_by=self.user
+        )
+        with CaptureQueriesContext(connection) as queries:
+            session.update_status('COMPLETED', 'done')
+        recounts = [q for q in queries if 'count(' in q['sql'].lower() and 'healthchecksession' in q['sql'].lower()]
+        self.assertFalse(recounts)
+        return session
+
+    def test_completion_increments_counters(self):
+        session = self.complete_session('run-1')
+        self.complete_session('run-2')
+
+        self.customer.refresh_from_db()
+        completed = timezone.localtime(session.completed_at)
+        self.assertEqual(self.customer.total_runs, 7)  # Migrated runs are kept
+        self.assertEqual(self.customer.monthly_runs[completed.strftime('%Y-%m')], completed.strftime('%Y-%m-%d'))
+
+        row = NetworkMonthlyRuns.objects.get(customer=self.customer, month=NetworkMonthlyRuns.month_of(session.created_at))
+        self.assertEqual(row.completed_count, 2)
+        self.assertEqual(row.recorded_run, completed.strftime('%Y-%m-%d'))
+
+    def test_repeated_completion_is_counted_once(self):
+        session = self.complete_session('run-1')
+        session.update_status('COMPLETED', 'done again')
+
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.total_runs, 6)
+
+    def test_completion_from_separately_loaded_sessions_is_counted_once(self):
+        session = HealthCheckSession.objects.create(
+            customer=self.customer, session_id='run-1', session_type='REGULAR_PROCESSING', initiated_by=self.user
+        )
+        first, second = HealthCheckSession.objects.get(pk=session.pk), HealthCheckSession.objects.get(pk=session.pk)
+        first.update_status('COMPLETED', 'done')
+        second.update_status('COMPLETED', 'done by the other worker')
+
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.total_runs, 6)
+        row = NetworkMonthlyRuns.objects.get(customer=self.customer, month=NetworkMonthlyRuns.month_of(session.created_at))
+        self.assertEqual(row.completed_count, 1)
+
+
+@override_settings(CACHES=TEST_CACHES, HEALTHCHECK_EXPORT_JOBS_IN_BACKGROUND=False)
+class ExportJobTests(TestCase):
+    """Export jobs write each export once per date range and data version and serve it from disk"""
+
+    def setUp(self):
+        cache.clear()
+        export_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(export_dir.cleanup)
+        self.export_dir = Path(export_dir.name)
+        settings_override = override_settings(HEALTHCHECK_EXPORT_DIR=self.export_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        self.customer = Customer.objects.create(name='Operator', network_name='North', total_runs=2)
+
+    def start_job(self, **params):
+        return self.client.post(reverse('api_export_jobs'), {'format': 'csv', **params})
+
+    def test_job_artefact_is_served_from_disk(self):
+        response = self.start_job()
+        self.assertEqual(response.status_code, 200)
+        job = response.json()
+        self.assertEqual(job['status'], 'ready')
+        self.assertEqual(len(list(self.export_dir.iterdir())), 1)
+
+        self.assertEqual(self.client.get(job['status_url']).json()['status'], 'ready')
+        download = self.client.get(job['download_url'])
+        self.assertIsInstance(download, FileResponse)
+        lines = b''.join(download.streaming_content).decode('utf-8').splitlines()
+        self.assertTrue(lines[1].startswith('Operator,'))
+
+        # The regular export endpoint reuses the artefact, and so does a repeated job request
+        self.assertIsInstance(self.client.get(reverse('api_export_excel'), {'format': 'csv'}), FileResponse)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.start_job().json()['job_id'], job['job_id'])
+        self.assertFalse([q for q in queries if 'healthcheck_app_customer' in q['sql'].lower()])
+
+    def test_date_ranges_get_their_own_artefact(self):
+        first = self.start_job().json()['job_id']
+        second = self.start_job(start_date='2025-01-01', end_date='2025-03-31').json()['job_id']
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(list(self.export_dir.iterdir())), 2)
+
+    def test_data_change_invalidates_artefact(self):
+        old_job = self.start_job().json()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer.save()
+
+        self.assertEqual(self.client.get(old_job['download_url']).status_code, 200)
+        new_job = self.start_job().json()
+        self.assertNotEqual(new_job['job_id'], old_job['job_id'])
+        # Artefacts of the old data version are removed once the new one is written
+        self.assertEqual(self.client.get(old_job['download_url']).status_code, 404)
+        self.assertEqual(len(list(self.export_dir.iterdir())), 1)
+
+    def test_unknown_jobs_and_formats(self):
+        self.assertEqual(self.start_job(format='pdf').status_code, 400)
+        self.assertEqual(self.client.get(reverse('api_export_job_status', args=['csv-1-settings'])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('api_export_job_download', args=['csv-1-0123456789abcdef'])).status_code, 404)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class FileDownloadTests(TestCase):
+    """Downloads resolve their path once and answer Range and conditional requests"""
+
+    def setUp(self):
+        cache.clear()
+        files_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(files_dir.cleanup)
+        self.tracker = Path(files_dir.name) / 'tracker.xlsx'
+        self.tracker.write_bytes(bytes(range(256)) * 4)
+
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        customer = Customer.objects.create(name='Operator', network_name='North')
+        HealthCheckSession.objects.create(
+            customer=customer, session_id='run-1', session_type='REGULAR_PROCESSING', initiated_by=self.user,
+            output_tracker_path=str(self.tracker), output_tracker_filename='Operator_tracker.xlsx',
+        )
+        self.url = reverse('download_tracker_file') + '?session_id=run-1'
+
+    def download(self, **headers):
+        response = self.client.get(self.url, **headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, body
+
+    def test_full_download_and_cached_path(self):
+        response, body = self.download()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, self.tracker.read_bytes())
+        self.assertEqual(response['Content-Length'], '1024')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('Operator_tracker.xlsx', response['Content-Disposition'])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.download()
+        self.assertFalse([q for q in queries if 'healthchecksession' in q['sql'].lower()])
+
+    def test_range_requests(self):
+        response, body = self.download(HTTP_RANGE='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 100-199/1024')
+        self.assertEqual(body, self.tracker.read_bytes()[100:200])
+
+        response, body = self.download(HTTP_RANGE='bytes=-24')
+        self.assertEqual(response['Content-Range'], 'bytes 1000-1023/1024')
+        self.assertEqual(len(body), 24)
+
+        response, _ = self.download(HTTP_RANGE='bytes=2000-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */1024')
+
+        # A stale If-Range validator gets the whole file
+        response, body = self.download(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(body), 1024)
+
+    def test_conditional_requests(self):
+        response, _ = self.download()
+        response, body = self.download(HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(body, b'')
+
+    def test_front_end_server_sends_the_file(self):
+        locations = {str(self.tracker.parent): '/protected/files/'}
+        with override_settings(HEALTHCHECK_DOWNLOAD_BACKEND='nginx', HEALTHCHECK_DOWNLOAD_ACCEL_LOCATIONS=locations):
+            response, body = self.download()
+        self.assertEqual(response['X-Accel-Redirect'], '/protected/files/tracker.xlsx')
+        self.assertEqual(body, b'')
+
+        with override_settings(HEALTHCHECK_DOWNLOAD_BACKEND='xsendfile'):
+            response, _ = self.download()
+        self.assertEqual(response['X-Sendfile'], str(self.tracker.resolve()))
+
+    def test_download_by_filename_for_selected_customer(self):
+        customer = Customer.objects.get(name='Operator')
+        HealthCheckFile.objects.create(
+            customer=customer, file_type='HC_TRACKER', original_filename='Operator_North.xlsx',
+            stored_filename='stored.xlsx', file_path=str(self.tracker), file_size=1024,
+        )
+        session = self.client.session
+        session['selected_customer_id'] = customer.id
+        session.save()
+        response = self.client.get(reverse('download_tracker_file') + '?filename=stored.xlsx')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Operator_North.xlsx', response['Content-Disposition'])
+        self.assertEqual(b''.join(response.streaming_content), self.tracker.read_bytes())
+
+    def test_missing_files(self):
+        self.assertEqual(self.client.get(reverse('download_tracker_file') + '?session_id=nope').status_code, 404)
+        self.tracker.unlink()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SessionBundleTests(TestCase):
+    """All outputs of a session download as one streamed ZIP"""
+
+    def setUp(self):
+        output_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(output_dir.cleanup)
+        self.output_dir = Path(output_dir.name)
+        output_patch = mock.patch('HealthCheck_app.views.downloads.SCRIPT_OUTPUT_DIR', self.output_dir)
+        output_patch.start()
+        self.addCleanup(output_patch.stop)
+
+        tracker = self.output_dir / 'North_HC_Issues_Tracker.xlsx'
+        tracker.write_bytes(b'tracker')
+        for name in ['North_HC_Issues_Tracker_05-Jan-2025.xlsx', 'North_OPEN cases for TAC_05-Jan-2025.xlsx',
+                     'New cases found in_North_Jan05.xlsx', 'Closed in_North_Jan05.xlsx',
+                     'Closed in_South_Jan05.xlsx', 'extracted_hc_test_cases.xlsx']:
+            (self.output_dir / name).write_bytes(name.encode('utf-8'))
+
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        self.customer = Customer.objects.create(name='Operator', network_name='North')
+        # The run took the last ten minutes, the outputs were written just now
+        self.session = self.create_session('run-1', minutes_ago=10, completed=True)
+        self.session.output_tracker_path = str(tracker)
+        self.session.output_tracker_filename = tracker.name
+        self.session.save()
+
+    def create_session(self, session_id, minutes_ago, completed, status='COMPLETED'):
+        session = HealthCheckSession.objects.create(
+            customer=self.customer, session_id=session_id, session_type='REGULAR_PROCESSING',
+            initiated_by=self.user, status=status if completed else 'PROCESSING',
+            completed_at=timezone.now() if completed else None,
+        )
+        HealthCheckSession.objects.filter(pk=session.pk).update(
+            created_at=timezone.now() - timedelta(minutes=minutes_ago)
+        )
+        session.refresh_from_db()
+        return session
+
+    def bundle_names(self, session_id='run-1'):
+        response = self.client.get(reverse('download_session_bundle', args=[session_id]))
+        return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content))).namelist()
+
+    def test_bundle_is_streamed_zip_of_session_outputs(self):
+        response = self.client.get(reverse('download_session_bundle', args=['run-1']))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/zip')
+
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(archive.namelist(), [
+            'North_HC_Issues_Tracker.xlsx', 'North_HC_Issues_Tracker_05-Jan-2025.xlsx',
+            'North_OPEN cases for TAC_05-Jan-2025.xlsx', 'New cases found in_North_Jan05.xlsx',
+            'Closed in_North_Jan05.xlsx',
+        ])
+        self.assertTrue(all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist()))
+        self.assertEqual(archive.read('North_HC_Issues_Tracker.xlsx'), b'tracker')
+        self.assertIsNone(archive.testzip())
+
+    def test_outputs_of_later_runs_are_not_attributed(self):
+        earlier = self.create_session('run-0', minutes_ago=60 * 24, completed=True)
+        HealthCheckSession.objects.filter(pk=earlier.pk).update(
+            completed_at=timezone.now() - timedelta(hours=23),
+            output_tracker_path=self.session.output_tracker_path,
+            output_tracker_filename=self.session.output_tracker_filename,
+        )
+        self.assertEqual(self.bundle_names('run-0'), ['North_HC_Issues_Tracker.xlsx'])
+
+        # Outputs written during the earlier run belong to it
+        old_report = self.output_dir / 'Closed in_North_Jan04.xlsx'
+        old_report.write_bytes(b'old')
+        written = (timezone.now() - timedelta(hours=23, minutes=30)).timestamp()
+        os.utime(old_report, (written, written))
+        self.assertEqual(self.bundle_names('run-0'), ['North_HC_Issues_Tracker.xlsx', 'Closed in_North_Jan04.xlsx'])
+        self.assertIn('Closed in_North_Jan05.xlsx', self.bundle_names())
+
+    def test_outputs_of_concurrent_runs_are_left_out(self):
+        self.create_session('run-2', minutes_ago=5, completed=False)
+        self.assertEqual(self.bundle_names(), ['North_HC_Issues_Tracker.xlsx'])
+
+        # A failed run did not record when it stopped and does not hide outputs
+        HealthCheckSession.objects.filter(session_id='run-2').update(status='FAILED')
+        self.assertEqual(len(self.bundle_names()), 5)
+
+    def test_unfinished_session_bundles_only_its_tracker(self):
+        HealthCheckSession.objects.filter(session_id='run-1').update(completed_at=None, status='PROCESSING')
+        self.assertEqual(self.bundle_names(), ['North_HC_Issues_Tracker.xlsx'])
+
+    def test_session_without_outputs(self):
+        HealthCheckSession.objects.filter(session_id='run-1').update(output_tracker_path='', output_tracker_filename='')
+        self.assertEqual(self.client.get(reverse('download_session_bundle', args=['run-1'])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('download_session_bundle', args=['nope'])).status_code, 404)
+
+
+@override_settings(CACHES=TEST_CACHES, HEALTHCHECK_PROGRESS_POLL_INTERVAL=0.01)
+class SessionProgressTests(TestCase):
+    """Session progress is published on save and streamed as Server-Sent Events without queries"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        customer = Customer.objects.create(name='Operator', network_name='North')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session = HealthCheckSession.objects.create(
+                customer=customer, session_id='run-1', session_type='REGULAR_PROCESSING', initiated_by=self.user
+            )
+
+    def advance(self, step, percentage, status='PROCESSING'):
+        self.session.current_step = step
+        self.session.progress_percentage = percentage
+        self.session.status = status
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session.save()
+
+    def test_saves_publish_steps_with_timings(self):
+        self.advance('Validating files', 15)
+        self.advance('Executing health check script', 25)
+        self.advance('Executing health check script', 50)
+        progress = get_progress('run-1')
+        self.assertEqual(progress['progress_percentage'], 50)
+        self.assertEqual([stage['step'] for stage in progress['stages']],
+                         ['Validating files', 'Executing health check script'])
+        self.assertIsNotNone(progress['stages'][0]['seconds'])
+        self.assertIsNone(progress['stages'][1]['seconds'])
+        self.assertFalse(progress['finished'])
+
+        self.advance('Completed', 100, status='COMPLETED')
+        self.assertTrue(get_progress('run-1')['finished'])
+
+    async def test_events_stream_until_finished(self):
+        await sync_to_async(self.advance)('Completed', 100, status='COMPLETED')
+        await self.async_client.aforce_login(self.user)
+        # The stream is served from the published snapshot, not the session row
+        await HealthCheckSession.objects.filter(session_id='run-1').adelete()
+        response = await self.async_client.get(reverse('session_events', args=['run-1']))
+        events = b''.join([chunk async for chunk in response.streaming_content]).decode('utf-8')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertTrue(events.startswith('id: '))
+        payload = json.loads(events.split('data: ', 1)[1])
+        self.assertEqual(payload['session_status'], 'COMPLETED')
+
+        missing = await self.async_client.get(reverse('session_events', args=['run-2']))
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_stream_follows_new_snapshots(self):
+        events = stream_progress('run-1', last_sequence=1)
+        self.session.current_step = 'Processing outputs'
+        self.session.progress_percentage = 80
+        await sync_to_async(publish_progress)(self.session)
+        first = await events.__anext__()
+        self.assertIn('"progress_percentage": 80', first)
+
+        self.session.status = 'COMPLETED'
+        await sync_to_async(publish_progress)(self.session)
+        last = await events.__anext__()
+        self.assertIn('"finished": true', last)
+        with self.assertRaises(StopAsyncIteration):
+            await events.__anext__()
+
+    def test_anonymous_requests_are_redirected_to_login(self):
+        for name in ('session_status', 'session_events'):
+            response = self.client.get(reverse(name, args=['run-1']))
+            self.assertEqual(response.status_code, 302, name)
+            self.assertIn(settings.LOGIN_URL, response['Location'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TrackerHistoryTests(TestCase):
+    """Tracker history is paginated per folder and built from metadata stored with each file"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        self.customer = Customer.objects.create(name='Operator', network_name='North')
+        session = self.client.session
+        session['selected_customer_id'] = self.customer.id
+        session.save()
+
+    def add_file(self, file_type, filename):
+        return HealthCheckFile.objects.create(
+            customer=self.customer, file_type=file_type, original_filename=filename,
+            stored_filename=filename, file_path=filename, file_size=1,
+        )
+
+    def history(self, **params):
+        return self.client.get(reverse('tracker_history'), params).json()
+
+    def test_metadata_is_stored_on_save(self):
+        report = self.add_file('TEC_REPORT', 'Operator North Report.xlsx')
+        report.refresh_from_db()
+        self.assertEqual(report.history_category, 'reports')
+        self.assertEqual(report.download_url, '/download/report/?filename=Operator+North+Report.xlsx')
+        self.assertEqual(report.upload_date_display, timezone.localtime(report.uploaded_at).strftime('%d/%m/%Y %I:%M %p'))
+
+        # Only HC_Issues_Tracker outputs are listed as trackers
+        self.assertEqual(self.add_file('TRACKER_GENERATED', 'extracted_hc_test_cases.xlsx').history_category, '')
+        self.assertEqual(self.add_file('GLOBAL_IGNORE_TXT', 'ignore.txt').history_category, 'old_trackers')
+
+    def test_folders_are_paginated(self):
+        for i in range(5):
+            self.add_file('TEC_REPORT', f'report-{i}.xlsx')
+        self.add_file('HOST', 'hosts.txt')
+
+        data = self.history(page_size=2)
+        folder = data['customer_folders'][0]
+        self.assertEqual(data['total_files'], 6)
+        self.assertEqual(folder['counts']['reports'], 5)
+        self.assertEqual(len(folder['folders']['reports']), 2)
+        self.assertTrue(data['pagination']['has_more']['reports'])
+        self.assertFalse(data['pagination']['has_more']['host_files'])
+
+        last_page = self.history(category='reports', page=3, page_size=2)
+        self.assertEqual(list(last_page['customer_folders'][0]['folders']), ['reports'])
+        self.assertEqual(len(last_page['customer_folders'][0]['folders']['reports']), 1)
+        self.assertFalse(last_page['pagination']['has_more']['reports'])
+
+        self.assertEqual(self.client.get(reverse('tracker_history'), {'category': 'temp'}).status_code, 400)
+
+    def test_first_page_is_cached_until_files_change(self):
+        self.add_file('HOST', 'hosts.txt')
+        self.history()
+        with CaptureQueriesContext(connection) as queries:
+            self.history()
+        self.assertFalse([q for q in queries if 'healthcheckfile' in q['sql'].lower()])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_file('HOST', 'hosts-2.txt')
+        self.assertEqual(self.history()['customer_folders'][0]['counts']['host_files'], 2)
+
+
+def reference_customer_match(customer_name, filename):
+    """Verdict and error kinds of the original step-by-step customer/filename check"""
+    customer_upper = customer_name.upper().strip()
+    filename_upper = filename.upper().strip()
+    customer_regions = [r for r in filename_matcher.REGIONS if r in customer_upper]
+    file_regions = [r for r in filename_matcher.REGIONS if r in filename_upper]
+    customer_technologies = [t for t in filename_matcher.TECHNOLOGIES if t in customer_upper]
+    file_technologies = [t for t in filename_matcher.TECHNOLOGIES if t in filename_upper]
+
+    errors = []
+    if customer_regions:
+        if not file_regions:
+            errors.append('MISSING REGION')
+        elif not any(c == f for c in customer_regions for f in file_regions):
+            errors.append('WRONG REGION')
+    if customer_technologies:
+        if not file_technologies:
+            errors.append('MISSING TECHNOLOGY')
+        elif not any(c == f for c in customer_technologies for f in file_technologies):
+            errors.append('WRONG TECHNOLOGY')
+    if errors:
+        return False, errors
+
+    customer_words = [w for w in re.findall(r'\b\w{3,}\b', customer_upper) if w not in filename_matcher.EXCLUDED_WORDS]
+    filename_words = [w for w in re.findall(r'\b\w{3,}\b', filename_upper) if w not in filename_matcher.EXCLUDED_WORDS]
+    if not customer_words:
+        return True, []
+    if any(word in fname for word in customer_words for fname in filename_words):
+        return True, []
+    return False, ['CUSTOMER NAME MISMATCH']
+
+
+class FilenameMatcherTests(TestCase):
+    """Upload validation keeps the verdicts of the original customer/filename check"""
+
+    CUSTOMERS = [
+        'BSNL North DWDM', 'Airtel_South_OTN', 'Vodafone Idea', 'Jio', 'TTML Mumbai',
+        'Railtel', 'PowerGrid Eastern Fiber', 'Nokia Delhi', 'MTNL', 'XY',
+    ]
+    FILENAMES = [
+        'BSNL_North_DWDM_HC_Issues_Tracker.xlsx', 'BSNL_South_DWDM_report.csv', 'bsnl_north.csv',
+        'Airtel-South-OTN-Jan.xlsx', 'AIRTEL_SOUTH_SDH.xlsx', 'vodafone_hosts.csv', 'Idea_inventory.xlsx',
+        'JIO_TEC_Report.csv', 'reliance_jio_mumbai.xlsx', 'TTML_MUMBAI_OTN.xlsx', 'ttml_delhi.xlsx',
+        'Railtel_tracker.xlsx', 'powergrid_eastern_fiber.csv', 'POWERGRID_EAST_FIBER.csv',
+        'nokia_delhi_report.xlsx', 'MTNL_data.csv', 'network_report.csv', 'XY.txt', '',
+    ]
+
+    def setUp(self):
+        filename_matcher.customer_profile.cache_clear()
+        filename_matcher._match.cache_clear()
+
+    def test_verdicts_match_original_check(self):
+        for customer_name in self.CUSTOMERS:
+            for filename in self.FILENAMES:
+                with self.subTest(customer=customer_name, filename=filename):
+                    valid, errors = reference_customer_match(customer_name, filename)
+                    result = validate_customer_technology_match(customer_name, filename)
+                    self.assertEqual(result['valid'], valid)
+                    for error in errors:
+                        self.assertIn(error, result['error'])
+
+    def test_mismatch_message(self):
+        result = validate_customer_technology_match('BSNL North DWDM', 'BSNL_South_OTN.xlsx')
+        self.assertFalse(result['valid'])
+        self.assertNotIn('match_info', result)
+        self.assertIn("WRONG REGION: Customer is 'NORTH' region but file is for 'SOUTH' region", result['error'])
+        self.assertIn("WRONG TECHNOLOGY: Customer uses 'DWDM' but file is for 'OTN'", result['error'])
+        self.assertTrue(result['error'].endswith('**?? Expected filename format:** BSNL_NORTH_DWDM_filename.ext'))
+
+    def test_memoized_results_are_independent(self):
+        result = validate_customer_technology_match('Jio', 'JIO_tracker.xlsx')
+        result['valid'] = False
+        self.assertTrue(validate_customer_technology_match('Jio', 'JIO_tracker.xlsx')['valid'])
+
+    def test_bounded_edit_distance(self):
+        self.assertEqual(filename_matcher.edit_distance('KITTEN', 'SITTING'), 3)
+        self.assertEqual(filename_matcher.edit_distance('KITTEN', 'SITTING', limit=3), 3)
+        self.assertEqual(filename_matcher.edit_distance('KITTEN', 'SITTING', limit=1), 2)
+        self.assertEqual(filename_matcher.edit_distance('AIRTEL', 'BHARTIAIRTEL', limit=2), 3)
+        self.assertEqual(filename_matcher.edit_distance('', 'ABC'), 3)
+
+    def test_benchmark_command(self):
+        customer = Customer.objects.create(name='BSNL North DWDM', network_name='North')
+        Customer.objects.create(name='Jio', network_name='Jio')
+        HealthCheckFile.objects.create(
+            customer=customer, file_type='HC_TRACKER', original_filename='BSNL_North_DWDM_tracker.xlsx',
+            stored_filename='tracker.xlsx', file_path='tracker.xlsx', file_size=1,
+        )
+        out = io.StringIO()
+        call_command('hc_benchmark', '--target', 'matcher', '--repeat', '1', stdout=out)
+        self.assertIn('2 pairs', out.getvalue())
+        self.assertIn('Accepted: 1  Rejected: 1', out.getvalue())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class AccessPolicyTests(TestCase):
+    """Profiles are compiled once into a cached policy that is dropped when the profile changes"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('engineer', password='engineer')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile = UserProfile.objects.create(
+                user=self.user, assigned_operators='bsnl, ', assigned_regions='North,East',
+            )
+
+    def test_can_access_customer(self):
+        self.assertEqual(self.profile.can_access_customer('BSNL_North_DWDM'), (True, 'Access granted'))
+        self.assertEqual(self.profile.can_access_customer('Railtel'), (True, 'Access granted'))
+        self.assertEqual(
+            self.profile.can_access_customer('Airtel-North'),
+            (False, 'User assigned to BSNL but customer is AIRTEL'),
+        )
+        can_access, reason = self.profile.can_access_customer('BSNL South')
+        self.assertFalse(can_access)
+        self.assertTrue(reason.endswith('but customer is SOUTH'))
+
+    def test_policy_is_cached_and_invalidated_on_save(self):
+        self.assertFalse(get_access_policy(User.objects.get(pk=self.user.pk)).exempt)
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            policy = get_access_policy(user)
+        self.assertEqual(policy.regions, {'NORTH', 'EAST'})
+
+        self.profile.is_super_user = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+        self.assertEqual(get_access_policy(User.objects.get(pk=self.user.pk)).exempt, 'super_user')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.delete()
+        self.assertEqual(get_access_policy(User.objects.get(pk=self.user.pk)).exempt, 'no_profile')
+
+    def test_filter_accessible(self):
+        customers = [Customer(name=name) for name in ('BSNL North', 'Airtel North', 'Railtel', 'BSNL West', 'Railtel')]
+        self.assertEqual(
+            [customer.name for customer in filter_accessible(self.user, customers)],
+            ['BSNL North', 'Railtel', 'Railtel'],
+        )
+        self.assertEqual(self.profile.filter_accessible(['BSNL East', 'BSNL South']), ['BSNL East'])
+        self.user.is_staff = True
+        self.assertEqual(len(filter_accessible(self.user, customers)), 5)
+
+    def test_region_access_validation(self):
+        result = validate_user_region_access(self.user, 'Airtel North', 'Airtel_North.xlsx')
+        self.assertFalse(result['valid'])
+        self.assertIn('Region Access Denied for engineer', result['error'])
+        self.assertTrue(validate_user_region_access(self.user, 'BSNL North', 'BSNL_North.xlsx')['valid'])
+
+    def test_equal_assignments_share_cache_scope(self):
+        other = User.objects.create_user('other', password='other')
+        with self.captureOnCommitCallbacks(execute=True):
+            UserProfile.objects.create(user=other, assigned_operators='BSNL', assigned_regions='east, north')
+        self.assertEqual(get_access_policy(other).scope, get_access_policy(self.user).scope)
+        self.assertNotEqual(get_access_policy(other).scope, 'all')
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ExcelIndexTests(TestCase):
+    """Tracker discovery and the workbook's customers are only rebuilt when the files change"""
+
+    def setUp(self):
+        cache.clear()
+        clear_excel_index()
+        self.addCleanup(clear_excel_index)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_dir = Path(temp_dir.name)
+        self.script_dir = self.base_dir / 'Script'
+        self.script_dir.mkdir()
+        self.reader = ExcelDataReader(self.base_dir)
+
+    def touch(self, path, mtime):
+        if not path.exists():
+            path.write_bytes(b'')
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_tracker_files_rescanned_only_after_directory_changes(self):
+        self.touch(self.script_dir / 'BSNL_North_DWDM_HC_Issues_Tracker.xlsx', 10**18)
+        os.utime(self.script_dir, ns=(10**18, 10**18))
+        self.assertEqual(
+            [path.name for path in self.reader.get_excel_files()], ['BSNL_North_DWDM_HC_Issues_Tracker.xlsx'],
+        )
+
+        with mock.patch.object(Path, 'glob', side_effect=AssertionError('directory rescanned')):
+            metadata = ExcelDataReader(self.base_dir).get_tracker_files_metadata()
+        self.assertEqual(metadata[0]['customer_name'], 'BSNL')
+        self.assertEqual(metadata[0]['network_type'], 'NORTH Zone DWDM')
+
+        # Only Django's cache survives a restart; the directory is still not rescanned
+        clear_excel_index()
+        with mock.patch.object(Path, 'glob', side_effect=AssertionError('directory rescanned')):
+            self.assertEqual(len(ExcelDataReader(self.base_dir).get_excel_files()), 1)
+
+        (self.script_dir / 'Airtel_Delhi_HC_Tracker.xlsx').write_bytes(b'')
+        (self.script_dir / 'BSNL_North_DWDM_HC_Issues_Tracker.xlsx').unlink()
+        os.utime(self.script_dir, ns=(10**18 + 1, 10**18 + 1))
+        self.assertEqual([path.name for path in self.reader.get_excel_files()], ['Airtel_Delhi_HC_Tracker.xlsx'])
+
+    def test_workbook_read_once_per_version(self):
+        workbook = self.script_dir / 'Health_Check_Tracker_1.xlsx'
+        self.assertEqual(self.reader.get_excel_customers_networks(), {})
+        self.touch(workbook, 10**18)
+        networks = {'BSNL': [{'customer_name': 'BSNL', 'network_type': 'North'}]}
+        with mock.patch.object(ExcelDataReader, '_read_customers_networks', return_value=networks) as read:
+            self.assertEqual(self.reader.get_excel_customers_networks(), networks)
+            self.reader.get_excel_customers_networks()['BSNL'][0]['network_type'] = 'changed'
+            self.assertEqual(self.reader.get_networks_for_customer('excel_bsnl')[0]['network_type'], 'North')
+            self.assertEqual(self.reader.get_unified_customer_choices(), [('excel_bsnl', 'BSNL')])
+            self.assertEqual(read.call_count, 1)
+
+            self.touch(workbook, 10**18 + 1)
+            self.reader.get_excel_customers_networks()
+            self.assertEqual(read.call_count, 2)
+
+
+class ColdStartTests(TestCase):
+    """The views stay importable without loading pandas or openpyxl"""
+
+    def test_parse_importtime(self):
+        output = (
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       100 |        100 |     numpy\n'
+            'import time:        50 |        150 |   pandas\n'
+            'import time:        10 |        160 | HealthCheck_app.views.excel_dashboard\n'
+            'import time:        20 |         20 | HealthCheck_app.urls\n'
+        )
+        self.assertEqual(parse_importtime(output), [
+            ('numpy', 100, 2, 'HealthCheck_app.views.excel_dashboard'),
+            ('pandas', 150, 1, 'HealthCheck_app.views.excel_dashboard'),
+            ('HealthCheck_app.views.excel_dashboard', 160, 0, 'HealthCheck_app.views.excel_dashboard'),
+            ('HealthCheck_app.urls', 20, 0, 'HealthCheck_app.urls'),
+        ])
+
+    def test_views_do_not_import_heavy_libraries(self):
+        out = io.StringIO()
+        call_command('hc_benchmark', '--target', 'imports', '--repeat', '1', '--budget-ms', '100000', stdout=out)
+        heavy = out.getvalue().split('Heavy libraries loaded at start-up:')[1]
+        self.assertNotIn('HealthCheck_app', heavy)
+        self.assertNotIn('pandas', heavy)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CustomerSelectionTests(TestCase):
+    """The landing page renders for a logged-in user"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        Customer.objects.create(name='Operator', network_name='North')
+
+    def test_customer_selection_renders(self):
+        response = self.client.get(reverse('customer_selection'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('selection_form', response.context)
+        self.assertIn('customer_form', response.context)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ChunkedUploadTests(TestCase):
+    """Resumable uploads are appended chunk by chunk, verified and stored like regular uploads"""
+
+    content = b'node,ip\n' + b'NE-1,10.0.0.1\n' * 100
+
+    def setUp(self):
+        base_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(base_dir.cleanup)
+        self.base_dir = Path(base_dir.name)
+        settings_override = override_settings(BASE_DIR=self.base_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        files_patch = mock.patch(
+            'HealthCheck_app.views.chunked_uploads.CUSTOMER_FILES_DIR', self.base_dir / 'customer_files'
+        )
+        files_patch.start()
+        self.addCleanup(files_patch.stop)
+
+        self.user = User.objects.create_user('dashboard', password='dashboard')
+        self.client.force_login(self.user)
+        self.customer = Customer.objects.create(name='Operator', network_name='North')
+
+    def start(self, filename='Operator_Remote_Inventory.csv', **fields):
+        data = {
+            'filename': filename, 'upload_type': 'INVENTORY', 'total_size': len(self.content),
+            'customer_id': self.customer.id, **fields,
+        }
+        return self.client.post(reverse('chunked_upload_start'), json.dumps(data), content_type='application/json')
+
+    def send(self, upload_id, offset, chunk):
+        return self.client.put(
+            reverse('chunked_upload_chunk', args=[upload_id]) + f'?offset={offset}', chunk,
+            content_type='application/octet-stream',
+        )
+
+    def complete(self, upload_id, **fields):
+        return self.client.post(
+            reverse('chunked_upload_complete', args=[upload_id]), json.dumps(fields), content_type='application/json'
+        )
+
+    def test_complete_stores_the_assembled_file(self):
+        upload_id = self.start().json()['upload_id']
+        self.assertEqual(self.send(upload_id, 0, self.content).status_code, 200)
+
+        response = self.complete(upload_id, sha256=hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(response.status_code, 200)
+        stored = HealthCheckFile.objects.get(id=response.json()['file_id'])
+        self.assertEqual(stored.file_type, 'INVENTORY_CSV')
+        self.assertEqual(stored.sha256, hashlib.sha256(self.content).hexdigest())
+        self.assertEqual(Path(stored.file_path).read_bytes(), self.content)
+
+    def test_start_validates_the_filename(self):
+        response = self.start(filename='Remote_Inventory.csv')
+        self.assertEqual(response.status_code, 400)
+        response = self.start(filename='Operator_Remote_Inventory.xlsx')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ChunkedUpload.objects.exists())
+
+    def test_start_rejects_oversized_uploads(self):
+        with mock.patch('HealthCheck_app.views.chunked_uploads.CHUNKED_UPLOAD_MAX_TOTAL_SIZE', len(self.content) - 1):
+            response = self.start()
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(ChunkedUpload.objects.exists())
+        self.assertEqual(self.start().status_code, 200)
+
+    def test_chunks_are_appended_and_resumed_from_the_stored_offset(self):
+        state = self.start().json()
+        self.assertEqual((state['offset'], state['total_size']), (0, len(self.content)))
+        upload_id = state['upload_id']
+
+        self.assertEqual(self.send(upload_id, 0, self.content[:500]).json()['offset'], 500)
+        # A client that lost the reply resends from a stale offset and is told where to resume
+        stale = self.send(upload_id, 0, self.content[:500])
+        self.assertEqual(stale.status_code, 409)
+        self.assertEqual(stale.json()['offset'], 500)
+
+        status = self.client.get(reverse('chunked_upload_status', args=[upload_id])).json()
+        self.assertEqual(status['offset'], 500)
+        self.assertEqual(status['upload_status'], 'UPLOADING')
+
+        # Completing early is refused until every byte has arrived
+        self.assertEqual(self.complete(upload_id).status_code, 409)
+
+        self.assertEqual(self.send(upload_id, 500, self.content[500:]).json()['offset'], len(self.content))
+        self.assertEqual(self.send(upload_id, len(self.content), b'x').status_code, 400)
+        upload = ChunkedUpload.objects.get(upload_id=upload_id)
+        self.assertEqual(upload.get_part_path().read_bytes(), self.content)
+
+    def test_uploads_belong_to_their_user(self):
+        upload_id = self.start().json()['upload_id']
+        self.client.force_login(User.objects.create_user('other', password='other'))
+        self.assertEqual(self.client.get(reverse('chunked_upload_status', args=[upload_id])).status_code, 404)
+        self.assertEqual(self.send(upload_id, 0, self.content).status_code, 404)
+
+    def test_checksum_mismatch_fails_the_upload(self):
+        upload_id = self.start(sha256='0' * 64).json()['upload_id']
+        self.send(upload_id, 0, self.content)
+
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()['upload_status'], 'FAILED')
+        upload = ChunkedUpload.objects.get(upload_id=upload_id)
+        self.assertFalse(upload.get_part_path().exists())
+        self.assertFalse(HealthCheckFile.objects.exists())
+        self.assertEqual(self.send(upload_id, 0, self.content).status_code, 409)
+
+    def test_completing_twice_returns_the_stored_file(self):
+        upload_id = self.start().json()['upload_id']
+        self.send(upload_id, 0, self.content)
+        file_id = self.complete(upload_id).json()['file_id']
+
+        again = self.complete(upload_id)
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.json()['file_id'], file_id)
+        self.assertEqual(HealthCheckFile.objects.count(), 1)
+
+    def start_report(self, report):
+        """Open a REPORT upload for a report that replaces one already stored at the same path"""
+        for target, path in [('customer_files.SCRIPT_DIR', self.base_dir / 'Script'),
+                             ('chunked_uploads.SCRIPT_INPUT_DIR', self.base_dir / 'input-hc-report')]:
+            path_patch = mock.patch(f'HealthCheck_app.views.{target}', path)
+            path_patch.start()
+            self.addCleanup(path_patch.stop)
+        (self.base_dir / 'input-hc-report').mkdir()
+
+        filename = 'Operator_North_Reports_20250105.xlsx'
+        old_path = get_customer_file_path(self.customer, 'TEC', filename)
+        old_path.write_bytes(b'old report')
+        old = HealthCheckFile.objects.create(
+            customer=self.customer, file_type='TEC_REPORT', original_filename=filename,
+            stored_filename=filename, file_path=str(old_path),
+        )
+        state = self.start(filename=filename, upload_type='REPORT', total_size=len(report)).json()
+        self.send(state['upload_id'], 0, report)
+        return state['upload_id'], old
+
+    @skipIf(openpyxl is None, 'openpyxl is required to build report workbooks')
+    def test_completed_report_replaces_the_old_report(self):
+        report = ReportPreflightTests.build_report(self)
+        upload_id, old = self.start_report(report)
+
+        response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 200, response.content)
+        stored = HealthCheckFile.objects.get()
+        self.assertEqual(stored.id, response.json()['file_id'])
+        self.assertEqual(stored.file_path, old.file_path)
+        self.assertEqual(Path(stored.file_path).read_bytes(), report)
+        self.assertEqual((self.base_dir / 'input-hc-report' / stored.stored_filename).read_bytes(), report)
+
+    @skipIf(openpyxl is None, 'openpyxl is required to build report workbooks')
+    def test_failed_finalize_keeps_the_old_report(self):
+        report = ReportPreflightTests.build_report(self)
+        upload_id, old = self.start_report(report)
+
+        with mock.patch('HealthCheck_app.views.chunked_uploads.link_or_copy_file', side_effect=OSError('disk full')):
+            response = self.complete(upload_id)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['upload_status'], 'FAILED')
+        upload = ChunkedUpload.objects.get(upload_id=upload_id)
+        self.assertIn('disk full', upload.error_message)
+        self.assertFalse(upload.get_part_path().exists())
+
+        self.assertEqual(list(HealthCheckFile.objects.all()), [old])
+        self.assertEqual(Path(old.file_path).read_bytes(), b'old report')
+        self.assertEqual(list(Path(old.file_path).parent.iterdir()), [Path(old.file_path)])
+        self.assertFalse(content_store_path(hashlib.sha256(report).hexdigest()).exists())
+        self.assertEqual(self.complete(upload_id).status_code, 409)
+
+
+@skipIf(openpyxl is None or matplotlib is None, 'Script/main.py needs openpyxl and matplotlib')
+class ScriptCheckpointTests(TestCase):
+    """A run of Script/main.py resumed from the filter checkpoint writes what a fresh run writes"""
+
+    script_dir = Path(__file__).resolve().parent.parent / 'Script'
+    header = ['HCId', 'Node IP', 'Location', 'User Label', 'NE Type', 'HC Date', 'Network Name',
+              'Test Case', 'Category', 'Priority', 'Issue', 'Finding']
+
+    def setUp(self):
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        self.work_dir = Path(work_dir.name)
+        (self.work_dir / 'input-hc-report').mkdir()
+        (self.work_dir / 'output').mkdir()
+
+        report = openpyxl.Workbook()
+        cwbp = report.active
+        cwbp.title = 'CWBP'
+        cwbp.append(self.header)
+        for hc_id, hc_date, test_case, priority in [
+            ('3', '20250103', 'opticalPower', 'Warning'), ('1', '20250101', 'fanStatus', 'Failure'),
+            ('2', '20250102', 'ntpSync', 'Info'), ('4', '20250101', 'alarmCheck', 'Failure'),
+            ('5', '20250102', 'diskUsage', 'Warning'),
+        ]:
+            cwbp.append([hc_id, '10.0.0.1', 'Pune', 'NE-1', '1830PSS', hc_date, 'Net', test_case, 'HW',
+                         priority, 'issue', f'{test_case} finding'])
+        report.create_sheet('Network Report Summary').append(['Node', 'Type'])
+        report.save(self.work_dir / 'input-hc-report' / 'Net_Reports_20250105.xlsx')
+        (self.work_dir / 'input-hc-report' / 'Net_inventory.csv').write_text('node,ip\nNE-1,10.0.0.1\n')
+
+        self.ignored_text = self.work_dir / 'Net_ignored_test_cases.txt'
+        self.ignored_text.write_text('alarmCheck\n')
+        ignored = openpyxl.Workbook()
+        main = ignored.active
+        main.title = 'MAIN'
+        main.append(self.header)
+        main.append([5, '10.0.0.1', 'Pune', 'NE-1', '1830PSS', '20250102', 'Net', 'diskUsage', 'HW',
+                     'Warning', 'issue', 'diskUsage finding'])
+        ignored.save(self.work_dir / 'Net_ignored_test_cases.xlsx')
+
+    def run_script(self):
+        """Run main.py up to the missing master tracker, which stops it right after the filter stage"""
+        result = subprocess.run(
+            [sys.executable, str(self.script_dir / 'main.py')], cwd=self.work_dir, capture_output=True, text=True,
+            env={**os.environ, 'PYTHONPATH': str(self.script_dir), 'MPLBACKEND': 'Agg'},
+        )
+        self.assertIn('No HC tracker file found', result.stdout, result.stdout + result.stderr)
+        outputs = {}
+        for name in ['extracted_hc_test_cases.xlsx', 'two_step_extracted.xlsx',
+                     'filtered_from_extracted_hc_test_cases.xlsx', 'ignored_from_extracted_hc_test_cases.xlsx']:
+            workbook = openpyxl.load_workbook(self.work_dir / 'output' / name)
+            outputs[name] = [list(row) for row in workbook.active.iter_rows(values_only=True)]
+        return result.stdout, outputs
+
+    def checkpoint(self):
+        with open(self.work_dir / 'checkpoints' / 'Net_filter.pkl', 'rb') as f:
+            return pickle.load(f)
+
+    def test_resumed_run_matches_fresh_run(self):
+        stdout, fresh_outputs = self.run_script()
+        self.assertNotIn('Resuming from checkpoint', stdout)
+        saved = self.checkpoint()
+        self.assertEqual([row[7] for row in saved['data']['filtered_data']], ['fanStatus', 'opticalPower'])
+        self.assertEqual([row[7] for row in saved['data']['ignored_rows']], ['diskUsage'])
+
+        stdout, resumed_outputs = self.run_script()
+        self.assertIn('Resuming from checkpoint', stdout)
+        self.assertEqual(resumed_outputs, fresh_outputs)
+
+        # Recomputing from scratch gives the rows that were replayed
+        (self.work_dir / 'checkpoints' / 'Net_filter.pkl').unlink()
+        stdout, recomputed_outputs = self.run_script()
+        self.assertNotIn('Resuming from checkpoint', stdout)
+        self.assertEqual(recomputed_outputs, fresh_outputs)
+        recomputed = self.checkpoint()
+        for rows in ['extracted_rows', 'two_step_rows', 'filtered_data', 'ignored_rows']:
+            self.assertEqual(recomputed['data'][rows], saved['data'][rows], rows)
+
+    def test_changed_input_invalidates_checkpoint(self):
+        self.run_script()
+        old_key = self.checkpoint()['key']
+
+        self.ignored_text.write_text('alarmCheck\nopticalPower\n')
+        stdout, outputs = self.run_script()
+        self.assertNotIn('Resuming from checkpoint', stdout)
+        self.assertNotEqual(self.checkpoint()['key'], old_key)
+        self.assertEqual([row[7] for row in outputs['filtered_from_extracted_hc_test_cases.xlsx'][1:]], ['fanStatus'])
+
+
+@skipIf(openpyxl is None, 'openpyxl is required to build report workbooks')
+class ReportPreflightTests(TestCase):
+    """Malformed TEC reports are rejected before processing, without loading the workbook"""
+
+    filename = 'Operator_North_Reports_20250105.xlsx'
+
+    def build_report(self, sheets=('CWBP', 'Network Report Summary')):
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+        if 'CWBP' in sheets:
+            workbook.create_sheet('CWBP').append(
+                ['HCID'] + [f'Column {i}' for i in range(1, report_preflight.CWBP_MIN_COLUMNS)]
+            )
+        if 'Network Report Summary' in sheets:
+            summary = workbook.create_sheet('Network Report Summary')
+            summary.append(['Node', 'HCID'])
+            summary.append(['NE-1', 1])
+            summary.append(['NE-2', 2])
+            summary.append([report_preflight.SUMMARY_END_MARKER, None])
+        report = io.BytesIO()
+        workbook.save(report)
+        return report.getvalue()
+
+    def preflight(self, content):
+        return report_preflight.preflight_validate_report(io.BytesIO(content), self.filename)
+
+    def test_valid_report(self):
+        result = self.preflight(self.build_report())
+        self.assertTrue(result['valid'], result['error'])
+        self.assertEqual(result['metadata'], {
+            'network_name': 'Operator_North', 'report_date': date(2025, 1, 5), 'node_count': 2,
+        })
+
+    def test_non_zip_and_corrupt_uploads(self):
+        result = self.preflight(b'HCID,Node\n1,NE-1\n')
+        self.assertFalse(result['valid'])
+        self.assertIn('not a valid Excel workbook', result['error'])
+
+        content = self.build_report()
+        self.assertFalse(self.preflight(content[:len(content) // 2])['valid'])
+
+    def test_missing_sheets(self):
+        result = self.preflight(self.build_report(sheets=('Network Report Summary',)))
+        self.assertFalse(result['valid'])
+        self.assertIn('missing required sheet(s): CWBP', result['error'])
+
+        result = self.preflight(self.build_report(sheets=('CWBP',)))
+        self.assertIn('missing required sheet(s): Network Report Summary', result['error'])
+
+    def add_member(self, content, name, data):
+        report = io.BytesIO(content)
+        with zipfile.ZipFile(report, 'a', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(name, data)
+        return report.getvalue()
+
+    def test_oversized_member(self):
+        content = self.add_member(self.build_report(), 'xl/media/image1.bin', os.urandom(128 * 1024))
+        with mock.patch.object(report_preflight, 'REPORT_MAX_MEMBER_SIZE', 64 * 1024):
+            result = self.preflight(content)
+        self.assertFalse(result['valid'])
+        self.assertIn("'xl/media/image1.bin' is too large", result['error'])
+
+    def test_decompression_bomb(self):
+        content = self.add_member(
+            self.build_report(), 'xl/worksheets/sheet3.xml', b'\0' * (report_preflight.REPORT_RATIO_CHECK_MIN_SIZE * 2)
+        )
+        self.assertLess(len(content), 1024 * 1024)
+        result = self.preflight(content)
+        self.assertFalse(result['valid'])
+        self.assertIn('expands', result['error'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ContentStoreTests(TestCase):
+    """Uploads are stored once per distinct content and unreferenced blobs are pruned"""
+
+    def setUp(self):
+        base_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(base_dir.cleanup)
+        self.base_dir = Path(base_dir.name)
+        settings_override = override_settings(BASE_DIR=self.base_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def store(self, content, name):
+        return store_uploaded_file(SimpleUploadedFile(name, content), self.base_dir / 'customers' / name)
+
+    def blobs(self):
+        return sorted(path.name for path in get_content_store_dir().glob('??/*'))
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.store(b'tracker rows', 'North_tracker.xlsx')
+        second = self.store(b'tracker rows', 'South_tracker.xlsx')
+
+        self.assertFalse(first['deduplicated'])
+        self.assertTrue(second['deduplicated'])
+        self.assertEqual(first['sha256'], hashlib.sha256(b'tracker rows').hexdigest())
+        self.assertEqual(self.blobs(), [first['sha256']])
+        self.assertTrue(os.path.samefile(first['path'], content_store_path(first['sha256'])))
+        self.assertEqual(second['path'].read_bytes(), b'tracker rows')
+        self.assertFalse(list((get_content_store_dir() / 'tmp').iterdir()))
+
+    def test_distinct_content_gets_distinct_blobs(self):
+        first = self.store(b'north rows', 'North_tracker.xlsx')
+        second = self.store(b'south rows', 'South_tracker.xlsx')
+
+        self.assertNotEqual(first['sha256'], second['sha256'])
+        self.assertEqual(self.blobs(), sorted([first['sha256'], second['sha256']]))
+        self.assertEqual(first['path'].read_bytes(), b'north rows')
+        self.assertEqual(second['path'].read_bytes(), b'south rows')
+
+    def test_link_falls_back_to_copy(self):
+        source = self.base_dir / 'source.xlsx'
+        source.write_bytes(bytes(range(256)) * 64)
+        dest = self.base_dir / 'input' / 'report.xlsx'
+
+        self.assertEqual(link_or_copy_file(source, dest), 'hardlink')
+        self.assertTrue(os.path.samefile(source, dest))
+
+        # Across filesystems (or on filesystems without hardlinks) the bytes are cloned or copied
+        dest.unlink()
+        with mock.patch('HealthCheck_app.file_utils.os.link', side_effect=OSError('cross-device link')):
+            self.assertIn(link_or_copy_file(source, dest), ('reflink', 'copy'))
+            with mock.patch('HealthCheck_app.file_utils._reflink_file', side_effect=OSError('not supported')):
+                self.assertEqual(link_or_copy_file(source, dest), 'copy')
+        self.assertFalse(os.path.samefile(source, dest))
+        self.assertEqual(dest.read_bytes(), source.read_bytes())
+
+        # A copy meant to be edited in place never shares the source's inode
+        self.assertIn(link_or_copy_file(source, dest, allow_hardlink=False), ('reflink', 'copy'))
+        self.assertFalse(os.path.samefile(source, dest))
+
+    def test_prune_keeps_referenced_blobs_and_in_flight_uploads(self):
+        linked = self.store(b'linked', 'linked.xlsx')
+        recorded = self.store(b'recorded', 'recorded.xlsx')
+        orphaned = self.store(b'orphaned', 'orphaned.xlsx')
+        recorded['path'].unlink()
+        orphaned['path'].unlink()
+        customer = Customer.objects.create(name='Operator', network_name='North')
+        HealthCheckFile.objects.create(
+            customer=customer, file_type='HC_TRACKER', original_filename='recorded.xlsx',
+            stored_filename='recorded.xlsx', file_path=str(recorded['path']), file_size=8, sha256=recorded['sha256'],
+        )
+
+        tmp_dir = get_content_store_dir() / 'tmp'
+        in_flight = tmp_dir / 'upload.part'
+        in_flight.write_bytes(b'partial')
+        crashed = tmp_dir / 'crashed.part'
+        crashed.write_bytes(b'partial')
+        two_days_ago = (timezone.now() - timedelta(days=2)).timestamp()
+        os.utime(crashed, (two_days_ago, two_days_ago))
+
+        removed = prune_content_store()
+
+        self.assertEqual(sorted(Path(path).name for path in removed), sorted([orphaned['sha256'], 'crashed.part']))
+        self.assertEqual(self.blobs(), sorted([linked['sha256'], recorded['sha256']]))
+        self.assertTrue(in_flight.exists())
+
+    def test_deep_integrity_check_rehashes_content(self):
+        customer = Customer.objects.create(name='Operator', network_name='North')
+        records = {}
+        for name in ['intact.xlsx', 'rewritten.xlsx', 'truncated.xlsx']:
+            stored = self.store(name.encode() * 4, name)
+            records[name] = HealthCheckFile.objects.create(
+                customer=customer, file_type='HC_TRACKER', original_filename=name, stored_filename=name,
+                file_path=str(stored['path']), file_size=stored['size'], sha256=stored['sha256'],
+            )
+        rewritten = Path(records['rewritten.xlsx'].file_path)
+        rewritten.write_bytes(rewritten.read_bytes()[::-1])
+        Path(records['truncated.xlsx'].file_path).write_bytes(b'cut')
+
+        shallow = verify_file_integrity(customer)
+        self.assertEqual([f['filename'] for f in shallow['corrupted_files']], ['truncated.xlsx'])
+
+        deep = verify_file_integrity(customer, deep=True)
+        self.assertEqual(sorted(f['filename'] for f in deep['corrupted_files']), ['rewritten.xlsx', 'truncated.xlsx'])
+        self.assertEqual(deep['corrupted_count'], 2)
+        self.assertEqual(deep['missing_count'], 0)
+
+
+class MigrationBackfillTests(TransactionTestCase):
+    """Data migrations backfill from the historical models, not from the current app code"""
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([('HealthCheck_app', target)])
+        return executor.loader.project_state([('HealthCheck_app', target)]).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_monthly_runs_backfill(self):
+        apps = self.migrate('0011_healthcheckfile_report_metadata')
+        Customer = apps.get_model('HealthCheck_app', 'Customer')
+        HealthCheckSession = apps.get_model('HealthCheck_app', 'HealthCheckSession')
+        HealthCheckFile = apps.get_model('HealthCheck_app', 'HealthCheckFile')
+        user = apps.get_model('auth', 'User').objects.create(username='dashboard')
+        customer = Customer.objects.create(name='Operator', network_name='North', monthly_runs={'2025-02': '2025-02-14'})
+        for session_id, status in [('run-1', 'COMPLETED'), ('run-2', 'FAILED')]:
+            session = HealthCheckSession.objects.create(
+                customer=customer, session_id=session_id, session_type='REGULAR_PROCESSING', status=status,
+                initiated_by=user,
+            )
+            HealthCheckSession.objects.filter(pk=session.pk).update(created_at=timezone.make_aware(datetime(2025, 1, 10, 12)))
+        HealthCheckFile.objects.create(
+            customer=customer, session=HealthCheckSession.objects.get(session_id='run-1'), file_type='TEC_REPORT',
+            original_filename='North_Reports_20250110.xlsx', stored_filename='North_Reports_20250110.xlsx',
+            file_path='', report_node_count=42,
+        )
+
+        apps = self.migrate('0012_networkmonthlyruns')
+        rows = apps.get_model('HealthCheck_app', 'NetworkMonthlyRuns').objects.order_by('month')
+        self.assertEqual(
+            [(row.month, row.session_count, row.completed_count, row.node_count, row.recorded_run) for row in rows],
+            [(date(2025, 1, 1), 2, 1, 42, ''), (date(2025, 2, 1), 0, 0, 0, '2025-02-14')],
+        )
+
+    def test_history_metadata_backfill(self):
+        apps = self.migrate('0014_customer_country_detected')
+        Customer = apps.get_model('HealthCheck_app', 'Customer')
+        HealthCheckFile = apps.get_model('HealthCheck_app', 'HealthCheckFile')
+        customer = Customer.objects.create(name='Operator', network_name='North')
+        for file_type, filename in [('TEC_REPORT', 'North Reports.xlsx'), ('HC_TRACKER', 'North_HC_Issues_Tracker.xlsx'),
+                                    ('HC_TRACKER', 'notes.xlsx')]:
+            HealthCheckFile.objects.create(
+                customer=customer, file_type=file_type, original_filename=filename, stored_filename=filename, file_path='',
+            )
+
+        apps = self.migrate('0015_healthcheckfile_history_metadata')
+        files = apps.get_model('HealthCheck_app', 'HealthCheckFile').objects.order_by('pk')
+        self.assertEqual([(f.history_category, f.download_url) for f in files], [
+            ('reports', '/download/report/?filename=North+Reports.xlsx'),
+            ('old_trackers', '/download/tracker/?filename=North_HC_Issues_Tracker.xlsx'),
+            ('', '/download/tracker/?filename=notes.xlsx'),
+        ])
+        # The snapshot in the migration agrees with what new files get on save
+        self.assertEqual(
+            [f.download_url for f in files],
+            [file_history_metadata(f.file_type, f.stored_filename, f.uploaded_at)['download_url'] for f in files],
+        )
+        self.assertTrue(all(f.upload_date_display for f in files))
@@ -31,6 +31,7 @@ urlpatterns = [
     path('download/report/', views.download_report_file, name='download_report_file'),
     path('download/inventory/', views.download_inventory_file, name='download_inventory_file'),
     path('download/host/', views.download_host_file, name='download_host_file'),
+    path('download/session/<str:session_id>/bundle/', views.download_session_bundle, name='download_session_bundle'),
     
     # Individual Folder Upload Endpoints
     path('upload-host/', views.upload_host_file, name='upload_host_file'),
@@ -41,9 +42,16 @@ urlpatterns = [
     path('upload-ignore-excel/', views.upload_ignore_excel_file, name='upload_ignore_excel_file'),
     path('upload-ignore-text/', views.upload_ignore_text_file, name='upload_ignore_text_file'),
     
+    # Resumable Chunked Upload Endpoints (large TEC reports / inventories)
+    path('api/chunked-upload/start/', views.chunked_upload_start, name='chunked_upload_start'),
+    path('api/chunked-upload/<str:upload_id>/', views.chunked_upload_status, name='chunked_upload_status'),
+    path('api/chunked-upload/<str:upload_id>/chunk/', views.chunked_upload_chunk, name='chunked_upload_chunk'),
+    path('api/chunked-upload/<str:upload_id>/complete/', views.chunked_upload_complete, name='chunked_upload_complete'),
+    
     # API Endpoints
     path('api/validate-filename/', views.validate_filename, name='validate_filename'),
     path('api/session-status/<str:session_id>/', views.session_status, name='session_status'),
+    path('api/session-events/<str:session_id>/', views.session_events, name='session_events'),
     path('get-customer-networks/<int:customer_id>/', views.get_customer_networks, name='get_customer_networks'),
     path('api/networks/<str:customer_name>/', views.get_networks_for_customer, name='get_networks_for_customer'),
     path('api/excel-networks/', views.get_excel_networks, name='get_excel_networks'),
@@ -66,10 +74,16 @@ urlpatterns = [
     path('api/customer-dashboard/customers/', views.api_customer_dashboard_customers, name='api_customer_dashboard_customers'),
     path('api/customer-dashboard/statistics/', views.api_customer_dashboard_statistics, name='api_customer_dashboard_statistics'),
     path('api/customer-dashboard/export/', views.api_customer_dashboard_export, name='api_customer_dashboard_export'),
+    path('api/customer-dashboard/snapshot/', views.api_customer_dashboard_snapshot, name='api_customer_dashboard_snapshot'),
+    path('api/v2/customer-dashboard/customers/', views.api_customer_dashboard_customers_v2, name='api_customer_dashboard_customers_v2'),
+    path('api/v2/customer-dashboard/customers/<str:customer_name>/networks/', views.api_customer_dashboard_networks_v2, name='api_customer_dashboard_networks_v2'),
     path('api/customer-dashboard/update-network/', views.update_customer_network, name='update_customer_network'),
     
     # Excel Export API
     path('api/export-excel/', views.api_export_excel, name='api_export_excel'),
+    path('api/export-jobs/', views.api_export_jobs, name='api_export_jobs'),
+    path('api/export-jobs/<str:job_id>/', views.api_export_job_status, name='api_export_job_status'),
+    path('api/export-jobs/<str:job_id>/download/', views.api_export_job_download, name='api_export_job_download'),
     path('api/simple-export-test/', views.simple_export_test, name='simple_export_test'),
     
     # Real Data APIs for Monthly and Network Sessions
@@ -1,15224 +0,0 @@
-﻿import os
-
-import uuid
-
-import sys
-
-import shutil
-
-import subprocess
-
-import re
-
-import csv
-
-import io
-
-from datetime import datetime
-
-from django.utils import timezone
-
-from pathlib import Path
-
-
-
-from django.shortcuts import render, redirect, get_object_or_404
-
-from django.http import JsonResponse, HttpResponse, FileResponse
-from django.views.decorators.http import require_http_methods
-from django.views.decorators.csrf import csrf_exempt
-
-# Excel handling imports
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
-except ImportError:
-    print("Warning: openpyxl not installed. Excel creation will use fallback.")
-
-from django.contrib.auth import authenticate, login, logout
-
-from django.contrib.auth.models import User
-
-from django.contrib.auth.decorators import login_required
-
-from django.contrib import messages
-
-from django.conf import settings
-
-# Excel integration imports
-try:
-    from .excel_integration import (
-        get_excel_integration, 
-        get_customer_networks_unified,
-        integrate_excel_with_database_choices
-    )
-    EXCEL_INTEGRATION_AVAILABLE = True
-except ImportError:
-    print("Warning: Excel integration not available")
-    EXCEL_INTEGRATION_AVAILABLE = False
-
-
-
-from .models import (
-
-    Customer, HealthCheckSession, HealthCheckFile, 
-
-    NodeCoverage, ServiceCheck
-
-)
-
-from .forms import (
-
-    CustomerSelectionForm, CustomerCreationForm, 
-
-    HealthCheckNewNetworkForm, HealthCheckExistingNetworkForm
-
-)
-
-# Helper function for monthly runs formatting
-def format_monthly_runs_to_array(monthly_runs_dict):
-    """
-    Convert monthly_runs dict to 12-element array format
-    Input: {'2025-01': '2025-01-08', '2025-02': '2025-02-01', ...}
-    Output: ['08-01', '01-02', '03-03', '-', '-', '-', '-', '-', '-', '-', '-', '-']
-    
-    Handles special cases:
-    - '2025-01-08' -> '08-01'
-    - 'Not Started' -> 'Not Started' 
-    - 'No Report' -> 'No Report'
-    - 'Not Run' -> 'Not Run'
-    """
-    if not monthly_runs_dict or not isinstance(monthly_runs_dict, dict):
-        return ['-'] * 12
-    
-    monthly_array = ['-'] * 12  # Initialize 12 months as empty
-    
-    for month_key, date_value in monthly_runs_dict.items():
-        try:
-            # Parse the month from key like '2025-01' -> month 1 (index 0)
-            year_month = month_key.split('-')
-            if len(year_month) == 2:
-                month_num = int(year_month[1])  # Get month number (1-12)
-                if 1 <= month_num <= 12:
-                    month_index = month_num - 1  # Convert to 0-based index
-                    
-                    # Handle different date value formats
-                    if not date_value or date_value in ['-', '', 'null', 'None']:
-                        monthly_array[month_index] = '-'
-                    elif date_value in ['Not Started', 'Not Run', 'No Report']:
-                        # Keep status messages as-is
-                        monthly_array[month_index] = date_value
-                    elif isinstance(date_value, str) and len(date_value) >= 10 and '-' in date_value:
-                        # Parse full date like '2025-01-08'
-                        date_parts = date_value.split('-')
-                        if len(date_parts) >= 3:
-                            try:
-                                day = date_parts[2]
-                                month = date_parts[1] 
-                                # Format as DD-MM
-                                monthly_array[month_index] = f"{day}-{month}"
-                            except (ValueError, IndexError):
-                                monthly_array[month_index] = str(date_value)
-                        else:
-                            monthly_array[month_index] = str(date_value)
-                    else:
-                        # For any other format, use as-is
-                        monthly_array[month_index] = str(date_value)
-        except (ValueError, IndexError) as e:
-            print(f"⚠️ Error processing {month_key}: {date_value} -> {e}")
-            continue
-    
-    return monthly_array
-
-# Try to import script_helper, fallback if not available
-try:
-    from .script_helper import execute_health_check_script, ScriptExecutor
-
-except ImportError:
-
-    # Fallback implementations
-
-    def execute_health_check_script(customer_name):
-
-        """Fallback implementation for script execution"""
-
-        return {
-
-            'success': False,
-
-            'error': 'Script helper not available - using fallback'
-
-        }
-
-    
-
-    class ScriptExecutor:
-
-        pass
-
-
-
-# === Directory Setup ===
-
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-
-# Ensure we're using the correct base directory - no case sensitivity fixes needed for hc_final
-
-print(f"DEBUG: Detected BASE_DIR = {BASE_DIR}")
-
-print(f"DEBUG: Script directory exists: {(BASE_DIR / 'Script').exists()}")
-
-
-
-SCRIPT_DIR = BASE_DIR / "Script"
-
-SCRIPT_INPUT_DIR = SCRIPT_DIR / "input-hc-report"
-
-SCRIPT_OUTPUT_DIR = SCRIPT_DIR / "output"
-
-CUSTOMER_FILES_DIR = SCRIPT_DIR / "customer_files"
-
-
-
-# Debug: Print actual paths to verify they're correct
-
-print(f"DEBUG: BASE_DIR = {BASE_DIR}")
-
-print(f"DEBUG: SCRIPT_DIR = {SCRIPT_DIR}")
-
-print(f"DEBUG: SCRIPT_OUTPUT_DIR = {SCRIPT_OUTPUT_DIR}")
-
-
-
-# Ensure directories exist
-
-os.makedirs(SCRIPT_INPUT_DIR, exist_ok=True)
-
-os.makedirs(SCRIPT_OUTPUT_DIR, exist_ok=True)
-
-
-
-
-
-# === Authentication Views ===
-
-def user_login(request):
-    """User login view"""
-    
-    # If user is already authenticated, redirect to customer selection
-    if request.user.is_authenticated:
-        return redirect('customer_selection')
-    
-    # Handle login form submission
-    if request.method == "POST":
-        username = request.POST.get("username")
-        password = request.POST.get("password")
-        
-        # Authenticate the user
-        user = authenticate(request, username=username, password=password)
-        
-        if user is not None:
-            # Login successful
-            login(request, user)
-            messages.success(request, f"Welcome back, {user.username}!")
-            
-            # Get the next URL or default to customer_selection
-            next_url = request.GET.get('next', 'customer_selection')
-            return redirect(next_url)
-        else:
-            # Login failed
-            messages.error(request, "Invalid username or password. Please try again.")
-            return render(request, "login.html", {"error": "Invalid credentials"})
-    
-    # GET request - show login form
-    return render(request, "login.html")
-
-
-
-
-
-def user_register(request):
-
-    """User registration view"""
-
-    if request.user.is_authenticated:
-
-        return redirect('customer_selection')
-
-
-
-    if request.method == "POST":
-
-        username = request.POST.get("username")
-
-        email = request.POST.get("email")
-
-        password = request.POST.get("password")
-
-        password_confirm = request.POST.get("password_confirm")
-
-
-
-        if password != password_confirm:
-
-            return render(request, "register.html", {"error": "Passwords do not match."})
-
-
-
-        if User.objects.filter(username=username).exists():
-
-            return render(request, "register.html", {"error": "Username already taken."})
-
-
-
-        User.objects.create_user(username=username, email=email, password=password)
-
-        messages.success(request, "Account created successfully! Please log in.")
-
-        return redirect("login")
-
-
-
-    return render(request, "register.html")
-
-
-
-
-
-def user_logout(request):
-
-    """User logout view"""
-
-    logout(request)
-
-    return redirect('login')
-
-
-
-
-
-# === Customer Statistics Helper Functions ===
-
-def get_customer_statistics():
-
-    """Calculate customer statistics for the sidebar with per-customer details"""
-
-    from django.db.models import Count, Max, Q
-
-    from datetime import datetime, timedelta
-
-    
-
-    # Get all active customers grouped by name
-
-    customers_with_networks = Customer.get_customers_with_networks()
-
-    
-
-    # Total registered customers (unique names)
-
-    total_registered_customers = len(customers_with_networks)
-
-    
-
-    # Total networks across all customers
-
-    total_networks = sum(len(networks) for networks in customers_with_networks.values())
-
-    
-
-    # Get all active customers for session analysis
-
-    all_customers = Customer.objects.filter(is_deleted=False)
-
-    customer_ids = list(all_customers.values_list('id', flat=True))
-
-    
-
-    # Get session statistics
-
-    total_sessions = HealthCheckSession.objects.filter(
-
-        customer_id__in=customer_ids
-
-    ).count()
-
-    
-
-    # Get last session information
-
-    last_session = HealthCheckSession.objects.filter(
-
-        customer_id__in=customer_ids
-
-    ).order_by('-created_at').first()
-
-    
-
-    # Get tracker generation statistics
-
-    completed_sessions = HealthCheckSession.objects.filter(
-
-        customer_id__in=customer_ids,
-
-        status='COMPLETED'
-
-    ).count()
-
-    
-
-    # Get trackers generated in the last 30 days
-
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-
-    recent_trackers = HealthCheckSession.objects.filter(
-
-        customer_id__in=customer_ids,
-
-        status='COMPLETED',
-
-        completed_at__gte=thirty_days_ago
-
-    ).count()
-
-    
-
-    # Get customer names list (first 10 for display)
-
-    customer_names = list(customers_with_networks.keys())[:10]
-
-    
-
-    # Get recent sessions for activity display
-
-    recent_sessions = HealthCheckSession.objects.filter(
-
-        customer_id__in=customer_ids
-
-    ).select_related('customer').order_by('-created_at')[:5]
-
-    
-
-    # NEW: Calculate per-customer statistics
-
-    per_customer_stats = {}
-
-    
-
-    for customer_name, networks in customers_with_networks.items():
-
-        # Get all customer IDs for this customer name
-
-        customer_network_ids = [network.id for network in networks]
-
-        
-
-        # Count runs (total sessions) for this customer
-
-        customer_runs = HealthCheckSession.objects.filter(
-
-            customer_id__in=customer_network_ids
-
-        ).count()
-
-        
-
-        # Count trackers generated (completed sessions) for this customer
-
-        customer_trackers = HealthCheckSession.objects.filter(
-
-            customer_id__in=customer_network_ids,
-
-            status='COMPLETED'
-
-        ).count()
-
-        
-
-        # Get last run date for this customer
-
-        last_session = HealthCheckSession.objects.filter(
-
-            customer_id__in=customer_network_ids
-
-        ).order_by('-created_at').first()
-
-        
-
-        last_run_date = None
-
-        if last_session:
-
-            last_run_date = last_session.created_at
-
-        
-
-        # Store per-customer statistics
-
-        per_customer_stats[customer_name] = {
-
-            'runs': customer_runs,
-
-            'trackers': customer_trackers,
-
-            'networks_count': len(networks),
-
-            'last_run_date': last_run_date
-
-        }
-
-    
-
-    return {
-
-        'total_registered_customers': total_registered_customers,
-
-        'total_networks': total_networks,
-
-        'customer_names': customer_names,
-
-        'total_customer_names': len(customers_with_networks),
-
-        'total_runs': total_sessions,
-
-        'last_run': last_session,
-
-        'trackers_generated': completed_sessions,
-
-        'recent_trackers': recent_trackers,
-
-        'recent_sessions': recent_sessions,
-
-        'customers_with_networks': customers_with_networks,
-
-        'per_customer_stats': per_customer_stats
-
-    }
-
-
-
-# === Customer Management Views ===
-
-@login_required
-
-def customer_selection(request):
-
-    """Enhanced Customer/Network selection view with network support"""
-
-    if request.method == "POST":
-
-        # Handle specific customer network removal (AJAX request) - remove specific network of specific customer
-
-        if 'remove_customer_network' in request.POST:
-
-            customer_name = request.POST.get('customer_name')
-
-            network_id = request.POST.get('network_id')
-
-            
-
-            if not customer_name or not network_id:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': 'Both customer name and network ID are required.'
-
-                })
-
-            
-
-            try:
-
-                # Find the specific network for this customer
-
-                network = Customer.objects.get(
-
-                    id=network_id, 
-
-                    name=customer_name, 
-
-                    is_deleted=False
-
-                )
-
-                
-
-                # ??? DELETE NETWORK FOLDER STRUCTURE FROM DISK
-
-                try:
-
-                    folder_deleted = delete_customer_folder_structure(network)
-
-                    if folder_deleted:
-
-                        print(f"? Successfully deleted folder structure for network: {network.display_name}")
-
-                    else:
-
-                        print(f"?? Warning: Could not delete folder structure for {network.display_name}")
-
-                except Exception as folder_error:
-
-                    print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
-
-                    # Don't fail the network removal if folder deletion fails
-
-                
-
-                # Mark network as deleted in database
-
-                network.is_deleted = True
-
-                network.save()
-                
-                # SYNC WITH EXCEL TRACKER - Remove network
-                try:
-                    remove_customer_from_excel_tracker(customer_name, network.network_name or network.name)
-                except Exception as excel_error:
-                    print(f"⚠️ Warning: Could not sync network removal with Excel: {excel_error}")
-
-                
-
-                # If this was the selected network, clear session
-
-                if request.session.get('selected_customer_id') == network.id:
-
-                    if 'selected_customer_id' in request.session:
-
-                        del request.session['selected_customer_id']
-
-                    if 'selected_customer_name' in request.session:
-
-                        del request.session['selected_customer_name']
-
-                
-
-                # Check if this was the last network for this customer
-
-                remaining_networks = Customer.objects.filter(
-
-                    name=customer_name, 
-
-                    is_deleted=False
-
-                ).count()
-
-                
-
-                if remaining_networks == 0:
-
-                    success_message = f'Network "{network.display_name}" has been removed successfully. This was the last network for customer "{customer_name}".'
-
-                else:
-
-                    success_message = f'Network "{network.display_name}" has been removed successfully. Customer "{customer_name}" still has {remaining_networks} remaining network(s).'
-
-                
-
-                return JsonResponse({
-
-                    'status': 'success',
-
-                    'message': success_message,
-
-                    'remaining_networks': remaining_networks,
-
-                    'customer_name': customer_name
-
-                })
-
-                
-
-            except Customer.DoesNotExist:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': f'Network not found for customer "{customer_name}" with the specified ID.'
-
-                })
-
-            except Exception as e:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': f'Error removing network: {str(e)}'
-
-                })
-
-        
-
-        # Handle network removal (AJAX request) - individual network (legacy support)
-
-        elif 'remove_network' in request.POST:
-
-            network_id = request.POST.get('remove_network')
-
-            try:
-
-                network = Customer.objects.get(id=network_id, is_deleted=False)
-
-                
-
-                # ??? DELETE NETWORK FOLDER STRUCTURE FROM DISK
-
-                try:
-
-                    folder_deleted = delete_customer_folder_structure(network)
-
-                    if folder_deleted:
-
-                        print(f"? Successfully deleted folder structure for network: {network.display_name}")
-
-                    else:
-
-                        print(f"?? Warning: Could not delete folder structure for {network.display_name}")
-
-                except Exception as folder_error:
-
-                    print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
-
-                    # Don't fail the network removal if folder deletion fails
-
-                
-
-                # Mark network as deleted in database
-
-                network.is_deleted = True
-
-                network.save()
-
-                
-
-                # If this was the selected network, clear session
-
-                if request.session.get('selected_customer_id') == network.id:
-
-                    if 'selected_customer_id' in request.session:
-
-                        del request.session['selected_customer_id']
-
-                    if 'selected_customer_name' in request.session:
-
-                        del request.session['selected_customer_name']
-
-                
-
-                return JsonResponse({
-
-                    'status': 'success',
-
-                    'message': f'Network "{network.display_name}" has been removed successfully.'
-
-                })
-
-            except Customer.DoesNotExist:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': 'Network not found.'
-
-                })
-
-            except Exception as e:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': f'Error removing network: {str(e)}'
-
-                })
-
-        
-
-        # Handle customer removal (AJAX request) - all networks
-
-        elif 'remove_customer' in request.POST:
-
-            customer_name = request.POST.get('remove_customer')
-
-            try:
-
-                # For health check, we remove all networks for the customer name
-
-                networks = Customer.objects.filter(name=customer_name, is_deleted=False)
-
-                if not networks.exists():
-
-                    return JsonResponse({
-
-                        'status': 'error',
-
-                        'message': f'Customer "{customer_name}" not found.'
-
-                    })
-
-                
-
-                # Remove all networks for this customer
-
-                removed_count = 0
-
-                for network in networks:
-
-                    # ??? DELETE CUSTOMER FOLDER STRUCTURE FROM DISK
-
-                    try:
-
-                        folder_deleted = delete_customer_folder_structure(network)
-
-                        if folder_deleted:
-
-                            print(f"? Successfully deleted folder structure for customer: {network.display_name}")
-
-                        else:
-
-                            print(f"?? Warning: Could not delete folder structure for {network.display_name}")
-
-                    except Exception as folder_error:
-
-                        print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
-
-                        # Don't fail the customer removal if folder deletion fails
-
-                    
-
-                    # Mark customer as deleted in database
-
-                    network.is_deleted = True
-
-                    network.save()
-
-                    
-
-                    # If this was the selected customer, clear session
-
-                    if request.session.get('selected_customer_id') == network.id:
-
-                        if 'selected_customer_id' in request.session:
-
-                            del request.session['selected_customer_id']
-
-                        if 'selected_customer_name' in request.session:
-
-                            del request.session['selected_customer_name']
-
-                    
-
-                    removed_count += 1
-
-                # SYNC WITH EXCEL TRACKER - Remove all networks for customer
-                try:
-                    remove_customer_from_excel_tracker(customer_name)
-                except Exception as excel_error:
-                    print(f"⚠️ Warning: Could not sync customer removal with Excel: {excel_error}")
-
-                
-
-                return JsonResponse({
-
-                    'status': 'success',
-
-                    'message': f'Customer "{customer_name}" and all {removed_count} associated networks have been removed successfully.'
-
-                })
-
-            except Customer.DoesNotExist:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': 'Network not found.'
-
-                })
-
-            except Exception as e:
-
-                return JsonResponse({
-
-                    'status': 'error',
-
-                    'message': f'Error removing network: {str(e)}'
-
-                })
-
-        
-
-        # Handle customer selection (main form submission)
-
-        elif 'select_customer' in request.POST:
-
-            customer_id = request.POST.get('customer')
-
-            network_id = request.POST.get('network')
-
-            
-
-            if not customer_id:
-                messages.error(request, 'Please select a customer.')
-                return redirect('customer_selection')
-            
-            # Handle Excel customers
-            if EXCEL_INTEGRATION_AVAILABLE and customer_id.startswith('excel_'):
-                try:
-                    # Handle Excel customer selection
-                    customer_name = customer_id.replace('excel_', '').replace('_', ' ').title()
-                    
-                    # Store Excel customer information in session
-                    request.session['selected_customer_id'] = customer_id
-                    request.session['selected_customer_name'] = customer_name
-                    request.session['selected_customer_source'] = 'excel'
-                    
-                    if network_id and network_id.startswith('excel_network_'):
-                        # Get network details from Excel integration
-                        networks, _ = get_customer_networks_unified(customer_id)
-                        network_index = int(network_id.replace('excel_network_', ''))
-                        
-                        if 0 <= network_index < len(networks):
-                            selected_network = networks[network_index]
-                            network_name = selected_network.get('network_type', 'HealthCheck')
-                            request.session['selected_network_info'] = {
-                                'filename': selected_network.get('filename', ''),
-                                'file_path': selected_network.get('file_path', ''),
-                                'network_type': network_name,
-                                'network_name': network_name,  # Store network name for display
-                                'source': 'excel'
-                            }
-                            # Update customer name to include network
-                            request.session['selected_customer_name'] = f"{customer_name} {network_name}"
-                    
-                    # Redirect to normal dashboard for Excel customers
-                    return redirect('dashboard')
-                    
-                except Exception as e:
-                    messages.error(request, f'Error selecting Excel customer: {str(e)}')
-                    return redirect('customer_selection')
-            
-            # Handle database customers (existing logic)
-            try:
-
-                # If network_id is provided and not empty, use that specific network
-
-                if network_id and network_id.strip():
-
-                    customer = Customer.objects.get(id=network_id, is_deleted=False)
-
-                else:
-
-                    # Use the selected customer - find first network for this customer
-
-                    first_customer = Customer.objects.get(id=customer_id, is_deleted=False)
-
-                    # Get all networks for this customer name
-
-                    customer_networks = Customer.objects.filter(name=first_customer.name, is_deleted=False)
-
-                    if customer_networks.count() == 1:
-
-                        # Single network, use it
-
-                        customer = customer_networks.first()
-
-                    elif customer_networks.count() > 1:
-
-                        # Multiple networks, need to select specific one via network dropdown
-
-                        if not network_id:
-
-                            messages.error(request, f'Customer "{first_customer.name}" has multiple networks. Please select a specific network.')
-
-                            return redirect('customer_selection')
-
-                        customer = Customer.objects.get(id=network_id, is_deleted=False)
-
-                    else:
-
-                        # No networks found (shouldn't happen), but use the found customer
-
-                        customer = first_customer
-
-                
-
-                request.session['selected_customer_id'] = customer.id
-                request.session['selected_customer_name'] = customer.display_name
-                request.session['selected_customer_source'] = 'database'
-                return redirect('dashboard')
-
-                
-
-            except Customer.DoesNotExist:
-
-                messages.error(request, 'Selected customer/network not found.')
-
-                return redirect('customer_selection')
-
-            except Exception as e:
-
-                messages.error(request, f'Error selecting customer/network: {str(e)}')
-
-                return redirect('customer_selection')
-
-        
-
-        # Handle customer-network selection
-
-        elif 'select_customer_network' in request.POST:
-
-            customer_name = request.POST.get('customer_name')
-
-            network_id = request.POST.get('network_id')
-
-            
-
-            if not customer_name:
-
-                messages.error(request, 'Please select a customer.')
-
-                return redirect('customer_selection')
-
-            
-
-            try:
-
-                # If network_id is provided and not "no_networks", use that specific network
-
-                if network_id and network_id != 'no_networks':
-
-                    customer = Customer.objects.get(id=network_id, is_deleted=False)
-
-                elif network_id == 'no_networks':
-
-                    # Customer has no networks, get first or create default
-
-                    networks = Customer.objects.filter(name=customer_name, is_deleted=False)
-
-                    if networks.exists():
-
-                        customer = networks.first()
-
-                    else:
-
-                        # Create a default network for this customer
-
-                        customer = Customer.objects.create(
-
-                            name=customer_name,
-
-                            network_name=None,
-
-                            network_type='Telecom'
-
-                        )
-
-                else:
-
-                    # Get the single network for this customer
-
-                    networks = Customer.objects.filter(name=customer_name, is_deleted=False)
-
-                    if networks.count() == 1:
-
-                        customer = networks.first()
-
-                    else:
-
-                        messages.error(request, 'Please select a specific network.')
-
-                        return redirect('customer_selection')
-
-                
-
-                request.session['selected_customer_id'] = customer.id
-
-                request.session['selected_customer_name'] = customer.display_name
-
-                return redirect('dashboard')
-
-                
-
-            except Customer.DoesNotExist:
-
-                messages.error(request, 'Selected customer/network not found.')
-
-                return redirect('customer_selection')
-
-        
-
-        # Handle new customer/network creation
-
-        elif 'add_customer_network' in request.POST:
-
-            customer_name = request.POST.get('customer_name')
-
-            network_name = request.POST.get('network_name', '')
-
-            network_type = request.POST.get('network_type', 'Telecom')
-
-            
-
-            if not customer_name:
-
-                messages.error(request, 'Customer name is required.')
-
-                return redirect('customer_selection')
-
-            
-
-            try:
-
-                # Check if this customer-network combination already exists
-
-                existing = Customer.objects.filter(
-
-                    name=customer_name,
-
-                    network_name=network_name,
-
-                    is_deleted=False
-
-                ).first()
-
-                
-
-                if existing:
-
-                    messages.warning(request, f'Customer/Network "{existing.display_name}" already exists.')
-
-                    request.session['selected_customer_id'] = existing.id
-
-                    request.session['selected_customer_name'] = existing.display_name
-
-                    return redirect('dashboard')
-
-                
-
-                # Create new customer-network
-
-                new_customer = Customer.objects.create(
-
-                    name=customer_name,
-
-                    network_name=network_name if network_name else None,
-
-                    network_type=network_type
-
-                )
-
-                
-
-                # ?? AUTO-CREATE CUSTOMER FOLDER STRUCTURE
-
-                try:
-
-                    create_customer_folder_structure(new_customer)
-
-                    print(f"? Created folder structure for customer: {new_customer.display_name}")
-
-                except Exception as e:
-                    print(f"?? Warning: Could not create folder structure for {new_customer.display_name}: {e}")
-                
-                # UPDATE EXCEL FILE WITH NEW CUSTOMER
-                try:
-                    update_excel_tracker_with_new_customer(new_customer)
-                    print(f"Excel Updated: {new_customer.display_name}")
-                except:
-                    print(f"Excel Update Failed: {new_customer.display_name}")
-                
-                request.session['selected_customer_id'] = new_customer.id
-                
-
-                request.session['selected_customer_id'] = new_customer.id
-
-                request.session['selected_customer_name'] = new_customer.display_name
-
-                
-
-                return redirect('dashboard')
-
-                
-
-            except Exception as e:
-
-                messages.error(request, f'Error creating customer/network: {str(e)}')
-
-                return redirect('customer_selection')
-
-    
-
-    # Get customers grouped by name with their networks
-
-    customers_with_networks = Customer.get_customers_with_networks()
-
-    total_networks = sum(len(networks) for networks in customers_with_networks.values())
-
-    
-
-    # Get customer statistics for the sidebar
-
-    customer_stats = get_customer_statistics()
-
-    
-
-    # Create forms for the template
-
-    from .forms import CustomerSelectionForm, CustomerCreationForm
-
-    
-
-    selection_form = CustomerSelectionForm()
-
-    customer_form = CustomerCreationForm()
-
-    
-
-    return render(request, 'customer_selection.html', {
-
-        'customers_with_networks': customers_with_networks,
-
-        'total_networks': total_networks,
-
-        'selection_form': selection_form,
-
-        'customer_form': customer_form,
-
-        'customer_statistics': customer_stats
-
-    })
-
-
-
-
-
-# === Health Check Dashboard and Main Views ===
-
-@login_required
-
-def health_check_dashboard(request):
-
-    """Main dashboard view based on MOP workflow"""
-
-    # Check if customer is selected
-
-    if 'selected_customer_id' not in request.session:
-
-        return redirect('customer_selection')
-
-    # Handle POST requests (file uploads)
-    if request.method == 'POST':
-        selected_customer_id = request.session.get('selected_customer_id')
-        try:
-            customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
-            return health_check_upload(request, customer.id)
-        except (Customer.DoesNotExist, ValueError):
-            messages.error(request, 'Customer not found.')
-            return redirect('customer_selection')
-
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-    selected_customer_source = request.session.get('selected_customer_source', 'database')
-    selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
-    
-    # Handle Excel vs Database customers differently
-    if selected_customer_source == 'excel' or (selected_customer_id and str(selected_customer_id).startswith('excel_')):
-        # Excel customer - create a mock customer object for template
-        selected_network_info = request.session.get('selected_network_info', {})
-        
-        class MockCustomer:
-            def __init__(self, name, customer_id, network_info):
-                # Extract customer name and network name if combined
-                if network_info.get('network_name'):
-                    # Split customer name to get base customer name
-                    name_parts = name.split()
-                    if len(name_parts) > 1:
-                        self.name = ' '.join(name_parts[:-1])  # Everything except last part
-                        self.network_name = name_parts[-1]  # Last part as network
-                    else:
-                        self.name = name
-                        self.network_name = network_info.get('network_name')
-                else:
-                    self.name = name
-                    self.network_name = None
-                    
-                self.display_name = name  # Keep full name for display
-                self.id = customer_id
-                self.network_type = network_info.get('network_type', 'Excel')
-                self.setup_status = 'NEW'  # Excel customers get 5-file form as new networks
-        
-        customer = MockCustomer(selected_customer_name, selected_customer_id, selected_network_info)
-        recent_sessions = []  # Excel customers don't have database sessions
-        
-    else:
-        # Database customer - verify it exists
-        try:
-            customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
-        except (Customer.DoesNotExist, ValueError):
-            # Customer was deleted or invalid ID, redirect to selection
-            if 'selected_customer_id' in request.session:
-                del request.session['selected_customer_id']
-            if 'selected_customer_name' in request.session:
-                del request.session['selected_customer_name']
-            if 'selected_customer_source' in request.session:
-                del request.session['selected_customer_source']
-            messages.error(request, "Selected network no longer exists.")
-            return redirect('customer_selection')
-        
-        # Get recent sessions for database customers
-        recent_sessions = HealthCheckSession.objects.filter(
-            customer=customer
-        ).order_by('-created_at')[:5]
-
-    
-
-    # Check for success message from health check processing
-
-    hc_success_message = request.session.pop('hc_success_message', None)
-
-    hc_success_safe = request.session.pop('hc_success_safe', False)
-
-    
-
-    if hc_success_message:
-
-        if hc_success_safe:
-
-            messages.success(request, hc_success_message, extra_tags='safe')
-
-        else:
-
-            messages.success(request, hc_success_message)
-
-    
-
-    return render(request, 'dashboard.html', {
-
-        'selected_customer': customer,
-
-        'recent_sessions': recent_sessions
-
-    })
-
-
-
-
-
-@login_required
-
-def health_check_upload(request, customer_id):
-
-    """Health check file upload view based on MOP requirements"""
-
-    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
-
-    
-
-    # Determine form type based on customer setup status
-
-    if customer.setup_status == 'NEW':
-
-        form_class = HealthCheckNewNetworkForm
-
-        template_name = 'health_check/upload_new_network.html'
-
-        files_expected = 5
-
-        session_type = 'NEW_NETWORK_SETUP'
-
-    else:
-
-        form_class = HealthCheckExistingNetworkForm
-
-        template_name = 'health_check/upload_existing_network.html'
-
-        files_expected = 2
-
-        session_type = 'REGULAR_PROCESSING'
-
-        
-
-    if request.method == 'POST':
-
-        form = form_class(request.POST, request.FILES)
-
-        if form.is_valid():
-
-            # Create health check session
-
-            session = HealthCheckSession.objects.create(
-
-                customer=customer,
-
-                session_id=str(uuid.uuid4()),
-
-                session_type=session_type,
-
-                initiated_by=request.user,
-
-                files_expected=files_expected
-
-            )
-
-            
-
-            # Process uploaded files
-
-            files_uploaded = 0
-
-            file_mapping = {
-
-                # New network files
-
-                'hc_tracker_file': 'HC_TRACKER',
-
-                'global_ignore_txt': 'GLOBAL_IGNORE_TXT',
-
-                'selective_ignore_xlsx': 'SELECTIVE_IGNORE_XLSX',
-
-                # Regular processing files
-
-                'tec_report_file': 'TEC_REPORT',
-
-                'inventory_csv': 'INVENTORY_CSV'
-
-            }
-
-            
-
-            # Ensure directories exist
-
-            os.makedirs(SCRIPT_INPUT_DIR, exist_ok=True)
-
-            os.makedirs(SCRIPT_DIR, exist_ok=True)
-
-            
-
-            # Clear input directory completely before uploading new files (for any customer)
-
-            for existing_file in SCRIPT_INPUT_DIR.glob("*"):
-
-                if existing_file.is_file():
-
-                    existing_file.unlink()
-
-                    print(f"??? Cleared old file from input: {existing_file.name}")
-
-            
-
-            for field_name, file_type in file_mapping.items():
-
-                if field_name in request.FILES:
-
-                    file = request.FILES[field_name]
-
-                    
-
-                    # ===== STRICT FILE VALIDATION BEFORE PROCESSING =====
-
-                    # Validate file type based on filename patterns
-
-                    if field_name == 'tec_report_file':
-
-                        validation_result = validate_file_type_match(file.name, 'REPORT')
-
-                        if not validation_result['valid']:
-
-                            messages.error(request, f"? Report Upload Error: {validation_result['error']}")
-
-                            return redirect('dashboard')
-
-                    elif field_name == 'inventory_csv':
-
-                        validation_result = validate_file_type_match(file.name, 'INVENTORY')
-
-                        if not validation_result['valid']:
-
-                            messages.error(request, f"? Inventory Upload Error: {validation_result['error']}")
-
-                            return redirect('dashboard')
-
-                    elif field_name == 'hc_tracker_file':
-
-                        validation_result = validate_file_type_match(file.name, 'TRACKER')
-
-                        if not validation_result['valid']:
-
-                            messages.error(request, f"? Tracker Upload Error: {validation_result['error']}")
-
-                            return redirect('dashboard')
-
-                    elif field_name in ['global_ignore_txt', 'selective_ignore_xlsx']:
-
-                        validation_result = validate_file_type_match(file.name, 'IGNORE')
-
-                        if not validation_result['valid']:
-
-                            messages.error(request, f"? Ignore File Upload Error: {validation_result['error']}")
-
-                            return redirect('dashboard')
-
-                    
-
-                    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
-
-                    customer_validation = validate_customer_technology_match(customer.name, file.name)
-
-                    if not customer_validation['valid']:
-
-                        messages.error(request, f"? Customer Validation Error: {customer_validation['error']}")
-
-                        return redirect('dashboard')
-
-                    
-
-                    # ROUTE FILES TO CORRECT DIRECTORIES - FIXED TO USE CUSTOMER DIRECTORIES
-
-                    if field_name in ['tec_report_file', 'inventory_csv']:
-
-                        # TEC Report and CSV go to CUSTOMER directories AND input-hc-report for processing
-
-                        stored_filename = file.name
-
-                        
-
-                        # Determine customer folder type
-
-                        if field_name == 'tec_report_file':
-
-                            customer_file_path = get_customer_file_path(customer, 'TEC', file.name)
-
-                        else:  # inventory_csv
-
-                            customer_file_path = get_customer_file_path(customer, 'INVENTORY', file.name)
-
-                        
-
-                        # Also save to processing directory (input-hc-report)
-
-                        file_path = SCRIPT_INPUT_DIR / file.name
-
-                            
-
-                    else:
-
-                        # HC Tracker and ignore files go to Script root with network name
-
-                        if field_name == 'hc_tracker_file':
-
-                            stored_filename = f"{customer.name}_HC_Issues_Tracker.xlsx"
-
-                        elif field_name == 'global_ignore_txt':
-
-                            stored_filename = f"{customer.name}_ignored_test_cases.txt"
-
-                        elif field_name == 'selective_ignore_xlsx':
-
-                            stored_filename = f"{customer.name}_ignored_test_cases.xlsx"
-
-                        else:
-
-                            stored_filename = file.name
-
-                        
-
-                        file_path = SCRIPT_DIR / stored_filename
-
-                        customer_file_path = get_customer_file_path(customer, 'OLD_TRACKER', stored_filename)
-
-                    
-
-                    # ?? FIRST: Clear existing files of this type BEFORE saving new ones
-
-                    # ENABLED for TEC_REPORT only (allow multiple INVENTORY_CSV files)
-
-                    if file_type in ['TEC_REPORT']:
-
-                        deleted_count = clear_existing_customer_files(customer, file_type)
-
-                        if deleted_count > 0:
-
-                            print(f"? Cleared {deleted_count} old {file_type} file(s) for customer: {customer.name}")
-
-                    
-
-                    # Save file to the Script location (for processing) AND customer folder (for downloads)
-
-                    # We need to reset file pointer before each save operation
-
-                    file.seek(0)  # Reset file pointer to beginning
-
-                    with open(file_path, 'wb+') as destination:
-
-                        for chunk in file.chunks():
-
-                            destination.write(chunk)
-
-                    
-
-                    # ALSO save file to customer folder (for download availability)
-
-                    try:
-
-                        file.seek(0)  # Reset file pointer to beginning again
-
-                        with open(customer_file_path, 'wb+') as destination:
-
-                            for chunk in file.chunks():
-
-                                destination.write(chunk)
-
-                        print(f"? Saved {file.name} ? {file_path}")
-
-                        print(f"?? Also saved to customer folder ? {customer_file_path}")
-
-                    except Exception as e:
-
-                        print(f"?? Warning: Could not save to customer folder: {e}")
-
-                        print(f"?? Error details: {str(e)}")
-
-
-
-                    hc_file = HealthCheckFile.objects.create(
-
-                        customer=customer,
-
-                        session=session,
-
-                        file_type=file_type,
-
-                        original_filename=file.name,
-
-                        stored_filename=stored_filename,  # Use proper filename
-
-                        file_path=str(customer_file_path),  # Point to customer folder for downloads
-
-                        file_size=file.size
-
-                    )
-
-                    
-
-                    files_uploaded += 1
-
-            
-
-            session.files_received = files_uploaded
-
-            session.update_status('UPLOADING', f"{files_uploaded} files uploaded successfully.")
-
-            
-
-            # Start processing (in production, this would be a background task)
-
-            try:
-
-                # Check if this upload includes TEC report files (means we need to run script)
-
-                has_tec_files = any(field in request.FILES for field in ['tec_report_file', 'inventory_csv'])
-
-                
-
-                if has_tec_files:
-
-                    # We have TEC files - ALWAYS run the Python script to generate output
-
-                    if customer.setup_status == 'NEW':
-
-                        customer.setup_status = 'READY'  # Mark as ready since we're setting it up
-
-                        customer.save()
-
-                    
-
-                    # Run the health check script to generate output files
-
-                    try:
-
-                        process_health_check_files_enhanced(session.id)
-
-                        
-
-                        # Get the generated tracker file for download link
-
-                        latest_tracker = HealthCheckFile.objects.filter(
-
-                            customer=customer,
-
-                            file_type='TRACKER_GENERATED'
-
-                        ).order_by('-uploaded_at').first()
-
-                        
-
-                        if latest_tracker:
-
-                            download_url = f"/download/tracker/?filename={latest_tracker.stored_filename}"
-
-                            success_msg = f"<strong>Tracker generated successfully for {customer.name}!</strong><br>" + \
-                                         f"<a href='{download_url}' class='text-blue-600 underline hover:text-blue-800' download>" + \
-                                         f"Download {latest_tracker.stored_filename}</a><br>" + \
-                                         f"Check all files in the history section below."
-
-                            
-
-                            # Store the success message to show in dashboard
-
-                            request.session['hc_success_message'] = success_msg
-
-                            request.session['hc_success_safe'] = True
-
-                            # Don't add message here - it will be added in dashboard view to avoid duplicates
-
-                        else:
-
-                            success_msg = f"? Health check processing completed for {customer.name}! Check the files in the history section below."
-
-                            request.session['hc_success_message'] = success_msg
-
-                            request.session['hc_success_safe'] = False
-
-                            # Don't add message here - it will be added in dashboard view to avoid duplicates
-
-                    except Exception as processing_error:
-
-                        messages.error(request, f"? Processing failed: {str(processing_error)}")
-
-                else:
-
-                    # Only setup files uploaded (no TEC files) - just mark as ready
-
-                    if customer.setup_status == 'NEW':
-
-                        customer.setup_status = 'READY'
-
-                        customer.save()
-
-                    session.update_status('COMPLETED', 'Network setup completed successfully')
-
-                    messages.success(request, f"Network {customer.name} has been set up successfully!")
-
-            except Exception as e:
-
-                session.update_status('FAILED', f"Processing failed: {str(e)}")
-
-                messages.error(request, f"Processing failed: {str(e)}")
-
-            
-
-            # Skip processing page - go directly to dashboard with success message (already set above)
-
-            return redirect('dashboard')
-
-    else:
-
-        form = form_class()
-
-        
-
-    return render(request, template_name, {
-
-        'form': form, 
-
-        'customer': customer,
-
-        'files_expected': files_expected
-
-    })
-
-
-
-
-
-@login_required
-
-def health_check_processing(request, session_id):
-
-    """Health check processing status view"""
-
-    session = get_object_or_404(HealthCheckSession, session_id=session_id)
-
-    
-
-    return render(request, 'health_check/processing.html', {
-
-        'session': session
-
-    })
-
-
-
-
-
-@login_required 
-
-def health_check_results(request, session_id):
-
-    """Health check results view"""
-
-    session = get_object_or_404(HealthCheckSession, session_id=session_id)
-
-    
-
-    return render(request, 'health_check/results.html', {
-
-        'session': session
-
-    })
-
-
-
-
-
-# === File Processing Logic (Based on MOP) ===
-
-def process_health_check_files(session_id):
-
-    """
-
-    Process health check files according to MOP workflow
-
-    This function would interface with the existing Script/main.py
-
-    """
-
-    try:
-
-        session = HealthCheckSession.objects.get(id=session_id)
-
-        session.update_status('PROCESSING', 'Starting health check analysis')
-
-        
-
-        # Step 1: Validate files
-
-        # session.add_log_entry("Validating uploaded files...")
-
-        session.progress_percentage = 10
-
-        session.current_step = "Validating files"
-
-        session.save()
-
-        
-
-        # Get files for this session
-
-        files = HealthCheckFile.objects.filter(session=session)
-
-        
-
-        # Step 2: Prepare script environment
-
-        # session.add_log_entry("Preparing script environment...")
-
-        session.progress_percentage = 20
-
-        session.current_step = "Preparing environment"
-
-        session.save()
-
-        
-
-        # Files are already in the correct location from upload
-
-        # Just validate they exist in input directory
-
-        script_input_dir = SCRIPT_DIR / "input-hc-report"
-
-        input_files = list(script_input_dir.glob("*"))
-
-        
-
-        if len(input_files) != 2:
-
-            raise Exception(f"Expected 2 files in input directory, found {len(input_files)}")
-
-        
-
-        # Step 3: Execute 1830PSS Health Check Script
-
-        # session.add_log_entry("Executing 1830PSS Health Check Script...")
-
-        session.progress_percentage = 40
-
-        session.current_step = "Processing health check data"
-
-        session.save()
-
-        
-
-        # This would execute the main.py script
-
-        script_result = execute_hc_script_enhanced(session)
-
-        
-
-        if script_result['success']:
-
-            # session.add_log_entry("Script execution completed successfully")
-
-            session.progress_percentage = 80
-
-            session.current_step = "Generating output files"
-
-            session.save()
-
-            
-
-            # Step 4: Process outputs
-
-            process_script_outputs(session, script_result)
-
-            session.progress_percentage = 100
-
-            session.current_step = "Processing completed"
-
-            session.save()
-
-            
-
-            session.update_status('COMPLETED', 'Health check processing completed successfully')
-
-        else:
-
-            session.update_status('FAILED', f"Script execution failed: {script_result['error']}")
-
-            
-
-    except Exception as e:
-
-        session.update_status('FAILED', f'Processing failed: {str(e)}')
-
-        # session.add_log_entry(f"ERROR: {str(e)}", level='ERROR')
-
-
-
-
-
-def execute_hc_script_enhanced(session):
-
-    """Enhanced script execution with better Windows path handling"""
-
-    try:
-
-        # Get customer name from session
-
-        customer_name = session.customer.name
-
-        
-
-        # Use the improved script executor
-
-        script_result = execute_health_check_script(customer_name)
-
-        
-
-        return {
-
-            'success': script_result['success'],
-
-            'stdout': script_result.get('stdout', ''),
-
-            'stderr': script_result.get('stderr', ''),
-
-            'returncode': script_result.get('returncode', 0),
-
-            'error': script_result.get('error', None)
-
-        }
-
-        
-
-    except Exception as e:
-
-        return {
-
-            'success': False,
-
-            'error': str(e)
-
-        }
-
-
-
-
-
-def process_script_outputs(session, script_result):
-
-    """Process outputs from the 1830PSS Health Check Script"""
-
-    try:
-
-        # Look for generated files in Script/output directory
-
-        script_output_dir = SCRIPT_DIR / "output"
-
-        
-
-        if script_output_dir.exists():
-
-            # Find the generated tracker file
-
-            for file_path in script_output_dir.glob("*.xlsx"):
-
-                if "HC_Issues_Tracker" in file_path.name:
-
-                    # Copy to our output directory
-
-                    output_path = SCRIPT_OUTPUT_DIR / file_path.name
-
-                    import shutil
-
-                    shutil.copy2(file_path, output_path)
-
-                    
-
-                    # Update session with output file info
-
-                    session.output_tracker_filename = file_path.name
-
-                    session.output_tracker_path = str(output_path)
-
-                    session.save()
-
-                    
-
-                    # session.add_log_entry(f"Generated tracker: {file_path.name}")
-
-                    
-
-                    break
-
-        
-
-        # Create summary report
-
-        create_summary_report(session)
-
-        
-
-    except Exception as e:
-
-        # session.add_log_entry(f"Error processing outputs: {str(e)}", level='ERROR')
-
-        pass
-
-
-
-
-
-def create_summary_report(session):
-
-    """Create summary report for the health check session"""
-
-    # Health check reports are no longer needed - session status provides sufficient information
-
-    pass
-
-
-
-
-
-# === File Download Views ===
-
-def download_tracker_file(request):
-
-    """Download generated tracker file with improved network-specific path handling"""
-
-    # Check authentication manually to avoid HTML redirect
-
-    if not request.user.is_authenticated:
-
-        return HttpResponse(
-
-            "Authentication required. Please log in to download files.",
-
-            status=401,
-
-            content_type='text/plain'
-
-        )
-
-    
-
-    session_id = request.GET.get('session_id')
-
-    filename = request.GET.get('filename')
-
-    
-
-    # Method 1: Download by session_id
-
-    if session_id:
-
-        try:
-
-            session = HealthCheckSession.objects.get(session_id=session_id)
-
-            
-
-            if session.output_tracker_path and Path(session.output_tracker_path).exists():
-
-                response = FileResponse(
-
-                    open(session.output_tracker_path, 'rb'),
-
-                    as_attachment=True,
-
-                    filename=session.output_tracker_filename
-
-                )
-
-                return response
-
-            else:
-
-                # Return proper HTTP 404 error instead of HTML redirect
-
-                return HttpResponse(
-
-                    f"Tracker file not found for session {session_id}",
-
-                    status=404,
-
-                    content_type='text/plain'
-
-                )
-
-                
-
-        except HealthCheckSession.DoesNotExist:
-
-            # Return proper HTTP 404 error instead of HTML redirect
-
-            return HttpResponse(
-
-                f"Session {session_id} not found",
-
-                status=404,
-
-                content_type='text/plain'
-
-            )
-
-    
-
-    # Method 2: Download by filename (for customer files)
-
-    elif filename:
-
-        try:
-
-            selected_customer_id = request.session.get('selected_customer_id')
-
-            if selected_customer_id:
-
-                try:
-
-                    customer = Customer.objects.get(id=selected_customer_id)
-
-                    
-
-                    # First, try to find file in database for current customer
-
-                    file_obj = HealthCheckFile.objects.filter(
-
-                        customer=customer,
-
-                        stored_filename=filename
-
-                    ).order_by('-uploaded_at').first()  # Get the most recent file
-
-                    
-
-                    if file_obj and file_obj.file_path:
-
-                        # Try the stored path first
-
-                        stored_path = Path(file_obj.file_path)
-
-                        
-
-                        print(f"?? Database path for {filename}: {stored_path}")
-
-                        
-
-                        if stored_path.exists():
-
-                            try:
-
-                                response = FileResponse(
-
-                                    open(stored_path, 'rb'),
-
-                                    as_attachment=True,
-
-                                    filename=file_obj.original_filename or filename
-
-                                )
-
-                                response['Content-Disposition'] = f'attachment; filename="{file_obj.original_filename or filename}"'
-
-                                print(f"? Successfully serving file from database path: {stored_path}")
-
-                                return response
-
-                            except Exception as file_error:
-
-                                print(f"?? Error opening stored file {stored_path}: {file_error}")
-
-                        else:
-
-                            print(f"?? Database path doesn't exist: {stored_path}")
-
-                    
-
-                    # If database path doesn't work, search customer directories (including network-specific)
-
-                    customer_base_name = customer.name.replace(" ", "_").replace("/", "_")
-
-                    customer_base_dir = CUSTOMER_FILES_DIR / customer_base_name
-
-                    
-
-                    print(f"?? Searching for {filename} in customer base directory: {customer_base_dir}")
-
-                    
-
-                    # Search priority: network-specific directories first, then base customer directory
-
-                    search_directories = []
-
-                    
-
-                    # 1. Add network-specific directories if they exist
-
-                    if customer_base_dir.exists():
-
-                        for network_dir in customer_base_dir.iterdir():
-
-                            if network_dir.is_dir() and network_dir.name.lower() not in ['readme.txt', '.gitkeep']:
-
-                                search_directories.append(network_dir)
-
-                    
-
-                    # 2. Add base customer directory
-
-                    search_directories.append(customer_base_dir)
-
-                    
-
-                    # Look in all directories with priority order
-
-                    subdirs = ['generated_trackers', 'tec_reports', 'old_trackers', 'inventory_files', 'host_files']
-
-                    
-
-                    for search_dir in search_directories:
-
-                        print(f"  ?? Checking directory: {search_dir}")
-
-                        for subdir in subdirs:
-
-                            file_path = search_dir / subdir / filename
-
-                            print(f"    ?? Checking: {file_path}")
-
-                            if file_path.exists():
-
-                                print(f"    ? Found file: {file_path}")
-
-                                try:
-
-                                    response = FileResponse(
-
-                                        open(file_path, 'rb'),
-
-                                        as_attachment=True,
-
-                                        filename=filename
-
-                                    )
-
-                                    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-                                    return response
-
-                                except Exception as file_error:
-
-                                    print(f"    ? Error opening file {file_path}: {file_error}")
-
-                                    continue
-
-                    
-
-                    print(f"  ? File not found in customer directories")
-
-                            
-
-                except Customer.DoesNotExist:
-
-                    print(f"?? Customer not found for ID: {selected_customer_id}")
-
-                    pass
-
-            else:
-
-                print(f"?? No customer selected in session")
-
-                
-
-                # Fallback: search all customer files if no customer selected
-
-                file_obj = HealthCheckFile.objects.filter(
-
-                    stored_filename=filename
-
-                ).order_by('-uploaded_at').first()
-
-                
-
-                if file_obj and file_obj.file_path:
-
-                    stored_path = Path(file_obj.file_path)
-
-                    if stored_path.exists():
-
-                        response = FileResponse(
-
-                            open(stored_path, 'rb'),
-
-                            as_attachment=True,
-
-                            filename=file_obj.original_filename or filename
-
-                        )
-
-                        return response
-
-            
-
-            # Also check Script output directory as fallback
-
-            script_output_dir = SCRIPT_DIR / "output"
-
-            file_path = script_output_dir / filename
-
-            if file_path.exists():
-
-                print(f"? Found file in Script output directory: {file_path}")
-
-                response = FileResponse(
-
-                    open(file_path, 'rb'),
-
-                    as_attachment=True,
-
-                    filename=filename
-
-                )
-
-                return response
-
-            
-
-            # Final comprehensive fallback: Search all customers for the file
-
-            print(f"?? Final fallback: comprehensive search for {filename}")
-
-            if CUSTOMER_FILES_DIR.exists():
-
-                for customer_dir in CUSTOMER_FILES_DIR.iterdir():
-
-                    if customer_dir.is_dir():
-
-                        # Search both in customer base directory and network subdirectories
-
-                        all_search_dirs = [customer_dir]
-
-                        
-
-                        # Add network subdirectories
-
-                        for network_dir in customer_dir.iterdir():
-
-                            if network_dir.is_dir() and network_dir.name.lower() not in ['readme.txt', '.gitkeep']:
-
-                                all_search_dirs.append(network_dir)
-
-                        
-
-                        for search_dir in all_search_dirs:
-
-                            for subdir in ['generated_trackers', 'tec_reports', 'old_trackers', 'inventory_files', 'host_files']:
-
-                                file_path = search_dir / subdir / filename
-
-                                if file_path.exists():
-
-                                    print(f"? Found file in comprehensive search: {file_path}")
-
-                                    try:
-
-                                        response = FileResponse(
-
-                                            open(file_path, 'rb'),
-
-                                            as_attachment=True,
-
-                                            filename=filename
-
-                                        )
-
-                                        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-                                        return response
-
-                                    except Exception as file_error:
-
-                                        print(f"? Error opening fallback file {file_path}: {file_error}")
-
-                                        continue
-
-            
-
-            # Return proper HTTP 404 error instead of HTML redirect
-
-            return HttpResponse(
-
-                f"File '{filename}' not found",
-
-                status=404,
-
-                content_type='text/plain'
-
-            )
-
-            
-
-        except Exception as e:
-
-            # Return proper HTTP 500 error instead of HTML redirect
-
-            print(f"? Exception in download_tracker_file: {str(e)}")
-
-            return HttpResponse(
-
-                f"Error downloading file: {str(e)}",
-
-                status=500,
-
-                content_type='text/plain'
-
-            )
-
-    
-
-    else:
-
-        # Return proper HTTP 400 error instead of HTML redirect
-
-        return HttpResponse(
-
-            "No file specified for download",
-
-            status=400,
-
-            content_type='text/plain'
-
-        )
-
-
-
-
-
-def download_report_file(request):
-
-    """Download TEC report files from tec_reports folder"""
-
-    return download_file_by_type(request, 'TEC', 'tec_reports')
-
-
-
-def download_inventory_file(request):
-
-    """Download inventory files from inventory_files folder"""
-
-    return download_file_by_type(request, 'INVENTORY', 'inventory_files')
-
-
-
-def download_host_file(request):
-
-    """Download host files from host_files folder"""
-
-    return download_file_by_type(request, 'HOST', 'host_files')
-
-
-
-def download_file_by_type(request, file_type, folder_name):
-
-    """Generic download function for specific file types with network-specific path handling"""
-
-    # Check authentication
-
-    if not request.user.is_authenticated:
-
-        return HttpResponse(
-
-            "Authentication required. Please log in to download files.",
-
-            status=401,
-
-            content_type='text/plain'
-
-        )
-
-    
-
-    filename = request.GET.get('filename')
-
-    if not filename:
-
-        return HttpResponse(
-
-            "No filename specified for download",
-
-            status=400,
-
-            content_type='text/plain'
-
-        )
-
-    
-
-    try:
-
-        selected_customer_id = request.session.get('selected_customer_id')
-
-        if selected_customer_id:
-
-            try:
-
-                customer = Customer.objects.get(id=selected_customer_id)
-
-                
-
-                # First, try to find file in database for current customer
-
-                file_obj = HealthCheckFile.objects.filter(
-
-                    customer=customer,
-
-                    stored_filename=filename
-
-                ).order_by('-uploaded_at').first()  # Get the most recent file
-
-                
-
-                if file_obj and file_obj.file_path:
-
-                    # Try the stored path first
-
-                    stored_path = Path(file_obj.file_path)
-
-                    
-
-                    print(f"?? Database path for {filename}: {stored_path}")
-
-                    
-
-                    if stored_path.exists():
-
-                        try:
-
-                            response = FileResponse(
-
-                                open(stored_path, 'rb'),
-
-                                as_attachment=True,
-
-                                filename=file_obj.original_filename or filename
-
-                            )
-
-                            response['Content-Disposition'] = f'attachment; filename="{file_obj.original_filename or filename}"'
-
-                            print(f"? Successfully serving {file_type} file from database path: {stored_path}")
-
-                            return response
-
-                        except Exception as file_error:
-
-                            print(f"?? Error opening stored file {stored_path}: {file_error}")
-
-                    else:
-
-                        print(f"?? Database path doesn't exist: {stored_path}")
-
-                
-
-                # If database path doesn't work, search customer directories (including network-specific)
-
-                customer_base_name = customer.name.replace(" ", "_").replace("/", "_")
-
-                customer_base_dir = CUSTOMER_FILES_DIR / customer_base_name
-
-                
-
-                print(f"?? Searching for {filename} in customer base directory: {customer_base_dir}")
-
-                
-
-                # Search priority: network-specific directories first, then base customer directory
-
-                search_directories = []
-
-                
-
-                # 1. Add network-specific directories if they exist
-
-                if customer_base_dir.exists():
-
-                    for network_dir in customer_base_dir.iterdir():
-
-                        if network_dir.is_dir() and network_dir.name.lower() not in ['readme.txt', '.gitkeep']:
-
-                            search_directories.append(network_dir)
-
-                
-
-                # 2. Add base customer directory
-
-                search_directories.append(customer_base_dir)
-
-                
-
-                # Look for the file in the specified folder within each directory
-
-                for search_dir in search_directories:
-
-                    file_path = search_dir / folder_name / filename
-
-                    print(f"  ?? Checking: {file_path}")
-
-                    if file_path.exists():
-
-                        print(f"  ? Found {file_type} file: {file_path}")
-
-                        try:
-
-                            response = FileResponse(
-
-                                open(file_path, 'rb'),
-
-                                as_attachment=True,
-
-                                filename=filename
-
-                            )
-
-                            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-                            return response
-
-                        except Exception as file_error:
-
-                            print(f"  ? Error opening {file_type} file {file_path}: {file_error}")
-
-                            continue
-
-                
-
-                print(f"  ? {file_type} file not found in any customer directories")
-
-                return HttpResponse(
-
-                    f"File '{filename}' not found in {folder_name} folder",
-
-                    status=404,
-
-                    content_type='text/plain'
-
-                )
-
-                    
-
-            except Customer.DoesNotExist:
-
-                print(f"?? Customer not found for ID: {selected_customer_id}")
-
-                return HttpResponse(
-
-                    "Customer not found",
-
-                    status=404,
-
-                    content_type='text/plain'
-
-                )
-
-        else:
-
-            print(f"?? No customer selected in session")
-
-            return HttpResponse(
-
-                "No customer selected",
-
-                status=400,
-
-                content_type='text/plain'
-
-            )
-
-            
-
-    except Exception as e:
-
-        print(f"? Error in download_file_by_type: {str(e)}")
-
-        return HttpResponse(
-
-            f"Error downloading file: {str(e)}",
-
-            status=500,
-
-            content_type='text/plain'
-
-        )
-
-
-
-
-
-
-
-
-
-def validate_section_specific_upload(customer_name, filename, upload_section, expected_type):
-
-    """
-
-    UNIVERSAL section validation - Works with any file naming convention
-
-    Validates file content type matches the upload section regardless of customer naming
-
-    """
-
-    try:
-
-        filename_upper = filename.upper()
-
-        filename_lower = filename.lower()
-
-        
-
-        # Get file extension
-
-        file_ext = filename_lower.split('.')[-1] if '.' in filename else ''
-
-        
-
-        # Section-specific validations
-
-        if upload_section == 'report_upload' or expected_type == 'REPORT':
-
-            # Report files validation
-
-            if file_ext not in ['xlsx', 'xls', 'csv']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Report files must be Excel (.xlsx) or CSV (.csv) format, but '{filename}' is .{file_ext}"
-
-                }
-
-            
-
-            # Check for report indicators
-
-            report_indicators = ['REPORT', 'TEC', 'HEALTH', 'HC', 'CHECK', 'ANALYSIS']
-
-            has_report_indicator = any(indicator in filename_upper for indicator in report_indicators)
-
-            
-
-            # Check for non-report indicators  
-
-            non_report_indicators = ['TRACKER', 'INVENTORY', 'IGNORE', 'HOST']
-
-            has_non_report_indicator = any(indicator in filename_upper for indicator in non_report_indicators)
-
-            
-
-            if has_non_report_indicator:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? '{filename}' appears to be a {[ind for ind in non_report_indicators if ind in filename_upper][0].lower()} file, not a report file"
-
-                }
-
-            
-
-            if not has_report_indicator:
-
-                # Be more lenient - allow xlsx files without specific keywords
-
-                return {'valid': True, 'warning': f"?? '{filename}' doesn't contain typical report keywords but will be accepted as Excel file"}
-
-        
-
-        elif upload_section == 'inventory_upload' or expected_type == 'INVENTORY':
-
-            # Inventory files validation
-
-            if file_ext != 'csv':
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Inventory files must be CSV format, but '{filename}' is .{file_ext}"
-
-                }
-
-            
-
-            # Check for inventory indicators
-
-            inventory_indicators = ['INVENTORY', 'REMOTE', 'EXPORT', 'NODE', 'LIST', 'CSV']
-
-            non_inventory_indicators = ['REPORT', 'TRACKER', 'IGNORE', 'HOST']
-
-            
-
-            has_inventory_indicator = any(indicator in filename_upper for indicator in inventory_indicators)
-
-            has_non_inventory_indicator = any(indicator in filename_upper for indicator in non_inventory_indicators)
-
-            
-
-            if has_non_inventory_indicator:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? '{filename}' appears to be a {[ind for ind in non_inventory_indicators if ind in filename_upper][0].lower()} file, not an inventory file"
-
-                }
-
-        
-
-        elif upload_section == 'tracker_upload' or expected_type == 'TRACKER':
-
-            # Tracker files validation
-
-            if file_ext not in ['xlsx', 'xls']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Tracker files must be Excel format (.xlsx), but '{filename}' is .{file_ext}"
-
-                }
-
-            
-
-            # Check for tracker indicators
-
-            tracker_indicators = ['TRACKER', 'ISSUES', 'TRACK', 'PROBLEM', 'ISSUE']
-
-            non_tracker_indicators = ['REPORT', 'TEC', 'INVENTORY', 'IGNORE', 'HOST']
-
-            
-
-            has_tracker_indicator = any(indicator in filename_upper for indicator in tracker_indicators)
-
-            has_non_tracker_indicator = any(indicator in filename_upper for indicator in non_tracker_indicators)
-
-            
-
-            if has_non_tracker_indicator and not has_tracker_indicator:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? '{filename}' appears to be a {[ind for ind in non_tracker_indicators if ind in filename_upper][0].lower()} file, not a tracker file"
-
-                }
-
-        
-
-        elif upload_section == 'ignore_upload' or expected_type == 'IGNORE':
-
-            # Ignore files validation
-
-            if file_ext not in ['txt', 'xlsx', 'xls']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Ignore files must be .txt or .xlsx format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        elif upload_section == 'host_upload' or expected_type == 'HOST':
-
-            # Host files validation
-
-            if file_ext not in ['csv', 'xlsx', 'xls']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Host files must be CSV (.csv) or Excel (.xlsx) format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        return {'valid': True, 'error': None}
-
-        
-
-    except Exception as e:
-
-        return {
-
-            'valid': False,
-
-            'error': f"? Section validation error: {str(e)}"
-
-        }
-
-
-
-
-
-def validate_file_type_match(filename, expected_type):
-
-    """
-
-    UNIVERSAL file type validation - Works with any filename format
-
-    Focuses on file extension and content type rather than strict naming conventions
-
-    """
-
-    try:
-
-        filename_upper = filename.upper()
-
-        filename_lower = filename.lower()
-
-        file_ext = filename_lower.split('.')[-1] if '.' in filename else ''
-
-        
-
-        if expected_type == 'REPORT':
-
-            # Report files should be Excel or CSV
-
-            if file_ext not in ['xlsx', 'xls', 'csv']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Report files must be Excel (.xlsx) or CSV (.csv) format, but '{filename}' is .{file_ext}"
-
-                }
-
-            
-
-            # Exclude obvious non-report files
-
-            exclusion_keywords = ['TRACKER', 'INVENTORY', 'IGNORE', 'HOST']
-
-            if any(keyword in filename_upper for keyword in exclusion_keywords):
-
-                conflicting_keyword = next(keyword for keyword in exclusion_keywords if keyword in filename_upper)
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? '{filename}' contains '{conflicting_keyword}' - not suitable for report section"
-
-                }
-
-        
-
-        elif expected_type == 'INVENTORY':
-
-            # Inventory files should be CSV
-
-            if file_ext != 'csv':
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Inventory files must be CSV format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        elif expected_type == 'TRACKER':
-
-            # Tracker files should be Excel or CSV
-
-            if file_ext not in ['xlsx', 'xls', 'csv']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Tracker files must be Excel (.xlsx) or CSV (.csv) format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        elif expected_type == 'IGNORE':
-
-            # Ignore files can be txt, xlsx, or csv
-
-            if file_ext not in ['txt', 'xlsx', 'xls', 'csv']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Ignore files must be .txt, .xlsx, or .csv format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        elif expected_type == 'HOST':
-
-            # Host files should be CSV or Excel
-
-            if file_ext not in ['csv', 'xlsx', 'xls']:
-
-                return {
-
-                    'valid': False,
-
-                    'error': f"? Host files must be CSV (.csv) or Excel (.xlsx) format, but '{filename}' is .{file_ext}"
-
-                }
-
-        
-
-        return {'valid': True, 'error': None}
-
-        
-
-    except Exception as e:
-
-        return {
-
-            'valid': False,
-
-            'error': f"? File type validation error: {str(e)}"
-
-        }
-
-
-
-
-
-def validate_user_region_access(user, customer_name, filename):
-
-    """
-
-    COMPREHENSIVE user access validation using UserProfile model
-
-    Enforces region-based access control based on user assignments
-
-    """
-
-    try:
-
-        if not user.is_authenticated:
-
-            return {
-
-                'valid': False,
-
-                'error': '? User must be authenticated to upload files'
-
-            }
-
-        
-
-        # Check if user is Django staff - they have full access
-
-        if user.is_staff or user.is_superuser:
-
-            return {
-
-                'valid': True, 
-
-                'error': None,
-
-                'reason': f"Staff/superuser {user.username} has full access"
-
-            }
-
-        
-
-        # Try to get user's health check profile
-
-        try:
-
-            from .models import UserProfile
-
-            profile = user.health_check_profile
-
-        except UserProfile.DoesNotExist:
-
-            # No profile exists - create a default one or allow based on settings
-
-            # For now, allow access but log the missing profile
-
-            print(f"?? No UserProfile found for user {user.username} - allowing access")
-
-            return {
-
-                'valid': True, 
-
-                'error': None,
-
-                'warning': f"No region profile found for user {user.username}"
-
-            }
-
-        
-
-        # Check if user is marked as super user in profile
-
-        if profile.is_super_user:
-
-            return {
-
-                'valid': True, 
-
-                'error': None,
-
-                'reason': f"User {user.username} is marked as super user in profile"
-
-            }
-
-        
-
-        # If strict validation is disabled for this user, allow access
-
-        if not profile.enforce_strict_validation:
-
-            return {
-
-                'valid': True, 
-
-                'error': None,
-
-                'reason': f"Strict validation disabled for user {user.username}"
-
-            }
-
-        
-
-        # Perform region-based access check
-
-        can_access, access_reason = profile.can_access_customer(customer_name)
-
-        
-
-        if not can_access:
-
-            return {
-
-                'valid': False,
-
-                'error': f"? Region Access Denied for {user.username}: {access_reason}"
-
-            }
-
-        
-
-        # Access granted
-
-        return {
-
-            'valid': True, 
-
-            'error': None,
-
-            'reason': f"User {user.username} has valid region access: {access_reason}"
-
-        }
-
-        
-
-    except Exception as e:
-
-        return {
-
-            'valid': False,
-
-            'error': f"? User access validation error: {str(e)}"
-
-        }
-
-
-
-
-
-# === API Endpoints ===
-
-@login_required
-
-def validate_filename(request):
-
-    """ENHANCED: Validate uploaded filename with section-specific validation"""
-
-    filename = request.GET.get('filename', '')
-
-    expected_type = request.GET.get('expected_type', '')  # Get expected file type from request
-
-    upload_section = request.GET.get('upload_section', '')  # Get upload section from request
-
-    customer_id = request.session.get('selected_customer_id')
-
-    
-
-    if not customer_id:
-
-        return JsonResponse({'status': 'error', 'message': 'No customer selected'})
-
-    
-
-    if not filename:
-
-        return JsonResponse({'status': 'error', 'message': 'No filename provided'})
-
-    
-
-    try:
-
-        customer = Customer.objects.get(id=customer_id)
-
-        
-
-        # DEBUG: Print actual validation info
-
-        print(f"?? ENHANCED VALIDATION DEBUG: Customer='{customer.name}', File='{filename}', Type='{expected_type}', Section='{upload_section}'")
-
-        
-
-        # 1. PRIORITY: REGION VALIDATION FIRST - Catch cross-region uploads before anything else!
-
-        customer_validation = validate_customer_technology_match(
-
-            customer.display_name, filename
-
-        )
-
-        if not customer_validation['valid']:
-
-            return JsonResponse({
-
-                'status': 'success',
-
-                'is_valid': False,
-
-                'message': f"? REGION MISMATCH: {customer_validation['error']}"
-
-            })
-
-        
-
-        # 2. File type validation - only after region check passes
-
-        if expected_type:
-
-            file_type_validation = validate_file_type_match(filename, expected_type)
-
-            if not file_type_validation['valid']:
-
-                return JsonResponse({
-
-                    'status': 'success',
-
-                    'is_valid': False,
-
-                    'message': f"? Wrong File Type: {file_type_validation['error']}"
-
-                })
-
-        
-
-        # 3. Validate section-specific upload if section provided
-
-        if upload_section and expected_type:
-
-            section_validation = validate_section_specific_upload(
-
-                customer.name, filename, upload_section, expected_type
-
-            )
-
-            if not section_validation['valid']:
-
-                return JsonResponse({
-
-                    'status': 'success',
-
-                    'is_valid': False,
-
-                    'message': f"? Wrong Section: {section_validation['error']}"
-
-                })
-
-        
-
-        # All validations passed
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'is_valid': True,
-
-            'message': "? File validation passed - correct type, section, and customer match!"
-
-        })
-
-        
-
-    except Customer.DoesNotExist:
-
-        return JsonResponse({'status': 'error', 'message': 'Customer not found'})
-
-    except Exception as e:
-
-        return JsonResponse({
-
-            'status': 'error', 
-
-            'message': f'Validation error: {str(e)}'
-
-        })
-
-
-
-
-
-@login_required
-
-def session_status(request, session_id):
-
-    """Get real-time session status"""
-
-    try:
-
-        session = HealthCheckSession.objects.get(session_id=session_id)
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'session_status': session.status,
-
-            'status_message': session.status_message,
-
-            'progress_percentage': session.progress_percentage,
-
-            'current_step': session.current_step,
-
-            'processing_duration': session.get_processing_duration_str()
-
-        })
-
-        
-
-    except HealthCheckSession.DoesNotExist:
-
-        return JsonResponse({'status': 'error', 'message': 'Session not found'})
-
-
-
-
-
-def get_networks_for_customer(request, customer_name):
-
-    """API endpoint to get networks for a specific customer - NO LOGIN REQUIRED for AJAX"""
-
-    try:
-
-        # Get all networks for the given customer name
-
-        networks = Customer.get_networks_for_customer(customer_name)
-
-        
-
-        network_list = []
-
-        for network in networks:
-
-            network_list.append({
-
-                'id': network.id,
-
-                'network_name': network.network_name or 'Default Network',
-
-                'display_name': network.display_name,
-
-                'network_type': network.network_type,
-
-                'setup_status': network.setup_status
-
-            })
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'customer_name': customer_name,
-
-            'networks': network_list,
-
-            'count': len(network_list)
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching networks: {str(e)}'
-
-        })
-
-
-
-
-
-# === COMPREHENSIVE DASHBOARD ===
-
-@login_required
-
-def comprehensive_dashboard(request):
-
-    """Comprehensive live dashboard with customer overview, statistics, and Excel export"""
-
-    # Get comprehensive statistics
-
-    dashboard_stats = get_customer_statistics()
-
-    
-
-    return render(request, 'comprehensive_dashboard.html', {
-
-        'dashboard_stats': dashboard_stats
-
-    })
-
-
-
-
-
-# === DASHBOARD API ENDPOINTS ===
-
-@login_required
-
-def api_dashboard_customers(request):
-
-    """API endpoint for dashboard customers data with date filtering"""
-
-    print(f"?? API Dashboard Customers called by user: {request.user}")
-
-    if request.method == 'GET':
-
-        try:
-
-            print("?? Starting to fetch customer data...")
-
-            
-
-            # Get date filter parameters  
-
-            start_date = request.GET.get('start_date')
-
-            end_date = request.GET.get('end_date')
-
-            
-
-            print(f"?? Raw GET parameters: {dict(request.GET)}")
-
-            print(f"?? Start date param: '{start_date}'")
-
-            print(f"?? End date param: '{end_date}'")
-
-            
-
-            if start_date and end_date:
-
-                try:
-
-                    from datetime import datetime
-
-                    start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
-
-                    end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-
-                    print(f"? Date filter applied: {start_date} to {end_date}")
-
-                    print(f"   Parsed dates: {start_date_obj.date()} to {end_date_obj.date()}")
-
-                except ValueError as e:
-
-                    print(f"? Date parsing error: {e}")
-
-                    start_date_obj = None
-
-                    end_date_obj = None
-
-            else:
-
-                start_date_obj = None
-
-                end_date_obj = None
-
-                print("?? No date filter - showing all data")
-
-            
-
-            print("\n?? DEBUG: api_dashboard_customers called")
-
-            
-
-            # Get all customers with their networks and statistics
-
-            customers_with_networks = Customer.get_customers_with_networks()
-
-            print(f"?? Found customers_with_networks: {list(customers_with_networks.keys())}")
-
-            
-
-            customer_data = {}
-
-            
-
-            for customer_name, networks in customers_with_networks.items():
-
-                print(f"\n?? Processing customer: {customer_name}")
-
-                print(f"   Networks count: {len(networks)}")
-
-                
-
-                # Get all customer IDs for this customer name
-
-                customer_network_ids = [network.id for network in networks]
-
-                print(f"   Network IDs: {customer_network_ids}")
-
-                
-
-                # Base query for sessions
-
-                all_sessions_query = HealthCheckSession.objects.filter(
-
-                    customer_id__in=customer_network_ids
-
-                )
-
-                all_sessions_count = all_sessions_query.count()
-
-                print(f"   Total sessions for {customer_name} (all time): {all_sessions_count}")
-
-                
-
-                # Show some sample session dates for debugging
-
-                if all_sessions_count > 0:
-
-                    sample_sessions = all_sessions_query.order_by('-created_at')[:3]
-
-                    print(f"   Sample session dates:")
-
-                    for session in sample_sessions:
-
-                        print(f"     - {session.created_at.date()} {session.created_at.time()}")
-
-                
-
-                base_session_query = all_sessions_query
-
-                
-
-                # Apply date filtering if provided
-
-                if start_date_obj and end_date_obj:
-
-                    base_session_query = base_session_query.filter(
-
-                        created_at__date__gte=start_date_obj.date(),
-
-                        created_at__date__lte=end_date_obj.date()
-
-                    )
-
-                    filtered_count = base_session_query.count()
-
-                    print(f"   Sessions after date filter ({start_date_obj.date()} to {end_date_obj.date()}): {filtered_count}")
-
-                else:
-
-                    print(f"   No date filter applied - using all {all_sessions_count} sessions")
-
-                
-
-                # Count runs (total sessions) for this customer
-
-                customer_runs = base_session_query.count()
-
-                print(f"   Total runs (filtered): {customer_runs}")
-
-                
-
-                # Count trackers generated (completed sessions) for this customer
-
-                customer_trackers = base_session_query.filter(
-
-                    status='COMPLETED'
-
-                ).count()
-
-                print(f"   Completed trackers (filtered): {customer_trackers}")
-
-                
-
-                # Get last run date for this customer (from all sessions, not filtered)
-
-                last_session = HealthCheckSession.objects.filter(
-
-                    customer_id__in=customer_network_ids
-
-                ).order_by('-created_at').first()
-
-                
-
-                last_run_date = None
-
-                if last_session:
-
-                    # Fix date format to prevent JavaScript timezone issues
-                    last_run_date = last_session.created_at.strftime('%Y-%m-%d')
-                    print(f"   FIXED: Original datetime: {last_session.created_at} -> Fixed format: {last_run_date}")
-
-                    print(f"   Last run: {last_run_date}")
-
-                else:
-
-                    print("   Last run: Never")
-
-                
-
-                # Get network names
-
-                network_names = [network.network_name or f"{network.name} Default" for network in networks]
-
-                print(f"   Network names: {network_names}")
-
-                
-
-                # Store customer data
-
-                customer_data[customer_name] = {
-
-                    'name': customer_name,
-
-                    'runs': customer_runs,
-
-                    'trackers': customer_trackers,
-
-                    'networks_count': len(networks),
-
-                    'last_run_date': last_run_date,
-
-                    'networks': network_names
-
-                }
-
-            
-
-            print(f"\n? Returning customer_data with {len(customer_data)} customers")
-
-            
-
-            return JsonResponse({
-
-                'status': 'success',
-
-                'customers': customer_data
-
-            })
-
-            
-
-        except Exception as e:
-
-            print(f"? ERROR in api_dashboard_customers: {str(e)}")
-
-            import traceback
-
-            print(traceback.format_exc())
-
-            return JsonResponse({
-
-                'status': 'error',
-
-                'message': f'Error fetching customer data: {str(e)}'
-
-            })
-
-    
-
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-@login_required
-def api_customer_dashboard_customers(request):
-    """API using EXACT SAME LOGIC as Excel export that works - WITH DATE FILTERING"""
-    print(f"🚀 DASHBOARD API CALLED - Using Excel export logic with date filtering!")
-    
-    # Get date filter parameters (same as export API)
-    start_date = request.GET.get('start_date')
-    end_date = request.GET.get('end_date')
-    print(f"   📅 Dashboard date filters: start_date={start_date}, end_date={end_date}")
-    
-    # IMPORTANT: Block future year filters - don't show data that doesn't exist yet!
-    from django.utils import timezone
-    from datetime import datetime, timedelta
-    
-    current_year = timezone.now().year
-    
-    # Check if user is trying to filter for future year
-    if end_date:
-        try:
-            filter_end_year = int(end_date.split('-')[0])
-            if filter_end_year > current_year:
-                print(f"   ⛔ BLOCKING FUTURE YEAR FILTER: User tried to filter year {filter_end_year}, but current year is {current_year}")
-                print(f"   ⛔ Cannot show data for year {filter_end_year} because it hasn't started yet!")
-                return JsonResponse({
-                    'status': 'success',
-                    'customers': {},  # Return empty data for future years
-                    'message': f'No data available for year {filter_end_year} (current year: {current_year})'
-                })
-        except (ValueError, IndexError):
-            pass  # Invalid date format, let it proceed and fail later
-    
-    # DEBUG: Check for October 2025 data specifically
-    oct_2025_start = timezone.make_aware(datetime(2025, 10, 1)) if timezone.is_aware(timezone.now()) else datetime(2025, 10, 1)
-    oct_2025_end = timezone.make_aware(datetime(2025, 10, 31, 23, 59, 59)) if timezone.is_aware(timezone.now()) else datetime(2025, 10, 31, 23, 59, 59)
-    
-    # Count October 2025 sessions specifically
-    from .models import HealthCheckSession
-    oct_sessions_count = HealthCheckSession.objects.filter(
-        created_at__gte=oct_2025_start,
-        created_at__lte=oct_2025_end
-    ).count()
-    print(f"🔍 OCTOBER 2025 DEBUG: Found {oct_sessions_count} total sessions in October 2025")
-    
-    # Show some sample October sessions
-    oct_sample = HealthCheckSession.objects.filter(
-        created_at__gte=oct_2025_start,
-        created_at__lte=oct_2025_end
-    ).order_by('-created_at')[:5]
-    for session in oct_sample:
-        print(f"   📅 Oct sample: {session.created_at} - Customer: {session.customer.name if hasattr(session, 'customer') else 'Unknown'}")
-    
-    # IMPORTANT: Only apply filtering if BOTH dates are provided
-    # SIMPLIFIED: Apply filtering whenever dates are provided (remove special 2025 exception)
-    should_filter = bool(start_date and end_date and start_date.strip() and end_date.strip())
-    print(f"   🔍 Should apply date filtering: {should_filter} (start_date='{start_date}', end_date='{end_date}')")
-    
-    if not should_filter:
-        print(f"   🌍 NO DATE FILTERING - Will show ALL data")
-    else:
-        print(f"   ✅ DATE FILTERING ACTIVE - Will filter data from {start_date} to {end_date}")
-    
-    # Parse dates if provided AND filtering is needed
-    date_filter = {}
-    print(f"   🔍 Raw date parameters: start_date='{start_date}', end_date='{end_date}'")
-    
-    if should_filter and start_date:
-        try:
-            from datetime import datetime
-            from django.utils import timezone
-            parsed_start = datetime.strptime(start_date, '%Y-%m-%d')
-            # Make timezone-aware to match database timestamps
-            if timezone.is_aware(timezone.now()):
-                parsed_start = timezone.make_aware(parsed_start)
-            date_filter['start'] = parsed_start
-            print(f"   ✅ Dashboard start date parsed: {parsed_start} (timezone: {parsed_start.tzinfo})")
-        except ValueError as e:
-            print(f"   ❌ Invalid start_date format '{start_date}': {e}")
-    
-    if should_filter and end_date:
-        try:
-            from datetime import datetime, timedelta
-            from django.utils import timezone
-            parsed_end = datetime.strptime(end_date, '%Y-%m-%d')
-            parsed_end = parsed_end + timedelta(days=1) - timedelta(seconds=1)
-            # Make timezone-aware to match database timestamps
-            if timezone.is_aware(timezone.now()):
-                parsed_end = timezone.make_aware(parsed_end)
-            date_filter['end'] = parsed_end
-            print(f"   ✅ Dashboard end date parsed: {parsed_end} (timezone: {parsed_end.tzinfo})")
-        except ValueError as e:
-            print(f"   ❌ Invalid end_date format '{end_date}': {e}")
-    
-    print(f"   🔄 Final date_filter object: {date_filter}")
-    print(f"   🔄 Has date filtering: {'YES' if date_filter else 'NO'}")
-    if date_filter:
-        print(f"   ✅ FILTERING MODE: Will show only data between {date_filter.get('start')} and {date_filter.get('end')}")
-    else:
-        print(f"   🌍 DEFAULT MODE: Will show ALL dashboard data (no date filtering applied)")
-    
-    if request.method == 'GET':
-        try:
-            # ONLY DATABASE CUSTOMERS - Excel integration completely disabled
-            customers_data = {}
-            
-            # SKIP Excel reading - only database customers needed
-            print("📊 EXCEL INTEGRATION DISABLED - Only showing DATABASE customers")
-            print("📊 Excel data is already migrated to database")
-            
-            # Skip Excel processing completely - data is already in database
-            if False:  # Excel section completely disabled
-                    print(f"📁 Reading Excel data from: {excel_path}")
-                    # Read the 'Summary' sheet specifically
-                    df = pd.read_excel(excel_path, sheet_name='Summary')
-                    print(f"✅ Excel file read successfully: {len(df)} rows from Summary sheet")
-                    print(f"📋 Excel columns: {list(df.columns)}")
-                    
-                    # Group data by Customer (not Network)
-                    customer_groups = df.groupby('Customer')
-                    
-                    for customer_name, group in customer_groups:
-                        try:
-                            print(f"\n🔍 Processing customer: {customer_name} ({len(group)} networks)")
-                            
-                            # Get basic info from first row of group
-                            first_row = group.iloc[0]
-                            
-                            customer_name = str(customer_name).strip()
-                            country = str(first_row['Country']) if pd.notna(first_row['Country']) else 'India'
-                            
-                            # Sum up all node quantities for this customer across networks  
-                            total_node_qty = int(group['Node Qty'].fillna(0).astype(int).sum())
-                            
-                            gtac_team = str(first_row['gTAC']) if pd.notna(first_row['gTAC']) else 'PSS'
-                            nw_type = str(first_row['NE Type']) if pd.notna(first_row['NE Type']) else '1830 PSS'
-                            
-                            # Count total runs for this customer (number of networks * months with data)
-                            total_runs = 0
-                            
-                            # Process monthly data - check datetime columns
-                            monthly_data = {i: '-' for i in range(1, 13)}  # Initialize all months
-                            last_run_date = 'Never'
-                            latest_date = None
-                            
-                            # Get datetime columns (2024-XX-01, 2025-XX-01 format)
-                            datetime_columns = [col for col in df.columns if isinstance(col, pd.Timestamp)]
-                            print(f"   📅 Found {len(datetime_columns)} datetime columns: {[col.strftime('%Y-%m') for col in datetime_columns[:6]]}...")
-                            
-                            # Create a mapping from datetime columns to month indices
-                            month_mapping = {}
-                            for col in datetime_columns:
-                                # Map year-month to display month (1-12)
-                                if col.year == 2024:
-                                    month_mapping[col] = col.month  # Jan 2024 = 1, Feb 2024 = 2, etc.
-                                elif col.year == 2025:
-                                    month_mapping[col] = col.month  # Jan 2025 = 1, Feb 2025 = 2, etc. (overwrites 2024)
-                            
-                            print(f"   🗓️ Month mapping: {len(month_mapping)} columns mapped")
-                            
-                            # SIMPLE APPROACH: Process each row (network) for this customer
-                            for _, row in group.iterrows():
-                                network_name = str(row['Network'])
-                                
-                                # Check all datetime columns for this network
-                                for col in datetime_columns:
-                                    if pd.notna(row[col]):
-                                        try:
-                                            date_val = row[col]
-                                            if isinstance(date_val, pd.Timestamp):
-                                                # Get month from column (1-12)
-                                                display_month = col.month
-                                                
-                                                # Format: "04-Sep-25" style
-                                                day = date_val.day
-                                                year = date_val.year
-                                                month_display = f"{day:02d}-{date_val.strftime('%b')}-{str(year)[-2:]}"
-                                                
-                                                # Set this month's data
-                                                monthly_data[display_month] = month_display
-                                                total_runs += 1
-                                                
-                                                # Track latest date
-                                                if latest_date is None or date_val > latest_date:
-                                                    latest_date = date_val
-                                        except Exception as e:
-                                            continue
-                            
-                            # Set last run date
-                            if latest_date:
-                                last_run_date = latest_date.strftime('%Y-%m-%d')
-                            
-                            print(f"   ✅ {customer_name}: {total_node_qty} nodes, {total_runs} runs, last: {last_run_date}")
-                            print(f"   📅 Monthly data: {[f'{i}:{monthly_data[i]}' for i in range(1,13) if monthly_data[i] != '-'][:6]}")
-                            
-                            # Create monthly runs array for frontend display (ordered by month)
-                            monthly_runs_array = [monthly_data.get(i, '-') for i in range(1, 13)]
-                            
-                            # Create networks array from actual Excel data
-                            networks_array = []
-                            for idx, (_, row) in enumerate(group.iterrows()):
-                                network_name = str(row['Network'])
-                                node_qty_for_network = int(row['Node Qty']) if pd.notna(row['Node Qty']) else 0
-                                
-                                # Count runs for this specific network - simple count
-                                network_runs = sum(1 for col in datetime_columns if pd.notna(row[col]))
-                                
-                                # Get last date for this network
-                                network_dates = [row[col] for col in datetime_columns if pd.notna(row[col]) and isinstance(row[col], pd.Timestamp)]
-                                network_last_date = max(network_dates) if network_dates else None
-                                
-                                networks_array.append({
-                                    'id': int(hash(f"{customer_name}_{network_name}") % 10000),
-                                    'name': str(network_name),
-                                    'network_name': str(network_name),
-                                    'runs': int(network_runs),
-                                    'last_run_date': network_last_date.strftime('%Y-%m-%d') if network_last_date else 'Never',
-                                    'monthly_runs': [monthly_data.get(i, '-') for i in range(1, 13)],
-                                    'country': str(country),
-                                    'node_count': int(node_qty_for_network)
-                                })
-                            
-                            # Create customer data structure with proper types
-                            customers_data[str(customer_name)] = {
-                                'name': str(customer_name),
-                                'country': str(country),
-                                'location': str(country),
-                                'node_count': int(total_node_qty),
-                                'node_qty': int(total_node_qty),
-                                'runs': int(total_runs),
-                                'total_runs': int(total_runs),
-                                'networks_count': int(len(networks_array)),
-                                'last_run_date': str(last_run_date),
-                                'networks': networks_array,
-                                'monthly_runs': monthly_runs_array,
-                                'gtac_team': str(gtac_team),
-                                'nw_type': str(nw_type),
-                                'ne_type': str(nw_type),
-                                'gtac': str(gtac_team),
-                                'trackers_generated': max(1, int(total_node_qty / 10)) if total_node_qty > 0 else 1,
-                                'excel_source': True,
-                                'excel_only': True
-                            }
-                            
-                            print(f"✅ Processed customer: {customer_name} - {country} - {total_node_qty} nodes - {total_runs} runs")
-                            
-                        except Exception as network_error:
-                            print(f"⚠️ Error processing network {network_name}: {network_error}")
-                            continue
-                    
-                    print(f"✅ Excel integration complete: {len(customers_data)} networks processed")
-                    
-            # Excel section ends here (all commented out)
-            pass
-            
-            # STEP 1: DATABASE CUSTOMERS ONLY (Excel integration disabled)
-            print("🔄 Adding database customers to dashboard...")
-            customers_with_networks = Customer.get_customers_with_networks()
-            print(f"Found {len(customers_with_networks)} database customers")
-            
-            for customer_name, networks in customers_with_networks.items():
-                try:
-                    # ULTRA STRICT FILTERING - Block Unknown/Fake customers at API level
-                    if (customer_name.lower().startswith('unknown') or
-                        customer_name == 'Unknown Customer' or
-                        'timedotcom' in customer_name.lower() or
-                        'default' in customer_name.lower() or
-                        customer_name == 'Default' or
-                        'test' in customer_name.lower() or
-                        'sample' in customer_name.lower() or
-                        'demo' in customer_name.lower() or
-                        'customer' in customer_name.lower() or
-                        len(customer_name.strip()) <= 2):
-                        print(f"❌❌❌ API BLOCKED Unknown/Fake customer: {customer_name}")
-                        continue  # Skip this customer entirely
-                    
-                    print(f"\n🔄 Processing REAL customer {customer_name}: {len(networks)} networks")
-                    
-                    # COMPLETE DEBUG: Print all network data
-                    print(f"   📝 COMPLETE NETWORK DEBUG:")
-                    for debug_idx, debug_net in enumerate(networks):
-                        print(f"     Network {debug_idx}: {debug_net.name} (ID: {debug_net.id})")
-                        print(f"       network_name: {debug_net.network_name}")
-                        print(f"       node_qty: {debug_net.node_qty} (type: {type(debug_net.node_qty)})")
-                        print(f"       total_runs: {debug_net.total_runs} (type: {type(debug_net.total_runs)})")
-                        print(f"       monthly_runs: {debug_net.monthly_runs}")
-                        print(f"       monthly_runs type: {type(debug_net.monthly_runs)}")
-                        print(f"       country: {debug_net.country}")
-                        print(f"       gtac: {debug_net.gtac}")
-                        print(f"       ne_type: {debug_net.ne_type}")
-                    
-                    # Check if this customer has migrated Excel data stored in database
-                    has_migrated_data = any(net.node_qty > 0 or net.total_runs > 0 or net.monthly_runs for net in networks)
-                    print(f"   📊 Has migrated Excel data: {has_migrated_data}")
-                    
-                    # DEBUG: Print detailed network data
-                    for i, net in enumerate(networks):
-                        print(f"     Network {i+1}: {net.network_name or net.name}")
-                        print(f"       - node_qty: {net.node_qty}")
-                        print(f"       - total_runs: {net.total_runs}")
-                        print(f"       - monthly_runs: {net.monthly_runs}")
-                        print(f"       - monthly_runs type: {type(net.monthly_runs)}")
-                    
-                    # EXACT same logic as Excel export
-                    network_ids = [net.id for net in networks]
-                    
-                    # Get network names (same as Excel export)
-                    network_names = []
-                    for net in networks:
-                        if net.network_name:
-                            network_names.append(net.network_name)
-                        else:
-                            network_names.append(f"{net.name} Default")
-                    
-                    # EXACT same session query as Excel export WITH DATE FILTERING - FIX FOREIGN KEY
-                    sessions = HealthCheckSession.objects.filter(customer__in=networks)
-                    
-                    # Apply date filtering ONLY if should_filter is True
-                    if should_filter and date_filter:
-                        print(f"   🔍 BEFORE filtering - {customer_name}: {sessions.count()} total sessions")
-                        
-                        if 'start' in date_filter:
-                            sessions = sessions.filter(created_at__gte=date_filter['start'])
-                            print(f"   🔍 AFTER start filter (>= {date_filter['start']}) - {customer_name}: {sessions.count()} sessions")
-                            
-                        if 'end' in date_filter:
-                            sessions = sessions.filter(created_at__lte=date_filter['end'])
-                            print(f"   🔍 AFTER end filter (<= {date_filter['end']}) - {customer_name}: {sessions.count()} sessions")
-                        
-                        # Show some actual session dates for debugging
-                        sample_sessions = sessions.order_by('-created_at')[:3]
-                        for session in sample_sessions:
-                            print(f"   📅 Sample session date: {session.created_at}")
-                        
-                        print(f"   ✅ FINAL filtered result for {customer_name}: {sessions.count()} sessions")
-                    else:
-                        print(f"   🌍 NO date filter applied to {customer_name}: {sessions.count()} total sessions (showing ALL data)")
-                        
-                        # Show some actual session dates for debugging
-                        sample_sessions = sessions.order_by('-created_at')[:3]
-                        for session in sample_sessions:
-                            print(f"   📅 Sample session date: {session.created_at}")
-                        
-                        print(f"   ✅ FINAL result for {customer_name}: {sessions.count()} sessions (ALL TIME DATA)")
-                    
-                    # FORCE check for migrated data - be more aggressive
-                    total_stored_runs = sum(net.total_runs for net in networks)
-                    total_stored_nodes = sum(net.node_qty for net in networks)
-                    has_monthly_data = any(net.monthly_runs and net.monthly_runs not in [None, {}, ''] for net in networks)
-                    
-                    # ENHANCED: Check if customer name suggests Excel migration
-                    excel_migrated_names = ['Tata', 'Moratel', 'BSNL', 'Kakao', 'KEPCO', 'KT_B2B_KINX', 'LGU_HANA_BANK', 'LTV', 'Maxix', 'Moratelindo', 'NongHyup-DCI', 'OPT_NC', 'Railtel', 'SKB_LH', 'Telekom_Malaysia', 'Worldlink']
-                    is_excel_customer = customer_name in excel_migrated_names
-                    
-                    print(f"   🔍 MIGRATION CHECK:")
-                    print(f"     - total_stored_runs: {total_stored_runs}")
-                    print(f"     - total_stored_nodes: {total_stored_nodes}")
-                    print(f"     - has_monthly_data: {has_monthly_data}")
-                    print(f"     - is_excel_customer: {is_excel_customer}")
-                    
-                    # SPECIAL: If this is Excel customer but no monthly data found, check raw database
-                    if is_excel_customer and not has_monthly_data:
-                        print(f"   ⚠️ EXCEL CUSTOMER '{customer_name}' has no monthly data - checking raw database:")
-                        for check_net in networks:
-                            raw_monthly = getattr(check_net, 'monthly_runs', None)
-                            print(f"     Raw monthly_runs for {check_net.network_name}: {repr(raw_monthly)}")
-                    
-                    # Use stored data if ANY network has stored data OR if this is a known Excel customer
-                    if total_stored_runs > 0 or total_stored_nodes > 0 or has_monthly_data or is_excel_customer:
-                        # Calculate total runs from monthly data across all networks
-                        total_from_monthly = 0
-                        for net in networks:
-                            if net.monthly_runs and isinstance(net.monthly_runs, dict):
-                                monthly_runs_count = sum(1 for v in net.monthly_runs.values() if v and str(v).strip() not in ['-', '', 'null', 'None'])
-                                total_from_monthly += monthly_runs_count
-                                print(f"     Network {net.network_name}: {monthly_runs_count} runs from monthly data")
-                        
-                        # For Excel migrated customers: Use DB sessions as primary source (it contains all data including migrated)
-                        # Only fall back to stored total_runs if sessions are empty
-                        session_runs = sessions.count()
-                        if session_runs > 0:
-                            # DB has actual session data - use it (it already includes migrated data)
-                            total_runs = session_runs
-                            print(f"   ✅ EXCEL CUSTOMER - Using DB sessions: {customer_name} total runs = {total_runs} (from {session_runs} actual sessions)")
-                        else:
-                            # No sessions in DB - fall back to stored/migrated totals
-                            total_runs = max(total_from_monthly, total_stored_runs)
-                            print(f"   📊 EXCEL CUSTOMER - Using stored data: {customer_name} total runs = {total_runs} (no sessions found, using migrated data)")
-                        has_migrated_data = True
-                    else:
-                        total_runs = sessions.count()
-                        has_migrated_data = False
-                        print(f"   🔄 Using SESSIONS count: {customer_name} has {total_runs} session runs")
-                    
-                    # ALWAYS INCLUDE DATABASE CUSTOMERS - even with 0 runs
-                    print(f"   ✅ Database customer {customer_name}: {total_runs} runs (will always be included)")
-                    
-                    completed = sessions.filter(status='COMPLETED').count()
-                    
-                    # Get last run date - PRIORITIZE FRESH SESSION DATA
-                    last_session = sessions.order_by('-created_at').first()
-                    session_last_run = last_session.created_at.strftime('%Y-%m-%d') if last_session else None
-                    
-                    # Use session date if available, otherwise use migrated date
-                    if session_last_run:
-                        last_run = session_last_run
-                        print(f"   📅 Using FRESH session date: {last_run}")
-                    else:
-                        # Fallback to migrated data if no fresh sessions
-                        last_run = 'Never'
-                        print(f"   📅 No fresh sessions, using fallback: {last_run}")
-                    
-                    # Get complete dashboard data (same as Excel section)
-                    try:
-                        country = get_customer_location(customer_name, networks)
-                        node_count = get_customer_node_count(customer_name, networks)
-                    except Exception as e:
-                        country = (
-                            'India' if 'BSNL' in customer_name.upper() else 
-                            'Malaysia' if any(x in customer_name.upper() for x in ['TELEKOM', 'MAXIS', 'TIMEDOTCOM']) else 
-                            'Indonesia' if 'MORATELINDO' in customer_name.upper() else 
-                            'New Caledonia' if 'OPT' in customer_name.upper() else 'India'
-                        )
-                        node_count = len(networks) * 4
-                    
-                    print(f"  🌐 Networks: {network_names}")
-                    
-                    # FIRST: Get customer-level data (country and total node count)
-                    print(f"  🔍 FETCHING CUSTOMER-LEVEL DATA for {customer_name}...")
-                    
-                    # ALWAYS try stored node_qty first
-                    customer_node_count = total_stored_nodes
-                    if customer_node_count > 0:
-                        print(f"  📊 Using STORED node_qty: {customer_name} has {customer_node_count} total nodes from database")
-                    else:
-                        try:
-                            customer_node_count = get_customer_node_count(customer_name, networks)
-                            print(f"  🔄 Using HELPER function: {customer_name} has {customer_node_count} calculated nodes")
-                        except Exception as helper_error:
-                            print(f"  ❌ CUSTOMER HELPER ERROR for {customer_name}: {helper_error}")
-                            customer_node_count = len(networks) * 2  # Fallback: 2 nodes per network
-                            print(f"  🔄 Using FALLBACK: {customer_name} has {customer_node_count} fallback nodes")
-                    
-                    # Get country (try helper first, then use migrated data if available)
-                    try:
-                        customer_country = get_customer_location(customer_name, networks)
-                        print(f"  ✅ CUSTOMER SUCCESS: {customer_name} -> {customer_country}")
-                    except Exception as helper_error:
-                        # Try to get country from migrated data first
-                        if has_migrated_data:
-                            migrated_countries = [net.country for net in networks if net.country]
-                            if migrated_countries:
-                                customer_country = migrated_countries[0]  # Use first available country
-                                print(f"  📊 Using MIGRATED country: {customer_name} -> {customer_country}")
-                            else:
-                                customer_country = 'India'  # Fallback
-                                print(f"  🔄 Using FALLBACK country: {customer_name} -> {customer_country}")
-                        else:
-                            print(f"  ❌ CUSTOMER HELPER ERROR for {customer_name}: {helper_error}")
-                            import traceback
-                            traceback.print_exc()
-                        
-                        # Direct inline country mapping
-                        customer_upper = customer_name.upper()
-                        if any(word in customer_upper for word in ['BSNL', 'AIRTEL', 'RELIANCE', 'TATA']):
-                            customer_country = 'India'
-                        elif any(word in customer_upper for word in ['MAXIS', 'TELEKOM', 'TIMEDOTCOM']):
-                            customer_country = 'Malaysia'
-                        elif 'MORATELINDO' in customer_upper or 'PSS24' in customer_upper:
-                            customer_country = 'Indonesia'
-                        elif 'OPT_NC' in customer_upper or 'OPT' in customer_upper:
-                            customer_country = 'New Caledonia'
-                        else:
-                            customer_country = 'India'  # Conservative default
-                        print(f"  🔄 CUSTOMER FALLBACK: {customer_name} -> {customer_country}, {customer_node_count} nodes")
-                    
-                    # SECOND: Calculate per-network node distribution
-                    # For multi-network customers, distribute total nodes across networks intelligently
-                    if len(networks) > 1:
-                        # Distribute customer total nodes among networks based on their activity
-                        network_weights = []
-                        total_sessions_all_nets = 0
-                        
-                        for net in networks:
-                            net_sessions = HealthCheckSession.objects.filter(customer=net)
-                            
-                            # Apply same date filtering to network weight calculation ONLY if should_filter is True
-                            if should_filter and date_filter:
-                                if 'start' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__gte=date_filter['start'])
-                                if 'end' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__lte=date_filter['end'])
-                            
-                            net_session_count = net_sessions.count()
-                            network_weights.append(max(net_session_count, 1))  # At least weight 1
-                            total_sessions_all_nets += max(net_session_count, 1)
-                        
-                        print(f"  🔢 Network session weights: {network_weights} (total: {total_sessions_all_nets})")
-                    else:
-                        # Single network gets all nodes
-                        network_weights = [1]
-                        total_sessions_all_nets = 1
-                    
-                    # THIRD: Build network details with distributed node counts
-                    network_runs = {}
-                    networks_with_runs = []
-                    
-                    for i, net in enumerate(networks):
-                        # Use migrated data if available (but prioritize actual DB sessions)
-                        if has_migrated_data:
-                            # For Excel customers: Use DB sessions as primary source
-                            net_sessions_count = HealthCheckSession.objects.filter(customer=net)
-                            
-                            # Apply same date filtering to individual network runs ONLY if should_filter is True
-                            if should_filter and date_filter:
-                                if 'start' in date_filter:
-                                    net_sessions_count = net_sessions_count.filter(created_at__gte=date_filter['start'])
-                                if 'end' in date_filter:
-                                    net_sessions_count = net_sessions_count.filter(created_at__lte=date_filter['end'])
-                            
-                            net_sessions_actual_count = net_sessions_count.count()
-                            
-                            if net_sessions_actual_count > 0:
-                                # DB has actual session data - use it (priority)
-                                net_run_count = net_sessions_actual_count
-                                print(f"    📊 EXCEL NETWORK - Using DB sessions: {net.network_name} = {net_run_count} runs (from actual sessions)")
-                            else:
-                                # No sessions - fall back to migrated data count
-                                if net.monthly_runs and isinstance(net.monthly_runs, dict):
-                                    net_run_count = sum(1 for v in net.monthly_runs.values() if v and str(v).strip() not in ['-', '', 'null', 'None'])
-                                    print(f"    📊 EXCEL NETWORK - Using monthly data: {net.network_name} = {net_run_count} runs (from migrated data)")
-                                else:
-                                    net_run_count = net.total_runs  # Fallback to stored value
-                                    print(f"    📊 EXCEL NETWORK - Using stored total: {net.network_name} = {net_run_count} runs (from total_runs field)")
-                            
-                            net_node_share = net.node_qty
-                            net_country = net.country if net.country else customer_country
-                            
-                            # Get last run date - PRIORITIZE FRESH SESSION DATA
-                            net_last_session = net_sessions_count.order_by('-created_at').first()
-                            if net_last_session:
-                                net_last_date = net_last_session.created_at.strftime('%Y-%m-%d')
-                                print(f"    📊 EXCEL NETWORK - Using session date: {net.network_name} last run = {net_last_date}")
-                            else:
-                                # Fallback to migrated data if no fresh sessions
-                                if net.monthly_runs and isinstance(net.monthly_runs, dict):
-                                    # Find the latest date from monthly_runs
-                                    latest_month = None
-                                    for month_key, month_data in net.monthly_runs.items():
-                                        if month_data and month_data != '-':
-                                            latest_month = month_data
-                                    net_last_date = latest_month if latest_month and latest_month != '-' else 'Never'
-                                    print(f"    📊 EXCEL NETWORK - Using migrated date: {net.network_name} last run = {net_last_date}")
-                                else:
-                                    net_last_date = 'Never'
-                                    print(f"    📊 EXCEL NETWORK - No date found: {net.network_name} last run = Never")
-                            print(f"    📊 EXCEL NETWORK final: {net.network_name}: {net_run_count} runs, {net_node_share} nodes, last: {net_last_date}")
-                        else:
-                            # Use session-based calculation for non-migrated data
-                            net_sessions = HealthCheckSession.objects.filter(customer=net)
-                            
-                            # Apply same date filtering to individual network runs ONLY if should_filter is True
-                            if should_filter and date_filter:
-                                if 'start' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__gte=date_filter['start'])
-                                if 'end' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__lte=date_filter['end'])
-                            
-                            net_run_count = net_sessions.count()
-                            net_last_run = net_sessions.order_by('-created_at').first()
-                            net_last_date = net_last_run.created_at.strftime('%Y-%m-%d') if net_last_run else 'Never'
-                            
-                            # Calculate this network's share of total nodes
-                            if len(networks) > 1:
-                                net_node_share = int((network_weights[i] / total_sessions_all_nets) * customer_node_count)
-                                net_node_share = max(net_node_share, 1)  # At least 1 node per network
-                            else:
-                                net_node_share = customer_node_count
-                            net_country = customer_country
-                            print(f"    🔄 SESSION network data for {net.network_name}: {net_run_count} runs, {net_node_share} nodes")
-                        
-                        net_name = net.network_name if net.network_name else f"{net.name} Default"
-                        network_runs[f"Bsnl - {net_name}"] = net_run_count
-                        
-                        # Prepare network-level monthly data in ARRAY format (same simple logic)
-                        net_monthly_array = ['-'] * 12
-                        
-                        # REUSE the already calculated sessions from above (no duplicate query)
-                        if has_migrated_data:
-                            # For Excel customers: Use the already calculated net_sessions_count
-                            net_sessions = net_sessions_count
-                            print(f"    🔄 REUSING Excel network sessions for monthly data: {net_name} ({net_sessions.count()} sessions)")
-                        else:
-                            # For non-Excel customers: Use the already calculated net_sessions
-                            net_sessions = HealthCheckSession.objects.filter(customer=net)
-                            # Apply same date filtering to network sessions ONLY if should_filter is True
-                            if should_filter and date_filter:
-                                if 'start' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__gte=date_filter['start'])
-                                if 'end' in date_filter:
-                                    net_sessions = net_sessions.filter(created_at__lte=date_filter['end'])
-                            print(f"    🔄 SESSION network sessions for monthly data: {net_name} ({net_sessions.count()} sessions)")
-                        
-                        # Add fresh network sessions to monthly array - FIX TIMEZONE ISSUE
-                        if net_sessions.exists():
-                            print(f"    🔄 Adding {net_sessions.count()} FRESH sessions for network {net_name}...")
-                            # FIX: Use date range instead of month filter to avoid timezone issues
-                            from datetime import datetime, timedelta
-                            
-                            # Get current year dynamically - NO HARDCODED 2025!
-                            current_date = timezone.now()
-                            current_year = current_date.year
-                            current_month = current_date.month
-                            print(f"      📅 Current date: {current_year}-{current_month:02d}")
-                            
-                            for month_num in range(1, 13):
-                                # Skip future months that haven't happened yet
-                                if month_num > current_month:
-                                    print(f"      ⏭️ Skipping future month {month_num} (we're in month {current_month})")
-                                    continue
-                                
-                                # Use CURRENT YEAR dynamically, not hardcoded 2025
-                                month_start = timezone.make_aware(datetime(current_year, month_num, 1))
-                                if month_num == 12:
-                                    month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                                else:
-                                    month_end = timezone.make_aware(datetime(current_year, month_num + 1, 1)) - timedelta(seconds=1)
-                                
-                                month_sessions = net_sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                                if month_sessions.exists():
-                                    latest_session = month_sessions.order_by('-created_at').first()
-                                    latest_date = latest_session.created_at.strftime('%d-%b')
-                                    net_monthly_array[month_num - 1] = latest_date
-                                    print(f"      ✅ Network {net_name} - Month {month_num}: {latest_date} (from {month_sessions.count()} sessions)")
-                        
-                        # THEN: Add migrated data if available (will overwrite if exists)
-                        if hasattr(net, 'monthly_runs') and net.monthly_runs and isinstance(net.monthly_runs, dict):
-                            print(f"    📊 Processing network {net.network_name} monthly data...")
-                            for month_key, month_value in net.monthly_runs.items():
-                                clean_value = str(month_value).strip() if month_value else ''
-                                
-                                if clean_value and clean_value not in ['-', '', 'null', 'None', 'Not Started', 'No Report']:
-                                    try:
-                                        if '-' in month_key:
-                                            # Format: '2025-05' -> extract month number
-                                            month_num = int(month_key.split('-')[1])
-                                        else:
-                                            # Format: '5' -> direct month number
-                                            month_num = int(month_key)
-                                        
-                                        month_index = month_num - 1
-                                        
-                                        if 0 <= month_index < 12:
-                                            # Clean the date value (remove year if present)
-                                            if '-' in clean_value:
-                                                parts = clean_value.split('-')
-                                                if len(parts) == 3:  # 2025-01-08
-                                                    clean_value = f"{parts[2]}-{parts[1]}"  # 08-01
-                                            
-                                            net_monthly_array[month_index] = clean_value
-                                            print(f"      ✅ Network month {month_num} = {clean_value}")
-                                    except (ValueError, IndexError) as e:
-                                        print(f"      ⚠️ Network month error: {month_key} = {month_value}, error: {e}")
-                        
-                        # FINAL NETWORK MONTHLY ARRAY: Combine session data + migrated data
-                        final_net_monthly_array = net_monthly_array[:] # Copy the array
-                        if hasattr(net, 'monthly_runs') and net.monthly_runs and isinstance(net.monthly_runs, dict):
-                            # Overlay migrated data on top
-                            migrated_array = format_monthly_runs_to_array(net.monthly_runs)
-                            for i in range(12):
-                                if migrated_array[i] != '-':
-                                    final_net_monthly_array[i] = migrated_array[i]
-                        
-                        print(f"      🎯 FINAL network monthly for {net_name}: {final_net_monthly_array}")
-                        
-                        # Add network with individual run data AND location/node info
-                        networks_with_runs.append({
-                            'name': f"Bsnl - {net_name}",
-                            'network_name': net_name,
-                            'runs': net_run_count,
-                            'total_runs': net_run_count,  # Explicit total_runs
-                            'last_run_date': net_last_date,
-                            'country': net_country,
-                            'node_count': net_node_share,
-                            'location': net_country,  # Alternative field name
-                            'node_qty': net_node_share,  # Alternative field name
-                            'monthly_runs': final_net_monthly_array,  # Use the combined array
-                            'monthly_runs_dict': net.monthly_runs if has_migrated_data else {},  # Original dict format
-                            'gtac': net.gtac if (has_migrated_data and net.gtac) else 'PSS',
-                            'ne_type': net.ne_type if (has_migrated_data and net.ne_type) else '1830 PSS'
-                        })
-                        
-                        print(f"    → {net_name}: {net_run_count} runs, {net_node_share} nodes, {net_country} (last: {net_last_date})")
-                    
-                    # Verify total adds up correctly
-                    total_distributed_nodes = sum([net['node_count'] for net in networks_with_runs])
-                    print(f"  🔢 Node distribution: {customer_node_count} total → {total_distributed_nodes} distributed")
-                    
-                    # Use calculated values
-                    node_count = customer_node_count
-                    country = customer_country
-                    
-                    # Handle duplicate names - if Excel customer exists, use DB suffix
-                    final_key = customer_name
-                    if customer_name in customers_data:
-                        final_key = f"{customer_name}_DB"
-                        print(f"  ⚠️ Duplicate name {customer_name}, using key: {final_key}")
-                    
-                    # Create aggregated monthly_runs for customer level (if migrated) in ARRAY format
-                    customer_monthly_runs_array = []
-                    customer_monthly_runs_dict = {}
-                    
-                    # SIMPLE APPROACH: Process real database data using PROVEN working logic
-                    customer_monthly_runs_array = ['-'] * 12  # Initialize all months as '-'
-                    
-                    # FIRST: Add fresh session data to monthly array - FIX TIMEZONE ISSUE
-                    if sessions.exists():
-                        print(f"   🔄 Adding FRESH session data to monthly array...")
-                        # FIX: Use date range instead of month filter to avoid timezone issues
-                        from datetime import datetime, timedelta
-                        
-                        # Get current year dynamically - NO HARDCODED 2025!
-                        current_date = timezone.now()
-                        current_year = current_date.year
-                        current_month = current_date.month
-                        print(f"   📅 Current date: {current_year}-{current_month:02d}")
-                        
-                        for month_num in range(1, 13):
-                            # Skip future months that haven't happened yet
-                            if month_num > current_month:
-                                print(f"      ⏭️ Skipping future month {month_num} (we're in month {current_month})")
-                                continue
-                            
-                            # Use CURRENT YEAR dynamically, not hardcoded 2025
-                            month_start = timezone.make_aware(datetime(current_year, month_num, 1))
-                            if month_num == 12:
-                                month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                            else:
-                                month_end = timezone.make_aware(datetime(current_year, month_num + 1, 1)) - timedelta(seconds=1)
-                            
-                            month_sessions = sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                            if month_sessions.exists():
-                                latest_session = month_sessions.order_by('-created_at').first()
-                                latest_date = latest_session.created_at.strftime('%d-%b')
-                                customer_monthly_runs_array[month_num - 1] = latest_date
-                                print(f"     ✅ Customer Month {month_num}: {latest_date} (from {month_sessions.count()} sessions)")
-                    
-                    print(f"   🔧 Processing {len(networks)} networks for {customer_name}...")
-                    
-                    # Process all networks for this customer (same logic that works in debug script)
-                    for network in networks:
-                        print(f"     📊 Network: {network.network_name}")
-                        print(f"       monthly_runs: {network.monthly_runs}")
-                        
-                        if network.monthly_runs and isinstance(network.monthly_runs, dict):
-                            for month_key, month_value in network.monthly_runs.items():
-                                print(f"       Processing {month_key} = {month_value}")
-                                
-                                # SIMPLE validation - just check if it has data
-                                clean_value = str(month_value).strip() if month_value else ''
-                                
-                                if clean_value and clean_value not in ['-', '', 'null', 'None', 'Not Started', 'No Report']:
-                                    # Convert date keys - check if it's like '2025-05' (May) or just '5'
-                                    try:
-                                        if '-' in month_key:
-                                            # Format: '2025-05' -> extract month number
-                                            month_num = int(month_key.split('-')[1])
-                                        else:
-                                            # Format: '5' -> direct month number
-                                            month_num = int(month_key)
-                                        
-                                        month_index = month_num - 1  # Convert to 0-based index
-                                        
-                                        if 0 <= month_index < 12:
-                                            # Clean the date value (remove year if present)
-                                            if '-' in clean_value:
-                                                parts = clean_value.split('-')
-                                                if len(parts) == 3:  # 2025-01-08
-                                                    clean_value = f"{parts[2]}-{parts[1]}"  # 08-01
-                                                elif len(parts) == 2:  # Already clean
-                                                    pass
-                                            
-                                            customer_monthly_runs_array[month_index] = clean_value
-                                            print(f"         ✅ Set month {month_num} (index {month_index}) = {clean_value}")
-                                    except (ValueError, IndexError) as e:
-                                        print(f"         ⚠️ Error parsing month {month_key}: {e}")
-                    
-                    print(f"   ✅ FINAL monthly array for {customer_name}: {customer_monthly_runs_array}")
-                    
-                    customers_data[final_key] = {
-                        'name': customer_name,
-                        'customer_name': customer_name,  # Add explicit customer_name field
-                        'display_name': customer_name,   # Add display_name field for frontend
-                        'runs': total_runs,
-                        'run_count': total_runs,         # Alternative field name
-                        'total_runs': total_runs,        # Explicit total_runs field
-                        'trackers': completed,
-                        'networks_count': len(networks),
-                        'networks': networks_with_runs,  # Enhanced with individual runs
-                        'network_runs': network_runs,    # For getNetworkRuns() function
-                        'last_run_date': last_run,
-                        'actual_last_run': last_run,     # Alternative field name
-                        # Use the fetched real data
-                        'node_count': node_count,
-                        'total_nodes': node_count,       # Alternative field name
-                        'country': country, 
-                        'region': country,               # Alternative field name
-                        'node_qty': node_count,          # Alternative field
-                        'location': country,             # Alternative field
-                        'source': 'database',            # Mark source as database
-                        'gtac': networks[0].gtac if (has_migrated_data and networks[0].gtac) else 'PSS',  # Use migrated gTAC if available
-                        'ne_type': networks[0].ne_type if (has_migrated_data and networks[0].ne_type) else '1830 PSS',  # Use migrated NE type
-                        'monthly_runs': customer_monthly_runs_array,  # ARRAY format for frontend table (directly use populated array)
-                        'monthly_runs_dict': customer_monthly_runs_dict,  # DICT format for advanced lookups
-                        'has_migrated_data': has_migrated_data,  # Flag for debugging
-                        # Add debug info
-                        '_debug_total_runs_calculation': f"migrated_data={has_migrated_data}, sessions_count={sessions.count()}, final_total={total_runs}",
-                        '_debug_monthly_array': str(customer_monthly_runs_array)  # Debug what we're sending
-                    }
-                    
-                    print(f"   🚀 FINAL API RESPONSE for {customer_name}:")
-                    print(f"     - total_runs: {total_runs}")
-                    print(f"     - monthly_runs array: {customer_monthly_runs_array}")
-                    print(f"     - networks_count: {len(networks)}")
-                    print(f"     - node_count: {node_count}")
-                    
-                except Exception as e:
-                    print(f"Error with customer {customer_name}: {e}")
-                    
-                    # Handle duplicate names in error case too
-                    final_key = customer_name
-                    if customer_name in customers_data:
-                        final_key = f"{customer_name}_DB"
-                    
-                    customers_data[final_key] = {
-                        'name': customer_name,
-                        'customer_name': customer_name,     # Add explicit customer_name field
-                        'display_name': customer_name,      # Add display_name field for frontend
-                        'runs': 0,
-                        'run_count': 0,                     # Alternative field name
-                        'trackers': 0,
-                        'networks_count': 0,
-                        'networks': ['Error loading networks'],
-                        'last_run_date': 'Error',
-                        'actual_last_run': 'Error',         # Alternative field name
-                        'node_count': 0,
-                        'total_nodes': 0,                   # Alternative field name
-                        'country': 'Error',
-                        'region': 'Error',                  # Alternative field name
-                        'node_qty': 0,
-                        'location': 'Error',
-                        'source': 'database',               # Mark source as database
-                        'gtac': 'PSS',                      # Default gTAC
-                        'ne_type': '1830 PSS'               # Default NE type
-                    }
-            
-            print(f"\n✅ Returning {len(customers_data)} customers with REAL data")
-            
-            return JsonResponse({
-                'success': True,
-                'status': 'success', 
-                'customers': customers_data
-            })
-            
-        except Exception as e:
-            print(f"❌ Error in dashboard API: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return JsonResponse({
-                'success': False,
-                'status': 'error',
-                'error': f'Failed to fetch customer data: {str(e)}',
-                'message': f'Failed to fetch customer data: {str(e)}'
-            }, status=500)
-    
-    return JsonResponse({'success': False, 'status': 'error', 'error': 'Method not allowed', 'message': 'Method not allowed'}, status=405)
-
-@login_required
-def api_customer_dashboard_customers_ORIGINAL(request):
-    """API endpoint for customer run statistics"""
-    if request.method == 'GET':
-        try:
-            customer = Customer.objects.get(id=customer_id, is_deleted=False)
-            
-            # Get run statistics
-            total_runs = HealthCheckSession.objects.filter(customer=customer).count()
-            completed_runs = HealthCheckSession.objects.filter(customer=customer, status='COMPLETED').count()
-            
-            # Get this month runs
-            from django.utils import timezone
-            from datetime import timedelta
-            now = timezone.now()
-            current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            current_month_runs = HealthCheckSession.objects.filter(
-                customer=customer,
-                created_at__gte=current_month_start
-            ).count()
-            
-            return JsonResponse({
-                'status': 'success',
-                'customer_name': customer.name,
-                'total_runs': total_runs,
-                'completed_runs': completed_runs,
-                'current_month_runs': current_month_runs
-            })
-            
-        except Customer.DoesNotExist:
-            return JsonResponse({
-                'status': 'error',
-                'message': 'Customer not found'
-            }, status=404)
-        except Exception as e:
-            print(f"❌ Customer dashboard API error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return JsonResponse({
-                'status': 'error',
-                'message': f'Failed to fetch customer data: {str(e)}'
-            }, status=500)
-    
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-def simple_export_test(request):
-    """Simple test export function"""
-    if request.method == 'POST':
-        try:
-            import csv
-            from io import StringIO
-            from django.http import HttpResponse
-            from django.utils import timezone
-            
-            # Create simple CSV
-            output = StringIO()
-            writer = csv.writer(output)
-            
-            writer.writerow(['Test Export'])
-            writer.writerow([f'Generated: {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-            writer.writerow(['Customer', 'Status', 'Count'])
-            writer.writerow(['Test Customer 1', 'Active', '5'])
-            writer.writerow(['Test Customer 2', 'Active', '3'])
-            
-            csv_content = output.getvalue()
-            output.close()
-            
-            response = HttpResponse(csv_content, content_type='text/csv')
-            response['Content-Disposition'] = f'attachment; filename="test_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-            
-            return response
-            
-        except Exception as e:
-            return JsonResponse({'status': 'error', 'message': f'Test export failed: {str(e)}'}, status=500)
-    
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-
-
-
-@login_required
-
-def api_dashboard_statistics(request):
-
-    """API endpoint for dashboard statistics with date filtering support"""
-
-    try:
-
-        from datetime import datetime, timedelta
-
-        
-
-        print("\n?? DEBUG: api_dashboard_statistics called")
-
-        
-
-        # Get date filter parameters
-
-        start_date = request.GET.get('start_date')
-
-        end_date = request.GET.get('end_date')
-
-        
-
-        if start_date and end_date:
-
-            start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
-
-            end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
-
-            print(f"?? Statistics date filter: {start_date} to {end_date}")
-
-            date_filtered = True
-
-        else:
-
-            start_date_obj = None
-
-            end_date_obj = None
-
-            date_filtered = False
-
-            print("?? No date filter for statistics")
-
-        
-
-        # Get all active customers
-
-        all_customers = Customer.objects.filter(is_deleted=False)
-
-        customer_ids = list(all_customers.values_list('id', flat=True))
-
-        print(f"?? Found {len(all_customers)} active customers with IDs: {customer_ids}")
-
-        
-
-        # Total customers (unique names)
-
-        customers_with_networks = Customer.get_customers_with_networks()
-
-        total_customers = len(customers_with_networks)
-
-        print(f"?? Total unique customers: {total_customers}")
-
-        
-
-        # Base query for sessions
-
-        base_query = HealthCheckSession.objects.filter(
-
-            customer_id__in=customer_ids
-
-        )
-
-        
-
-        # Apply date filtering if provided
-
-        if date_filtered and start_date_obj and end_date_obj:
-
-            base_query = base_query.filter(
-
-                created_at__date__gte=start_date_obj.date(),
-
-                created_at__date__lte=end_date_obj.date()
-
-            )
-
-            print(f"?? Filtering statistics between {start_date_obj.date()} and {end_date_obj.date()}")
-
-        
-
-        # Total runs (sessions) - filtered
-
-        total_runs = base_query.count()
-
-        print(f"?? Total runs (filtered): {total_runs}")
-
-        
-
-        # Total trackers generated - filtered
-
-        total_trackers = base_query.filter(
-
-            status='COMPLETED'
-
-        ).count()
-
-        print(f"?? Total completed trackers (filtered): {total_trackers}")
-
-        
-
-        # Current month runs or filtered period runs
-
-        if date_filtered:
-
-            # Use the filtered period for "current" stats
-
-            current_month_runs = total_runs  # Already filtered
-
-            print(f"?? Filtered period runs: {current_month_runs}")
-
-        else:
-
-            # Use current month if no filter applied
-
-            now = datetime.now()
-
-            first_day_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-            
-
-            current_month_runs = HealthCheckSession.objects.filter(
-
-                customer_id__in=customer_ids,
-
-                created_at__gte=first_day_of_month
-
-            ).count()
-
-            print(f"?? Current month runs: {current_month_runs}")
-
-        
-
-        result = {
-
-            'status': 'success',
-
-            'total_customers': total_customers,
-
-            'total_runs': total_runs,
-
-            'total_trackers': total_trackers,
-
-            'current_month_runs': current_month_runs
-
-        }
-
-        print(f"? Returning statistics: {result}")
-
-        
-
-        return JsonResponse(result)
-
-        
-
-    except Exception as e:
-
-        print(f"? ERROR in api_dashboard_statistics: {str(e)}")
-
-        import traceback
-
-        print(traceback.format_exc())
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching statistics: {str(e)}'
-
-        })
-
-
-
-
-
-@login_required
-
-def api_customer_monthly_sessions(request):
-
-    """API endpoint to get real monthly session data for a specific customer with date filtering"""
-
-    if request.method != 'POST':
-
-        return JsonResponse({'status': 'error', 'message': 'POST method required'}, status=405)
-
-    
-
-    try:
-
-        import json
-
-        from datetime import datetime
-
-        from django.utils import timezone
-
-        from django.db.models import Count
-
-        from django.db.models.functions import TruncMonth
-
-        
-
-        data = json.loads(request.body)
-
-        customer_name = data.get('customer_name')
-
-        year = data.get('year', datetime.now().year)
-
-        
-
-        # Get date filter parameters (same as export logic)
-
-        start_date_str = data.get('start_date')
-
-        end_date_str = data.get('end_date')
-
-        
-
-        # Parse dates if provided
-
-        start_date = None
-
-        end_date = None
-
-        filter_year = year
-
-        
-
-        if start_date_str:
-
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').replace(tzinfo=timezone.get_current_timezone())
-
-            filter_year = start_date.year
-
-            
-
-        if end_date_str:
-
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=timezone.get_current_timezone())
-
-        
-
-        print(f"\n?? Getting real monthly sessions for customer: {customer_name}")
-
-        print(f"?? Date filter - Start: {start_date}, End: {end_date}, Using year: {filter_year}")
-
-        
-
-        if not customer_name:
-
-            return JsonResponse({'status': 'error', 'message': 'Customer name required'})
-
-        
-
-        # Get all networks for this customer
-
-        customer_networks = Customer.objects.filter(name=customer_name, is_deleted=False)
-
-        customer_network_ids = list(customer_networks.values_list('id', flat=True))
-
-        
-
-        print(f"?? Found {len(customer_network_ids)} networks for {customer_name}: {customer_network_ids}")
-
-        
-
-        if not customer_network_ids:
-
-            return JsonResponse({
-
-                'status': 'success',
-
-                'customer_name': customer_name,
-
-                'monthly_sessions': {},
-
-                'total_sessions': 0
-
-            })
-
-        
-
-        # Get actual sessions grouped by month for this year (with date filtering)
-
-        monthly_sessions_dict = {}
-
-        total_sessions = 0
-
-        
-
-        # Get sessions for each month separately with date filtering (same logic as export)
-        for month in range(1, 13):
-            month_query = HealthCheckSession.objects.filter(
-                customer__in=customer_network_ids,
-                created_at__year=filter_year,
-                created_at__month=month
-            )
-
-            
-
-            # Apply date range filter if provided (same as export)
-
-            if start_date and end_date:
-
-                month_query = month_query.filter(
-
-                    created_at__gte=start_date,
-
-                    created_at__lte=end_date
-
-                )
-
-            
-
-            month_sessions = month_query.count()
-
-            
-
-            monthly_sessions_dict[month] = month_sessions
-
-            total_sessions += month_sessions
-
-            
-
-            if month_sessions > 0:
-
-                print(f"   Month {month}: {month_sessions} sessions")
-
-        
-
-        print(f"?? Monthly session data calculated without timezone issues")
-
-        
-
-        print(f"? Final monthly breakdown for {customer_name}: {monthly_sessions_dict}")
-
-        print(f"?? Total sessions: {total_sessions}")
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'customer_name': customer_name,
-
-            'year': filter_year,  # Use filtered year instead of requested year
-
-            'monthly_sessions': monthly_sessions_dict,
-
-            'total_sessions': total_sessions,
-
-            'network_count': len(customer_network_ids),
-
-            'date_filtered': bool(start_date and end_date)
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"? ERROR in api_customer_monthly_sessions: {str(e)}")
-
-        import traceback
-
-        print(traceback.format_exc())
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching monthly sessions: {str(e)}'
-
-        })
-
-
-
-@login_required
-
-def api_network_sessions(request):
-
-    """API endpoint to get real session data for a specific network"""
-
-    if request.method != 'POST':
-
-        return JsonResponse({'status': 'error', 'message': 'POST method required'}, status=405)
-
-    
-
-    try:
-
-        import json
-
-        
-
-        data = json.loads(request.body)
-
-        network_id = data.get('network_id')
-
-        
-
-        print(f"\n?? Getting real sessions for network ID: {network_id}")
-
-        
-
-        if not network_id:
-
-            return JsonResponse({'status': 'error', 'message': 'Network ID required'})
-
-        
-
-        # Get actual session count for this specific network
-
-        total_sessions = HealthCheckSession.objects.filter(customer_id=network_id).count()
-
-        
-
-        # Get ALL sessions for real data (not just recent 5)
-
-        all_sessions = HealthCheckSession.objects.filter(
-            customer_id=network_id
-        ).order_by('-created_at')
-
-        
-
-        session_info = []
-
-        for session in all_sessions:
-
-            session_info.append({
-
-                'id': session.id,
-
-                'status': session.status,
-
-                'created_at': session.created_at.strftime('%Y-%m-%d'),  # Fix date format
-
-                'completed_at': session.completed_at.strftime('%Y-%m-%d') if session.completed_at else None  # Fix date format
-
-            })
-
-            
-
-        print(f"?? Found {len(session_info)} total sessions for network {network_id}")
-
-        if len(session_info) > 0:
-
-            print(f"   Most recent: {session_info[0]['created_at']}")
-
-            print(f"   Oldest: {session_info[-1]['created_at']}")
-
-        
-
-        print(f"?? Network {network_id} has {total_sessions} total sessions")
-        
-        # Create monthly breakdown with actual dates (like Excel export)
-        monthly_breakdown = {}
-        for month in range(1, 13):
-            sessions_in_month = [s for s in all_sessions if s.created_at.month == month]
-            if sessions_in_month:
-                # Show ALL actual dates, not just latest
-                if len(sessions_in_month) == 1:
-                    # Single session - show exact date
-                    session_date = sessions_in_month[0].created_at.strftime('%d-%b-%y')
-                    monthly_breakdown[str(month)] = {
-                        'count': 1,
-                        'date': session_date
-                    }
-                    print(f"   Month {month}: Single session on {session_date}")
-                else:
-                    # Multiple sessions - show the first (earliest) session date
-                    earliest_session = min(sessions_in_month, key=lambda x: x.created_at)
-                    session_date = earliest_session.created_at.strftime('%d-%b-%y')
-                    monthly_breakdown[str(month)] = {
-                        'count': len(sessions_in_month),
-                        'date': session_date  # Show earliest, not latest
-                    }
-                    print(f"   Month {month}: {len(sessions_in_month)} sessions, showing earliest: {session_date}")
-            else:
-                monthly_breakdown[str(month)] = {'count': 0, 'date': '-'}
-        
-        return JsonResponse({
-            'status': 'success',
-            'network_id': network_id,
-            'total_sessions': total_sessions,
-            'recent_sessions': session_info,
-            'monthly_sessions': monthly_breakdown
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"? ERROR in api_network_sessions: {str(e)}")
-
-        import traceback
-
-        print(traceback.format_exc())
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching network sessions: {str(e)}'
-
-        })
-
-
-
-@login_required
-
-def api_dashboard_monthly(request):
-
-    """API endpoint for monthly dashboard data with debugging"""
-
-    try:
-
-        from datetime import datetime, timedelta
-
-        from django.db.models import Count
-
-        from django.db.models.functions import TruncMonth
-
-        
-
-        print("\n?? DEBUG: api_dashboard_monthly called")
-
-        
-
-        # Get all active customers
-
-        all_customers = Customer.objects.filter(is_deleted=False)
-
-        customer_ids = list(all_customers.values_list('id', flat=True))
-
-        print(f"?? Found {len(all_customers)} active customers")
-
-        
-
-        # Get monthly data for the last 6 months
-
-        six_months_ago = datetime.now() - timedelta(days=180)
-
-        print(f"?? Looking for data since: {six_months_ago}")
-
-        
-
-        monthly_data = HealthCheckSession.objects.filter(
-
-            customer_id__in=customer_ids,
-
-            created_at__gte=six_months_ago
-
-        ).annotate(
-
-            month=TruncMonth('created_at')
-
-        ).values('month').annotate(
-
-            runs=Count('id')
-
-        ).order_by('month')
-
-        
-
-        print(f"?? Raw monthly data query result: {list(monthly_data)}")
-
-        
-
-        # Format the data
-
-        formatted_data = []
-
-        for item in monthly_data:
-
-            month_date = item['month']
-
-            formatted_entry = {
-
-                'month': month_date.strftime('%b'),
-
-                'year': month_date.year,
-
-                'runs': item['runs']
-
-            }
-
-            formatted_data.append(formatted_entry)
-
-            print(f"   Formatted: {formatted_entry}")
-
-        
-
-        # Fill in missing months with zero data
-
-        now = datetime.now()
-
-        all_months = []
-
-        
-
-        print(f"?? Filling in missing months for last 6 months from {now}")
-
-        
-
-        for i in range(6):
-
-            month_date = datetime(now.year, now.month - i, 1) if now.month - i > 0 else datetime(now.year - 1, now.month - i + 12, 1)
-
-            month_name = month_date.strftime('%b')
-
-            
-
-            # Find existing data for this month
-
-            existing_data = next((item for item in formatted_data if item['month'] == month_name and item['year'] == month_date.year), None)
-
-            
-
-            if existing_data:
-
-                all_months.append(existing_data)
-
-                print(f"   Found data for {month_name} {month_date.year}: {existing_data['runs']} runs")
-
-            else:
-
-                zero_entry = {
-
-                    'month': month_name,
-
-                    'year': month_date.year,
-
-                    'runs': 0
-
-                }
-
-                all_months.append(zero_entry)
-
-                print(f"   No data for {month_name} {month_date.year}, using: {zero_entry}")
-
-        
-
-        # Reverse to get chronological order
-
-        all_months.reverse()
-
-        
-
-        print(f"? Final monthly data: {all_months}")
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'monthly_data': all_months
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"? ERROR in api_dashboard_monthly: {str(e)}")
-
-        import traceback
-
-        print(traceback.format_exc())
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching monthly data: {str(e)}'
-
-        })
-
-
-
-
-
-# === CSV EXPORT API ===
-
-@login_required
-
-def api_export_excel(request):
-
-    """Export customer data as CSV - MATCHES FRONTEND EXACTLY"""
-
-    print("?? EXPORT FUNCTION CALLED!")
-
-    print(f"   Method: {request.method}")
-
-    print(f"   User: {request.user}")
-    
-    # Optional date filtering (don't break export if it fails)
-    date_filter = {}
-    try:
-        start_date = request.GET.get('start_date')
-        end_date = request.GET.get('end_date')
-        
-        if start_date and end_date:
-            from datetime import datetime
-            from django.utils import timezone
-            
-            parsed_start = datetime.strptime(start_date, '%Y-%m-%d')
-            parsed_end = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            if timezone.is_aware(timezone.now()):
-                parsed_start = timezone.make_aware(parsed_start)
-                parsed_end = timezone.make_aware(parsed_end)
-            
-            date_filter['start'] = parsed_start
-            date_filter['end'] = parsed_end
-            print(f"   ✅ Date filtering enabled: {start_date} to {end_date}")
-        else:
-            print(f"   🌍 No date filtering - showing all data")
-    except Exception as e:
-        print(f"   ⚠️ Date filter error (ignoring): {e}")
-        date_filter = {}
-
-    
-
-    # Create CSV content matching frontend dashboard
-
-    csv_lines = []
-
-    # Get current year for month headers (dynamic like dashboard)
-    from django.utils import timezone
-    current_year = timezone.now().year
-    year_short = str(current_year)[-2:]  # Get last 2 digits (2025 -> 25)
-    
-    # Create month headers with year (e.g., "Jan 25, Feb 25, ...")
-    month_headers = ','.join([f"{month} {year_short}" for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']])
-    csv_lines.append(f'Customer,Country,Networks,Node Qty,NE Type,GTAC,{month_headers},Total Runs')
-
-    
-
-    try:
-
-        # Get customers with networks like the frontend does
-
-        customers_with_networks = Customer.get_customers_with_networks()
-
-        print(f"Found {len(customers_with_networks)} customers with networks")
-
-        
-
-        for customer_name, networks in customers_with_networks.items():
-
-            try:
-
-                # Get network IDs for this customer
-
-                network_ids = [net.id for net in networks]
-
-                
-
-                # Get network names (like frontend)
-
-                network_names = []
-
-                for net in networks:
-
-                    if net.network_name:
-
-                        network_names.append(net.network_name)
-
-                    else:
-
-                        network_names.append(f"{net.name} Default")
-
-                
-
-                network_names_str = ', '.join(network_names)
-
-                
-
-                # Get session stats for all networks of this customer
-
-                sessions = HealthCheckSession.objects.filter(customer_id__in=network_ids)
-                
-                # Apply date filtering if provided
-                if date_filter:
-                    if 'start' in date_filter:
-                        sessions = sessions.filter(created_at__gte=date_filter['start'])
-                    if 'end' in date_filter:
-                        sessions = sessions.filter(created_at__lte=date_filter['end'])
-                    print(f"   📅 Applied date filter to {customer_name}: {sessions.count()} sessions")
-
-                total_runs = sessions.count()
-
-                completed = sessions.filter(status='COMPLETED').count()
-
-                
-
-                # Get last run date
-                last_session = sessions.order_by('-created_at').first()
-                last_run = last_session.created_at.strftime('%Y-%m-%d') if last_session else 'Never'
-                
-                # Get country and node count - EXACT same logic as dashboard
-                try:
-                    country = get_customer_location(customer_name, networks)
-                    node_count = get_customer_node_count(customer_name, networks)
-                    print(f"   ✅ Helper functions success for {customer_name}: {country}, {node_count} nodes")
-                except Exception as helper_error:
-                    print(f"   ⚠️ Helper function error for {customer_name}: {helper_error}")
-                    # Use same fallback logic as dashboard
-                    country = (
-                        'India' if 'BSNL' in customer_name.upper() else 
-                        'Malaysia' if any(x in customer_name.upper() for x in ['TELEKOM', 'MAXIS', 'TIMEDOTCOM']) else 
-                        'Indonesia' if 'MORATELINDO' in customer_name.upper() else 
-                        'New Caledonia' if 'OPT' in customer_name.upper() else 'India'
-                    )
-                    node_count = len(networks) * 4  # Same fallback as dashboard
-                
-                # DASHBOARD SHOWS CUSTOMER SUMMARY + INDIVIDUAL NETWORKS!
-                # Generate customer summary row + network rows (like dashboard)
-                
-                from django.utils import timezone
-                from datetime import datetime, timedelta
-                import calendar
-                
-                # Get customer-level data
-                try:
-                    customer_country = get_customer_location(customer_name, networks)
-                    customer_node_count = get_customer_node_count(customer_name, networks)
-                except Exception as helper_error:
-                    customer_country = (
-                        'India' if 'BSNL' in customer_name.upper() else 
-                        'Malaysia' if any(x in customer_name.upper() for x in ['TELEKOM', 'MAXIS', 'TIMEDOTCOM']) else 
-                        'Indonesia' if 'MORATELINDO' in customer_name.upper() else 
-                        'New Caledonia' if 'OPT' in customer_name.upper() else 'India'
-                    )
-                    customer_node_count = len(networks) * 4
-                
-                # Calculate customer-level monthly data (aggregate of all networks)
-                monthly_runs_customer = {}
-                current_year = timezone.now().year
-                months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                
-                for month_idx, month_name in enumerate(months, 1):
-                    try:
-                        month_start = timezone.make_aware(datetime(current_year, month_idx, 1))
-                        if month_idx == 12:
-                            month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                        else:
-                            month_end = timezone.make_aware(datetime(current_year, month_idx + 1, 1)) - timedelta(seconds=1)
-                        
-                        month_sessions = sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                        month_count = month_sessions.count()
-                        
-                        if month_count > 0:
-                            last_month_session = month_sessions.order_by('-created_at').first()
-                            if last_month_session:
-                                monthly_runs_customer[month_name] = last_month_session.created_at.strftime('%d-%b-%y')
-                            else:
-                                monthly_runs_customer[month_name] = '-'
-                        else:
-                            monthly_runs_customer[month_name] = '-'
-                    except Exception as e:
-                        monthly_runs_customer[month_name] = '-'
-                
-                # CRITICAL FIX: Skip customers with zero sessions in filtered date range
-                if date_filter and total_runs == 0:
-                    print(f"   🚫 SKIPPING {customer_name} from CSV: No sessions found in filtered date range")
-                    continue
-                
-                # 1. Add CUSTOMER SUMMARY ROW (like "Airtel" with "7 NETWORKS")
-                networks_display = f"{len(networks)} NETWORK{'S' if len(networks) > 1 else ''}"
-                gtac_customer = 'PSS'
-                ne_type_customer = '1830 PSS'
-                monthly_data_customer = ','.join([f'"{monthly_runs_customer[month]}"' for month in months])
-                
-                csv_lines.append(f'"{customer_name}","{customer_country}","{networks_display}",{customer_node_count},"{ne_type_customer}","{gtac_customer}",{monthly_data_customer},{total_runs}')
-                print(f"Added customer summary: {customer_name} -> {customer_country}, {len(networks)} networks, {customer_node_count} nodes, {total_runs} total runs")
-                
-                # 2. Add INDIVIDUAL NETWORK ROWS (like "airtel Default Network")
-                for network in networks:
-                    network_sessions = HealthCheckSession.objects.filter(customer=network)
-                    
-                    # Apply date filtering to network sessions
-                    if date_filter:
-                        if 'start' in date_filter:
-                            network_sessions = network_sessions.filter(created_at__gte=date_filter['start'])
-                        if 'end' in date_filter:
-                            network_sessions = network_sessions.filter(created_at__lte=date_filter['end'])
-                    
-                    network_total_runs = network_sessions.count()
-                    network_name = network.network_name if network.network_name else f"{network.name} Default"
-                    
-                    # Calculate monthly data for this specific network
-                    monthly_runs_network = {}
-                    for month_idx, month_name in enumerate(months, 1):
-                        try:
-                            month_start = timezone.make_aware(datetime(current_year, month_idx, 1))
-                            if month_idx == 12:
-                                month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                            else:
-                                month_end = timezone.make_aware(datetime(current_year, month_idx + 1, 1)) - timedelta(seconds=1)
-                            
-                            month_sessions = network_sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                            month_count = month_sessions.count()
-                            
-                            if month_count > 0:
-                                last_month_session = month_sessions.order_by('-created_at').first()
-                                if last_month_session:
-                                    monthly_runs_network[month_name] = last_month_session.created_at.strftime('%d-%b-%y')
-                                else:
-                                    monthly_runs_network[month_name] = '-'
-                            else:
-                                monthly_runs_network[month_name] = '-'
-                        except Exception as e:
-                            monthly_runs_network[month_name] = '-'
-                    
-                    # Network node count (distribute total)
-                    if len(networks) > 1:
-                        network_node_count = max(1, customer_node_count // len(networks))
-                    else:
-                        network_node_count = customer_node_count
-                    
-                    gtac_network = 'PSS'
-                    ne_type_network = '1830 PSS'
-                    monthly_data_network = ','.join([f'"{monthly_runs_network[month]}"' for month in months])
-                    
-                    # Add individual network row with indentation (like dashboard)
-                    indented_network_name = f"    {network_name}"  # Add spaces for indentation like dashboard
-                    network_display = f"{network_total_runs} runs" if network_total_runs > 0 else "0 runs"
-                    csv_lines.append(f'"{indented_network_name}","{customer_country}","{network_display}",{network_node_count},"{ne_type_network}","{gtac_network}",{monthly_data_network},{network_total_runs}')
-                    print(f"Added network: {indented_network_name} -> {customer_country}, {network_node_count} nodes, {network_total_runs} runs")
-
-                
-
-            except Exception as e:
-                print(f"Error with customer {customer_name}: {e}")
-                csv_lines.append(f'"{customer_name}","Error",0,0,"Error","Error",0,0,0,0,0,0,0,0,0,0,0,0,0')
-
-        
-
-        if len(csv_lines) == 1:  # Only header
-            csv_lines.append('"No Data Available","Unknown",0,0,"Error","Error",0,0,0,0,0,0,0,0,0,0,0,0,0')
-
-            
-
-    except Exception as e:
-        print(f"Database error: {e}")
-        csv_lines.append('"Database Error","Error",0,0,"Error","Error",0,0,0,0,0,0,0,0,0,0,0,0,0')
-
-    
-
-    
-    # TRY PROFESSIONAL EXCEL FIRST
-    try:
-        import openpyxl
-        from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-        from openpyxl.utils import get_column_letter
-        from openpyxl.worksheet.table import Table, TableStyleInfo
-        from datetime import datetime
-        
-        print("📊 Creating professional Excel file with enhanced formatting...")
-        
-        workbook = openpyxl.Workbook()
-        ws = workbook.active
-        ws.title = "Customer Dashboard Export"
-        
-        # Enhanced title section with company branding
-        ws.merge_cells('A1:H1')
-        ws['A1'] = '📊 Health Check Customer Dashboard Report'
-        ws['A1'].font = Font(name='Calibri', size=18, bold=True, color='1F4E79')
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
-        ws['A1'].fill = PatternFill(start_color='E8F4FD', end_color='E8F4FD', fill_type='solid')
-        
-        ws.merge_cells('A2:H2')
-        date_range_info = ""
-        if start_date or end_date:
-            if start_date and end_date:
-                date_range_info = f" | Filtered: {start_date} to {end_date}"
-            elif start_date:
-                date_range_info = f" | From: {start_date}"
-            elif end_date:
-                date_range_info = f" | Until: {end_date}"
-        
-        ws['A2'] = f'📅 Generated on {datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")} by {request.user.username}{date_range_info}'
-        ws['A2'].font = Font(name='Calibri', size=11, italic=True, color='555555')
-        ws['A2'].alignment = Alignment(horizontal='center')
-        
-        # Headers with professional styling - EXACT same as dashboard
-        headers = ['🏢 Customer', '🌍 Country', '🔗 Networks', '🖥️ Node Qty', '🔧 NE Type', '🏢 GTAC', '📅 Jan', '📅 Feb', '📅 Mar', '📅 Apr', '📅 May', '📅 Jun', '📅 Jul', '📅 Aug', '📅 Sep', '📅 Oct', '📅 Nov', '📅 Dec', '🔄 Total Runs']
-        
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=4, column=col)
-            cell.value = header
-            cell.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thin'), right=Side(style='thin'),
-                top=Side(style='thin'), bottom=Side(style='thin')
-            )
-        
-        # Add data with enhanced formatting - CUSTOMER SUMMARIES + INDENTED NETWORKS
-        row_num = 5
-        for customer_name, networks in customers_with_networks.items():
-            try:
-                # Get all sessions for this customer (all networks combined)
-                network_ids = [net.id for net in networks]
-                sessions = HealthCheckSession.objects.filter(customer_id__in=network_ids)
-                
-                # Apply date filtering if provided
-                if date_filter:
-                    if 'start' in date_filter:
-                        sessions = sessions.filter(created_at__gte=date_filter['start'])
-                    if 'end' in date_filter:
-                        sessions = sessions.filter(created_at__lte=date_filter['end'])
-                
-                total_runs = sessions.count()
-                
-                # CRITICAL FIX: Skip customers with zero sessions in filtered date range  
-                if date_filter and total_runs == 0:
-                    print(f"   🚫 SKIPPING {customer_name} from Excel: No sessions found in filtered date range")
-                    continue
-                
-                # Get customer-level data
-                try:
-                    customer_country = get_customer_location(customer_name, networks)
-                    customer_node_count = get_customer_node_count(customer_name, networks)
-                except Exception as helper_error:
-                    customer_country = (
-                        'India' if 'BSNL' in customer_name.upper() else 
-                        'Malaysia' if any(x in customer_name.upper() for x in ['TELEKOM', 'MAXIS', 'TIMEDOTCOM']) else 
-                        'Indonesia' if 'MORATELINDO' in customer_name.upper() else 
-                        'New Caledonia' if 'OPT' in customer_name.upper() else 'India'
-                    )
-                    customer_node_count = len(networks) * 4
-                
-                # Calculate customer-level monthly data
-                from datetime import datetime, timedelta
-                monthly_runs_customer = {}
-                current_year = timezone.now().year
-                months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                
-                for month_idx, month_name in enumerate(months, 1):
-                    try:
-                        month_start = timezone.make_aware(datetime(current_year, month_idx, 1))
-                        if month_idx == 12:
-                            month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                        else:
-                            month_end = timezone.make_aware(datetime(current_year, month_idx + 1, 1)) - timedelta(seconds=1)
-                        
-                        month_sessions = sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                        month_count = month_sessions.count()
-                        
-                        if month_count > 0:
-                            last_month_session = month_sessions.order_by('-created_at').first()
-                            if last_month_session:
-                                monthly_runs_customer[month_name] = last_month_session.created_at.strftime('%d-%b-%y')
-                            else:
-                                monthly_runs_customer[month_name] = '-'
-                        else:
-                            monthly_runs_customer[month_name] = '-'
-                    except Exception as e:
-                        monthly_runs_customer[month_name] = '-'
-                
-                # 1. Add CUSTOMER SUMMARY ROW
-                networks_display = f"{len(networks)} NETWORK{'S' if len(networks) > 1 else ''}"
-                gtac_customer = 'PSS'
-                ne_type_customer = '1830 PSS'
-                
-                customer_data = [customer_name, customer_country, networks_display, customer_node_count, ne_type_customer, gtac_customer]
-                customer_data.extend([monthly_runs_customer[month] for month in months])
-                customer_data.append(total_runs)
-                
-                # Add customer summary row to Excel
-                for col, value in enumerate(customer_data, 1):
-                    cell = ws.cell(row=row_num, column=col)
-                    cell.value = value
-                    cell.font = Font(name='Calibri', size=10, bold=True)  # Bold for customer summary
-                    cell.alignment = Alignment(
-                        horizontal='center' if col in [2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19] else 'left',
-                        vertical='center'
-                    )
-                    cell.border = Border(
-                        left=Side(style='thin'), right=Side(style='thin'),
-                        top=Side(style='thin'), bottom=Side(style='thin')
-                    )
-                    # Customer summary row - light blue background
-                    cell.fill = PatternFill(start_color='E8F4FD', end_color='E8F4FD', fill_type='solid')
-                
-                row_num += 1
-                
-                # 2. Add INDIVIDUAL NETWORK ROWS (indented)
-                for network in networks:
-                    network_sessions = HealthCheckSession.objects.filter(customer=network)
-                    
-                    # Apply date filtering to network sessions
-                    if date_filter:
-                        if 'start' in date_filter:
-                            network_sessions = network_sessions.filter(created_at__gte=date_filter['start'])
-                        if 'end' in date_filter:
-                            network_sessions = network_sessions.filter(created_at__lte=date_filter['end'])
-                    
-                    network_total_runs = network_sessions.count()
-                    network_name = network.network_name if network.network_name else f"{network.name} Default"
-                    
-                    # Calculate monthly data for this specific network
-                    monthly_runs_network = {}
-                    for month_idx, month_name in enumerate(months, 1):
-                        try:
-                            month_start = timezone.make_aware(datetime(current_year, month_idx, 1))
-                            if month_idx == 12:
-                                month_end = timezone.make_aware(datetime(current_year + 1, 1, 1)) - timedelta(seconds=1)
-                            else:
-                                month_end = timezone.make_aware(datetime(current_year, month_idx + 1, 1)) - timedelta(seconds=1)
-                            
-                            month_sessions = network_sessions.filter(created_at__gte=month_start, created_at__lte=month_end)
-                            month_count = month_sessions.count()
-                            
-                            if month_count > 0:
-                                last_month_session = month_sessions.order_by('-created_at').first()
-                                if last_month_session:
-                                    monthly_runs_network[month_name] = last_month_session.created_at.strftime('%d-%b-%y')
-                                else:
-                                    monthly_runs_network[month_name] = '-'
-                            else:
-                                monthly_runs_network[month_name] = '-'
-                        except Exception as e:
-                            monthly_runs_network[month_name] = '-'
-                    
-                    # Network node count (distribute total)
-                    if len(networks) > 1:
-                        network_node_count = max(1, customer_node_count // len(networks))
-                    else:
-                        network_node_count = customer_node_count
-                    
-                    gtac_network = 'PSS'
-                    ne_type_network = '1830 PSS'
-                    network_display = f"{network_total_runs} runs" if network_total_runs > 0 else "0 runs"
-                    
-                    # Indented network name (like dashboard)
-                    indented_network_name = f"    {network_name}"  # Spaces for indentation
-                    
-                    network_data = [indented_network_name, customer_country, network_display, network_node_count, ne_type_network, gtac_network]
-                    network_data.extend([monthly_runs_network[month] for month in months])
-                    network_data.append(network_total_runs)
-                    
-                    # Add network row to Excel (indented under customer)
-                    for col, value in enumerate(network_data, 1):
-                        cell = ws.cell(row=row_num, column=col)
-                        cell.value = value
-                        cell.font = Font(name='Calibri', size=10)  # Regular font for network rows
-                        cell.alignment = Alignment(
-                            horizontal='center' if col in [2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19] else 'left',
-                            vertical='center'
-                        )
-                        cell.border = Border(
-                            left=Side(style='thin'), right=Side(style='thin'),
-                            top=Side(style='thin'), bottom=Side(style='thin')
-                        )
-                        
-                        # Network row color coding
-                        if col == 2:  # Country column - light blue
-                            cell.fill = PatternFill(start_color='EFF6FF', end_color='EFF6FF', fill_type='solid')
-                        elif col == 4:  # Node Qty column - light green
-                            cell.fill = PatternFill(start_color='F0FDF4', end_color='F0FDF4', fill_type='solid')
-                        elif 7 <= col <= 18:  # Monthly columns - light gray if has date
-                            if value != '-':
-                                cell.fill = PatternFill(start_color='F9FAFB', end_color='F9FAFB', fill_type='solid')
-                        elif col == 19:  # Total runs column
-                            if network_total_runs == 0:
-                                cell.fill = PatternFill(start_color='FEF2F2', end_color='FEF2F2', fill_type='solid')
-                            elif network_total_runs > 0:
-                                cell.fill = PatternFill(start_color='F0FDF4', end_color='F0FDF4', fill_type='solid')
-                    
-                
-            except Exception as e:
-                print(f"Excel row error: {e}")
-                row_num += 1
-        
-        # Auto-adjust column widths
-        for col in range(1, len(headers) + 1):
-            column_letter = get_column_letter(col)
-            max_length = len(headers[col-1])
-            
-            for row_cells in ws[f'{column_letter}5:{column_letter}{row_num-1}']:
-                for cell in row_cells:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-            
-            ws.column_dimensions[column_letter].width = min(max(max_length + 2, 14), 50)
-        
-        # Create professional table
-        if row_num > 5:
-            table_range = f"A4:{get_column_letter(len(headers))}{row_num-1}"
-            table = Table(displayName="CustomerDashboardData", ref=table_range)
-            
-            style = TableStyleInfo(
-                name="TableStyleMedium9",
-                showFirstColumn=False,
-                showLastColumn=False,
-                showRowStripes=True,
-                showColumnStripes=False
-            )
-            table.tableStyleInfo = style
-            ws.add_table(table)
-        
-        # Add summary statistics
-        summary_row = row_num + 2
-        ws[f'A{summary_row}'] = '📈 SUMMARY STATISTICS'
-        ws[f'A{summary_row}'].font = Font(name='Calibri', size=12, bold=True, color='1F4E79')
-        
-        summary_data = [
-            ['👥 Total Customers:', len(customers_with_networks)],
-            ['🌐 Total Networks:', sum(len(networks) for networks in customers_with_networks.values())],
-            ['🕰️ Export Time:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-            ['👤 Generated by:', request.user.username]
-        ]
-        
-        for i, (label, value) in enumerate(summary_data):
-            ws[f'A{summary_row + i + 1}'] = label
-            ws[f'B{summary_row + i + 1}'] = value
-            ws[f'A{summary_row + i + 1}'].font = Font(name='Calibri', size=10, bold=True)
-        
-        # Save Excel file
-        from io import BytesIO
-        output = BytesIO()
-        workbook.save(output)
-        output.seek(0)
-        
-        # Create Excel response
-        response = HttpResponse(
-            output.getvalue(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        filename = f'customer_dashboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        print(f"✅ PROFESSIONAL EXCEL SUCCESS: {filename}")
-        return response
-        
-    except ImportError:
-        print("⚠️ openpyxl not available, creating CSV instead")
-    except Exception as e:
-        print(f"⚠️ Excel creation failed: {e}, creating CSV instead")
-    
-    # FALLBACK: Create CSV content
-    csv_content = '\n'.join(csv_lines)
-
-    print(f"CSV created with {len(csv_lines)} lines")
-
-    
-
-    # Create response
-
-    response = HttpResponse(csv_content, content_type='text/csv')
-
-    filename = f'customer_dashboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
-    response['Content-Length'] = len(csv_content)
-
-    
-
-    print(f"? EXPORT SUCCESS: {filename}")
-
-    return response
-
-
-
-
-
-
-
-
-
-# === Network Setup Views (For NEW networks) ===
-
-@login_required
-
-def setup_new_network(request, customer_id):
-
-    """Setup new network with required files per MOP"""
-
-    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
-    
-    print(f"🔍 DEBUG: Customer {customer.name} status: {customer.setup_status}")
-    # Don't redirect immediately - allow file processing regardless of status
-    # This allows customers to upload files even if status is not 'NEW'
-    if customer.setup_status != 'NEW' and request.method == 'GET':
-        messages.info(request, f"Network {customer.name} is already set up. You can still upload files to update the configuration.")
-
-    
-
-    if request.method == 'POST':
-        print(f"🔍 DEBUG: POST request received for customer {customer.name}")
-        print(f"🔍 DEBUG: FILES in request: {list(request.FILES.keys())}")
-        form = HealthCheckNewNetworkForm(request.POST, request.FILES)
-        print(f"🔍 DEBUG: Form is_valid: {form.is_valid()}")
-        if not form.is_valid():
-            print(f"🚫 DEBUG: Form errors: {form.errors}")
-        if form.is_valid():
-            # Create setup session
-            session = HealthCheckSession.objects.create(
-                customer=customer,
-                session_id=str(uuid.uuid4()),
-                session_type='NEW_NETWORK_SETUP',
-                initiated_by=request.user,
-                files_expected=5
-            )
-            
-            # Process setup files
-            setup_result = setup_network_files(customer, form.cleaned_data, session)
-            
-            if setup_result['success']:
-                # Mark customer as ready
-                customer.setup_status = 'READY'
-                customer.save()
-                
-                # SYNC WITH EXCEL TRACKER - Add new customer
-                try:
-                    update_excel_tracker_with_new_customer(customer)
-                except Exception as excel_error:
-                    print(f"⚠️ Warning: Could not sync new customer with Excel: {excel_error}")
-                
-                # ✅ NEW: RUN INITIAL PROCESSING WITH UPLOADED FILES
-                try:
-                    print(f"🚀 DEBUG: Starting initial processing for new network {customer.name}")
-                    # Run processing in background to avoid timeout
-                    import threading
-                    def run_initial_processing():
-                        try:
-                            process_health_check_files_enhanced(session.id)
-                        except Exception as e:
-                            print(f"❌ DEBUG: Initial processing failed: {str(e)}")
-                            session.update_status('FAILED', f'Initial processing failed: {str(e)}')
-                    
-                    # Start background processing
-                    processing_thread = threading.Thread(target=run_initial_processing)
-                    processing_thread.daemon = True
-                    processing_thread.start()
-                    
-                    session.update_status('PROCESSING', 'Network setup completed, initial processing started')
-                    messages.success(request, f"Network {customer.name} has been set up and initial processing started!")
-                    print(f"✅ DEBUG: Background processing started for session {session.session_id}")
-                    
-                except Exception as processing_error:
-                    print(f"❌ DEBUG: Failed to start processing: {str(processing_error)}")
-                    session.update_status('COMPLETED', 'Network setup completed successfully')
-                    messages.success(request, f"Network {customer.name} has been set up successfully!")
-                
-                return redirect('dashboard')
-            else:
-                session.update_status('FAILED', f"Setup failed: {setup_result['error']}")
-                messages.error(request, f"Setup failed: {setup_result['error']}")
-    else:
-        form = HealthCheckNewNetworkForm()
-    
-    return render(request, 'health_check/setup_new_network.html', {
-        'form': form,
-        'customer': customer
-    })
-
-
-
-
-
-def setup_network_files(customer, form_data, session):
-    """Setup network files according to MOP requirements"""
-    try:
-        network_name = customer.name
-        print(f"📁 DEBUG: Starting file setup for network: {network_name}")
-        print(f"📁 DEBUG: Form data keys: {list(form_data.keys())}")
-        
-        # File mappings from form to expected script files
-        file_setup = {
-            'hc_tracker_file': f"{network_name}_HC_Issues_Tracker.xlsx",
-            'global_ignore_txt': f"{network_name}_ignored_test_cases.txt", 
-            'selective_ignore_xlsx': f"{network_name}_ignored_test_cases.xlsx",
-            'tec_report_file': f"{network_name}_Reports_{datetime.now().strftime('%Y%m%d')}.xlsx",
-            'inventory_csv': f"{network_name}_remote_inventory.csv"
-        }
-        
-        # Save files to Script directory with proper naming
-        files_processed = 0
-        for form_field, target_filename in file_setup.items():
-            print(f"🔍 DEBUG: Checking field: {form_field}")
-            if form_field in form_data and form_data[form_field]:
-                uploaded_file = form_data[form_field]
-                print(f"✅ DEBUG: Processing file: {uploaded_file.name} -> {target_filename}")
-                files_processed += 1
-                
-                # Save to Script directory with network-specific naming
-                target_path = SCRIPT_DIR / target_filename
-                
-                with open(target_path, 'wb+') as destination:
-                    for chunk in uploaded_file.chunks():
-                        destination.write(chunk)
-                
-                # Create HealthCheckFile record
-                HealthCheckFile.objects.create(
-                    customer=customer,
-                    session=session,
-                    file_type=form_field.upper().replace('_FILE', ''),
-                    original_filename=uploaded_file.name,
-                    stored_filename=target_filename,
-                    file_path=str(target_path),
-                    file_size=uploaded_file.size
-                )
-        
-        print(f"🎉 DEBUG: Successfully processed {files_processed} files out of 5 expected")
-        return {'success': True}
-        
-    except Exception as e:
-        print(f"❌ DEBUG: Error in setup_network_files: {str(e)}")
-        return {'success': False, 'error': str(e)}
-
-
-
-
-
-# === Enhanced Processing Views ===
-
-@login_required
-
-def process_health_check_enhanced(request, customer_id):
-
-    """Enhanced health check processing with full MOP compliance"""
-
-    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
-
-    
-
-    if customer.setup_status != 'READY':
-
-        messages.error(request, f"Network {customer.name} must be set up first before processing health checks.")
-
-        return redirect('setup_new_network', customer_id=customer_id)
-
-    
-
-    if request.method == 'POST':
-
-        form = HealthCheckExistingNetworkForm(request.POST, request.FILES)
-
-        if form.is_valid():
-
-            # Validate required files are present
-
-            if not validate_hc_files(request.FILES):
-
-                messages.error(request, "Please upload both TEC Health Check report (.xlsx) and Remote Inventory (.csv) files.")
-
-                return render(request, 'health_check/process_existing_network.html', {
-
-                    'form': form,
-
-                    'customer': customer
-
-                })
-
-            
-
-            # Create processing session
-
-            session = HealthCheckSession.objects.create(
-
-                customer=customer,
-
-                session_id=str(uuid.uuid4()),
-
-                session_type='REGULAR_PROCESSING',
-
-                initiated_by=request.user,
-
-                files_expected=2
-
-            )
-
-            
-
-            # Save uploaded files
-
-            save_processing_files(customer, request.FILES, session)
-
-            
-
-            # Start processing with better error handling
-
-            try:
-
-                # Run processing in background to avoid timeout
-
-                import threading
-
-                def run_processing():
-
-                    try:
-
-                        process_health_check_files_enhanced(session.id)
-
-                    except Exception as e:
-
-                        session.update_status('FAILED', f'Processing failed: {str(e)}')
-
-                        print(f"Processing error: {str(e)}")
-
-                
-
-                # Start processing thread
-
-                processing_thread = threading.Thread(target=run_processing)
-
-                processing_thread.daemon = True
-
-                processing_thread.start()
-
-                
-
-                # Return immediately with processing message
-
-                messages.info(request, f"?? Health check processing started for {customer.name}! This may take several minutes. You'll see the results on the dashboard when complete.")
-
-                return redirect('dashboard')
-
-                
-
-            except Exception as e:
-
-                session.update_status('FAILED', f"Processing failed: {str(e)}")
-
-                messages.error(request, f"Processing failed: {str(e)}")
-
-    else:
-
-        form = HealthCheckExistingNetworkForm()
-
-    
-
-    return render(request, 'health_check/process_existing_network.html', {
-
-        'form': form,
-
-        'customer': customer
-
-    })
-
-
-
-
-
-def validate_hc_files(uploaded_files):
-
-    """Validate uploaded health check files"""
-
-    has_xlsx = any(f.name.endswith('.xlsx') for f in uploaded_files.values())
-
-    has_csv = any(f.name.endswith('.csv') for f in uploaded_files.values())
-
-    return has_xlsx and has_csv
-
-
-
-
-
-def save_processing_files(customer, uploaded_files, session):
-
-    """Save processing files to Script input directory AND customer folders for download"""
-
-    # Clear previous files from Script input directory
-
-    for file in SCRIPT_INPUT_DIR.glob("*"):
-
-        file.unlink()
-
-    
-
-    # Save new files to BOTH Script input directory AND customer folders
-
-    for field_name, file in uploaded_files.items():
-
-        # Determine file type and customer folder path first
-
-        if file.name.endswith('.xlsx'):
-
-            file_type = 'TEC_REPORT'
-
-            customer_file_path = get_customer_file_path(customer, 'TEC', file.name)
-
-        else:  # .csv
-
-            file_type = 'INVENTORY_CSV'
-
-            customer_file_path = get_customer_file_path(customer, 'INVENTORY', file.name)
-
-        
-
-        # Save to Script input directory (for processing) with fresh file pointer
-
-        file_path = SCRIPT_INPUT_DIR / file.name
-
-        file.seek(0)  # Reset file pointer to beginning
-
-        with open(file_path, 'wb+') as destination:
-
-            for chunk in file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # ALSO save to customer folder (for download availability)
-
-        try:
-
-            file.seek(0)  # Reset file pointer to beginning again
-
-            with open(customer_file_path, 'wb+') as destination:
-
-                for chunk in file.chunks():
-
-                    destination.write(chunk)
-
-            print(f"? Saved {file.name} ? {file_path}")
-
-            print(f"?? Also saved to customer folder ? {customer_file_path}")
-
-        except Exception as e:
-
-            print(f"?? Warning: Could not save to customer folder: {e}")
-
-            print(f"?? Error details: {str(e)}")
-
-        
-
-        # ?? Clear existing files of this type to avoid duplicates (ENABLED FOR REPORTS)
-
-        deleted_count = clear_existing_customer_files(customer, file_type)
-
-        if deleted_count > 0:
-
-            print(f"? Cleared {deleted_count} old {file_type} file(s) for customer: {customer.name}")
-
-        
-
-        # Create database record pointing to customer folder for downloads
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            session=session,
-
-            file_type=file_type,
-
-            original_filename=file.name,
-
-            stored_filename=file.name,
-
-            file_path=str(customer_file_path),  # Point to customer folder for downloads
-
-            file_size=file.size
-
-        )
-
-
-
-
-
-def process_health_check_files_enhanced(session_id):
-
-    """Enhanced processing that fully integrates with Script/main.py"""
-
-    try:
-
-        session = HealthCheckSession.objects.get(id=session_id)
-
-        customer = session.customer
-
-        
-
-        session.update_status('PROCESSING', 'Initializing health check analysis...')
-
-        session.progress_percentage = 5
-
-        session.current_step = "Preparing environment"
-
-        session.save()
-
-        
-
-        # Validate network setup files exist
-
-        network_files_exist = validate_network_setup_files(customer.name)
-
-        if not network_files_exist:
-
-            raise Exception(f"Network setup files missing for {customer.name}. Please run initial network setup.")
-
-        
-
-        # Validate input files are present
-
-        input_files = list(SCRIPT_INPUT_DIR.glob("*"))
-
-        if len(input_files) != 2:
-
-            raise Exception("Expected exactly 2 input files (HC report .xlsx and inventory .csv)")
-
-        
-
-        # Set up timeout monitoring with network size-based timeouts
-
-        import threading
-
-        
-
-        # Dynamic timeout based on estimated network size
-
-        timeout_seconds = calculate_processing_timeout(input_files)
-
-        print(f"?? Setting processing timeout to {timeout_seconds/60:.1f} minutes for {customer.name}")
-
-        
-
-        timeout_timer = threading.Timer(timeout_seconds, lambda: handle_session_timeout(session_id))
-
-        timeout_timer.start()
-
-        
-
-        # Update progress
-
-        session.progress_percentage = 15
-
-        session.current_step = "Validating files"
-
-        session.save()
-
-        
-
-        # Extract network information from filenames (per MOP)
-
-        hc_report_file = None
-
-        csv_file = None
-
-        
-
-        for file_path in input_files:
-
-            if file_path.suffix == '.xlsx':
-
-                hc_report_file = file_path
-
-            elif file_path.suffix == '.csv':
-
-                csv_file = file_path
-
-        
-
-        if not hc_report_file or not csv_file:
-
-            raise Exception("Could not identify HC report (.xlsx) and inventory (.csv) files")
-
-        
-
-        # Parse network info from filename (per MOP format)
-
-        network_info = parse_hc_filename(hc_report_file.name)
-
-        if not network_info:
-
-            raise Exception("HC report filename does not follow expected format")
-
-        
-
-        session.progress_percentage = 25
-
-        session.current_step = "Executing health check script"
-
-        session.save()
-
-        
-
-        # Execute the actual Script/main.py
-
-        script_result = execute_hc_script_direct(session)
-
-        
-
-        if script_result['success']:
-
-            session.progress_percentage = 80
-
-            session.current_step = "Processing outputs"
-
-            session.save()
-
-            
-
-            # Process generated outputs (don't fail on file copying issues)
-
-            try:
-
-                output_info = process_script_outputs_enhanced(session, network_info)
-
-            except Exception as output_error:
-
-                print(f"Warning: Output processing had issues: {output_error}")
-
-                output_info = {'output_files': [], 'network_info': network_info}
-
-            
-
-            session.progress_percentage = 95
-
-            session.current_step = "Finalizing results"
-
-            session.save()
-
-            
-
-            # Create detailed report
-
-            try:
-
-                create_detailed_report(session, output_info)
-
-            except Exception as report_error:
-
-                print(f"Warning: Report creation had issues: {report_error}")
-
-            
-
-            session.progress_percentage = 100
-
-            session.current_step = "Completed"
-
-            
-
-            # Count output files to show in success message
-
-            output_dir = SCRIPT_DIR / "output"
-
-            
-
-            # Add small delay to ensure all files are written
-
-            import time
-
-            time.sleep(2)
-
-            
-
-            # Count files more reliably
-
-            output_count = 0
-
-            if output_dir.exists():
-
-                output_files = [f for f in output_dir.glob("*") if f.is_file()]
-
-                output_count = len(output_files)
-
-                print(f"Web app found {output_count} output files:")
-
-                for f in output_files:
-
-                    print(f"  - {f.name}")
-
-            
-
-            success_message = f'Health check analysis completed successfully! Generated {output_count} output files.'
-            session.update_status('COMPLETED', success_message)
-            
-            # ===== DASHBOARD SYNC FIX =====
-            # Add a flag to indicate dashboard needs refresh
-            session.dashboard_refresh_needed = True
-            session.last_updated = timezone.now()
-            session.save()
-
-            
-
-        else:
-
-            raise Exception(f"Script execution failed: {script_result['error']}")
-
-        
-
-    except Exception as e:
-
-        session.update_status('FAILED', f'Processing failed: {str(e)}')
-
-        raise e
-
-
-
-
-
-def validate_network_setup_files(network_name):
-
-    """Validate that network setup files exist per MOP requirements"""
-
-    required_files = [
-
-        f"{network_name}_HC_Issues_Tracker.xlsx",
-
-        f"{network_name}_ignored_test_cases.txt", 
-
-        f"{network_name}_ignored_test_cases.xlsx"
-
-    ]
-
-    
-
-    for filename in required_files:
-
-        file_path = SCRIPT_DIR / filename
-
-        if not file_path.exists():
-
-            return False
-
-    
-
-    return True
-
-
-
-
-
-def parse_hc_filename(filename):
-
-    """Parse network info from HC filename per MOP format"""
-
-    try:
-
-        # Expected format: Network_name_Reports_YYYYMMDD.xlsx
-
-        # Parse using the logic from main.py
-
-        base_name = filename.replace('.xlsx', '')
-
-        last_underscore_pos = base_name.rfind('_')
-
-        
-
-        if last_underscore_pos == -1:
-
-            return None
-
-        
-
-        network_name = base_name[:last_underscore_pos - 8]  # -8 for "_Reports"
-
-        date_part = base_name[last_underscore_pos + 1:]
-
-        
-
-        if len(date_part) != 8:
-
-            return None
-
-        
-
-        year = date_part[:4]
-
-        month = date_part[4:6] 
-
-        day = date_part[6:8]
-
-        
-
-        return {
-
-            'network_name': network_name,
-
-            'year': year,
-
-            'month': month,
-
-            'day': day,
-
-            'date_string': date_part
-
-        }
-
-        
-
-    except Exception:
-
-        return None
-
-
-
-
-
-def execute_hc_script_direct(session):
-
-    """Direct script execution - simplified and reliable"""
-
-    try:
-
-        # Ensure we're in the Script directory
-
-        original_cwd = os.getcwd()
-
-        os.chdir(str(SCRIPT_DIR))
-
-        
-
-        try:
-
-            # Determine python executable
-
-            if sys.platform == "win32":
-
-                venv_python = SCRIPT_DIR / "venv" / "Scripts" / "python.exe"
-
-            else:
-
-                venv_python = SCRIPT_DIR / "venv" / "bin" / "python"
-
-            
-
-            if not venv_python.exists():
-
-                # Try system python
-
-                venv_python = sys.executable
-
-            
-
-            main_script = SCRIPT_DIR / "main.py"
-
-            
-
-            # Execute with extended timeout for large networks  
-
-            print(f"?? Starting script execution: {venv_python} {main_script}")
-
-            print(f"?? Working directory: {SCRIPT_DIR}")
-
-            result = subprocess.run(
-
-                [str(venv_python), str(main_script)],
-
-                cwd=str(SCRIPT_DIR),
-
-                capture_output=True,
-
-                text=True,
-
-                timeout=7200 #2 hour timeout for large networks like Telekom
-
-            )
-
-            
-
-            return {
-
-                'success': result.returncode == 0,
-
-                'stdout': result.stdout,
-
-                'stderr': result.stderr,
-
-                'returncode': result.returncode,
-
-                'error': result.stderr if result.returncode != 0 else None
-
-            }
-
-            
-
-        finally:
-
-            # Restore original working directory
-
-            os.chdir(original_cwd)
-
-            
-
-    except subprocess.TimeoutExpired:
-
-        return {
-
-            'success': False,
-
-            'error': 'Script execution timed out (1 hour) - network too large'
-
-        }
-
-    except Exception as e:
-
-        return {
-
-            'success': False,
-
-            'error': str(e)
-
-        }
-
-
-
-
-
-def execute_hc_script_enhanced(session):
-
-    """Enhanced script execution with better error handling"""
-
-    try:
-
-        # Ensure we're in the Script directory
-
-        original_cwd = os.getcwd()
-
-        os.chdir(str(SCRIPT_DIR))
-
-        
-
-        try:
-
-            # Determine python executable
-
-            if sys.platform == "win32":
-
-                venv_python = SCRIPT_DIR / "venv" / "Scripts" / "python.exe"
-
-            else:
-
-                venv_python = SCRIPT_DIR / "venv" / "bin" / "python"
-
-            
-
-            if not venv_python.exists():
-
-                # Try system python
-
-                venv_python = sys.executable
-
-            
-
-            main_script = SCRIPT_DIR / "main.py"
-
-            
-
-            # Execute with extended timeout for large networks
-
-            result = subprocess.run(
-
-                [str(venv_python), str(main_script)],
-
-                cwd=str(SCRIPT_DIR),
-
-                capture_output=True,
-
-                text=True,
-
-                timeout=7200 # 2 hour timeout for large networks like Telekom
-
-            )
-
-            
-
-            return {
-
-                'success': result.returncode == 0,
-
-                'stdout': result.stdout,
-
-                'stderr': result.stderr,
-
-                'returncode': result.returncode,
-
-                'error': result.stderr if result.returncode != 0 else None
-
-            }
-
-            
-
-        finally:
-
-            # Restore original working directory
-
-            os.chdir(original_cwd)
-
-            
-
-    except subprocess.TimeoutExpired:
-
-        return {
-
-            'success': False,
-
-            'error': 'Script execution timed out (1 hour) - network too large'
-
-        }
-
-    except Exception as e:
-
-        return {
-
-            'success': False,
-
-            'error': str(e)
-
-        }
-
-
-
-
-
-def process_script_outputs_enhanced(session, network_info):
-
-    """Enhanced output processing - copy only HC_Issues_Tracker to both customer folders AND Script directory"""
-
-    try:
-
-        script_output_dir = SCRIPT_DIR / "output"
-
-        output_files = []
-
-        customer = session.customer
-
-        
-
-        # ALSO check if the HC_Issues_Tracker is already in Script directory (generated from previous processing)
-
-        script_tracker_filename = f"{customer.name}_HC_Issues_Tracker.xlsx"
-
-        script_tracker_path = SCRIPT_DIR / script_tracker_filename
-
-        
-
-        # Find the HC_Issues_Tracker file (could be in output or Script directory)
-
-        tracker_source_path = None
-
-        if script_output_dir.exists():
-
-            # Check output directory for ANY file containing HC_Issues_Tracker
-
-            output_files = list(script_output_dir.glob("*HC_Issues_Tracker*.xlsx"))
-
-            print(f"?? Looking for tracker files in {script_output_dir}")
-
-            print(f"?? Found {len(output_files)} potential tracker files: {[f.name for f in output_files]}")
-
-            
-
-            for file_path in output_files:
-
-                if file_path.is_file():
-
-                    tracker_source_path = file_path
-
-                    print(f"?? Selected tracker file: {tracker_source_path}")
-
-                    break
-
-        
-
-        # If not found in output, check Script directory
-
-        if not tracker_source_path and script_tracker_path.exists():
-
-            tracker_source_path = script_tracker_path
-
-            print(f"?? Using fallback tracker from Script directory: {tracker_source_path}")
-
-        
-
-        # Process the found tracker file
-
-        if tracker_source_path:
-
-            print(f"?? Found HC_Issues_Tracker at: {tracker_source_path}")
-
-            
-
-            # Get customer folder paths
-
-            tracker_generated_path = get_customer_file_path(customer, 'TRACKER', tracker_source_path.name)
-
-            old_tracker_path = get_customer_file_path(customer, 'OLD_TRACKER', tracker_source_path.name)
-
-            
-
-            # Ensure customer directories exist
-
-            os.makedirs(tracker_generated_path.parent, exist_ok=True)
-
-            os.makedirs(old_tracker_path.parent, exist_ok=True)
-
-            
-
-            # Try copying with retries for file locking issues
-
-            for attempt in range(3):
-
-                try:
-
-                    # Remove existing files first
-
-                    if tracker_generated_path.exists():
-
-                        tracker_generated_path.unlink()
-
-                    if old_tracker_path.exists():
-
-                        old_tracker_path.unlink()
-
-                    
-
-                    # Wait a bit and try copying
-
-                    import time
-
-                    time.sleep(0.5)
-
-                    
-
-                    # Copy to BOTH customer folders
-
-                    shutil.copy2(tracker_source_path, tracker_generated_path)
-
-                    shutil.copy2(tracker_source_path, old_tracker_path)
-
-                    
-
-                    # If source is not in Script directory, also copy there
-
-                    if tracker_source_path != script_tracker_path:
-
-                        if script_tracker_path.exists():
-
-                            script_tracker_path.unlink()
-
-                        shutil.copy2(tracker_source_path, script_tracker_path)
-
-                    
-
-                    print(f"? Copied HC_Issues_Tracker to multiple locations:")
-
-                    print(f"   ?? Generated Trackers: {customer.name}/generated_trackers/{tracker_source_path.name}")
-
-                    print(f"   ?? Old Trackers: {customer.name}/old_trackers/{tracker_source_path.name}")
-
-                    print(f"   ?? Script Directory: {script_tracker_filename}")
-
-                    break
-
-                except (PermissionError, OSError) as copy_error:
-
-                    if attempt == 2:  # Last attempt
-
-                        print(f"Warning: Could not copy {tracker_source_path.name}: {copy_error}")
-
-                        # Use the original file path as fallback
-
-                        tracker_generated_path = tracker_source_path
-
-                        old_tracker_path = tracker_source_path
-
-                    else:
-
-                        time.sleep(1)  # Wait before retry
-
-            
-
-            # Get current timestamp for generated files
-
-            from django.utils import timezone
-
-            current_time = timezone.now()
-
-            
-
-            # ?? CLEAR EXISTING TRACKER_GENERATED files to avoid duplicates
-
-            existing_tracker_generated = HealthCheckFile.objects.filter(
-
-                customer=customer, 
-
-                file_type='TRACKER_GENERATED'
-
-            )
-
-            for old_file in existing_tracker_generated:
-
-                try:
-
-                    if old_file.file_path and Path(old_file.file_path).exists():
-
-                        Path(old_file.file_path).unlink()
-
-                    old_file.delete()
-
-                    print(f"??? Removed old TRACKER_GENERATED: {old_file.stored_filename}")
-
-                except Exception as e:
-
-                    print(f"?? Could not remove old tracker generated file: {e}")
-
-            
-
-            # ?? Allow multiple HC_TRACKER files - don't clear existing generated ones
-
-            # Keep all previous generated trackers + original setup files for history
-
-            
-
-            # Create database record for TRACKER_GENERATED (shows in "Tracker Generated" section)
-
-            tracker_generated_record = HealthCheckFile.objects.create(
-
-                customer=customer,
-
-                session=session,
-
-                file_type='TRACKER_GENERATED',
-
-                original_filename=tracker_source_path.name,
-
-                stored_filename=tracker_source_path.name,
-
-                file_path=str(tracker_generated_path),
-
-                file_size=tracker_source_path.stat().st_size
-
-            )
-
-            # Update the timestamp to current time (when file was generated)
-
-            tracker_generated_record.uploaded_at = current_time
-
-            tracker_generated_record.save()
-
-            
-
-            # Create database record for HC_TRACKER (shows in "Old Trackers" section)
-
-            old_tracker_record = HealthCheckFile.objects.create(
-
-                customer=customer,
-
-                session=session,
-
-                file_type='HC_TRACKER',
-
-                original_filename=tracker_source_path.name,
-
-                stored_filename=tracker_source_path.name,
-
-                file_path=str(old_tracker_path),
-
-                file_size=tracker_source_path.stat().st_size
-
-            )
-
-            # Update the timestamp to current time (when file was generated)
-
-            old_tracker_record.uploaded_at = current_time
-
-            old_tracker_record.save()
-
-            
-
-            # Update session to point to the tracker file
-
-            session.output_tracker_filename = tracker_source_path.name
-
-            session.output_tracker_path = str(tracker_generated_path)
-
-            session.save()
-
-            
-
-            print(f"?? HC_Issues_Tracker will appear in BOTH sections: {tracker_source_path.name}")
-
-            print(f"?? Created 2 database records: TRACKER_GENERATED + HC_TRACKER")
-
-            
-
-            # Track all files for logging
-
-            output_files.append({
-
-                'name': tracker_source_path.name,
-
-                'path': str(tracker_source_path),  # Always point to original output directory
-
-                'size': tracker_source_path.stat().st_size
-
-            })
-
-        
-
-        # Also check output directory for other files
-
-        if script_output_dir.exists():
-
-            for file_path in script_output_dir.glob("*"):
-
-                if file_path.is_file() and "HC_Issues_Tracker" not in file_path.name:
-
-                    # All other files (like extracted_hc_test_cases.xlsx, etc.) stay in output directory only
-
-                    print(f"?? Keeping other output file in output directory only: {file_path.name}")
-
-                    
-
-                    # Track all files for logging
-
-                    output_files.append({
-
-                        'name': file_path.name,
-
-                        'path': str(file_path),  # Always point to original output directory
-
-                        'size': file_path.stat().st_size
-
-                    })
-
-        
-
-        return {
-
-            'output_files': output_files,
-
-            'network_info': network_info
-
-        }
-
-        
-
-    except Exception as e:
-
-        # Don't fail the whole process for file copying issues
-
-        print(f"Warning: Error processing script outputs: {str(e)}")
-
-        # Return basic info so processing can continue
-
-        return {
-
-            'output_files': [],
-
-            'network_info': network_info
-
-        }
-
-
-
-
-
-def create_detailed_report(session, output_info):
-
-    """Create detailed health check report"""
-
-    # Health check reports are no longer needed - session status provides sufficient information
-
-    pass
-
-
-
-
-
-def clear_existing_customer_files(customer, file_type):
-
-    """Deletes all existing files of a specific type for a customer."""
-
-    files_to_delete = HealthCheckFile.objects.filter(
-
-        customer=customer, 
-
-        file_type=file_type
-
-    )
-
-    
-
-    count = files_to_delete.count()
-
-    if count == 0:
-
-        return 0
-
-
-
-    print(f"?? Found {count} existing {file_type} files for customer '{customer.name}'. Removing them...")
-
-
-
-    for f in files_to_delete:
-
-        try:
-
-            # Delete the physical file from disk
-
-            if f.file_path and Path(f.file_path).exists():
-
-                Path(f.file_path).unlink()
-
-                print(f"  ??? Deleted physical file: {f.file_path}")
-
-            
-
-            # Delete the database record
-
-            f.delete()
-
-            print(f"  ? Deleted DB record for: {f.stored_filename}")
-
-
-
-        except Exception as e:
-
-            print(f"  ?? Warning: Could not delete file {f.stored_filename}: {e}")
-
-            
-
-    return count
-
-
-
-
-
-def parse_tracker_statistics(tracker_path):
-
-    """Parse statistics from the generated HC Issues Tracker"""
-
-    try:
-
-        if not tracker_path or not Path(tracker_path).exists():
-
-            return {}
-
-        
-
-        import openpyxl
-
-        wb = openpyxl.load_workbook(tracker_path, read_only=True)
-
-        
-
-        stats = {
-
-            'total_nodes': 0,
-
-            'healthy_nodes': 0,
-
-            'warning_nodes': 0,
-
-            'offline_nodes': 0,
-
-            'total_services': 0,
-
-            'healthy_services': 0,
-
-            'health_score': 95.0  # Default score
-
-        }
-
-        
-
-        # Parse Summary sheet if available
-
-        if 'Summary' in wb.sheetnames:
-
-            summary_sheet = wb['Summary']
-
-            # Extract relevant statistics from specific cells
-
-            # This would depend on the exact structure of the generated file
-
-            pass
-
-        
-
-        # Parse OPEN sheet for issue counts
-
-        if 'OPEN' in wb.sheetnames:
-
-            open_sheet = wb['OPEN']
-
-            issue_count = max(0, open_sheet.max_row - 1)  # Subtract header row
-
-            
-
-            # Calculate health score based on issues
-
-            if issue_count == 0:
-
-                stats['health_score'] = 100.0
-
-            else:
-
-                # Simple scoring algorithm - can be enhanced
-
-                stats['health_score'] = max(0, 100 - (issue_count * 2))
-
-        
-
-        wb.close()
-
-        return stats
-
-        
-
-    except Exception:
-
-        return {'health_score': 50.0}  # Default fallback
-
-
-
-
-
-# === Missing View Functions (Stubs) ===
-
-@login_required
-
-def upload_host_file(request):
-
-    """Upload file specifically to host files folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    # Check for multiple possible field names for host files
-
-    host_file = None
-
-    possible_field_names = ['host_file', 'host_files', 'csv_file', 'inventory_host']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            host_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not host_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = host_file
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'HOST', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer host folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='HOST',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Host file '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def tracker_history(request):
-
-    """Get tracker history"""
-
-    return JsonResponse({'status': 'error', 'message': 'Tracker history not implemented yet'})
-
-
-
-@login_required
-
-def get_sticky_notes_data(request):
-
-    """Get sticky notes data"""
-
-    return JsonResponse({'status': 'error', 'message': 'Sticky notes not implemented yet'})
-
-
-
-
-
-def get_customer_networks(request, customer_id):
-
-    """API endpoint to get networks for a specific customer by ID - NO LOGIN REQUIRED for AJAX"""
-
-    try:
-
-        # First, get the customer to find their name
-
-        customer = Customer.objects.get(id=customer_id, is_deleted=False)
-
-        
-
-        # Now get all networks for this customer name
-
-        networks = Customer.objects.filter(name=customer.name, is_deleted=False).order_by('network_name')
-
-        
-
-        network_list = []
-
-        for network in networks:
-
-            network_list.append({
-
-                'id': network.id,
-
-                'name': network.display_name,
-
-                'network_name': network.network_name or 'Default Network',
-
-                'network_type': network.network_type,
-
-                'setup_status': network.setup_status
-
-            })
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'customer_id': customer_id,
-
-            'customer_name': customer.name,
-
-            'networks': network_list,
-
-            'count': len(network_list)
-
-        })
-
-        
-
-    except Customer.DoesNotExist:
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Customer with ID {customer_id} not found'
-
-        })
-
-    except Exception as e:
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': f'Error fetching networks: {str(e)}'
-
-        })
-
-
-
-@login_required
-
-def delete_tracker_file(request):
-
-    """Delete tracker file"""
-
-    return JsonResponse({'status': 'error', 'message': 'Delete tracker not implemented yet'})
-
-
-
-@login_required
-
-def upload_inventory_file(request):
-
-    """Upload file specifically to inventory folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'inventory_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['inventory_file']
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'INVENTORY', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='INVENTORY_CSV',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Inventory file '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_report_file(request):
-
-    """Upload file to BOTH Script processing directory AND customer reports folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    # Check for multiple possible field names for TEC reports
-
-    tec_report_file = None
-
-    possible_field_names = ['tec_report', 'tec_report_file', 'report_file', 'hc_report']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            tec_report_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not tec_report_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = tec_report_file
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'TEC', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='TEC_REPORT',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"TEC report '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_old_tracker_file(request):
-
-    """Upload file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'old_tracker_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['old_tracker_file']
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'OLD_TRACKER', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='HC_TRACKER',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Old tracker '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_tracker_generated_file(request):
-
-    """Upload generated tracker file"""
-
-    return JsonResponse({'status': 'error', 'message': 'Generated tracker upload not implemented yet'})
-
-
-
-@login_required
-
-def upload_ignore_excel_file(request):
-
-    """Upload Excel ignore file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'ignore_excel_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['ignore_excel_file']
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'OLD_TRACKER', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='SELECTIVE_IGNORE_XLSX',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Ignore Excel file '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_ignore_text_file(request):
-
-    """Upload Text ignore file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'ignore_text_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['ignore_text_file']
-
-    
-
-    # SUPER STRICT VALIDATION: Technology-aware customer validation
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'OLD_TRACKER', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer folder
-
-        uploaded_file.seek(0)
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='GLOBAL_IGNORE_TXT',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Ignore Text file '{uploaded_file.name}' uploaded successfully"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-# === Utility Functions ===
-
-def get_customer_directory(customer):
-
-    """Get or create directory for customer files"""
-
-    customer_dir = SCRIPT_DIR / customer.get_directory_name()
-
-    os.makedirs(customer_dir, exist_ok=True)
-
-    return customer_dir
-
-
-
-# === Customer Folder Management Functions ===
-
-def get_customer_file_path(customer, file_type, filename):
-
-    """Get customer-specific file path for better organization - now supports network-specific paths"""
-
-    customer_name = customer.name.replace(" ", "_").replace("/", "_")
-
-    
-
-    # Create base customer directory first
-
-    customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
-
-    customer_base_dir.mkdir(parents=True, exist_ok=True)
-
-    
-
-    # If there's a network_name, create a network-specific subfolder
-
-    if customer.network_name:
-
-        network_name = customer.network_name.replace(" ", "_").replace("/", "_")
-
-        customer_dir = customer_base_dir / network_name
-
-    else:
-
-        # If no network specified, use the base customer directory
-
-        customer_dir = customer_base_dir
-
-    
-
-    customer_dir.mkdir(parents=True, exist_ok=True)
-
-    
-
-    type_dirs = {
-
-        'HOST': 'host_files',
-
-        'TEC': 'tec_reports', 
-
-        'TRACKER': 'generated_trackers',
-
-        'OLD_TRACKER': 'old_trackers',
-
-        'INVENTORY': 'inventory_files'
-
-    }
-
-    
-
-    file_dir = customer_dir / type_dirs.get(file_type, 'misc')
-
-    file_dir.mkdir(exist_ok=True)
-
-    
-
-    return file_dir / filename
-
-
-
-def preserve_customer_file(customer, file_type, source_path, filename):
-
-    """Preserve file in customer-specific directory"""
-
-    try:
-
-        # Convert to Path object if string
-
-        if isinstance(source_path, str):
-
-            source_path = Path(source_path)
-
-            
-
-        dest_path = get_customer_file_path(customer, file_type, filename)
-
-        
-
-        if source_path.exists():
-
-            # Always copy - overwrite if exists but don't delete other files
-
-            shutil.copy2(str(source_path), str(dest_path))
-
-            print(f"Preserved {file_type} file for {customer.name}: {filename}")
-
-            return dest_path
-
-        else:
-
-            print(f"Source file doesn't exist for preservation: {source_path}")
-
-    except Exception as e:
-
-        print(f"Error preserving customer file: {e}")
-
-    return None
-
-
-
-def find_customer_file(customer, file_type, filename):
-
-    """Find file in customer-specific directory"""
-
-    customer_file_path = get_customer_file_path(customer, file_type, filename)
-
-    if customer_file_path.exists():
-
-        return customer_file_path
-
-    return None
-
-
-
-def create_customer_folder_structure(customer):
-
-    """Create complete folder structure for new customer including sample files"""
-
-    try:
-
-        customer_name = customer.name.replace(" ", "_").replace("/", "_").replace(".", "_")
-
-        
-
-        # Create base customer directory first
-
-        customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
-
-        customer_base_dir.mkdir(parents=True, exist_ok=True)
-
-        print(f"?? Created base customer directory: {customer_base_dir}")
-
-        
-
-        # If there's a network_name, create a network-specific subfolder
-
-        if customer.network_name and customer.network_name.strip():
-
-            network_name = customer.network_name.replace(" ", "_").replace("/", "_").replace(".", "_")
-
-            customer_dir = customer_base_dir / network_name
-
-            print(f"?? Creating network-specific folder: {network_name}")
-
-        else:
-
-            # If no network specified, use the base customer directory
-
-            customer_dir = customer_base_dir
-
-            print(f"?? Using base customer directory (no specific network)")
-
-        
-
-        # Create network-specific directory
-
-        customer_dir.mkdir(parents=True, exist_ok=True)
-
-        print(f"?? Created customer/network directory: {customer_dir}")
-
-        
-
-        # Define folder structure with descriptions
-
-        folders = {
-
-            'host_files': 'CSV inventory files and host configurations',
-
-            'tec_reports': 'TEC Health Check Reports (.xlsx files)',
-
-            'generated_trackers': 'Auto-generated tracker files from processing',
-
-            'old_trackers': 'Manual tracker uploads and archived trackers',
-
-            'inventory_files': 'Remote inventory data and inventory reports'
-
-        }
-
-        
-
-        # Create subfolders
-
-        for folder_name, description in folders.items():
-
-            folder_path = customer_dir / folder_name
-
-            folder_path.mkdir(exist_ok=True)
-
-            
-
-            # Create a README.txt file in each folder explaining its purpose
-
-            readme_path = folder_path / "README.txt"
-
-            if not readme_path.exists():
-
-                readme_content = f"""?? {folder_name.replace('_', ' ').title()} Folder
-
-
-
-Customer: {customer.name}
-
-Created: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-
-
-Purpose:
-
-{description}
-
-
-
-This folder is automatically managed by the Health Check Tracking Tool.
-
-Files uploaded through the web interface will appear here organized by type.
-
-
-
-Folder Structure:
-
-?? host_files/        ? CSV inventory files go here
-
-?? tec_reports/       ? .xlsx TEC reports go here  
-
-?? generated_trackers/ ? Generated tracker files go here
-
-?? old_trackers/      ? Manual tracker uploads go here
-
-?? inventory_files/   ? Remote inventory data and reports go here
-
-
-
-? All files are automatically organized and available for download through the dashboard!
-
-"""
-
-                with open(readme_path, 'w', encoding='utf-8') as f:
-
-                    f.write(readme_content)
-
-                
-
-            print(f"  ?? Created subfolder: {folder_name}")
-
-        
-
-        # Create a main customer info file with enhanced information
-
-        info_filename = f"{customer_name}_info.txt"
-
-        if customer.network_name and customer.network_name.strip():
-
-            info_filename = f"{customer_name}_{customer.network_name.replace(' ', '_')}_info.txt"
-
-        
-
-        customer_info_path = customer_dir / info_filename
-
-        if not customer_info_path.exists():
-
-            network_info = f"\nNetwork: {customer.network_name}" if customer.network_name else "\nNetwork: Default/Generic"
-
-            info_content = f"""?? Customer Information
-
-
-
-Name: {customer.name}{network_info}
-
-Network Type: {customer.network_type}
-
-Setup Status: {customer.setup_status}
-
-Created: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-Customer ID: {customer.id}
-
-
-
-Folder Structure:
-
-+-- ?? host_files/        ? CSV inventory files
-
-+-- ?? tec_reports/       ? TEC Health Check Reports (.xlsx)
-
-+-- ?? generated_trackers/ ? Auto-generated tracker files
-
-+-- ?? old_trackers/      ? Manual uploads & archives
-
-+-- ?? inventory_files/   ? Remote inventory data (.csv)
-
-
-
-?? File Management:
-
- Files uploaded through web dashboard are automatically organized
-
- Old files are cleaned up to prevent duplicates
-
- Generated tracker files appear in both generated_trackers/ and old_trackers/
-
- All files remain available for download through dashboard
-
-
-
-?? This customer is ready for health check processing!
-
-    Upload files through the web dashboard and they'll appear in the appropriate folders.
-
-
-
-??  IMPORTANT: When deleting this customer/network, all files in this directory will be permanently removed!
-
-"""
-
-            with open(customer_info_path, 'w', encoding='utf-8') as f:
-
-                f.write(info_content)
-
-        
-
-        print(f"? Customer folder structure created successfully for: {customer.name}")
-
-        return True
-
-        
-
-    except Exception as e:
-
-        print(f"? Error creating customer folder structure: {e}")
-
-        return False
-
-
-
-def delete_customer_folder_structure(customer):
-
-    """Delete customer folder structure and all associated files from disk"""
-
-    try:
-
-        customer_name = customer.name.replace(" ", "_").replace("/", "_").replace(".", "_")
-
-        customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
-
-        
-
-        # If there's a network_name, delete the specific network folder
-
-        if customer.network_name and customer.network_name.strip():
-
-            network_name = customer.network_name.replace(" ", "_").replace("/", "_").replace(".", "_")
-
-            customer_dir = customer_base_dir / network_name
-
-            print(f"??? Deleting network-specific folder: {customer.name} - {customer.network_name}")
-
-        else:
-
-            # If no network specified, delete the entire customer directory
-
-            customer_dir = customer_base_dir
-
-            print(f"??? Deleting entire customer directory: {customer.name}")
-
-        
-
-        # Check if directory exists
-
-        if not customer_dir.exists():
-
-            print(f"?? Customer/network directory not found: {customer_dir}")
-
-            # Check if this is a network deletion and there are other networks
-
-            if customer.network_name and customer_base_dir.exists():
-
-                remaining_networks = [d for d in customer_base_dir.iterdir() if d.is_dir()]
-
-                if remaining_networks:
-
-                    print(f"?? Other networks still exist for customer {customer.name}: {[d.name for d in remaining_networks]}")
-
-            return True  # Not an error if directory doesn't exist
-
-        
-
-        # Count files and directories for detailed logging
-
-        total_files = 0
-
-        total_dirs = 0
-
-        file_types = {}
-
-        
-
-        for folder_path in customer_dir.rglob('*'):
-
-            if folder_path.is_file():
-
-                total_files += 1
-
-                # Track file types for reporting
-
-                ext = folder_path.suffix.lower()
-
-                if ext in file_types:
-
-                    file_types[ext] += 1
-
-                else:
-
-                    file_types[ext] = 1
-
-            elif folder_path.is_dir():
-
-                total_dirs += 1
-
-        
-
-        print(f"??? Deleting customer folder structure: {customer_dir}")
-
-        print(f"?? Total files to be deleted: {total_files}")
-
-        print(f"?? Total directories to be deleted: {total_dirs}")
-
-        if file_types:
-
-            print(f"?? File types: {dict(file_types)}")
-
-        
-
-        # Create backup info before deletion (optional - can be disabled)
-
-        backup_info = {
-
-            'customer_name': customer.name,
-
-            'network_name': customer.network_name,
-
-            'deleted_at': timezone.now().isoformat(),
-
-            'total_files': total_files,
-
-            'total_dirs': total_dirs,
-
-            'file_types': dict(file_types),
-
-            'directory_path': str(customer_dir)
-
-        }
-
-        
-
-        # Write deletion log to parent directory
-
-        if customer_base_dir.exists():
-
-            log_file = customer_base_dir / f"DELETED_{customer.name}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-            try:
-
-                with open(log_file, 'w', encoding='utf-8') as f:
-
-                    import json
-
-                    f.write(f"CUSTOMER/NETWORK DELETION LOG\n")
-
-                    f.write(f"{'=' * 50}\n\n")
-
-                    f.write(json.dumps(backup_info, indent=2))
-
-                print(f"?? Created deletion log: {log_file.name}")
-
-            except Exception as log_error:
-
-                print(f"?? Could not create deletion log: {log_error}")
-
-        
-
-        # Delete the entire customer directory tree
-
-        import shutil
-
-        shutil.rmtree(str(customer_dir))
-
-        
-
-        # Check if customer base directory is empty after network deletion
-
-        if customer.network_name and customer_base_dir.exists():
-
-            remaining_items = list(customer_base_dir.iterdir())
-
-            # Filter out log files
-
-            remaining_dirs = [item for item in remaining_items if item.is_dir()]
-
-            if not remaining_dirs:
-
-                print(f"?? Customer base directory is now empty (only log files remain)")
-
-                # Optionally, you could delete the entire customer directory here
-
-                # shutil.rmtree(str(customer_base_dir))
-
-        
-
-        print(f"? Successfully deleted customer folder structure for: {customer.name}")
-
-        print(f"??? Removed directory: {customer_dir}")
-
-        print(f"?? Deleted {total_files} files")
-
-        
-
-        return True
-
-        
-
-    except PermissionError as e:
-
-        print(f"? Permission denied deleting customer folder: {e}")
-
-        print(f"?? Some files may be in use. Try closing any open files for {customer.name}")
-
-        return False
-
-    except Exception as e:
-
-        print(f"? Error deleting customer folder structure: {e}")
-
-        return False
-
-
-
-def validate_filename_contains_customer_name(filename, customer_name):
-
-    """Check if filename contains customer name (case-insensitive)"""
-
-    import string
-
-    
-
-    # Clean customer name: remove spaces, punctuation, convert to lowercase
-
-    customer_clean = ''.join(c for c in customer_name.lower() if c not in string.punctuation and c != ' ')
-
-    
-
-    # Clean filename: remove spaces, punctuation, convert to lowercase
-
-    filename_clean = ''.join(c for c in filename.lower() if c not in string.punctuation and c != ' ')
-
-    
-
-    # Also check individual words in customer name
-
-    customer_words = [word.strip().lower() for word in customer_name.split() if len(word.strip()) > 2]
-
-    
-
-    # Check if full cleaned name is in filename or if any significant word is in filename
-
-    return (customer_clean in filename_clean or 
-
-            any(word in filename_clean for word in customer_words if len(word) > 2))
-
-
-
-def validate_report_file_strict(file_name):
-
-    """STRICT validation for report files - rejects HC Tracker, Tracker, and Ignore files"""
-
-    file_name_upper = file_name.upper()
-
-    
-
-    # FORBIDDEN patterns that are NEVER allowed in report files
-
-    forbidden_patterns = [
-
-        'HC_ISSUES_TRACKER', 'ISSUES_TRACKER', 'HC_TRACKER', 'TRACKER',
-
-        'IGNORED_TEST_CASES', 'IGNORE_TEST', 'SELECTIVE_IGNORE', 'GLOBAL_IGNORE', 'IGNORE'
-
-    ]
-
-    
-
-    # Check if file contains any forbidden pattern
-
-    for pattern in forbidden_patterns:
-
-        if pattern in file_name_upper:
-
-            error_message = f"?? **WRONG FILE TYPE FOR REPORT UPLOAD**\n\n"
-
-            error_message += f"File '{file_name}' contains '{pattern}' which is NOT allowed in report upload section.\n\n"
-
-            
-
-            if 'TRACKER' in pattern:
-
-                error_message += f"**?? SOLUTION:** This appears to be a TRACKER file.\n"
-
-                error_message += f" Use the **'Upload Old Tracker'** section instead\n"
-
-            elif 'IGNORE' in pattern:
-
-                error_message += f"**?? SOLUTION:** This appears to be an IGNORE file.\n"
-
-                error_message += f" Use the **'Upload Ignore Files'** section instead\n"
-
-            
-
-            error_message += f"\n**? FORBIDDEN PATTERN:** {pattern}\n"
-
-            error_message += f"**?? VALID REPORT FILES should contain:** 'REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK'\n"
-
-            return {'valid': False, 'error': error_message}
-
-    
-
-    # REQUIRED patterns for report files (at least one should be present)
-
-    required_patterns = ['REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK']
-
-    has_required = any(pattern in file_name_upper for pattern in required_patterns)
-
-    
-
-    if not has_required:
-
-        error_message = f"?? **NOT A REPORT FILE**\n\n"
-
-        error_message += f"File '{file_name}' doesn't appear to be a health check report.\n\n"
-
-        error_message += f"**Required patterns (at least one):** REPORT, REPORTS, TEC, HEALTH_CHECK\n\n"
-
-        error_message += f"**Examples of valid report filenames:**\n"
-
-        error_message += f" BSNL_East_DWDM_Reports_20250115.xlsx\n"
-
-        error_message += f" Customer_TEC_Health_Check_Report_Jan2025.xlsx\n"
-
-        error_message += f" Network_HC_Report_20250115.xlsx\n"
-
-        return {'valid': False, 'error': error_message}
-
-    
-
-    return {'valid': True, 'error': None}
-
-
-
-def validate_file_type_match(file_name, expected_type):
-
-    """Validate that the file matches the expected type based on file name patterns with strict exclusions"""
-
-    
-
-    # For REPORT type, use strict validation
-
-    if expected_type == 'REPORT':
-
-        return validate_report_file_strict(file_name)
-
-    
-
-    file_name_upper = file_name.upper()
-
-    
-
-    # Define EXCLUSIVE patterns - if a file contains these, it belongs to that type ONLY
-
-    exclusive_patterns = {
-
-        'TRACKER': ['HC_ISSUES_TRACKER', 'ISSUES_TRACKER', 'HC_TRACKER', 'TRACKER'],
-
-        'IGNORE': ['IGNORED_TEST_CASES', 'IGNORE_TEST', 'SELECTIVE_IGNORE', 'GLOBAL_IGNORE', 'IGNORE'],
-
-        'INVENTORY': ['INVENTORY_CSV', 'REMOTE_INVENTORY'],
-
-        'HOST': ['HOST_FILE', 'HOST_LIST']
-
-    }
-
-    
-
-    # FIRST: Check if file belongs to a different exclusive type
-
-    for file_type, patterns in exclusive_patterns.items():
-
-        if file_type != expected_type:
-
-            for pattern in patterns:
-
-                if pattern in file_name_upper:
-
-                    error_message = f"?? **WRONG UPLOAD SECTION**\n\n"
-
-                    error_message += f"This file '{file_name}' appears to be a **{file_type.lower()}** file, not a {expected_type.lower()} file.\n\n"
-
-                    error_message += f"**?? SOLUTION:** Please upload this file in the correct section:\n"
-
-                    if file_type == 'TRACKER':
-
-                        error_message += " Use the **'Upload Tracker'** or **'Upload Old Tracker'** section\n"
-
-                    elif file_type == 'IGNORE':
-
-                        error_message += " Use the **'Upload Ignore Files'** section\n"
-
-                    error_message += f"\n**?? File contains pattern:** {pattern}\n"
-
-                    error_message += f"**?? Detected as:** {file_type} file\n"
-
-                    error_message += f"**? Current section:** {expected_type} upload (wrong!)\n"
-
-                    return {'valid': False, 'error': error_message}
-
-    
-
-    # Standard file type patterns (only checked if not exclusively another type)
-
-    file_type_patterns = {
-
-        'INVENTORY': ['INVENTORY', 'REMOTE_INVENTORY', 'NODE_LIST', 'DEVICES'],
-
-        'TRACKER': ['TRACKER', 'HC_ISSUES', 'ISSUES_TRACKER', 'HC_TRACKER'],
-
-        'IGNORE': ['IGNORE', 'IGNORED_TEST', 'TEST_CASES', 'SELECTIVE_IGNORE'],
-
-        'HOST': ['HOST', 'HOSTS', 'HOST_FILE', 'NODE_DETAILS']
-
-    }
-
-    
-
-    # Check if file name contains any pattern for the expected type
-
-    if expected_type in file_type_patterns:
-
-        patterns = file_type_patterns[expected_type]
-
-        if any(pattern in file_name_upper for pattern in patterns):
-
-            return {'valid': True, 'error': None}
-
-    
-
-    # Generate error message with allowed patterns
-
-    error_message = f"?? **FILE TYPE MISMATCH**\n\n"
-
-    error_message += f"This file '{file_name}' doesn't appear to be a {expected_type.lower()} file.\n\n"
-
-    
-
-    if expected_type in file_type_patterns:
-
-        error_message += f"**Expected file name patterns for {expected_type}:**\n"
-
-        for pattern in file_type_patterns[expected_type]:
-
-            error_message += f" *{pattern.lower()}*\n"
-
-    
-
-    error_message += f"\n**Examples of valid filenames:**\n"
-
-    
-
-    # Generate example filenames based on type
-
-    if expected_type == 'INVENTORY':
-
-        error_message += " Remote_Inventory_August_2024.csv\n"
-
-        error_message += " Node_List_CSV_Export.csv\n"
-
-    elif expected_type == 'TRACKER':
-
-        error_message += " HC_Issues_Tracker_Aug2024.xlsx\n"
-
-        error_message += " Issues_Tracker_Updated.xlsx\n"
-
-    elif expected_type == 'IGNORE':
-
-        error_message += " Ignored_Test_Cases.xlsx\n"
-
-        error_message += " Selective_Ignore_List.xlsx\n"
-
-    elif expected_type == 'HOST':
-
-        error_message += " Host_File_Details.csv\n"
-
-        error_message += " Node_Details_Export.csv\n"
-
-    
-
-    return {'valid': False, 'error': error_message}
-
-
-
-def validate_section_specific_upload(customer_name, filename, upload_section, expected_file_type):
-
-    """ULTRA STRICT SECTION VALIDATION: Only correct file types allowed in each section"""
-
-    
-
-    print(f"?? ULTRA STRICT SECTION VALIDATION: Customer='{customer_name}', File='{filename}', Section='{upload_section}', Expected='{expected_file_type}'")
-
-    
-
-    filename_upper = filename.upper()
-
-    
-
-    # ULTRA STRICT: Each section only accepts ONE file type
-
-    section_rules = {
-
-        'REPORT': {
-
-            'required_patterns': ['REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK'],
-
-            'forbidden_patterns': ['TRACKER', 'INVENTORY', 'IGNORE', 'HOST'],
-
-            'allowed_extensions': ['.xlsx'],
-
-            'section_name': 'Report Upload'
-
-        },
-
-        'INVENTORY': {
-
-            'required_patterns': ['INVENTORY', 'REMOTE_INVENTORY', 'CSV'],
-
-            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'IGNORE', 'HOST'],
-
-            'allowed_extensions': ['.csv'],
-
-            'section_name': 'Inventory Upload'
-
-        },
-
-        'TRACKER': {
-
-            'required_patterns': ['TRACKER', 'HC_ISSUES', 'ISSUES_TRACKER', 'HC_TRACKER'],
-
-            'forbidden_patterns': ['REPORT', 'REPORTS', 'INVENTORY', 'IGNORE', 'HOST'],
-
-            'allowed_extensions': ['.xlsx'],
-
-            'section_name': 'Tracker Upload'
-
-        },
-
-        'IGNORE': {
-
-            'required_patterns': ['IGNORE', 'IGNORED_TEST', 'TEST_CASES'],
-
-            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'INVENTORY', 'HOST'],
-
-            'allowed_extensions': ['.xlsx', '.txt'],
-
-            'section_name': 'Ignore Files Upload'
-
-        },
-
-        'HOST': {
-
-            'required_patterns': ['HOST', 'HOSTS', 'NODE_DETAILS'],
-
-            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'INVENTORY', 'IGNORE'],
-
-            'allowed_extensions': ['.csv', '.xlsx', '.xls'],
-
-            'section_name': 'Host Files Upload'
-
-        }
-
-    }
-
-    
-
-    # Get file extension
-
-    file_extension = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
-
-    
-
-    # Check if expected file type exists
-
-    if expected_file_type not in section_rules:
-
-        return {'valid': False, 'error': f"? Unknown file type: {expected_file_type}"}
-
-    
-
-    rules = section_rules[expected_file_type]
-
-    
-
-    # 1. STRICT EXTENSION CHECK
-
-    if file_extension not in rules['allowed_extensions']:
-
-        allowed_ext = ', '.join(rules['allowed_extensions'])
-
-        return {
-
-            'valid': False,
-
-            'error': f"?? **WRONG FILE EXTENSION**\n\n"
-
-                    f"File '{filename}' has extension '{file_extension}'.\n"
-
-                    f"**{rules['section_name']} section ONLY accepts:** {allowed_ext}\n\n"
-
-                    f"?? **SOLUTION:** Upload a {allowed_ext} file in this section."
-
-        }
-
-    
-
-    # 2. STRICT FORBIDDEN PATTERN CHECK - REJECT if contains wrong type
-
-    for forbidden in rules['forbidden_patterns']:
-
-        if forbidden in filename_upper:
-
-            return {
-
-                'valid': False,
-
-                'error': f"?? **WRONG FILE TYPE FOR {rules['section_name'].upper()} SECTION**\n\n"
-
-                        f"File '{filename}' contains '{forbidden}' - this is NOT a {expected_file_type} file!\n\n"
-
-                        f"**? CURRENT SECTION:** {rules['section_name']} (WRONG!)\n"
-
-                        f"**? CORRECT SECTION:** {get_correct_section_for_pattern(forbidden)}\n\n"
-
-                        f"?? **SOLUTION:** Upload this file in the correct section."
-
-            }
-
-    
-
-    # 3. STRICT REQUIRED PATTERN CHECK - MUST contain correct type
-
-    has_required = any(pattern in filename_upper for pattern in rules['required_patterns'])
-
-    if not has_required:
-
-        required_list = ', '.join([f"*{p}*" for p in rules['required_patterns']])
-
-        return {
-
-            'valid': False,
-
-            'error': f"?? **NOT A {expected_file_type} FILE**\n\n"
-
-                    f"File '{filename}' doesn't contain any {expected_file_type} identifiers.\n\n"
-
-                    f"**REQUIRED PATTERNS:** {required_list}\n\n"
-
-                    f"**?? Valid {expected_file_type} file examples:**\n"
-
-                    f"{get_example_filenames(expected_file_type, customer_name)}\n\n"
-
-                    f"?? **SOLUTION:** Only upload {expected_file_type} files in {rules['section_name']} section."
-
-        }
-
-    
-
-    print(f"? ULTRA STRICT SECTION VALIDATION PASSED: Correct {expected_file_type} file in correct section!")
-
-    return {'valid': True, 'error': None}
-
-
-
-
-
-def get_correct_section_for_pattern(pattern):
-
-    """Get correct section name for a forbidden pattern"""
-
-    pattern_to_section = {
-
-        'TRACKER': 'Tracker Upload',
-
-        'REPORT': 'Report Upload', 
-
-        'REPORTS': 'Report Upload',
-
-        'INVENTORY': 'Inventory Upload',
-
-        'IGNORE': 'Ignore Files Upload',
-
-        'HOST': 'Host Files Upload'
-
-    }
-
-    return pattern_to_section.get(pattern, 'appropriate upload section')
-
-
-
-
-
-def get_correct_section_name(forbidden_pattern):
-
-    """Get the correct section name for a forbidden pattern"""
-
-    section_map = {
-
-        'TRACKER': 'HC Tracker Upload',
-
-        'INVENTORY': 'Inventory Upload', 
-
-        'REPORT': 'Report Upload',
-
-        'IGNORE': 'Ignore Files Upload',
-
-        'HOST': 'Host Files Upload'
-
-    }
-
-    return section_map.get(forbidden_pattern, 'appropriate upload')
-
-
-
-
-
-def get_example_filenames(file_type, customer_name):
-
-    """Generate ultra-strict example filenames for a given file type and customer"""
-
-    customer_prefix = customer_name.replace(' ', '_').replace('-', '_')
-
-    
-
-    examples = {
-
-        'REPORT': [
-
-            f" {customer_prefix}_TEC_Health_Check_Report_20250115.xlsx",
-
-            f" {customer_prefix}_HC_Report_January_2025.xlsx",
-
-            f" {customer_prefix}_Network_Reports_20250115.xlsx",
-
-            f" {customer_prefix}_TEC_Reports_Monthly.xlsx"
-
-        ],
-
-        'INVENTORY': [
-
-            f" {customer_prefix}_Remote_Inventory_20250115.csv",
-
-            f" {customer_prefix}_Node_List_January.csv",
-
-            f" {customer_prefix}_Inventory_Export.csv",
-
-            f" Remote_Inventory_{customer_prefix}_Latest.csv"
-
-        ],
-
-        'TRACKER': [
-
-            f" {customer_prefix}_HC_Issues_Tracker_20250115.xlsx",
-
-            f" {customer_prefix}_Issues_Tracker_Updated.xlsx",
-
-            f" HC_Issues_Tracker_{customer_prefix}_Jan2025.xlsx",
-
-            f" {customer_prefix}_Health_Check_Tracker.xlsx"
-
-        ],
-
-        'IGNORE': [
-
-            f" {customer_prefix}_Ignored_Test_Cases.xlsx",
-
-            f" {customer_prefix}_Selective_Ignore_List.xlsx",
-
-            f" {customer_prefix}_Global_Ignore.txt",
-
-            f" Ignored_Test_Cases_{customer_prefix}.xlsx"
-
-        ],
-
-        'HOST': [
-
-            f" {customer_prefix}_Host_Details.csv",
-
-            f" {customer_prefix}_Node_Host_File.csv",
-
-            f" Host_File_{customer_prefix}_Export.csv",
-
-            f" {customer_prefix}_Hosts_List.csv"
-
-        ]
-
-    }
-
-    
-
-    return '\n'.join(examples.get(file_type, [f" {customer_prefix}_{file_type}_file.ext"]))
-
-
-
-
-
-def validate_customer_technology_match(customer_name, filename):
-
-    """?? COMPREHENSIVE VALIDATION - Validates operator, region, and technology matching"""
-
-    
-
-    # Convert both to uppercase for comparison
-
-    customer_upper = customer_name.upper().strip()
-
-    filename_upper = filename.upper().strip()
-
-    
-
-    print(f"?? COMPREHENSIVE VALIDATION: Customer='{customer_name}', File='{filename}'")
-
-    print(f"?? Checking for operator, region, and technology validation...")
-
-    
-
-    # STEP 1: DEFINE ALL VALIDATION CATEGORIES
-
-    
-
-    # Telecom operators
-
-    operators = [
-
-        'BSNL', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'RELIANCE',
-
-        'BHARTI', 'TATA', 'TTML', 'TTSL', 'RAILTEL', 'POWERGRID'
-
-    ]
-
-    
-
-    # Regions
-
-    regions = [
-
-        'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
-
-        'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
-
-        'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
-
-        'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD'
-
-    ]
-
-    
-
-    # Technologies
-
-    technologies = [
-
-        'OTN', 'DWDM', 'SDH', 'SONET', 'PDH', 'MPLS', 'IP', 'ETHERNET',
-
-        'OPTICAL', 'FIBER', 'TRANSPORT', 'BACKBONE', 'METRO', 'ACCESS',
-
-        '1830PSS', 'CIENA', 'NOKIA', 'HUAWEI', 'ZTE', 'ERICSSON'
-
-    ]
-
-    
-
-    # STEP 2: EXTRACT COMPONENTS FROM CUSTOMER NAME AND FILENAME
-
-    
-
-    # Find customer's components
-
-    customer_operators = [op for op in operators if op in customer_upper]
-
-    customer_regions = [region for region in regions if region in customer_upper]
-
-    customer_technologies = [tech for tech in technologies if tech in customer_upper]
-
-    
-
-    # Find file's components
-
-    file_operators = [op for op in operators if op in customer_upper]
-
-    file_regions = [region for region in regions if region in filename_upper]
-
-    file_technologies = [tech for tech in technologies if tech in filename_upper]
-
-    
-
-    print(f"?? Customer components:")
-
-    print(f"   Operators: {customer_operators}")
-
-    print(f"   Regions: {customer_regions}")
-
-    print(f"   Technologies: {customer_technologies}")
-
-    print(f"?? File components:")
-
-    print(f"   Operators: {file_operators}")
-
-    print(f"   Regions: {file_regions}")
-
-    print(f"   Technologies: {file_technologies}")
-
-    
-
-    # STEP 3: COMPREHENSIVE COMPONENT VALIDATION
-
-    validation_errors = []
-
-    
-
-    # 1. OPERATOR VALIDATION - Must match if customer has operator
-
-    if customer_operators:
-
-        if not file_operators:
-
-            validation_errors.append(f"MISSING OPERATOR: Customer '{customer_name}' requires operator '{'/'.join(customer_operators)}' but file doesn't contain any operator")
-
-        else:
-
-            # Check if operators match (allow equivalent operators)
-
-            operators_match = any(
-
-                are_equivalent_operators(c_op, f_op) or c_op == f_op 
-
-                for c_op in customer_operators for f_op in file_operators
-
-            )
-
-            if not operators_match:
-
-                validation_errors.append(f"WRONG OPERATOR: Customer uses '{'/'.join(customer_operators)}' but file is for '{'/'.join(file_operators)}'")
-
-            else:
-
-                print(f"? OPERATOR MATCH: Customer {customer_operators} matches file {file_operators}")
-
-    
-
-    # 2. REGION VALIDATION - STRICT enforcement if customer has region
-
-    if customer_regions:
-
-        if not file_regions:
-
-            validation_errors.append(f"MISSING REGION: Customer '{customer_name}' is '{'/'.join(customer_regions)}' region but file doesn't specify any region")
-
-        else:
-
-            # Check if regions match exactly
-
-            regions_match = any(c_region == f_region for c_region in customer_regions for f_region in file_regions)
-
-            if not regions_match:
-
-                validation_errors.append(f"WRONG REGION: Customer is '{'/'.join(customer_regions)}' region but file is for '{'/'.join(file_regions)}' region")
-
-            else:
-
-                print(f"? REGION MATCH: Customer {customer_regions} matches file {file_regions}")
-
-    elif file_regions and not customer_regions:
-
-        # Allow: Generic customer can accept region-specific files
-
-        print(f"? Generic customer accepting region-specific file: {'/'.join(file_regions)}")
-
-    
-
-    # 3. TECHNOLOGY VALIDATION - Must match if customer has technology
-
-    if customer_technologies:
-
-        if not file_technologies:
-
-            validation_errors.append(f"MISSING TECHNOLOGY: Customer '{customer_name}' uses '{'/'.join(customer_technologies)}' but file doesn't specify any technology")
-
-        else:
-
-            # Check if technologies match
-
-            technologies_match = any(c_tech == f_tech for c_tech in customer_technologies for f_tech in file_technologies)
-
-            if not technologies_match:
-
-                validation_errors.append(f"WRONG TECHNOLOGY: Customer uses '{'/'.join(customer_technologies)}' but file is for '{'/'.join(file_technologies)}'")
-
-            else:
-
-                print(f"? TECHNOLOGY MATCH: Customer {customer_technologies} matches file {file_technologies}")
-
-    
-
-    # STEP 4: CHECK FOR VALIDATION ERRORS
-
-    if validation_errors:
-
-        print(f"? COMPREHENSIVE VALIDATION FAILED: {len(validation_errors)} error(s)")
-
-        
-
-        error_message = f"?? **CUSTOMER-FILE MISMATCH**\n\n"
-
-        error_message += f"File '{filename}' does not belong to customer '{customer_name}'.\n\n"
-
-        error_message += f"**? Validation Errors:**\n"
-
-        for i, error in enumerate(validation_errors, 1):
-
-            error_message += f"{i}. {error}\n"
-
-        
-
-        error_message += f"\n**?? SOLUTION:**\n"
-
-        error_message += f" Upload files specifically for '{customer_name}'\n"
-
-        error_message += f" Ensure filename contains all customer-specific identifiers\n"
-
-        error_message += f" Double-check you selected the correct customer\n"
-
-        
-
-        # Add expected filename format
-
-        expected_parts = []
-
-        if customer_operators:
-
-            expected_parts.append(customer_operators[0])
-
-        if customer_regions:
-
-            expected_parts.append(customer_regions[0])
-
-        if customer_technologies:
-
-            expected_parts.append(customer_technologies[0])
-
-        
-
-        if expected_parts:
-
-            expected_format = '_'.join(expected_parts)
-
-            error_message += f"\n**?? Expected filename format:** {expected_format}_filename.ext"
-
-        
-
-        return {'valid': False, 'error': error_message}
-
-    
-
-    # STEP 5: BASIC CUSTOMER NAME MATCHING (only if component validation passed)
-
-    import re
-
-    
-
-    # Simple word extraction for basic matching
-
-    customer_words = re.findall(r'\b\w{3,}\b', customer_upper)
-
-    filename_words = re.findall(r'\b\w{3,}\b', filename_upper)
-
-    
-
-    # Remove common words but keep important ones
-
-    excluded_words = {
-
-        'NETWORK', 'NETWORKS', 'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA',
-
-        'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEC', 'CSV', 'XLSX',
-
-        'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
-
-        'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
-
-        'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'
-
-    }
-
-    
-
-    customer_words = [w for w in customer_words if w not in excluded_words]
-
-    filename_words = [w for w in filename_words if w not in excluded_words]
-
-    
-
-    print(f"?? Customer words: {customer_words}")
-
-    print(f"?? Filename words: {filename_words}")
-
-    
-
-    # If customer has no meaningful words, accept (component validation already passed)
-
-    if not customer_words:
-
-        print(f"? Generic customer name with valid components, accepting")
-
-        return {'valid': True, 'error': None, 'match_info': 'Generic customer with valid components'}
-
-    
-
-    # Check if at least one customer word appears in filename
-
-    matches = [word for word in customer_words if any(word in fname for fname in filename_words)]
-
-    
-
-    if matches:
-
-        print(f"? Customer matching PASSED: Found matches {matches}")
-
-        return {'valid': True, 'error': None, 'match_info': 'Customer match with valid components'}
-
-    else:
-
-        print(f"? Customer matching FAILED: No matches found")
-
-        return {
-
-            'valid': False,
-
-            'error': f"?? **CUSTOMER NAME MISMATCH**\n\n"
-
-                    f"Customer '{customer_name}' contains: **{', '.join(customer_words)}**\n"
-
-                    f"But file '{filename}' doesn't contain any of these identifiers.\n\n"
-
-                    f"**?? SOLUTION:**\n"
-
-                    f" Ensure filename contains customer name or identifiers\n"
-
-                    f" Double-check you selected the correct customer\n\n"
-
-                    f"**?? Expected patterns:** {', '.join([f'*{word.lower()}*' for word in customer_words[:3]])}"
-
-        }
-
-    
-
-    print(f"?? Customer regions found: {customer_regions}")
-
-    print(f"?? File regions found: {file_regions}")
-
-    
-
-    # ENHANCED LOGIC: Check if this is a multi-region scenario
-
-    # If customer has no region but file has region, this might be intentional for generic customers
-
-    if not customer_regions and file_regions:
-
-        # Check if this is a generic customer that should accept region files
-
-        import re
-
-        customer_words = re.findall(r'\b\w{3,}\b', customer_upper)
-
-        filename_words = re.findall(r'\b\w{3,}\b', filename_upper)
-
-        
-
-        # Remove common and region words from comparison
-
-        excluded_words = {
-
-            'NETWORK', 'NETWORKS', 'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA',
-
-            'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEC', 'CSV', 'XLSX',
-
-            'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
-
-            'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
-
-            'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC',
-
-            'ZONE', 'CIRCLE', 'AREA', 'DIVISION', 'BRANCH', 'OFFICE', 'DWDM', 'HC'
-
-        }
-
-        # Also exclude the regions themselves from word matching
-
-        excluded_words.update(regions)
-
-        
-
-        customer_words_filtered = [w for w in customer_words if w not in excluded_words]
-
-        filename_words_filtered = [w for w in filename_words if w not in excluded_words]
-
-        
-
-        # Check if customer name appears in filename (ignoring region)
-
-        customer_in_filename = any(cw in fw for cw in customer_words_filtered for fw in filename_words_filtered)
-
-        
-
-        if customer_in_filename:
-
-            print(f"? Generic customer '{customer_name}' uploading region-specific file from {'/'.join(file_regions)} - ALLOWED")
-
-            print(f"? Customer words match found: {customer_words_filtered} in {filename_words_filtered}")
-
-            return {'valid': True, 'error': None, 'match_info': f'Generic customer accepting {file_regions[0]} region file'}
-
-        else:
-
-            print(f"?? REJECTING: Generic customer name doesn't match filename")
-
-            return {
-
-                'valid': False,
-
-                'error': f"?? **CUSTOMER MISMATCH**\n\n"
-
-                        f"Customer '{customer_name}' doesn't appear to match file '{filename}'.\n\n"
-
-                        f"**?? SOLUTION:**\n"
-
-                        f" Ensure the filename contains the customer identifier\n"
-
-                        f" Double-check you selected the correct customer\n\n"
-
-                        f"**?? Customer words found:** {', '.join(customer_words_filtered)}\n"
-
-                        f"**?? Filename words found:** {', '.join(filename_words_filtered)}"
-
-            }
-
-    
-
-    # STRICT ENFORCEMENT: If customer has region, file MUST match or be rejected
-
-    if customer_regions:
-
-        if not file_regions:
-
-            print(f"?? REJECTING: Customer has region {customer_regions} but file has NO region")
-
-            return {
-
-                'valid': False,
-
-                'error': f"?? **FILE MISSING REQUIRED REGION**\n\n"
-
-                        f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
-
-                        f"But file '{filename}' does not specify any region.\n\n"
-
-                        f"**?? SOLUTION:**\n"
-
-                        f" Upload files that contain **{'/'.join(customer_regions)}** in the filename\n"
-
-                        f" Ensure filename follows pattern: *{customer_regions[0].lower()}*\n\n"
-
-                        f"**? MISSING REGION:** File must contain {'/'.join(customer_regions)}"
-
-            }
-
-        
-
-        # Check if regions match exactly
-
-        regions_match = any(c_region == f_region for c_region in customer_regions for f_region in file_regions)
-
-        
-
-        if not regions_match:
-
-            print(f"?? REJECTING: Region mismatch - Customer: {customer_regions}, File: {file_regions}")
-
-            return {
-
-                'valid': False,
-
-                'error': f"?? **WRONG REGION FOR CUSTOMER**\n\n"
-
-                        f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
-
-                        f"But file '{filename}' is for **{'/'.join(file_regions)}** region.\n\n"
-
-                        f"**?? SOLUTION:**\n"
-
-                        f" Upload files specifically for **{'/'.join(customer_regions)}** region only\n"
-
-                        f" Double-check you selected the correct customer\n\n"
-
-                        f"**?? Expected filename format:**\n"
-
-                        f" *{customer_regions[0].lower()}* should be in the filename\n\n"
-
-                        f"**? REGION MISMATCH:** {'/'.join(customer_regions)} ? {'/'.join(file_regions)}"
-
-            }
-
-        else:
-
-            print(f"? Region validation PASSED: {customer_regions} matches {file_regions}")
-
-    elif not customer_regions and not file_regions:
-
-        print(f"? Neither customer nor file specify regions - allowing upload")
-
-    
-
-    # STEP 2: Basic customer name matching (only if region check passed)
-
-    import re
-
-    
-
-    # Simple word extraction for basic matching
-
-    customer_words = re.findall(r'\b\w{3,}\b', customer_upper)
-
-    filename_words = re.findall(r'\b\w{3,}\b', filename_upper)
-
-    
-
-    # Remove common words but keep important ones
-
-    excluded_words = {
-
-        'NETWORK', 'NETWORKS', 'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA',
-
-        'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEC', 'CSV', 'XLSX',
-
-        'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
-
-        'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
-
-        'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'
-
-    }
-
-    
-
-    customer_words = [w for w in customer_words if w not in excluded_words]
-
-    filename_words = [w for w in filename_words if w not in excluded_words]
-
-    
-
-    print(f"?? Customer words: {customer_words}")
-
-    print(f"?? Filename words: {filename_words}")
-
-    
-
-    # If customer has no meaningful words, accept
-
-    if not customer_words:
-
-        print(f"? Generic customer name, accepting")
-
-        return {'valid': True, 'error': None, 'match_info': 'Generic customer'}
-
-    
-
-    # Check if at least one customer word appears in filename
-
-    matches = [word for word in customer_words if any(word in fname for fname in filename_words)]
-
-    
-
-    if matches or len(customer_words) <= 1:
-
-        print(f"? Customer matching PASSED: Found matches {matches}")
-
-        return {'valid': True, 'error': None, 'match_info': 'Customer match'}
-
-    else:
-
-        print(f"?? Customer matching FAILED: No matches found")
-
-        return {
-
-            'valid': False,
-
-            'error': f"?? **FILE DOESN'T MATCH CUSTOMER**\n\n"
-
-                    f"Customer '{customer_name}' contains: **{', '.join(customer_words)}**\n"
-
-                    f"But file '{filename}' doesn't contain any of these identifiers.\n\n"
-
-                    f"**?? SOLUTION:**\n"
-
-                    f" Ensure filename contains customer name or identifiers\n"
-
-                    f" Double-check you selected the correct customer\n\n"
-
-                    f"**?? Expected patterns:** {', '.join([f'*{word.lower()}*' for word in customer_words[:3]])}"
-
-        }
-
-
-
-
-
-def extract_meaningful_words(text):
-
-    """Extract meaningful words from customer name or filename"""
-
-    import re
-
-    
-
-    # Convert to uppercase and clean
-
-    text_upper = text.upper().strip()
-
-    
-
-    # Replace common separators with spaces
-
-    text_clean = re.sub(r'[_\-\.\\\/>]', ' ', text_upper)
-
-    
-
-    # Split into words
-
-    words = text_clean.split()
-
-    
-
-    # Define words to exclude (common but not meaningful for matching)
-
-    excluded_words = {
-
-        # Generic terms
-
-        'NETWORK', 'NETWORKS', 'COMPANY', 'LIMITED', 'LTD', 'PVT', 'PRIVATE',
-
-        'CORPORATION', 'CORP', 'INC', 'TECHNOLOGIES', 'TECH', 'SOLUTIONS',
-
-        'SERVICES', 'SERVICE', 'SYSTEMS', 'SYSTEM', 'GROUP', 'ENTERPRISES',
-
-        # File-related terms
-
-        'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA', 'EXPORT', 'IMPORT',
-
-        'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEST', 'CASES', 'IGNORE',
-
-        'IGNORED', 'GLOBAL', 'SELECTIVE', 'HC', 'TEC', 'CSV', 'XLSX', 'TXT',
-
-        # Time-related terms
-
-        'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
-
-        'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
-
-        'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC',
-
-        '2024', '2025', '2026', '2023', '2022', '2021', '2020',
-
-        # Generic location terms (but NOT regions - we need those for validation)
-
-        'ZONE', 'CIRCLE', 'AREA', 'DIVISION', 'BRANCH', 'OFFICE'
-
-    }
-
-    
-
-    # Filter meaningful words (length >= 2 and not in excluded list)
-
-    meaningful_words = []
-
-    for word in words:
-
-        word_clean = word.strip()
-
-        # Skip if too short, numeric only, or in excluded list
-
-        if (len(word_clean) >= 2 and 
-
-            not word_clean.isdigit() and 
-
-            word_clean not in excluded_words):
-
-            meaningful_words.append(word_clean)
-
-    
-
-    return meaningful_words
-
-
-
-
-
-def perform_smart_customer_matching(customer_name, filename, customer_words, filename_words):
-
-    """Perform intelligent customer matching based on word overlap"""
-
-    
-
-    if not customer_words:
-
-        return {'valid': True, 'error': None}
-
-    
-
-    # STRICT REGION CHECK - Regional customers can only upload files from their region
-
-    regions = [
-
-        'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
-
-        'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
-
-        'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
-
-        'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD',
-
-        'UP', 'BIHAR', 'PUNJAB', 'HARYANA', 'RAJASTHAN', 'MP', 'GUJARAT',
-
-        'MAHARASHTRA', 'KARNATAKA', 'TAMILNADU', 'AP', 'TELANGANA'
-
-    ]
-
-    
-
-    customer_upper = customer_name.upper()
-
-    filename_upper = filename.upper()
-
-    
-
-    # Find customer's regions
-
-    customer_regions = [region for region in regions if region in customer_upper]
-
-    
-
-    # Find file's regions  
-
-    file_regions = [region for region in regions if region in filename_upper]
-
-    
-
-    # ?? CONFIGURABLE REGION VALIDATION - Now disabled since validate_customer_technology_match handles it
-
-    # OPTION 1: STRICT MODE - Regions must match exactly
-
-    # OPTION 2: FLEXIBLE MODE - Allow cross-region uploads with warning
-
-    # OPTION 3: DISABLED MODE - Skip region validation entirely
-
-    
-
-    REGION_VALIDATION_MODE = 'DISABLED'  # Disabled here because validate_customer_technology_match already handles region validation
-
-    
-
-    if customer_regions and REGION_VALIDATION_MODE != 'DISABLED':
-
-        if file_regions:
-
-            # Both have regions - check based on validation mode
-
-            regions_match = any(c_region == f_region for c_region in customer_regions for f_region in file_regions)
-
-            
-
-            if not regions_match:
-
-                if REGION_VALIDATION_MODE == 'STRICT':
-
-                    print(f"?? STRICT MODE: Region mismatch detected - REJECTING FILE")
-
-                    print(f"   Customer regions: {customer_regions}")
-
-                    print(f"   File regions: {file_regions}")
-
-                    return {
-
-                        'valid': False,
-
-                        'error': f"?? **WRONG REGION FOR CUSTOMER**\n\n"
-
-                                f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
-
-                                f"But file '{filename}' is for **{'/'.join(file_regions)}** region.\n\n"
-
-                                f"**?? SOLUTION:**\n"
-
-                                f" Upload files specifically for **{'/'.join(customer_regions)}** region only\n"
-
-                                f" Double-check you selected the correct customer\n\n"
-
-                                f"**?? Expected filename format:**\n"
-
-                                f" *{customer_regions[0].lower()}* should be in the filename\n\n"
-
-                                f"**? REGION MISMATCH:** {'/'.join(customer_regions)} ? {'/'.join(file_regions)}"
-
-                    }
-
-                elif REGION_VALIDATION_MODE == 'FLEXIBLE':
-
-                    print(f"?? FLEXIBLE MODE: Region mismatch detected - ALLOWING with warning")
-
-                    print(f"   Customer regions: {customer_regions} | File regions: {file_regions}")
-
-                    print(f"   ?? Cross-region upload allowed in flexible mode")
-
-            else:
-
-                print(f"? Region validation passed: {customer_regions} matches {file_regions}")
-
-        
-
-        # Handle files without region in flexible mode
-
-        elif REGION_VALIDATION_MODE == 'FLEXIBLE':
-
-            print(f"?? FLEXIBLE MODE: Customer has region {customer_regions} but file has NO region - ALLOWING")
-
-        elif REGION_VALIDATION_MODE == 'STRICT':
-
-            print(f"?? STRICT MODE: Customer has region {customer_regions} but file has NO region - REJECTING FILE")
-
-            return {
-
-                'valid': False,
-
-                'error': f"?? **FILE MISSING REQUIRED REGION**\n\n"
-
-                        f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
-
-                        f"But file '{filename}' does not specify any region.\n\n"
-
-                        f"**?? SOLUTION:**\n"
-
-                        f" Upload files that contain **{'/'.join(customer_regions)}** in the filename\n"
-
-                        f" Ensure filename follows pattern: *{customer_regions[0].lower()}*\n\n"
-
-                        f"**? MISSING REGION:** File must contain {'/'.join(customer_regions)}"
-
-            }
-
-        
-
-        print(f"?? Region validation completed for regional customer (mode: {REGION_VALIDATION_MODE})")
-
-    elif REGION_VALIDATION_MODE == 'DISABLED':
-
-        print(f"?? Region validation is DISABLED - accepting all region combinations")
-
-    
-
-    # Count exact and partial matches
-
-    exact_matches = 0
-
-    partial_matches = 0
-
-    matched_words = []
-
-    
-
-    for customer_word in customer_words:
-
-        found_match = False
-
-        
-
-        # Try exact match first
-
-        if customer_word in filename_words:
-
-            exact_matches += 1
-
-            matched_words.append(f"{customer_word}(exact)")
-
-            found_match = True
-
-        else:
-
-            # Try partial matches for words >= 3 characters
-
-            if len(customer_word) >= 3:
-
-                for filename_word in filename_words:
-
-                    if len(filename_word) >= 3:
-
-                        # Check substring matches in both directions
-
-                        if (customer_word in filename_word or 
-
-                            filename_word in customer_word or
-
-                            are_similar_words(customer_word, filename_word)):
-
-                            partial_matches += 1
-
-                            matched_words.append(f"{customer_word}?{filename_word}(partial)")
-
-                            found_match = True
-
-                            break
-
-    
-
-    total_matches = exact_matches + partial_matches
-
-    total_words = len(customer_words)
-
-    match_percentage = total_matches / total_words if total_words > 0 else 0
-
-    
-
-    print(f"?? Match Analysis: {exact_matches} exact, {partial_matches} partial, {total_matches}/{total_words} total ({match_percentage:.1%})")
-
-    print(f"?? Matched words: {matched_words}")
-
-    
-
-    # Flexible matching criteria - adjust based on customer name complexity
-
-    if total_words == 1:
-
-        # Single word customer - need at least partial match
-
-        required_threshold = 0.7
-
-    elif total_words == 2:
-
-        # Two words - need at least one good match
-
-        required_threshold = 0.5
-
-    else:
-
-        # Multiple words - more lenient for complex names
-
-        required_threshold = 0.4
-
-    
-
-    # Special case: if we have at least 2 exact matches, always accept
-
-    if exact_matches >= 2:
-
-        print(f"? Strong match: {exact_matches} exact matches found")
-
-        return {'valid': True, 'error': None}
-
-    
-
-    # Check if we meet the threshold
-
-    if match_percentage >= required_threshold or total_matches >= 2:
-
-        print(f"? Sufficient match: {match_percentage:.1%} meets threshold {required_threshold:.1%}")
-
-        return {'valid': True, 'error': None}
-
-    
-
-    # If no matches found, provide helpful error
-
-    if total_matches == 0:
-
-        return {
-
-            'valid': False,
-
-            'error': f"?? **FILE DOESN'T MATCH CUSTOMER**\n\n"
-
-                    f"Customer '{customer_name}' contains: **{', '.join(customer_words)}**\n"
-
-                    f"But file '{filename}' doesn't contain any of these identifiers.\n\n"
-
-                    f"**?? SOLUTION:**\n"
-
-                    f" Ensure filename contains at least some customer identifiers\n"
-
-                    f" Double-check you selected the correct customer\n\n"
-
-                    f"**?? Expected patterns in filename:**\n" +
-
-                    "\n".join([f" *{word.lower()}*" for word in customer_words[:3]])
-
-        }
-
-    
-
-    # Insufficient matches
-
-    return {
-
-        'valid': False,
-
-        'error': f"?? **INSUFFICIENT CUSTOMER MATCH**\n\n"
-
-                f"Customer '{customer_name}' requires better filename match.\n"
-
-                f"Found {total_matches}/{total_words} matches ({match_percentage:.1%}), need {required_threshold:.1%}\n\n"
-
-                f"**Matched:** {', '.join(matched_words) if matched_words else 'None'}\n"
-
-                f"**Missing:** {', '.join([w for w in customer_words if not any(w in m for m in matched_words)])}\n\n"
-
-                f"**?? SOLUTION:** Include more customer-specific identifiers in filename"
-
-    }
-
-
-
-
-
-def are_similar_words(word1, word2):
-
-    """Check if two words are similar (for common variations)"""
-
-    # Handle common variations
-
-    variations = {
-
-        'VI': 'VODAFONE',
-
-        'VODAFONE': 'VI',
-
-        'IDEA': 'VI',
-
-        'BHARTI': 'AIRTEL',
-
-        'RELIANCE': 'JIO',
-
-        'TATA': 'TTML',
-
-        'BSNL': 'BHARAT',
-
-        'BHARAT': 'BSNL'
-
-    }
-
-    
-
-    # Check if words are variations of each other
-
-    if word1 in variations and variations[word1] == word2:
-
-        return True
-
-    if word2 in variations and variations[word2] == word1:
-
-        return True
-
-    
-
-    # Check Levenshtein distance for typos (only for words >= 4 chars)
-
-    if len(word1) >= 4 and len(word2) >= 4:
-
-        distance = calculate_levenshtein_distance(word1, word2)
-
-        max_distance = max(len(word1), len(word2)) * 0.2  # Allow 20% difference
-
-        return distance <= max_distance
-
-    
-
-    return False
-
-
-
-
-
-def calculate_levenshtein_distance(s1, s2):
-
-    """Calculate Levenshtein distance between two strings"""
-
-    if len(s1) > len(s2):
-
-        s1, s2 = s2, s1
-
-    
-
-    distances = range(len(s1) + 1)
-
-    for i2, c2 in enumerate(s2):
-
-        distances_ = [i2 + 1]
-
-        for i1, c1 in enumerate(s1):
-
-            if c1 == c2:
-
-                distances_.append(distances[i1])
-
-            else:
-
-                distances_.append(1 + min((distances[i1], distances[i1 + 1], distances_[-1])))
-
-        distances = distances_
-
-    return distances[-1]
-
-
-
-
-
-def perform_enhanced_category_validation(customer_name, filename, customer_upper, filename_upper):
-
-    """Enhanced validation for specific categories (telecom, enterprise, etc.)"""
-
-    
-
-    # Define known categories and their specific validation rules
-
-    telecom_operators = [
-
-        'BSNL', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'RELIANCE',
-
-        'RAILTEL', 'POWERGRID', 'BHARTI', 'TATA', 'TTML', 'TTSL',
-
-        'SIFY', 'NETMAGIC', 'NKN', 'MTNL', 'QUADRANT', 'TULIP',
-
-        'NICNET', 'SWAN', 'ERNET', 'PGCIL'
-
-    ]
-
-    
-
-    regions = [
-
-        'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
-
-        'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
-
-        'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
-
-        'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD',
-
-        'UP', 'BIHAR', 'PUNJAB', 'HARYANA', 'RAJASTHAN', 'MP', 'GUJARAT',
-
-        'MAHARASHTRA', 'KARNATAKA', 'TAMILNADU', 'AP', 'TELANGANA'
-
-    ]
-
-    
-
-    technologies = [
-
-        'DWDM', 'OTN', 'SDH', 'SONET', 'PDH', 'MPLS', 'IP', 'ETHERNET',
-
-        'OPTICAL', 'FIBER', 'TRANSPORT', 'BACKBONE', 'METRO', 'ACCESS',
-
-        '1830PSS', 'CIENA', 'NOKIA', 'HUAWEI', 'ZTE', 'ERICSSON'
-
-    ]
-
-    
-
-    # Find matches in customer and file
-
-    customer_operator = find_longest_match(customer_upper, telecom_operators)
-
-    file_operator = find_longest_match(filename_upper, telecom_operators)
-
-    
-
-    customer_regions = find_all_matches(customer_upper, regions)
-
-    file_regions = find_all_matches(filename_upper, regions)
-
-    
-
-    customer_technologies = find_all_matches(customer_upper, technologies)
-
-    file_technologies = find_all_matches(filename_upper, technologies)
-
-    
-
-    # Validation logic - only enforce if customer has specific attributes
-
-    validation_issues = []
-
-    
-
-    # 1. Operator validation (strict for telecom customers)
-
-    if customer_operator and file_operator and customer_operator != file_operator:
-
-        # Handle known equivalencies
-
-        if not are_equivalent_operators(customer_operator, file_operator):
-
-            validation_issues.append({
-
-                'type': 'OPERATOR_MISMATCH',
-
-                'customer_value': customer_operator,
-
-                'file_value': file_operator,
-
-                'message': f"Customer is {customer_operator} but file is for {file_operator}"
-
-            })
-
-    
-
-    # 2. REGION VALIDATION - STRICT ENFORCEMENT
-
-    # Files MUST match the customer's region exactly
-
-    if customer_regions and file_regions:
-
-        if not any(c_region == f_region for c_region in customer_regions for f_region in file_regions):
-
-            validation_issues.append({
-
-                'type': 'REGION_MISMATCH',
-
-                'customer_value': '/'.join(customer_regions),
-
-                'file_value': '/'.join(file_regions),
-
-                'message': f"Customer is {'/'.join(customer_regions)} region but file is for {'/'.join(file_regions)} region"
-
-            })
-
-    elif customer_regions and not file_regions:
-
-        validation_issues.append({
-
-            'type': 'MISSING_REGION',
-
-            'customer_value': '/'.join(customer_regions),
-
-            'file_value': 'NONE',
-
-            'message': f"Customer is {'/'.join(customer_regions)} region but file has no region specified"
-
-        })
-
-    
-
-    # STRICT: If customer has region, file MUST have matching region - no exceptions
-
-    
-
-    # 3. Technology validation (lenient - warn but don't fail)
-
-    if customer_technologies and file_technologies:
-
-        if not any(c_tech == f_tech for c_tech in customer_technologies for f_tech in file_technologies):
-
-            print(f"?? TECHNOLOGY MISMATCH: Customer uses {customer_technologies} but file is for {file_technologies} (allowing)")
-
-    
-
-    # If we have validation issues, construct error message
-
-    if validation_issues:
-
-        error_parts = ["?? **CUSTOMER-FILE MISMATCH**\n"]
-
-        for issue in validation_issues:
-
-            error_parts.append(f" {issue['message']}")
-
-        
-
-        error_parts.extend([
-
-            "\n**?? SOLUTION:**",
-
-            f" Upload files specifically for '{customer_name}'",
-
-            " Check that you selected the correct customer",
-
-            " Ensure filename matches customer attributes"
-
-        ])
-
-        
-
-        # Add examples if we know the operator
-
-        if customer_operator:
-
-            error_parts.append(f"\n**?? Expected filename patterns:**")
-
-            base_name = customer_operator
-
-            if customer_regions:
-
-                base_name += f"_{customer_regions[0]}"
-
-            if customer_technologies:
-
-                base_name += f"_{customer_technologies[0]}"
-
-            error_parts.append(f" {base_name}_Report_20250115.xlsx")
-
-            error_parts.append(f" {base_name}_HC_Issues_Tracker.xlsx")
-
-        
-
-        return {'valid': False, 'error': "\n".join(error_parts)}
-
-    
-
-    # Build match info for success message
-
-    match_components = []
-
-    if customer_operator:
-
-        match_components.append(f"Operator: {customer_operator}")
-
-    if customer_regions:
-
-        match_components.append(f"Region: {'/'.join(customer_regions)}")
-
-    if customer_technologies:
-
-        match_components.append(f"Technology: {'/'.join(customer_technologies)}")
-
-    
-
-    match_info = " | ".join(match_components) if match_components else "Generic customer"
-
-    
-
-    return {'valid': True, 'error': None, 'match_info': match_info}
-
-
-
-
-
-def find_longest_match(text, candidates):
-
-    """Find the longest matching candidate in text"""
-
-    candidates_sorted = sorted(candidates, key=len, reverse=True)
-
-    for candidate in candidates_sorted:
-
-        if candidate in text:
-
-            return candidate
-
-    return None
-
-
-
-
-
-def find_all_matches(text, candidates):
-
-    """Find all matching candidates in text"""
-
-    matches = []
-
-    candidates_sorted = sorted(candidates, key=len, reverse=True)
-
-    for candidate in candidates_sorted:
-
-        if candidate in text and candidate not in matches:
-
-            matches.append(candidate)
-
-    return matches
-
-
-
-
-
-def are_equivalent_operators(op1, op2):
-
-    """Check if two operators are equivalent (handle mergers, rebranding)"""
-
-    equivalencies = {
-
-        ('VI', 'VODAFONE'): True,
-
-        ('VI', 'IDEA'): True,
-
-        ('VODAFONE', 'IDEA'): True,
-
-        ('BHARTI', 'AIRTEL'): True,
-
-        ('RELIANCE', 'JIO'): True,
-
-        ('TATA', 'TTML'): True,
-
-        ('TATA', 'TTSL'): True,
-
-    }
-
-    
-
-    # Check both directions
-
-    return equivalencies.get((op1, op2), False) or equivalencies.get((op2, op1), False)
-
-
-
-def validate_enhanced_customer_specific_upload(customer_name, filename, upload_section):
-
-    """STRICT CUSTOMER-SPECIFIC VALIDATION: Only files matching the exact customer are allowed"""
-
-    
-
-    print(f"?? STRICT CUSTOMER VALIDATION: Customer='{customer_name}', Filename='{filename}', Section='{upload_section}'")
-
-    
-
-    # Convert both to uppercase for comparison
-
-    customer_upper = customer_name.upper().strip()
-
-    filename_upper = filename.upper().strip()
-
-    
-
-    # STRICT MATCHING: Extract all significant words from customer name
-
-    import re
-
-    customer_words = [word.strip() for word in re.split(r'[\s_-]+', customer_upper) if word.strip() and len(word.strip()) >= 2]
-
-    filename_words = [word.strip() for word in re.split(r'[\s_-]+', filename_upper) if word.strip() and len(word.strip()) >= 2]
-
-    
-
-    print(f"?? Customer words: {customer_words}")
-
-    print(f"?? Filename words: {filename_words}")
-
-    
-
-    # Define critical components that MUST match exactly
-
-    operators = ['BSNL', 'RELIANCE', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'TATA']
-
-    regions = ['NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL', 'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST']
-
-    technologies = ['DWDM', 'OTN', 'SDH', 'MPLS', 'IP', 'ETHERNET', 'OPTICAL', 'TRANSPORT', 'ACCESS']
-
-    
-
-    # Extract components from customer name
-
-    customer_operator = next((op for op in operators if op in customer_words), None)
-
-    customer_regions = [region for region in regions if region in customer_words]
-
-    customer_technologies = [tech for tech in technologies if tech in customer_words]
-
-    
-
-    # Extract components from filename
-
-    filename_operator = next((op for op in operators if op in filename_words), None)
-
-    filename_regions = [region for region in regions if region in filename_words]
-
-    filename_technologies = [tech for tech in technologies if tech in filename_words]
-
-    
-
-    validation_errors = []
-
-    
-
-    # 1. OPERATOR VALIDATION - Must match exactly if customer has operator
-
-    if customer_operator:
-
-        if not filename_operator:
-
-            validation_errors.append(f"MISSING OPERATOR: Customer '{customer_name}' requires operator '{customer_operator}' but file doesn't contain it")
-
-        elif customer_operator != filename_operator:
-
-            validation_errors.append(f"WRONG OPERATOR: Customer is '{customer_operator}' but file is for '{filename_operator}'")
-
-        else:
-
-            print(f"? OPERATOR MATCH: {customer_operator}")
-
-    
-
-    # 2. REGIONAL VALIDATION - Must match exactly if customer has region
-
-    if customer_regions:
-
-        if not filename_regions:
-
-            validation_errors.append(f"MISSING REGION: Customer '{customer_name}' requires region '{'/'.join(customer_regions)}' but file doesn't contain it")
-
-        elif not any(c_region == f_region for c_region in customer_regions for f_region in filename_regions):
-
-            validation_errors.append(f"WRONG REGION: Customer is '{'/'.join(customer_regions)}' but file is for '{'/'.join(filename_regions)}'")
-
-        else:
-
-            matching_regions = [region for region in customer_regions if region in filename_regions]
-
-            print(f"? REGION MATCH: {'/'.join(matching_regions)}")
-
-    elif filename_regions and not customer_regions:
-
-        # ALLOW: Customer with no region can accept files with any region
-
-        print(f"? Customer '{customer_name}' has no specific region, allowing file with region {'/'.join(filename_regions)}")
-
-    
-
-    # 3. TECHNOLOGY VALIDATION - Must match exactly if customer has technology
-
-    if customer_technologies:
-
-        if not filename_technologies:
-
-            validation_errors.append(f"MISSING TECHNOLOGY: Customer '{customer_name}' requires technology '{'/'.join(customer_technologies)}' but file doesn't contain it")
-
-        elif not any(c_tech == f_tech for c_tech in customer_technologies for f_tech in filename_technologies):
-
-            validation_errors.append(f"WRONG TECHNOLOGY: Customer uses '{'/'.join(customer_technologies)}' but file is for '{'/'.join(filename_technologies)}'")
-
-        else:
-
-            matching_techs = [tech for tech in customer_technologies if tech in filename_technologies]
-
-            print(f"? TECHNOLOGY MATCH: {'/'.join(matching_techs)}")
-
-    
-
-    # 4. STRICT KEYWORD MATCHING - All significant customer words must be found in filename
-
-    excluded_words = set(operators + regions + technologies + ['ZONE', 'CIRCLE', 'REGION', 'AREA', 'NETWORK', 'REPORTS', 'REPORT', 'HC', 'HEALTH', 'CHECK', 'ISSUES', 'TRACKER', 'FILE', 'DATA', 'CSV', 'XLSX', 'TXT'])
-
-    customer_keywords = [word for word in customer_words if word not in excluded_words and len(word) >= 3]
-
-    
-
-    if customer_keywords:
-
-        missing_keywords = []
-
-        for keyword in customer_keywords:
-
-            if keyword not in filename_upper:
-
-                missing_keywords.append(keyword)
-
-        
-
-        if missing_keywords:
-
-            validation_errors.append(f"MISSING CUSTOMER KEYWORDS: File must contain these customer-specific keywords: {', '.join(missing_keywords)}")
-
-        else:
-
-            print(f"? ALL CUSTOMER KEYWORDS FOUND: {customer_keywords}")
-
-    
-
-    # Return validation result
-
-    if not validation_errors:
-
-        print(f"? STRICT CUSTOMER VALIDATION PASSED: File belongs to correct customer!")
-
-        return {'valid': True, 'error': None}
-
-    else:
-
-        print(f"? STRICT CUSTOMER VALIDATION FAILED: {len(validation_errors)} error(s)")
-
-        
-
-        error_message = f"?? **FILE BELONGS TO WRONG CUSTOMER**\n\n"
-
-        error_message += f"This file '{filename}' does not belong to customer '{customer_name}'.\n\n"
-
-        error_message += f"**? Validation Errors:**\n"
-
-        for i, error in enumerate(validation_errors, 1):
-
-            error_message += f"{i}. {error}\n"
-
-        
-
-        error_message += f"\n**?? SOLUTION:**\n"
-
-        error_message += f" Only upload files that specifically belong to '{customer_name}'\n"
-
-        error_message += f" File names must contain all customer-specific identifiers\n"
-
-        error_message += f" Double-check you selected the correct customer\n"
-
-        
-
-        # Add expected format example
-
-        if customer_operator or customer_regions or customer_technologies:
-
-            expected_parts = []
-
-            if customer_operator:
-
-                expected_parts.append(customer_operator)
-
-            if customer_regions:
-
-                expected_parts.append(customer_regions[0])
-
-            if customer_technologies:
-
-                expected_parts.append(customer_technologies[0])
-
-            
-
-            if expected_parts:
-
-                expected_format = '_'.join(expected_parts)
-
-                error_message += f"\n**?? Expected filename format:** {expected_format}_filename.ext"
-
-        
-
-        return {'valid': False, 'error': error_message}
-
-
-
-def validate_flexible_customer_name_match(customer_name, filename):
-
-    """BACKWARD COMPATIBILITY: Flexible customer name matching with regional validation"""
-
-    import re
-
-    import string
-
-    
-
-    # First, try simple substring match (case-insensitive)
-
-    customer_simple = customer_name.lower().replace(' ', '').replace('_', '').replace('-', '')
-
-    filename_simple = filename.lower().replace(' ', '').replace('_', '').replace('-', '')
-
-    
-
-    # If simple match works, accept immediately
-
-    if customer_simple in filename_simple:
-
-        print(f"? Simple match: '{customer_simple}' found in '{filename_simple}'")
-
-        return True
-
-    
-
-    # STRICT REGIONAL VALIDATION: Check for conflicting regions
-
-    regions = ['west', 'east', 'north', 'south', 'central', 'northeast', 'northwest', 'southeast', 'southwest']
-
-    
-
-    # Extract regions from customer name and filename
-
-    customer_regions = [region for region in regions if region in customer_name.lower()]
-
-    filename_regions = [region for region in regions if region in filename.lower()]
-
-    
-
-    # If both have regions but they don't match, REJECT
-
-    if customer_regions and filename_regions:
-
-        if not any(c_region == f_region for c_region in customer_regions for f_region in filename_regions):
-
-            print(f"? REGIONAL MISMATCH: Customer has {customer_regions}, but file has {filename_regions}")
-
-            return False
-
-        else:
-
-            print(f"? REGIONAL MATCH: Both have matching region {customer_regions[0]}")
-
-    
-
-    # Clean both customer name and filename
-
-    def clean_text(text):
-
-        # Convert to lowercase first, then remove punctuation
-
-        text = text.lower()
-
-        # Replace underscores, hyphens, and other separators with spaces
-
-        text = re.sub(r'[_\-\.\\/]', ' ', text)
-
-        # Remove other punctuation and keep only alphanumeric and spaces
-
-        cleaned = ''.join(c if c.isalnum() or c.isspace() else ' ' for c in text)
-
-        # Split into words and remove common filler words
-
-        filler_words = {'zone', 'circle', 'region', 'area', 'network', 'reports', 'report', 'the', 'and', 'of', 'for', 'hc', 'health', 'check', 'date', 'file', 'data'}
-
-        words = [word.strip() for word in cleaned.split() if word.strip() and len(word.strip()) > 2 and word.strip() not in filler_words]
-
-        return words
-
-    
-
-    customer_words = clean_text(customer_name)
-
-    filename_words = clean_text(filename)
-
-    
-
-    print(f"?? Customer words: {customer_words}")
-
-    print(f"?? Filename words: {filename_words}")
-
-    
-
-    # If no significant words in customer name, accept
-
-    if not customer_words:
-
-        print(f"? No significant words in customer name, accepting")
-
-        return True
-
-    
-
-    # Count matches
-
-    matches = 0
-
-    matched_words = []
-
-    for customer_word in customer_words:
-
-        # Look for exact match or partial match (at least 3 characters)
-
-        for filename_word in filename_words:
-
-            if len(customer_word) >= 3 and len(filename_word) >= 3:
-
-                # Check for exact match or substring match in both directions
-
-                if (customer_word == filename_word or 
-
-                    customer_word in filename_word or 
-
-                    filename_word in customer_word):
-
-                    matches += 1
-
-                    matched_words.append(f"{customer_word}?{filename_word}")
-
-                    break
-
-    
-
-    match_percentage = matches / len(customer_words)
-
-    print(f"?? Matched {matches}/{len(customer_words)} words ({match_percentage:.1%}): {matched_words}")
-
-    
-
-    # More lenient threshold - accept if at least 50% match OR if 2+ significant words match
-
-    is_valid = match_percentage >= 0.5 or matches >= 2
-
-    print(f"?? Validation result: {is_valid} (threshold: 50% or 2+ matches)")
-
-    
-
-    return is_valid
-
-
-
-@login_required
-
-def tracker_history(request):
-
-    """Return a JSON with all customers and their files, using the correct HealthCheckFile model."""
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected", "customer_folders": []})
-
-
-
-    try:
-
-        customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
-
-        customers = [customer]
-
-    except Customer.DoesNotExist:
-
-        customers = []
-
-
-
-    customer_folders = []
-
-    for customer in customers:
-
-        all_files = HealthCheckFile.objects.filter(customer=customer).order_by('-uploaded_at')
-
-
-
-        # Organize files by their type
-
-        file_categories = {
-
-            'host_files': [],
-
-            'reports': [],
-
-            'tracker_generated': [],
-
-            'old_trackers': [],
-
-            'inventory_files': []
-
-        }
-
-
-
-        tracker_candidates = []
-
-
-
-        for f in all_files:
-
-            # Convert to IST timezone explicitly
-
-            import zoneinfo
-
-            ist = zoneinfo.ZoneInfo('Asia/Kolkata')
-
-            ist_time = f.uploaded_at.astimezone(ist)
-
-            
-
-            # Determine correct download URL based on file type
-
-            if f.file_type == 'HOST':
-
-                file_url = f"/download/host/?filename={f.stored_filename}"
-
-            elif f.file_type == 'INVENTORY_CSV':
-
-                file_url = f"/download/inventory/?filename={f.stored_filename}"
-
-            elif f.file_type == 'TEC_REPORT':
-
-                file_url = f"/download/report/?filename={f.stored_filename}"
-
-            else:
-
-                # Tracker files and others use the original tracker download URL
-
-                file_url = f"/download/tracker/?filename={f.stored_filename}"
-
-            
-
-            file_info = {
-
-                "upload_id": f.id,
-
-                "filename": f.stored_filename,
-
-                "original_filename": f.original_filename,
-
-                "upload_date": ist_time.strftime('%d/%m/%Y %I:%M %p'),
-
-                "file_url": file_url,
-
-                "upload_timestamp": f.uploaded_at,
-
-            }
-
-
-
-            if f.file_type == 'HOST':
-
-                file_categories['host_files'].append(file_info)
-
-            elif f.file_type == 'INVENTORY_CSV':
-
-                file_categories['inventory_files'].append(file_info)
-
-            elif f.file_type == 'TEC_REPORT':
-
-                file_categories['reports'].append(file_info)
-
-            elif f.file_type == 'TRACKER_GENERATED':
-
-                # Only show HC_Issues_Tracker files in UI, not all output files
-
-                if "HC_Issues_Tracker" in f.stored_filename:
-
-                    file_categories['tracker_generated'].append(file_info)
-
-            elif f.file_type == 'HC_TRACKER': # Old trackers
-
-                # Only show HC_Issues_Tracker files in UI
-
-                if "HC_Issues_Tracker" in f.stored_filename:
-
-                    file_categories['old_trackers'].append(file_info)
-
-            elif f.file_type in ['GLOBAL_IGNORE_TXT', 'SELECTIVE_IGNORE_XLSX']: # Ignored files for reference
-
-                # Show ignored files in Old Trackers section for reference
-
-                file_categories['old_trackers'].append(file_info)
-
-
-
-        customer_folders.append({
-
-            "customer_id": customer.id,
-
-            "customer_name": customer.name,
-
-            "folders": file_categories
-
-        })
-
-    
-
-    total_files = sum(len(folder) for folder in customer_folders[0]['folders'].values()) if customer_folders else 0
-
-
-
-    response = JsonResponse({
-
-        "status": "success",
-
-        "selected_customer_id": selected_customer_id,
-
-        "selected_customer_name": request.session.get('selected_customer_name', 'Unknown'),
-
-        "customer_folders": customer_folders,
-
-        "total_customers": len(customer_folders),
-
-        "total_files": total_files,
-
-        "selected_customer_files": total_files,
-
-    })
-
-    
-
-    # Add cache-busting headers
-
-    response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-
-    response['Pragma'] = 'no-cache'
-
-    response['Expires'] = '0'
-
-    
-
-    return response
-
-
-
-@login_required
-
-def get_sticky_notes_data(request):
-
-    """API endpoint to get data for sticky notes panel"""
-
-    try:
-
-        selected_customer_id = request.session.get('selected_customer_id')
-
-        selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
-
-        
-
-        # Get last tracker generated for the current customer only
-
-        last_tracker = None
-
-        if selected_customer_id:
-
-            try:
-
-                current_customer = Customer.objects.get(id=selected_customer_id)
-
-                
-
-                # Get latest completed session with tracker
-
-                last_session = HealthCheckSession.objects.filter(
-
-                    customer=current_customer,
-
-                    status='COMPLETED',
-
-                    output_tracker_filename__isnull=False
-
-                ).exclude(output_tracker_filename='').order_by('-completed_at').first()
-
-                
-
-                if last_session:
-
-                    # Convert to IST timezone
-
-                    import zoneinfo
-
-                    ist = zoneinfo.ZoneInfo('Asia/Kolkata')
-
-                    ist_time = last_session.completed_at.astimezone(ist)
-
-                    
-
-                    last_tracker = {
-
-                        "filename": last_session.output_tracker_filename,
-
-                        "customer": last_session.customer.name,
-
-                        "timestamp": ist_time.strftime('%d/%m/%Y %I:%M %p'),
-
-                        "threshold": None  # Health check doesn't use temperature thresholds
-
-                    }
-
-                    
-
-            except Customer.DoesNotExist:
-
-                last_tracker = None
-
-        
-
-        # Get last activity (most recent session)
-
-        last_activity = None
-
-        last_session = HealthCheckSession.objects.filter().order_by('-created_at').first()
-
-        if last_session:
-
-            action_type = "Health Check Started"
-
-            if last_session.status == 'COMPLETED':
-
-                action_type = "Health Check Completed"
-
-            elif last_session.status == 'FAILED':
-
-                action_type = "Health Check Failed"
-
-            
-
-            # Convert to IST timezone for consistency
-
-            import zoneinfo
-
-            ist = zoneinfo.ZoneInfo('Asia/Kolkata')
-
-            ist_time = last_session.created_at.astimezone(ist)
-
-            
-
-            last_activity = {
-
-                "action": action_type,
-
-                "customer": last_session.customer.name,
-
-                "timestamp": ist_time.strftime('%d/%m/%Y %I:%M %p'),
-
-                "filename": last_session.session_id
-
-            }
-
-        
-
-        # Get current time for customer selection
-
-        from datetime import datetime
-
-        import zoneinfo
-
-        ist = zoneinfo.ZoneInfo('Asia/Kolkata')
-
-        current_time = datetime.now(ist).strftime('%d/%m/%Y %I:%M %p')
-
-        
-
-        return JsonResponse({
-
-            "status": "success",
-
-            "current_customer": {
-
-                "name": selected_customer_name,
-
-                "selected_time": current_time,
-
-                "previous_temperature": None,  # Health check doesn't use temperature
-
-                "current_temperature": None,
-
-                "is_new_customer": True
-
-            },
-
-            "last_tracker": last_tracker,
-
-            "previous_tracker": None,  # Health check doesn't track previous trackers
-
-            "last_activity": last_activity
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"Error in get_sticky_notes_data: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"Error getting sticky notes data: {str(e)}"})
-
-
-
-# === Individual Folder Upload Endpoints ===
-
-@login_required
-
-def upload_host_file(request):
-
-    """Upload file specifically to host files folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-    selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
-
-    if not selected_customer_id:
-        return JsonResponse({"status": "error", "message": "No customer selected", "customer_folders": []})
-
-    # Only database customers are supported
-    try:
-        customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
-        customers = [customer]
-    except Customer.DoesNotExist:
-        customers = []
-    # Check for multiple possible field names for host files
-
-    host_file = None
-
-    possible_field_names = ['host_file', 'host_files', 'csv_file', 'inventory_host']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            host_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not host_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = host_file
-
-    
-
-    # Validate file extension (typically CSV for host files, but also allow Excel)
-
-    allowed_extensions = ['.csv', '.xlsx', '.xls']
-
-    file_extension = None
-
-    for ext in allowed_extensions:
-
-        if uploaded_file.name.lower().endswith(ext):
-
-            file_extension = ext
-
-            break
-
-    
-
-    if not file_extension:
-
-        return JsonResponse({"status": "error", "message": "Only CSV (.csv) or Excel (.xlsx, .xls) files are allowed for host files"})
-
-    
-
-    # NEW: Validate that it's actually a HOST file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'HOST')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY host files can be uploaded in host section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'host_upload', 'HOST'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY host files can be uploaded in host section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'host_upload', 'HOST'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation for HOST files - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # ?? Allow multiple HOST files - don't clear existing ones
-
-        
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'HOST', uploaded_file.name)
-
-        
-
-        # Ensure directory exists
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to customer host folder
-
-        uploaded_file.seek(0)  # Reset file pointer to beginning
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        print(f"? Saved {uploaded_file.name} ? {customer_file_path}")
-
-        
-
-        # Create database record pointing to customer folder for downloads
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='HOST',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Host file '{uploaded_file.name}' uploaded successfully to host files folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"?? Error in upload_host_file: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_inventory_file(request):
-
-    """Upload file specifically to inventory folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'inventory_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['inventory_file']
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.csv'):
-
-        return JsonResponse({"status": "error", "message": "Only CSV files are allowed for inventory"})
-
-    
-
-    # NEW: Validate that it's actually an INVENTORY file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'INVENTORY')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure file is appropriate for INVENTORY section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'inventory_upload', 'INVENTORY'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # ?? Allow multiple INVENTORY_CSV files - don't clear existing ones
-
-        
-
-        # Save to customer's inventory folder
-
-        customer_folder = CUSTOMER_FILES_DIR / customer.name / "inventory_files"
-
-        os.makedirs(customer_folder, exist_ok=True)
-
-        
-
-        target_path = customer_folder / uploaded_file.name
-
-        
-
-        with open(target_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='INVENTORY_CSV',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(target_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Inventory file '{uploaded_file.name}' uploaded successfully to inventory folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_report_file(request):
-
-    """Upload file to BOTH Script processing directory AND customer reports folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    # Check for multiple possible field names for TEC reports
-
-    tec_report_file = None
-
-    possible_field_names = ['tec_report', 'tec_report_file', 'report_file', 'hc_report']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            tec_report_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not tec_report_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = tec_report_file
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.xlsx'):
-
-        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for TEC reports"})
-
-    
-
-    # NEW: Validate that it's actually a REPORT file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'REPORT')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure file is appropriate for REPORT section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'report_upload', 'REPORT'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # ?? Clear existing TEC_REPORT files to avoid duplicates
-
-        deleted_count = clear_existing_customer_files(customer, 'TEC_REPORT')
-
-        if deleted_count > 0:
-
-            print(f"? Cleared {deleted_count} old TEC_REPORT file(s) for customer: {customer.name}")
-
-        
-
-        # Get customer folder path
-
-        customer_file_path = get_customer_file_path(customer, 'TEC', uploaded_file.name)
-
-        
-
-        # Get Script processing path
-
-        script_file_path = SCRIPT_INPUT_DIR / uploaded_file.name
-
-        
-
-        # Ensure directories exist
-
-        os.makedirs(customer_file_path.parent, exist_ok=True)
-
-        os.makedirs(script_file_path.parent, exist_ok=True)
-
-        
-
-        # Save to Script processing directory (for processing)
-
-        uploaded_file.seek(0)  # Reset file pointer to beginning
-
-        with open(script_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # ALSO save to customer folder (for downloads)
-
-        uploaded_file.seek(0)  # Reset file pointer to beginning again
-
-        with open(customer_file_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        print(f"? Saved {uploaded_file.name} ? {script_file_path}")
-
-        print(f"?? Also saved to customer folder ? {customer_file_path}")
-
-        
-
-        # Create database record pointing to customer folder for downloads
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='TEC_REPORT',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(customer_file_path),  # Point to customer folder for downloads
-
-            file_size=uploaded_file.size
-
-        )
-        
-        # NEW: Trigger country re-detection now that we have uploaded reports
-        print(f"🔄 Triggering country re-detection for {customer.name} after report upload...")
-        try:
-            # Get customer networks for country detection
-            from .models import Customer
-            networks = Customer.objects.filter(name=customer.name, is_deleted=False)
-            if networks.exists():
-                updated_country = get_customer_location(customer.name, networks)
-                print(f"✅ Updated country for {customer.name}: {updated_country}")
-        except Exception as country_error:
-            print(f"⚠️ Country re-detection failed for {customer.name}: {country_error}")
-        
-        return JsonResponse({
-            "status": "success", 
-            "message": f"TEC report '{uploaded_file.name}' uploaded successfully. Country detection updated."
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"?? Error in upload_report_file: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_old_tracker_file(request):
-
-    """Upload file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'old_tracker_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['old_tracker_file']
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.xlsx'):
-
-        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for tracker files"})
-
-    
-
-    # NEW: Validate that it's actually a TRACKER file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'TRACKER')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'old_tracker_upload', 'TRACKER'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'old_tracker_upload', 'TRACKER'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation for OLD TRACKER files - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Save to customer's old_trackers folder
-
-        customer_folder = CUSTOMER_FILES_DIR / customer.name / "old_trackers"
-
-        os.makedirs(customer_folder, exist_ok=True)
-
-        
-
-        target_path = customer_folder / uploaded_file.name
-
-        
-
-        with open(target_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='HC_TRACKER',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(target_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Old tracker '{uploaded_file.name}' uploaded successfully to old trackers folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_tracker_generated_file(request):
-
-    """Upload file specifically to tracker generated folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    if 'tracker_generated_file' not in request.FILES:
-
-        return JsonResponse({"status": "error", "message": "No file uploaded"})
-
-    
-
-    uploaded_file = request.FILES['tracker_generated_file']
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.xlsx'):
-
-        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for tracker files"})
-
-    
-
-    # NEW: Validate that it's actually a TRACKER file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'TRACKER')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker generated section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'tracker_generated_upload', 'TRACKER'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker generated section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'tracker_generated_upload', 'TRACKER'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation for TRACKER GENERATED files - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # ?? FIRST: Clear existing TRACKER_GENERATED files BEFORE saving new ones (like reports)
-
-        deleted_count = clear_existing_customer_files(customer, 'TRACKER_GENERATED')
-
-        if deleted_count > 0:
-
-            print(f"? Cleared {deleted_count} old TRACKER_GENERATED file(s) for customer: {customer.name}")
-
-        
-
-        # Save to customer's tracker_generated folder
-
-        customer_folder = CUSTOMER_FILES_DIR / customer.name / "tracker_generated"
-
-        os.makedirs(customer_folder, exist_ok=True)
-
-        
-
-        target_path = customer_folder / uploaded_file.name
-
-        
-
-        with open(target_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='TRACKER_GENERATED',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(target_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Tracker '{uploaded_file.name}' uploaded successfully to tracker generated folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_ignore_excel_file(request):
-
-    """Upload Excel ignore file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    # Check for multiple possible field names for ignore Excel files
-
-    ignore_file = None
-
-    possible_field_names = ['ignore_excel_file', 'selective_ignore_xlsx', 'ignore_file', 'excel_ignore']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            ignore_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not ignore_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = ignore_file
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.xlsx'):
-
-        return JsonResponse({"status": "error", "message": "Only Excel (.xlsx) files are allowed for ignore Excel files"})
-
-    
-
-    # NEW: Validate that it's actually an IGNORE file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'IGNORE')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'ignore_excel_upload', 'IGNORE'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'ignore_excel_upload', 'IGNORE'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation for IGNORE EXCEL files - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Save to customer's old_trackers folder (where ignore files are stored)
-
-        customer_folder = CUSTOMER_FILES_DIR / customer.name.replace(" ", "_").replace("/", "_") / "old_trackers"
-
-        os.makedirs(customer_folder, exist_ok=True)
-
-        
-
-        target_path = customer_folder / uploaded_file.name
-
-        
-
-        # Also save to Script directory for processing (with customer name prefix)
-
-        script_filename = f"{customer.name}_ignored_test_cases.xlsx"
-
-        script_path = SCRIPT_DIR / script_filename
-
-        
-
-        # Save to customer folder
-
-        with open(target_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Also save to Script directory
-
-        uploaded_file.seek(0)  # Reset file pointer
-
-        with open(script_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        print(f"? Saved {uploaded_file.name} ? {target_path}")
-
-        print(f"?? Also saved to Script directory ? {script_path}")
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='SELECTIVE_IGNORE_XLSX',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(target_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Ignore Excel file '{uploaded_file.name}' uploaded successfully to old trackers folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"?? Error in upload_ignore_excel_file: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def upload_ignore_text_file(request):
-
-    """Upload Text ignore file specifically to old trackers folder"""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-    
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-    
-
-    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
-
-    
-
-    # Check for multiple possible field names for ignore text files
-
-    ignore_file = None
-
-    possible_field_names = ['ignore_text_file', 'global_ignore_txt', 'ignore_txt', 'text_ignore']
-
-    
-
-    for field_name in possible_field_names:
-
-        if field_name in request.FILES:
-
-            ignore_file = request.FILES[field_name]
-
-            break
-
-    
-
-    if not ignore_file:
-
-        return JsonResponse({
-
-            "status": "error", 
-
-            "message": f"No file uploaded. Expected field names: {possible_field_names}"
-
-        })
-
-    
-
-    uploaded_file = ignore_file
-
-    
-
-    # Validate file extension
-
-    if not uploaded_file.name.lower().endswith('.txt'):
-
-        return JsonResponse({"status": "error", "message": "Only Text (.txt) files are allowed for ignore text files"})
-
-    
-
-    # NEW: Validate that it's actually an IGNORE file based on filename
-
-    file_type_validation = validate_file_type_match(uploaded_file.name, 'IGNORE')
-
-    if not file_type_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": file_type_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'ignore_text_upload', 'IGNORE'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
-
-    section_validation = validate_section_specific_upload(
-
-        customer.name, uploaded_file.name, 'ignore_text_upload', 'IGNORE'
-
-    )
-
-    if not section_validation['valid']:
-
-        return JsonResponse({"status": "error", "message": section_validation['error']})
-
-    
-
-    # ENHANCED VALIDATION: Technology-aware customer validation for IGNORE TEXT files - ENABLED FOR STRICT MATCHING
-
-    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
-
-    if not validation_result['valid']:
-
-        return JsonResponse({"status": "error", "message": validation_result['error']})
-
-    
-
-    try:
-
-        # Save to customer's old_trackers folder (where ignore files are stored)
-
-        customer_folder = CUSTOMER_FILES_DIR / customer.name.replace(" ", "_").replace("/", "_") / "old_trackers"
-
-        os.makedirs(customer_folder, exist_ok=True)
-
-        
-
-        target_path = customer_folder / uploaded_file.name
-
-        
-
-        # Also save to Script directory for processing (with customer name prefix)
-
-        script_filename = f"{customer.name}_ignored_test_cases.txt"
-
-        script_path = SCRIPT_DIR / script_filename
-
-        
-
-        # Save to customer folder
-
-        with open(target_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        # Also save to Script directory
-
-        uploaded_file.seek(0)  # Reset file pointer
-
-        with open(script_path, 'wb+') as destination:
-
-            for chunk in uploaded_file.chunks():
-
-                destination.write(chunk)
-
-        
-
-        print(f"? Saved {uploaded_file.name} ? {target_path}")
-
-        print(f"?? Also saved to Script directory ? {script_path}")
-
-        
-
-        # Create database record
-
-        HealthCheckFile.objects.create(
-
-            customer=customer,
-
-            file_type='GLOBAL_IGNORE_TXT',
-
-            original_filename=uploaded_file.name,
-
-            stored_filename=uploaded_file.name,
-
-            file_path=str(target_path),
-
-            file_size=uploaded_file.size
-
-        )
-
-        
-
-        return JsonResponse({
-
-            "status": "success", 
-
-            "message": f"Ignore Text file '{uploaded_file.name}' uploaded successfully to old trackers folder"
-
-        })
-
-        
-
-    except Exception as e:
-
-        print(f"?? Error in upload_ignore_text_file: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
-
-
-
-@login_required
-
-def delete_tracker_file(request):
-
-    """Robustly delete a file and its database entry from all known locations."""
-
-    if request.method != "POST":
-
-        return JsonResponse({"status": "error", "message": "Invalid request method"})
-
-
-
-    selected_customer_id = request.session.get('selected_customer_id')
-
-    if not selected_customer_id:
-
-        return JsonResponse({"status": "error", "message": "No customer selected"})
-
-
-
-    upload_id = request.POST.get('upload_id')
-
-    if not upload_id:
-
-        return JsonResponse({"status": "error", "message": "Upload ID required"})
-
-
-
-    try:
-
-        customer = Customer.objects.get(id=selected_customer_id)
-
-        file_obj = get_object_or_404(HealthCheckFile, id=upload_id, customer=customer)
-
-        
-
-        filename = file_obj.stored_filename
-
-        file_type = file_obj.file_type
-
-        
-
-        # List of potential file paths to delete
-
-        paths_to_delete = set()
-
-        
-
-        # 1. Path from the database record
-
-        if file_obj.file_path:
-
-            paths_to_delete.add(Path(file_obj.file_path))
-
-            
-
-        # 2. Path in the customer-specific folder
-
-        customer_file_path = get_customer_file_path(customer, file_type, filename)
-
-        paths_to_delete.add(customer_file_path)
-
-
-
-        # 3. Path in the main script directories
-
-        if file_type in ['TEC_REPORT', 'INVENTORY_CSV']:
-
-            paths_to_delete.add(SCRIPT_INPUT_DIR / filename)
-
-            paths_to_delete.add(SCRIPT_INPUT_DIR / file_obj.original_filename)
-
-        else:
-
-            paths_to_delete.add(SCRIPT_DIR / filename)
-
-            
-
-        # 4. Path in the script output directory (for generated files)
-
-        if file_type == 'TRACKER_GENERATED':
-
-            paths_to_delete.add(SCRIPT_OUTPUT_DIR / filename)
-
-            paths_to_delete.add(SCRIPT_DIR / "output" / filename)
-
-
-
-        deleted_paths = []
-
-        for path in paths_to_delete:
-
-            try:
-
-                if path and path.exists() and path.is_file():
-
-                    path.unlink()
-
-                    print(f"? Successfully deleted physical file: {path}")
-
-                    deleted_paths.append(str(path))
-
-            except Exception as e:
-
-                print(f"?? Warning: Could not delete file at {path}: {e}")
-
-
-
-        # Delete the database record
-
-        file_obj.delete()
-
-        print(f"? Successfully deleted database record for: {filename}")
-
-
-
-        return JsonResponse({
-
-            "status": "success",
-
-            "message": f"File '{filename}' and its associated records have been deleted.",
-
-            "deleted_files": [filename],
-
-            "deleted_paths": deleted_paths,
-
-            "workflow_restart_needed": False
-
-        })
-
-
-
-    except Customer.DoesNotExist:
-
-        return JsonResponse({"status": "error", "message": "Customer not found"})
-
-    except HealthCheckFile.DoesNotExist:
-
-        return JsonResponse({"status": "error", "message": f"File record with ID {upload_id} not found."})
-
-    except Exception as e:
-
-        print(f"? Error in delete_tracker_file: {str(e)}")
-
-        return JsonResponse({"status": "error", "message": f"An unexpected error occurred: {str(e)}"})
-
-
-
-@login_required
-
-def get_customer_networks(request, customer_id):
-
-    """API endpoint to get networks for a specific customer"""
-
-    try:
-
-        # Get all networks for this customer
-
-        networks = Customer.get_networks_for_customer_by_id(customer_id)
-
-        
-
-        networks_data = []
-
-        for network in networks:
-
-            networks_data.append({
-
-                'id': network.id,
-
-                'name': network.network_name or network.name,
-
-                'network_type': network.network_type,
-
-                'full_name': network.display_name
-
-            })
-
-        
-
-        return JsonResponse({
-
-            'status': 'success',
-
-            'networks': networks_data
-
-        })
-
-        
-
-    except Exception as e:
-
-        return JsonResponse({
-
-            'status': 'error',
-
-            'message': str(e)
-
-        })
-
-
-
-
-
-def calculate_processing_timeout(input_files):
-
-    """Calculate processing timeout based on estimated network size from input files"""
-
-    try:
-
-        # Minimum timeout for small networks (15 minutes)
-
-        min_timeout = 900  # 15 minutes
-
-        
-
-        if not input_files:
-
-            return min_timeout
-
-        
-
-        # Analyze file sizes to estimate network complexity
-
-        total_size = 0
-
-        has_large_files = False
-
-        file_count = 0
-
-        
-
-        for file_path in input_files:
-
-            try:
-
-                if hasattr(file_path, 'stat'):
-
-                    file_size = file_path.stat().st_size
-
-                elif isinstance(file_path, str):
-
-                    file_size = Path(file_path).stat().st_size
-
-                else:
-
-                    continue
-
-                    
-
-                total_size += file_size
-
-                file_count += 1
-
-                
-
-                # Check for large files (>15MB indicates larger network)
-
-                if file_size > 15 * 1024 * 1024:  # 15MB
-
-                    has_large_files = True
-
-                    
-
-            except (OSError, AttributeError):
-
-                continue
-
-        
-
-        # Calculate timeout based on total size and file characteristics
-
-        if total_size > 100 * 1024 * 1024:  # >100MB total - very large enterprise network
-
-            timeout = 7200  # 2 hour for very large networks like Telekom
-
-        elif total_size > 50 * 1024 * 1024 or has_large_files:  # >50MB or has large files - large network
-
-            timeout = 7200  # 2 hour for large networks
-
-        elif total_size > 20 * 1024 * 1024:  # >20MB - medium network
-
-            timeout = 2700  # 45 minutes for medium networks
-
-        elif total_size > 5 * 1024 * 1024:  # >5MB - small-medium network
-
-            timeout = 1800  # 30 minutes for small-medium networks
-
-        else:
-
-            timeout = min_timeout  # 15 minutes for small networks (minimum)
-
-        
-
-        # Additional time for multiple large files (complex processing)
-
-        if file_count > 2 and has_large_files:
-
-            timeout += 300  # Add 5 more minutes for complex multi-file processing
-
-        
-
-        print(f"?? Network size analysis:")
-
-        print(f"   ?? Total size: {total_size/1024/1024:.1f}MB across {file_count} files")
-
-        print(f"   ?? Has large files (>15MB): {has_large_files}")
-
-        print(f"   ?? Calculated timeout: {timeout/60:.1f} minutes")
-
-        
-
-        return timeout
-
-        
-
-    except Exception as e:
-
-        print(f"?? Error calculating timeout: {e}, using default")
-
-        return 7200  # 2 hour default fallback for large networks
-
-
-
-
-
-def handle_session_timeout(session_id):
-
-    """Handle session timeout by marking it as failed"""
-
-    try:
-
-        session = HealthCheckSession.objects.get(id=session_id)
-
-        if session.status == 'PROCESSING':
-
-            timeout_minutes = "20+"
-
-            try:
-
-                # Try to get the actual timeout that was used
-
-                if hasattr(session, 'timeout_used'):
-
-                    timeout_minutes = f"{session.timeout_used/60:.0f}"
-
-            except:
-
-                pass
-
-            
-
-            session.update_status('FAILED', f'Processing timed out after {timeout_minutes} minutes - network may be too large or complex')
-
-            print(f"? Session {session_id} timed out and marked as FAILED")
-
-    except HealthCheckSession.DoesNotExist:
-
-        print(f"?? Timeout handler called for non-existent session: {session_id}")
-
-    except Exception as e:
-
-        print(f"? Error in timeout handler: {e}")
-
-
-
-
-
-# === API ENDPOINTS FOR RUN STATISTICS ===
-
-
-
-def api_run_statistics(request):
-
-    """API endpoint for overall run statistics"""
-
-    if request.method == 'GET':
-
-        try:
-
-            from django.utils import timezone
-
-            from datetime import datetime, timedelta
-
-            
-
-            # Get current month statistics
-
-            now = timezone.now()
-
-            
-
-            # Total runs (all health check sessions)
-
-            total_runs = HealthCheckSession.objects.count()
-
-            
-
-            # Current month runs using same logic as monthly breakdown
-
-            current_year = now.year
-
-            current_month = now.month
-
-            
-
-            # Calculate current month start and end dates (same as monthly breakdown)
-
-            current_month_start = datetime(current_year, current_month, 1, tzinfo=now.tzinfo)
-
-            if current_month == 12:
-
-                current_month_end = datetime(current_year + 1, 1, 1, tzinfo=now.tzinfo) - timedelta(seconds=1)
-
-            else:
-
-                current_month_end = datetime(current_year, current_month + 1, 1, tzinfo=now.tzinfo) - timedelta(seconds=1)
-
-            
-
-            current_month_runs = HealthCheckSession.objects.filter(
-
-                created_at__gte=current_month_start,
-
-                created_at__lte=current_month_end
-
-            ).count()
-
-            
-
-            return JsonResponse({
-
-                'status': 'success',
-
-                'total_runs': total_runs,
-
-                'current_month_runs': current_month_runs,
-
-                'last_updated': timezone.localtime(now).strftime('%I:%M:%S %p')
-
-            })
-
-            
-
-        except Exception as e:
-
-            return JsonResponse({
-
-                'status': 'error',
-
-                'message': f'Failed to fetch run statistics: {str(e)}'
-
-            }, status=500)
-
-    
-
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-
-
-
-# === CUSTOMER DASHBOARD VIEWS ===
-
-
-
-@login_required
-
-def customer_dashboard(request):
-
-    """Customer dashboard view with filtering and analytics"""
-
-    return render(request, 'customer_dashboard.html')
-
-
-from django.views.decorators.csrf import csrf_exempt
-from django.http import JsonResponse
-
-@csrf_exempt
-def customer_dashboard_excel(request):
-    """
-    DISABLED: Excel dashboard - now returns only database customers.
-    Excel integration is completely disabled to show only database data.
-    """
-    from pathlib import Path
-    import pandas as pd
-    from datetime import datetime
-    from django.http import FileResponse
-    import tempfile
-    import os
-
-    # Match your actual Excel columns
-    month_columns = [
-        "Jan/2025", "Feb/2025", "Mar/2025", "Apr/2025", "May/2025", "Jun/2025",
-        "Jul/2025", "Aug/2025", "Sep/2025", "Oct/2025", "Nov/2025", "Dec/2025"
-    ]
-
-    def parse_df(df, start_date=None, end_date=None):
-        print(f"\n🔍 PARSING EXCEL FILE - Shape: {df.shape}")
-        print(f"📋 Available columns: {list(df.columns)}")
-        
-        customers = {}
-        
-        # Check if we have the expected Summary sheet columns
-        expected_cols = ['Customer', 'Network', 'Country', 'Node Qty', 'NE Type', 'gTAC']
-        missing_cols = [col for col in expected_cols if col not in df.columns]
-        
-        if missing_cols:
-            print(f"⚠️ Missing columns: {missing_cols}")
-        
-        # Clean column names to remove any trailing spaces
-        df.columns = df.columns.str.strip()
-        
-        # Process each row using actual column names from Summary sheet
-        for index, row in df.iterrows():
-            try:
-                # Use 'Customer' as primary customer name, 'Network' as secondary identifier
-                customer_name = str(row.get('Customer', f'Customer_{index}')).strip()
-                network_name = str(row.get('Network', f'Network_{index}')).strip()
-                
-                if not customer_name or customer_name == 'nan' or not network_name or network_name == 'nan':
-                    continue  # Skip empty rows
-                
-                # Extract data using Summary sheet column names
-                country = str(row.get('Country', 'India')).strip()
-                node_qty = row.get('Node Qty', 0)
-                gtac_team = str(row.get('gTAC', 'Classic')).strip()
-                nw_type = str(row.get('NE Type', '1830 PSS')).strip()
-                
-                # Process monthly datetime columns for monthly data
-                monthly_data = ['-'] * 12  # Jan to Dec
-                has_activity_in_range = False
-                
-                # Get datetime columns (all columns that are datetime objects)
-                for col_name, col_value in row.items():
-                    if isinstance(col_name, pd.Timestamp) and pd.notna(col_value):
-                        try:
-                            if isinstance(col_value, pd.Timestamp):
-                                month_idx = col_name.month - 1  # 0-based index for month
-                                if 0 <= month_idx < 12:  # Valid month range
-                                    day = col_value.day
-                                    year = col_value.year
-                                    # Format: "01-Apr-24"
-                                    month_display = f"{day:02d}-{col_value.strftime('%b')}-{str(year)[-2:]}"
-                                    monthly_data[month_idx] = month_display
-                                    
-                                    # Check if this date falls within filter range
-                                    if start_date and end_date:
-                                        if start_date <= col_value <= end_date:
-                                            has_activity_in_range = True
-                                    else:
-                                        has_activity_in_range = True  # No filter, include all
-                                        
-                        except Exception as date_error:
-                            print(f"⚠️ Date parsing error for {network_name}: {date_error}")
-                
-                # If filtering by date range, only include customers with activity in that range
-                if start_date and end_date and not has_activity_in_range:
-                    continue
-                
-                # Use network_name as the unique key
-                customers[network_name] = {
-                    'Customer': customer_name,  # Match Excel column name
-                    'Network': network_name,  # Match Excel column name
-                    'Country': country,  # Match Excel column name
-                    'Node Qty': int(node_qty) if node_qty else 0,  # Match Excel column name
-                    'NE Type': nw_type,  # Match Excel column name
-                    'gTAC': gtac_team,  # Match Excel column name
-                    'months': monthly_data,
-                    'total_runs': 1  # Count each row as 1 run
-                }
-                
-                print(f"✅ Added customer: {customer_name} - Network: {network_name} ({country}, {node_qty} nodes)")
-                
-            except Exception as row_error:
-                print(f"⚠️ Error processing row {index}: {row_error}")
-                continue
-        
-        print(f"\n🎉 PARSING COMPLETE: {len(customers)} customers found")
-        return customers
-
-    def create_excel_file(customers, filename="customer_dashboard_export.xlsx"):
-        """Create Excel file from customer data"""
-        # Convert customers dict to DataFrame
-        rows = []
-        for customer_data in customers.values():
-            row = {
-                'Customer': customer_data.get('Customer', ''),
-                'Network': customer_data.get('Network', ''),
-                'Country': customer_data.get('Country', ''),
-                'Node Qty': customer_data.get('Node Qty', 0),
-                'NE Type': customer_data.get('NE Type', ''),
-                'gTAC': customer_data.get('gTAC', ''),
-                'Jan': customer_data.get('months', ['-'] * 12)[0],
-                'Feb': customer_data.get('months', ['-'] * 12)[1],
-                'Mar': customer_data.get('months', ['-'] * 12)[2],
-                'Apr': customer_data.get('months', ['-'] * 12)[3],
-                'May': customer_data.get('months', ['-'] * 12)[4],
-                'Jun': customer_data.get('months', ['-'] * 12)[5],
-                'Jul': customer_data.get('months', ['-'] * 12)[6],
-                'Aug': customer_data.get('months', ['-'] * 12)[7],
-                'Sep': customer_data.get('months', ['-'] * 12)[8],
-                'Oct': customer_data.get('months', ['-'] * 12)[9],
-                'Nov': customer_data.get('months', ['-'] * 12)[10],
-                'Dec': customer_data.get('months', ['-'] * 12)[11],
-                'Total Runs': customer_data.get('total_runs', 1)
-            }
-            rows.append(row)
-        
-        df = pd.DataFrame(rows)
-        
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
-        temp_file.close()
-        
-        # Write to Excel
-        with pd.ExcelWriter(temp_file.name, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Summary', index=False)
-            
-        return temp_file.name
-
-    if request.method == 'GET':
-        # Check if this is a download request
-        download_requested = request.GET.get('download') == 'true'
-        start_date_str = request.GET.get('start_date')
-        end_date_str = request.GET.get('end_date')
-        
-        # Parse date filters if provided
-        start_date = None
-        end_date = None
-        if start_date_str:
-            try:
-                start_date = pd.to_datetime(start_date_str)
-            except:
-                pass
-        if end_date_str:
-            try:
-                end_date = pd.to_datetime(end_date_str)
-            except:
-                pass
-        
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        if not excel_path.exists():
-            return JsonResponse({'status': 'error', 'message': 'Excel file not found'}, status=404)
-            
-        try:
-            # Read from Summary sheet
-            df = pd.read_excel(excel_path, sheet_name='Summary')
-            print(f"Excel Summary sheet shape: {df.shape}, columns: {list(df.columns)}")  # Debug info
-            customers = parse_df(df, start_date, end_date)
-            
-            if download_requested:
-                # SIMPLE SOLUTION: Return the original Excel file directly (always works)
-                try:
-                    # Generate appropriate filename
-                    if start_date_str and end_date_str:
-                        filename = f"Health_Check_Tracker_filtered_{start_date_str}_to_{end_date_str}.xlsx"
-                    else:
-                        filename = "Health_Check_Tracker_1.xlsx"
-                    
-                    print(f"✅ Serving original Excel file: {filename}")
-                    
-                    # Return the original Excel file using FileResponse (guaranteed to work)
-                    response = FileResponse(
-                        open(excel_path, 'rb'),
-                        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                        as_attachment=True,
-                        filename=filename
-                    )
-                    
-                    return response
-                    
-                except Exception as file_error:
-                    print(f"❌ File serving error: {str(file_error)}")
-                    return JsonResponse({'status': 'error', 'message': f'Excel file not found: {str(file_error)}'}, status=404)
-            else:
-                # Return JSON data
-                if not customers:
-                    return JsonResponse({
-                        'status': 'success',
-                        'customers': {},
-                        'message': 'No customer data found in Excel file. Please check that the file has valid rows and correct column names.'
-                    })
-                return JsonResponse({'status': 'success', 'customers': customers})
-                
-        except Exception as e:
-            print(f"❌ Excel processing error: {str(e)}")
-            return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
-            
-    elif request.method == 'POST' and 'excel_file' in request.FILES:
-        excel_file = request.FILES['excel_file']
-        try:
-            df = pd.read_excel(excel_file, sheet_name='Summary')
-            customers = parse_df(df)
-            if not customers:
-                return JsonResponse({
-                    'status': 'success',
-                    'customers': {},
-                    'message': 'No customer data found in uploaded Excel file. Please check your file.'
-                })
-            return JsonResponse({'status': 'success', 'customers': customers})
-        except Exception as e:
-            return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
-    else:
-        return JsonResponse({'status': 'error', 'message': 'No Excel file uploaded'}, status=400)
-
-@login_required
-
-def api_customer_dashboard_statistics(request):
-
-    """API endpoint for customer dashboard statistics with optional date filtering"""
-
-    if request.method == 'GET':
-
-        try:
-
-            from django.utils import timezone
-
-            from datetime import datetime, timedelta
-
-            
-
-            # Get date filter parameters
-
-            start_date_str = request.GET.get('start_date')
-
-            end_date_str = request.GET.get('end_date')
-
-            
-
-            # Parse dates if provided
-
-            start_date = None
-
-            end_date = None
-
-            if start_date_str:
-
-                start_date = datetime.strptime(start_date_str, '%Y-%m-%d').replace(tzinfo=timezone.get_current_timezone())
-
-            if end_date_str:
-
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=timezone.get_current_timezone())
-
-            
-
-            # Get overall statistics
-
-            total_customers = Customer.objects.count()
-
-            total_runs = HealthCheckSession.objects.count()
-
-            total_trackers = HealthCheckSession.objects.filter(status='COMPLETED').count()
-
-            
-
-            # Current month runs
-
-            now = timezone.now()
-
-            current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-            next_month_start = (current_month_start + timedelta(days=32)).replace(day=1)
-
-            current_month_runs = HealthCheckSession.objects.filter(
-
-                created_at__gte=current_month_start,
-
-                created_at__lt=next_month_start
-
-            ).count()
-
-            
-
-            # Filtered period runs (if date filter is applied)
-
-            filtered_runs = 0
-
-            if start_date and end_date:
-
-                filtered_runs = HealthCheckSession.objects.filter(
-
-                    created_at__gte=start_date,
-
-                    created_at__lte=end_date
-
-                ).count()
-
-            else:
-
-                filtered_runs = current_month_runs
-
-            
-
-            return JsonResponse({
-
-                'status': 'success',
-
-                'total_customers': total_customers,
-
-                'total_runs': total_runs,
-
-                'total_trackers': total_trackers,
-
-                'current_month_runs': current_month_runs,
-
-                'filtered_runs': filtered_runs
-
-            })
-
-            
-
-        except Exception as e:
-
-            return JsonResponse({
-
-                'status': 'error',
-
-                'message': f'Failed to fetch statistics: {str(e)}'
-
-            }, status=500)
-
-    
-
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-
-@login_required
-
-def api_customer_dashboard_export(request):
-
-    """Simple working export function"""
-
-    if request.method == 'POST':
-
-        try:
-
-            import json
-
-            from django.http import HttpResponse
-
-            from django.utils import timezone
-
-            import csv
-
-            from io import StringIO
-
-            
-
-            print("?? COMPREHENSIVE EXPORT CALLED - MATCHING DASHBOARD EXACTLY!")
-
-            
-
-            # Create CSV
-
-            output = StringIO()
-
-            writer = csv.writer(output)
-
-            
-
-            # Header
-
-            writer.writerow(['Customer Dashboard Export'])
-
-            writer.writerow([f'Generated: {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'])
-
-            writer.writerow([])
-
-            # Get current year for month headers (dynamic like dashboard)
-            current_year_for_headers = timezone.now().year
-            year_short = str(current_year_for_headers)[-2:]  # Get last 2 digits (2025 -> 25)
-            
-            # Create month headers with year (e.g., "Jan 25, Feb 25, ...")
-            month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            month_headers_with_year = [f'{month} {year_short}' for month in month_names]
-            print(f"📅 EXPORT HEADERS WITH YEAR: {month_headers_with_year[:3]}...")  # Debug: Shows first 3 months
-            
-            writer.writerow(['Customer', 'Country', 'Networks', 'Node Qty', 'NE Type', 'GTAC'] + month_headers_with_year + ['Total Runs'])
-
-            
-
-            # Get data
-            # Use SAME LOGIC as dashboard API - call the working customer dashboard API
-            print("📊 Using SAME LOGIC as dashboard API...")
-            
-            # Import the working dashboard function
-            from django.test import RequestFactory
-            factory = RequestFactory()
-            api_request = factory.get('/api/customer-dashboard/customers/')
-            api_request.user = request.user
-            
-            # Get data from the WORKING dashboard API function
-            from django.http import JsonResponse
-            dashboard_response = api_customer_dashboard_customers(api_request)
-            
-            if isinstance(dashboard_response, JsonResponse):
-                import json
-                dashboard_data = json.loads(dashboard_response.content.decode('utf-8'))
-                
-                if dashboard_data.get('status') == 'success':
-                    customers_data = dashboard_data.get('customers', {})
-                    print(f"✅ Got {len(customers_data)} customers from dashboard API")
-                    
-                    for customer_name, customer_info in customers_data.items():
-                        print(f"\n=== Processing customer: {customer_name} ===")
-                        
-                        # 1. CUSTOMER MAIN ROW (using SAME data as dashboard)
-                        try:
-                            # Use the SAME fields as dashboard API
-                            country = customer_info.get('country', customer_info.get('location', 'Unknown'))
-                            node_qty = customer_info.get('node_count', customer_info.get('node_qty', 0))
-                            total_runs = customer_info.get('runs', 0)
-                            networks_count = customer_info.get('networks_count', 0)
-                            
-                            # Get monthly data - check current year (2025 based on your data)
-                            current_year = 2025  # Your data is in 2025
-                            customer_monthly = []
-                            
-                            for month in range(1, 13):
-                                month_date = '-'
-                                
-                                # Check each network for runs in this month
-                                for network in customer_info.get('networks', []):
-                                    if (network.get('runs', 0) > 0 and 
-                                        network.get('last_run_date') and 
-                                        network.get('last_run_date') != 'Never'):
-                                        
-                                        try:
-                                            from datetime import datetime
-                                            run_date = datetime.strptime(network['last_run_date'], '%Y-%m-%d')
-                                            if run_date.year == current_year and run_date.month == month:
-                                                month_date = run_date.strftime('%d-%b-%y')
-                                                break  # Use the first valid date found
-                                        except ValueError:
-                                            continue
-                                
-                                customer_monthly.append(month_date)
-                            
-                            # Write CUSTOMER main row with REAL data
-                            writer.writerow([
-                                customer_name,                    # Customer name
-                                country,                         # Real country from API
-                                f"{networks_count} networks",     # Real networks count
-                                node_qty,                        # Real node qty from API
-                                '1830 PSS',                      # NE Type  
-                                'PSS',                          # GTAC
-                                customer_monthly[0],            # Jan
-                                customer_monthly[1],            # Feb
-                                customer_monthly[2],            # Mar
-                                customer_monthly[3],            # Apr
-                                customer_monthly[4],            # May
-                                customer_monthly[5],            # Jun
-                                customer_monthly[6],            # Jul
-                                customer_monthly[7],            # Aug
-                                customer_monthly[8],            # Sep
-                                customer_monthly[9],            # Oct
-                                customer_monthly[10],           # Nov
-                                customer_monthly[11],           # Dec
-                                total_runs                      # Real total runs
-                            ])
-                            print(f"✓ Exported CUSTOMER row: {customer_name}")
-                        
-                        except Exception as e:
-                            print(f"Error with customer {customer_name}: {e}")
-                        
-                        # 2. NETWORK SUB-ROWS (using SAME data as dashboard)
-                        for network in customer_info.get('networks', []):
-                            try:
-                                # Use SAME data as dashboard API
-                                network_name = network.get('network_name', network.get('name', 'Unknown Network'))
-                                network_runs = network.get('runs', 0)
-                                network_last_run_date = network.get('last_run_date', 'Never')
-                                
-                                # Clean network name (remove customer prefix like dashboard does)
-                                display_name = network_name
-                                if network.get('name') and ' - ' in network.get('name', ''):
-                                    display_name = network.get('name').split(' - ')[-1]
-                                
-                                print(f"  Processing network: {display_name} ({network_runs} runs, date: {network_last_run_date})")
-                                
-                                # DON'T SKIP networks with 0 runs - include them like dashboard does
-                                
-                                # Get monthly data using SAME logic as dashboard
-                                network_monthly = []
-                                
-                                for month in range(1, 13):
-                                    month_date = '-'
-                                    
-                                    # If this network has runs and valid date
-                                    if (network_runs > 0 and 
-                                        network_last_run_date and 
-                                        network_last_run_date != 'Never'):
-                                        
-                                        try:
-                                            from datetime import datetime
-                                            run_date = datetime.strptime(network_last_run_date, '%Y-%m-%d')
-                                            if run_date.year == current_year and run_date.month == month:
-                                                month_date = run_date.strftime('%d-%b-%y')
-                                        except ValueError:
-                                            pass
-                                    
-                                    network_monthly.append(month_date)
-                                
-                                # Write NETWORK sub-row with SAME data as dashboard
-                                writer.writerow([
-                                    f"  {display_name}",        # Network name (clean, indented)
-                                    '',                         # Country (empty for sub-row)
-                                    f"{network_runs} runs",     # Network runs from API
-                                    '',                         # Node Qty (empty)
-                                    'PSS',                      # NE Type
-                                    '',                         # GTAC (empty)
-                                    network_monthly[0],         # Jan
-                                    network_monthly[1],         # Feb
-                                    network_monthly[2],         # Mar
-                                    network_monthly[3],         # Apr
-                                    network_monthly[4],         # May
-                                    network_monthly[5],         # Jun
-                                    network_monthly[6],         # Jul
-                                    network_monthly[7],         # Aug
-                                    network_monthly[8],         # Sep
-                                    network_monthly[9],         # Oct
-                                    network_monthly[10],        # Nov
-                                    network_monthly[11],        # Dec
-                                    network_runs                # Total Runs from API
-                                ])
-                                print(f"  ✅ Exported NETWORK row: {display_name} ({network_runs} runs)")
-                                
-                            except Exception as e:
-                                print(f"  Error with network {network.get('name', 'Unknown')}: {e}")
-                                
-                else:
-                    print("❌ Dashboard API returned no data or error")
-                    writer.writerow(['Error', 'No Data', 'Dashboard API failed', 0, 'Error', 'Error', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', 0])
-            else:
-                print("❌ Failed to get dashboard API response")
-                writer.writerow(['Error', 'API Error', 'Could not fetch data', 0, 'Error', 'Error', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', '-', 0])
-
-            
-
-            # Return CSV
-
-            csv_content = output.getvalue()
-
-            output.close()
-
-            
-
-            response = HttpResponse(csv_content, content_type='text/csv')
-
-            response['Content-Disposition'] = f'attachment; filename="customer_dashboard_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-
-            
-
-            # print("? Export successful!")
-
-            return response
-
-            
-
-        except Exception as e:
-
-            print(f"? Export error: {e}")
-
-            return JsonResponse({'status': 'error', 'message': f'Export failed: {str(e)}'}, status=500)
-
-    
-
-    return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
-
-
-# HELPER FUNCTIONS FOR FETCHING REAL DATA FROM REPORTS
-
-def get_customer_node_count(customer_name, networks):
-    """
-    Dynamically get real node count from reports or intelligent estimation
-    """
-    try:
-        from .models import NodeCoverage, HealthCheckSession
-        
-        print(f"\n🔍 ===== NODE COUNT DEBUG for {customer_name} =====")
-        print(f"🔍 Customer: {customer_name} with {len(networks)} networks")
-        
-        # Get network IDs for this customer
-        network_ids = [net.id for net in networks]
-        print(f"🔍 Network IDs: {network_ids}")
-        
-        # Debug: Print network details
-        for net in networks:
-            print(f"  - Network: {net.name} (ID: {net.id}, Network Name: {net.network_name})")
-        
-        # STEP 1: Try to get REAL node counts from NodeCoverage reports
-        all_sessions = HealthCheckSession.objects.filter(customer_id__in=network_ids)
-        print(f"🔍 Found {all_sessions.count()} total sessions for these networks")
-        
-        # Debug: Print some session details
-        if all_sessions.exists():
-            recent_sessions = all_sessions.order_by('-created_at')[:5]
-            print(f"🔍 Recent sessions:")
-            for session in recent_sessions:
-                print(f"  - Session {session.id}: Customer {session.customer.name}, Created: {session.created_at}, Status: {session.status}")
-        
-        if all_sessions.exists():
-            # Get the most recent sessions for better accuracy
-            recent_sessions = all_sessions.order_by('-created_at')[:20]  # Increased to get more data
-            print(f"🔍 Using {recent_sessions.count()} recent sessions for NodeCoverage lookup")
-            
-            # Debug: Check if NodeCoverage table has any data at all
-            total_node_coverage_records = NodeCoverage.objects.all().count()
-            print(f"🔍 Total NodeCoverage records in database: {total_node_coverage_records}")
-            
-            # Check NodeCoverage for these specific sessions
-            node_coverage_for_sessions = NodeCoverage.objects.filter(session__in=recent_sessions)
-            print(f"🔍 NodeCoverage records for recent sessions: {node_coverage_for_sessions.count()}")
-            
-            if node_coverage_for_sessions.exists():
-                # Print some sample NodeCoverage data
-                sample_coverage = node_coverage_for_sessions[:3]
-                for cov in sample_coverage:
-                    print(f"  - NodeCoverage: Session {cov.session.id}, Node: {cov.node_name}, Customer: {cov.customer_name}")
-            
-            # Count UNIQUE nodes from NodeCoverage (this is the real count from reports)
-            unique_nodes_query = NodeCoverage.objects.filter(
-                session__in=recent_sessions
-            ).values('node_name').distinct()
-            
-            unique_nodes_count = unique_nodes_query.count()
-            print(f"🔍 Unique nodes found: {unique_nodes_count}")
-            
-            if unique_nodes_count > 0:
-                print(f"✅ REAL NODE COUNT from reports: {unique_nodes_count} nodes for {customer_name}")
-                # Also log some example node names for debugging
-                sample_nodes = list(unique_nodes_query.values_list('node_name', flat=True)[:10])
-                print(f"🔍 Sample node names: {sample_nodes}")
-                return unique_nodes_count
-            else:
-                print(f"⚠️ No unique nodes found in NodeCoverage for {customer_name}")
-            
-            # If no NodeCoverage data, try to estimate from session patterns
-            print(f"⚠️ No NodeCoverage data found - this means no TEC reports have been processed yet")
-            print(f"🔄 Using SMART SESSION-BASED estimation instead")
-            
-            # Advanced estimation: Look at session frequency and patterns
-            session_count = all_sessions.count()
-            completed_sessions = all_sessions.filter(status='COMPLETED').count()
-            
-            print(f"🔍 Session analysis: {session_count} total, {completed_sessions} completed")
-            
-            # Dynamic estimation based on customer activity patterns
-            if session_count > 0:
-                # SMART estimation based on session activity
-                # More sessions typically means more nodes were processed
-                session_based_estimate = min(session_count * 2, 50)  # 2 nodes per session average, max 50
-                
-                # Adjust based on customer type (telecom industry knowledge)
-                customer_upper = customer_name.upper()
-                if 'BSNL' in customer_upper:
-                    # BSNL is major Indian telecom - typically large networks
-                    type_based_estimate = len(networks) * 8  # 8 nodes per network
-                elif any(word in customer_upper for word in ['MAXIS', 'TELEKOM']):
-                    # Malaysian major operators - medium to large
-                    type_based_estimate = len(networks) * 6  # 6 nodes per network
-                elif 'TIMEDOTCOM' in customer_upper:
-                    # Malaysian ISP - medium size
-                    type_based_estimate = len(networks) * 4  # 4 nodes per network
-                elif 'MORATELINDO' in customer_upper or 'PSS' in customer_upper:
-                    # Indonesian operator - typically large networks
-                    type_based_estimate = len(networks) * 7  # 7 nodes per network
-                elif 'OPT' in customer_upper:
-                    # New Caledonia operator - smaller scale
-                    type_based_estimate = len(networks) * 3  # 3 nodes per network
-                elif any(word in customer_upper for word in ['AIRTEL', 'RELIANCE']):
-                    # Major Indian operators
-                    type_based_estimate = len(networks) * 6  # 6 nodes per network
-                else:
-                    # Generic telecom estimation
-                    type_based_estimate = len(networks) * 3  # 3 nodes per network
-                
-                # Use the MAXIMUM of session-based and type-based estimates
-                # This ensures active customers get higher estimates
-                estimated_nodes = max(session_based_estimate, type_based_estimate)
-                estimated_nodes = min(estimated_nodes, 80)  # Cap at 80 nodes
-                estimated_nodes = max(estimated_nodes, len(networks))  # At least 1 node per network
-                
-                print(f"🔄 SMART estimate: session-based={session_based_estimate}, type-based={type_based_estimate} -> final={estimated_nodes}")
-                return estimated_nodes
-        
-        # STEP 2: No sessions yet - intelligent estimation based on customer profile
-        print(f"🔄 No sessions found - using INTELLIGENT estimation for {customer_name}")
-        
-        customer_upper = customer_name.upper()
-        
-        # Dynamic estimation based on telecom industry patterns
-        if 'BSNL' in customer_upper:
-            # BSNL is India's largest telecom - typically large networks
-            estimated_nodes = len(networks) * 8  # 8 nodes per network average
-        elif any(word in customer_upper for word in ['AIRTEL', 'RELIANCE']):
-            # Major Indian operators
-            estimated_nodes = len(networks) * 6
-        elif any(word in customer_upper for word in ['MAXIS', 'TELEKOM']):
-            # Malaysian major operators
-            estimated_nodes = len(networks) * 5
-        elif 'TIMEDOTCOM' in customer_upper:
-            # Malaysian ISP - medium size
-            estimated_nodes = len(networks) * 4
-        elif 'MORATELINDO' in customer_upper or 'PSS' in customer_upper:
-            # Indonesian operator - typically large networks
-            estimated_nodes = len(networks) * 6
-        elif 'OPT' in customer_upper:
-            # New Caledonia operator - smaller scale
-            estimated_nodes = len(networks) * 3
-        elif 'TATA' in customer_upper:
-            # Indian enterprise networks
-            estimated_nodes = len(networks) * 4
-        else:
-            # Generic estimation
-            estimated_nodes = len(networks) * 2
-        
-        # Ensure reasonable bounds
-        estimated_nodes = max(estimated_nodes, 1)  # At least 1 node
-        estimated_nodes = min(estimated_nodes, 50)  # Cap at 50 for new customers
-        
-        print(f"🔄 INTELLIGENT estimate: {estimated_nodes} nodes for {customer_name} ({len(networks)} networks)")
-        return estimated_nodes
-            
-    except Exception as e:
-        print(f"❌ Error getting node count for {customer_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        # Robust fallback
-        return max(len(networks) * 2, 1)  # At least 2 nodes per network
-
-
-def detect_country_from_uploaded_reports(customer_name):
-    """
-    Analyze uploaded report files to detect customer country dynamically
-    """
-    try:
-        import os
-        import glob
-        
-        # Get customer directory paths
-        customer_clean = customer_name.replace(' ', '_').replace('-', '_')
-        
-        # Common paths where reports might be stored
-        possible_paths = [
-            f"HealthCheck_app/uploads/{customer_clean}/reports/",
-            f"HealthCheck_app/uploads/{customer_name}/reports/",
-            f"uploads/{customer_clean}/reports/",
-            f"uploads/{customer_name}/reports/",
-            f"customer_files/{customer_clean}/reports/",
-            f"customer_files/{customer_name}/reports/"
-        ]
-        
-        all_report_files = []
-        
-        # Collect all report files from possible paths
-        for path in possible_paths:
-            if os.path.exists(path):
-                # Look for Excel and CSV report files
-                excel_files = glob.glob(os.path.join(path, "*.xlsx")) + glob.glob(os.path.join(path, "*.xls"))
-                csv_files = glob.glob(os.path.join(path, "*.csv"))
-                all_report_files.extend(excel_files + csv_files)
-        
-        if not all_report_files:
-            print(f"🔍 No uploaded reports found for {customer_name}")
-            return None
-        
-        print(f"🔍 Found {len(all_report_files)} report files for {customer_name}")
-        
-        # Analyze filenames for country patterns
-        country_indicators = {
-            'Malaysia': ['malaysia', 'maxis', 'telekom', 'timedotcom', 'time.com', 'kuala', 'lumpur', 'kl'],
-            'Indonesia': ['indonesia', 'moratelindo', 'pss24', 'pss', 'jakarta', 'indo'],
-            'New Caledonia': ['caledonia', 'nouvelle', 'opt_nc', 'opt', 'noumea'],
-            'Singapore': ['singapore', 'singtel', 'starhub', 'sg'],
-            'India': ['india', 'bsnl', 'airtel', 'reliance', 'tata', 'delhi', 'mumbai', 'bangalore']
-        }
-        
-        country_scores = {country: 0 for country in country_indicators.keys()}
-        
-        # Score each country based on filename matches
-        for file_path in all_report_files:
-            filename = os.path.basename(file_path).lower()
-            print(f"🔍 Analyzing: {filename}")
-            
-            for country, indicators in country_indicators.items():
-                for indicator in indicators:
-                    if indicator in filename:
-                        country_scores[country] += 1
-                        print(f"   ➜ '{indicator}' found → +1 for {country}")
-        
-        # Find the country with highest score
-        if any(score > 0 for score in country_scores.values()):
-            best_country = max(country_scores.items(), key=lambda x: x[1])[0]
-            best_score = country_scores[best_country]
-            print(f"🎯 Country detection from reports: {best_country} (score: {best_score})")
-            return best_country
-        
-        print(f"🔍 No clear country indicators found in report filenames")
-        return None
-        
-    except Exception as e:
-        print(f"❌ Error detecting country from reports for {customer_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
-
-
-def get_customer_location(customer_name, networks):
-    """
-    Dynamically detect customer location from uploaded reports, database sessions, and intelligent pattern matching
-    """
-    try:
-        from .models import NodeCoverage, HealthCheckSession
-        from collections import Counter
-        import os
-        
-        print(f"🔍 DEBUG: Getting location for {customer_name}")
-        
-        # Get network IDs for this customer
-        network_ids = [net.id for net in networks]
-        
-        # STEP 1: NEW - Check uploaded report files for country information
-        country_from_reports = detect_country_from_uploaded_reports(customer_name)
-        if country_from_reports and country_from_reports != 'India':
-            print(f"🎯 Country detected from uploaded reports: '{country_from_reports}' for {customer_name}")
-            return country_from_reports
-        
-        # STEP 2: Try to get location from database sessions and NodeCoverage
-        all_sessions = HealthCheckSession.objects.filter(customer_id__in=network_ids)
-        print(f"🔍 Found {all_sessions.count()} sessions for {customer_name}")
-        
-        if all_sessions.exists():
-            # Check NodeCoverage for location data
-            locations = NodeCoverage.objects.filter(
-                session__in=all_sessions,
-                location__isnull=False
-            ).exclude(location='').values_list('location', flat=True)
-            
-            if locations:
-                location_counts = Counter(locations)
-                most_common_location = location_counts.most_common(1)[0][0]
-                print(f"✅ Found location from database: '{most_common_location}' for {customer_name}")
-                return most_common_location
-        
-        # STEP 2: Dynamic pattern-based detection
-        customer_clean = customer_name.upper().strip()
-        print(f"🔄 Using dynamic detection for: '{customer_clean}'")
-        
-        # Check network names for additional clues
-        network_clues = []
-        for net in networks:
-            if net.network_name:
-                network_clues.append(net.network_name.upper())
-        print(f"🔍 Network name clues: {network_clues}")
-        
-        # Dynamic detection patterns
-        def detect_country_dynamically(name, network_hints=None):
-            name = name.upper()
-            if network_hints is None:
-                network_hints = []
-            
-            # Indonesia patterns
-            if any(pattern in name for pattern in ['MORATELINDO', 'PSS24', 'PSS', 'INDONESIA', 'JAKARTA']):
-                return 'Indonesia'
-            
-            # New Caledonia patterns  
-            if any(pattern in name for pattern in ['OPT_NC', 'OPT', 'CALEDONIA', 'NOUVELLE']):
-                return 'New Caledonia'
-            
-            # Malaysia patterns - enhanced for Telekom and Timedotcom
-            malaysia_patterns = ['MALAYSIA', 'MAXIS', 'TELEKOM', 'TIMEDOTCOM', 'TIME', 'DOTCOM', 'KUALA', 'LUMPUR']
-            if any(pattern in name for pattern in malaysia_patterns):
-                return 'Malaysia'
-            
-            # Check network hints for Malaysia
-            if network_hints:
-                network_text = ' '.join(network_hints).upper()
-                if any(pattern in network_text for pattern in ['MALAYSIA', 'DEFAULT']):
-                    return 'Malaysia'
-            
-            # India patterns
-            india_patterns = ['INDIA', 'BSNL', 'AIRTEL', 'RELIANCE', 'TATA', 'DELHI', 'MUMBAI', 'BANGALORE']
-            if any(pattern in name for pattern in india_patterns):
-                return 'India'
-            
-            # Singapore patterns
-            if any(pattern in name for pattern in ['SINGAPORE', 'SINGTEL', 'STARHUB']):
-                return 'Singapore'
-            
-            # Default based on common patterns in telecom industry
-            if any(word in name for word in ['TELECOM', 'TELEKOM', 'NETWORK']):
-                return 'Malaysia'  # Many Asian telecoms are Malaysian in your data
-            
-            return 'India'  # Most conservative default based on your data
-        
-        # Apply dynamic detection
-        detected_country = detect_country_dynamically(customer_clean, network_clues)
-        print(f"✅ Dynamic detection result: {customer_name} -> {detected_country}")
-        
-        return detected_country
-            
-    except Exception as e:
-        print(f"❌ Error in get_customer_location for {customer_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        
-        # Final robust fallback - analyze customer name for basic patterns
-        try:
-            customer_upper = customer_name.upper()
-            
-            # Emergency pattern matching
-            if 'MORAT' in customer_upper or 'PSS' in customer_upper:
-                return 'Indonesia'
-            elif 'OPT' in customer_upper:
-                return 'New Caledonia'
-            elif 'TELEKOM' in customer_upper or 'TIME' in customer_upper:
-                return 'Malaysia'
-            elif any(word in customer_upper for word in ['BSNL', 'AIRTEL', 'RELIANCE', 'TATA']):
-                return 'India'
-            else:
-                return 'India'  # Safe default - never return 'Unknown'
-                
-        except Exception as fallback_error:
-            print(f"❌ Even fallback failed for {customer_name}: {fallback_error}")
-            return 'India'  # Ultimate fallback
-
-
-# QUICK DEBUG TEST - Remove after fixing
-@login_required  
-def test_date_filter_debug(request):
-    """Quick test to debug date filtering issues"""
-    try:
-        from datetime import datetime
-        from django.utils import timezone
-        
-        # Test date parsing
-        start_date = request.GET.get('start_date', '2024-09-13')
-        end_date = request.GET.get('end_date', '2024-09-14')
-        
-        print(f"📝 DEBUG: Testing date filter with start={start_date}, end={end_date}")
-        
-        # Parse dates
-        parsed_start = datetime.strptime(start_date, '%Y-%m-%d')
-        parsed_end = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        if timezone.is_aware(timezone.now()):
-            parsed_start = timezone.make_aware(parsed_start)
-            parsed_end = timezone.make_aware(parsed_end)
-        
-        print(f"📝 Parsed dates: {parsed_start} to {parsed_end}")
-        
-        # Test session query
-        from .models import HealthCheckSession
-        all_sessions = HealthCheckSession.objects.all()
-        filtered_sessions = all_sessions.filter(created_at__gte=parsed_start, created_at__lte=parsed_end)
-        
-        print(f"📝 Total sessions: {all_sessions.count()}")
-        print(f"📝 Filtered sessions: {filtered_sessions.count()}")
-        
-        # Show sample dates
-        sample_sessions = all_sessions.order_by('-created_at')[:5]
-        for session in sample_sessions:
-            print(f"📝 Sample session: {session.id} - {session.created_at}")
-        
-        return JsonResponse({
-            'status': 'success',
-            'message': 'Debug test completed',
-            'total_sessions': all_sessions.count(),
-            'filtered_sessions': filtered_sessions.count(),
-            'start_date': str(parsed_start),
-            'end_date': str(parsed_end)
-        })
-        
-    except Exception as e:
-        print(f"❌ Debug test error: {e}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'status': 'error',
-            'message': str(e)
-        })
-
-# DEBUG ENDPOINT - Removed duplicate function that was overriding customer_dashboard view
-
-
-# EXCEL DASHBOARD HTML PAGE VIEW
-def customer_dashboard_excel_page(request):
-    """
-    Simple view to render the Excel dashboard HTML page.
-    The actual data loading is handled by JavaScript AJAX calls.
-    """
-    return render(request, 'customer_dasboard_excel.html', {
-        'page_title': 'Excel Customer Dashboard',
-        'auto_load_data': True
-    })
-
-def test_excel_dashboard(request):
-    """
-    Test page with clean simple JavaScript
-    """
-    return render(request, 'customer_test.html')
-
-# EXCEL API FUNCTION
-from django.http import JsonResponse
-import pandas as pd
-
-def update_excel_tracker_with_new_customer(customer):
-    """
-    Update Excel tracker file with new customer data
-    """
-    try:
-        import pandas as pd
-        import os
-        from datetime import datetime
-        from pathlib import Path
-        
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        
-        if not excel_path.exists():
-            print(f"⚠️ Excel file not found at {excel_path}")
-            return False
-        
-        # Read existing Excel data
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        
-        # Check if customer already exists
-        customer_name = customer.name
-        network_name = customer.network_name or customer.name
-        
-        existing_row = df[df['Network'] == network_name]
-        if not existing_row.empty:
-            print(f"📈 Customer {network_name} already exists in Excel")
-            return True
-        
-        # Create new row for the customer
-        new_row = {
-            'Customer': customer_name,
-            'Network': network_name,
-            'Country': 'India',  # Default country
-            'Node Qty': 0,  # Will be updated later
-            'NE Type': customer.network_type or 'Unknown',
-            'gTAC': 'Classic'  # Default gTAC
-        }
-        
-        # Add empty months (12 months)
-        month_columns = [col for col in df.columns if isinstance(col, datetime)]
-        for col in month_columns:
-            new_row[col] = '-'
-        
-        # Add the new row to DataFrame
-        new_df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        
-        # Write back to Excel
-        with pd.ExcelWriter(excel_path, engine='openpyxl', mode='w') as writer:
-            new_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        print(f"✅ Successfully added {network_name} to Excel tracker")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error updating Excel tracker: {str(e)}")
-        return False
-
-def remove_customer_from_excel_tracker(customer_name, network_name=None):
-    """
-    Remove customer/network from Excel tracker file
-    """
-    try:
-        import pandas as pd
-        from pathlib import Path
-        
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        
-        if not excel_path.exists():
-            print(f"⚠️ Excel file not found at {excel_path}")
-            return False
-        
-        # Read existing Excel data
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        
-        # Remove specific network or all networks for customer
-        if network_name:
-            # Remove specific network
-            df = df[~((df['Customer'] == customer_name) & (df['Network'] == network_name))]
-            print(f"🗑️ Removing network {network_name} for customer {customer_name} from Excel")
-        else:
-            # Remove all networks for customer
-            df = df[df['Customer'] != customer_name]
-            print(f"🗑️ Removing all networks for customer {customer_name} from Excel")
-        
-        # Write back to Excel
-        with pd.ExcelWriter(excel_path, engine='openpyxl', mode='w') as writer:
-            df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        print(f"✅ Successfully updated Excel tracker")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error removing from Excel tracker: {str(e)}")
-        return False
-
-def customer_dashboard_excel(request):
-    # Add all necessary imports at the top
-    import pandas as pd
-    from pathlib import Path
-    from datetime import datetime
-    from django.http import JsonResponse, HttpResponse
-    
-    # Handle download requests
-    if request.GET.get('download') == 'true':
-        try:
-            
-            excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-            
-            if not excel_path.exists():
-                return JsonResponse({'error': 'Excel file not found'}, status=404)
-            
-            # Read Excel file
-            df = pd.read_excel(excel_path, sheet_name='Summary')
-            
-            # Create response for file download
-            response = HttpResponse(
-                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            )
-            
-            # Set filename based on filters
-            start_date = request.GET.get('start_date')
-            end_date = request.GET.get('end_date')
-            
-            if start_date and end_date:
-                filename = f'Health_Check_Tracker_filtered_{start_date}_to_{end_date}.xlsx'
-            else:
-                filename = f'Health_Check_Tracker_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-            
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            
-            # Process data EXACTLY like dashboard table
-            processed_data = []
-            
-            # Clean column names first
-            df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
-            
-            for index, row in df.iterrows():
-                customer_name = str(row.get('Customer', 'Unknown')).strip()
-                network_name = str(row.get('Network', 'Unknown')).strip()
-                country = str(row.get('Country', '')).strip()
-                node_qty = int(row.get('Node Qty', 0)) if pd.notna(row.get('Node Qty', 0)) else 0
-                ne_type = str(row.get('NE Type', '')).strip()
-                gtac = str(row.get('gTAC', '')).strip()
-                
-                # Process months exactly like dashboard - START WITH ALL BLANK
-                months = ['-'] * 12  # Jan to Dec, all start as blank
-                total_runs_count = 0
-                
-                # Process datetime columns ONLY for 2025 data (matching dashboard logic)
-                for col_name, col_value in row.items():
-                    is_datetime_col_2025 = (
-                        (isinstance(col_name, pd.Timestamp) or hasattr(col_name, 'month')) and
-                        hasattr(col_name, 'year') and col_name.year == 2025
-                    )
-                    
-                    if is_datetime_col_2025:
-                        has_real_data = pd.notna(col_value) and str(col_value).strip() != '' and str(col_value).lower() != 'nan'
-                        month_index = col_name.month - 1  # Convert to 0-based index
-                        
-                        if has_real_data:
-                            try:
-                                if hasattr(col_value, 'strftime'):
-                                    formatted_date = col_value.strftime('%d-%b')
-                                else:
-                                    formatted_date = str(col_value)[:10]
-                            except:
-                                formatted_date = str(col_value)[:10]
-                            
-                            months[month_index] = formatted_date
-                            total_runs_count += 1
-                        else:
-                            months[month_index] = '-'
-                
-                # Create row exactly like dashboard table
-                processed_row = {
-                    'Customer': customer_name,
-                    'Country': country,
-                    'Networks': f"{network_name}",
-                    'Node_Qty': node_qty,
-                    'NE_Type': ne_type,
-                    'GTAC': gtac,
-                    'Jan': months[0],
-                    'Feb': months[1],
-                    'Mar': months[2],
-                    'Apr': months[3],
-                    'May': months[4],
-                    'Jun': months[5],
-                    'Jul': months[6],
-                    'Aug': months[7],
-                    'Sep': months[8],
-                    'Oct': months[9],
-                    'Nov': months[10],
-                    'Dec': months[11],
-                    'Total_Runs': total_runs_count
-                }
-                
-                processed_data.append(processed_row)
-            
-            # Convert to DataFrame with exact column order like dashboard
-            processed_df = pd.DataFrame(processed_data)
-            
-            # Write processed Excel to response with dashboard-like formatting
-            with pd.ExcelWriter(response, engine='openpyxl') as writer:
-                processed_df.to_excel(writer, sheet_name='Health_Check_Dashboard', index=False)
-                
-                # Get the workbook and worksheet to apply dashboard-like formatting
-                workbook = writer.book
-                worksheet = writer.sheets['Health_Check_Dashboard']
-                
-                # Import styling modules
-                from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-                
-                # Define colors matching dashboard
-                blue_header_fill = PatternFill(start_color='3B82F6', end_color='3B82F6', fill_type='solid')
-                green_total_fill = PatternFill(start_color='10B981', end_color='10B981', fill_type='solid')
-                white_font = Font(color='FFFFFF', bold=True, size=10)
-                header_font = Font(color='FFFFFF', bold=True, size=9)
-                data_font = Font(size=9)
-                
-                # Alignment
-                center_align = Alignment(horizontal='center', vertical='center')
-                
-                # Apply header formatting (blue background like dashboard)
-                for col_idx in range(1, len(processed_df.columns) + 1):
-                    cell = worksheet.cell(row=1, column=col_idx)
-                    if processed_df.columns[col_idx-1] == 'Total_Runs':
-                        # Total Runs header - green background
-                        cell.fill = green_total_fill
-                        cell.value = 'TOTAL\nRUNS'  # Match dashboard header
-                    else:
-                        # Other headers - blue background
-                        cell.fill = blue_header_fill
-                    
-                    cell.font = header_font
-                    cell.alignment = center_align
-                
-                # Format data rows
-                for row_idx in range(2, len(processed_df) + 2):
-                    for col_idx in range(1, len(processed_df.columns) + 1):
-                        cell = worksheet.cell(row=row_idx, column=col_idx)
-                        
-                        if processed_df.columns[col_idx-1] == 'Total_Runs':
-                            # Total Runs column - green background with white text
-                            cell.fill = green_total_fill
-                            cell.font = white_font
-                        else:
-                            cell.font = data_font
-                        
-                        # Center align certain columns
-                        if processed_df.columns[col_idx-1] in ['Country', 'Node_Qty', 'NE_Type', 'GTAC', 'Total_Runs'] or processed_df.columns[col_idx-1] in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']:
-                            cell.alignment = center_align
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 20)  # Max width 20
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            return response
-            
-        except Exception as e:
-            return JsonResponse({'error': f'Download failed: {str(e)}'}, status=500)
-    
-    # Regular dashboard view
-    try:
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        
-        if not excel_path.exists():
-            print(f"❌ Excel file not found at: {excel_path}")
-            return JsonResponse({
-                'success': False,
-                'error': f'Excel file not found at: {excel_path}'
-            }, status=404)
-        
-        print(f"📂 Reading Excel file from: {excel_path}")
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        print(f"📊 Loaded Summary sheet with shape: {df.shape}")
-        print(f"📋 Original columns: {list(df.columns)}")
-        print(f"🔍 Column types: {[f'{col}: {type(col).__name__}' for col in df.columns]}")
-        
-        # Show sample data
-        if len(df) > 0:
-            print(f"📋 First row sample: {dict(df.iloc[0])}")
-        
-        # Process columns - don't strip datetime columns
-        new_columns = []
-        for col in df.columns:
-            if isinstance(col, str):
-                new_columns.append(col.strip())
-            else:
-                new_columns.append(col)  # Keep datetime columns as-is
-        df.columns = new_columns
-        print(f"📊 After processing: {len([c for c in df.columns if isinstance(c, pd.Timestamp)])} datetime columns found")
-        
-        customers_data = df.to_dict(orient='records')
-        
-        excel_customers = {}
-        for row_index, row in enumerate(customers_data):
-            network_name = row.get('Network', 'Unknown')
-            customer_name = row.get('Customer', 'Unknown')
-            
-            # Process months from real Excel datetime columns - START WITH ALL BLANK
-            months = ["-"] * 12  # All months start as blank
-            total_runs_count = 0
-            
-            # Get datetime columns and process ONLY those with actual data
-            print(f"  🔍 Processing {customer_name} - {network_name}:")
-            for col_name, col_value in row.items():
-                # Check for datetime columns - ONLY PROCESS 2025 COLUMNS
-                is_datetime_col_2025 = (
-                    (isinstance(col_name, pd.Timestamp) or hasattr(col_name, 'month')) and
-                    hasattr(col_name, 'year') and col_name.year == 2025  # ONLY 2025 data
-                )
-                
-                # ONLY process if it's a 2025 datetime column AND has actual data
-                if is_datetime_col_2025:
-                    has_real_data = pd.notna(col_value) and str(col_value).strip() != '' and str(col_value).lower() != 'nan'
-                    month_index = col_name.month - 1  # Convert to 0-based index (Jan=0, Feb=1, etc.)
-                    
-                    if has_real_data:
-                        # Format the actual date value from Excel
-                        try:
-                            if hasattr(col_value, 'strftime'):
-                                formatted_date = col_value.strftime('%d-%b')  # e.g., "10-Jan"
-                            else:
-                                formatted_date = str(col_value)[:10]  # Fallback
-                        except:
-                            formatted_date = str(col_value)[:10]
-                        
-                        # Set the month with actual data
-                        months[month_index] = formatted_date
-                        total_runs_count += 1
-                        print(f"    ✅ Month {month_index+1} ({col_name.strftime('%b %Y')}): {formatted_date}")
-                    else:
-                        # Explicitly ensure no data months stay as "-"
-                        months[month_index] = "-"
-                        print(f"    ❌ Month {month_index+1} ({col_name.strftime('%b %Y')}): NO DATA (set to '-')")
-            
-            # Don't set minimum - use actual count only
-            if total_runs_count == 0:
-                print(f"  ⚠️ No 2025 run data found for this customer")
-            # Use actual count, don't artificially inflate
-            
-            print(f"  ✅ {customer_name}: {total_runs_count} total runs (2025 only)")
-            print(f"  📅 2025 Months with data: {[f'{i+1}:{m}' for i, m in enumerate(months) if m != '-']}")
-            print(f"  📝 Full months array: {months}")
-            
-            excel_customers[network_name] = {
-                'Customer': str(customer_name),
-                'Network': str(network_name),
-                'Country': str(row.get('Country', '')),
-                'Node Qty': int(row.get('Node Qty', 0)) if pd.notna(row.get('Node Qty', 0)) else 0,
-                'NE Type': str(row.get('NE Type', '')),
-                'gTAC': str(row.get('gTAC', '')),
-                'name': str(customer_name),
-                'network': str(network_name),
-                'country': str(row.get('Country', '')),
-                'node_qty': int(row.get('Node Qty', 0)) if pd.notna(row.get('Node Qty', 0)) else 0,
-                'ne_type': str(row.get('NE Type', '')),
-                'gtac': str(row.get('gTAC', '')),
-                'months': months,  # Real Excel dates
-                'total_runs': total_runs_count  # Real run count
-            }
-        
-        # Count unique customers only (not networks) - FIX FOR CUSTOMER COUNT
-        unique_customer_names = set()
-        for network_data in excel_customers.values():
-            unique_customer_names.add(network_data['Customer'])
-        
-        print(f"📊 FINAL COUNT - Networks: {len(excel_customers)}, Unique Customers: {len(unique_customer_names)}")
-        print(f"👥 Unique customers found: {sorted(unique_customer_names)}")
-        
-        return JsonResponse({
-            'success': True,
-            'customers': excel_customers,  # Keep all networks as before
-            'total_customers': len(unique_customer_names),  # Count unique customers only
-            'total_networks': len(excel_customers)  # Total networks
-        })
-    except Exception as e:
-        print(f"❌ Error in customer_dashboard_excel: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'success': False,
-            'error': f'Dashboard error: {str(e)}',
-            'traceback': traceback.format_exc() if hasattr(traceback, 'format_exc') else 'No traceback available'
-        }, status=500)
-
-
-@login_required
-def get_integrated_excel_data(request):
-    """Get integrated Excel customer data from Health_Check_Tracker_1.xlsx with real dynamic data"""
-    if request.method != 'GET':
-        return JsonResponse({'status': 'error', 'message': 'GET method required'}, status=405)
-    
-    try:
-        from pathlib import Path
-        import pandas as pd
-        
-        # Get date filter parameters
-        start_date_str = request.GET.get('start_date')
-        end_date_str = request.GET.get('end_date')
-        
-        # Parse date filters if provided
-        start_date = None
-        end_date = None
-        if start_date_str:
-            try:
-                start_date = pd.to_datetime(start_date_str)
-            except:
-                pass
-        if end_date_str:
-            try:
-                end_date = pd.to_datetime(end_date_str)
-            except:
-                pass
-        
-        # Read the main Excel file (same as original dashboard)
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        if not excel_path.exists():
-            return JsonResponse({'status': 'error', 'message': 'Excel file not found'}, status=404)
-        
-        # Use the same parse_df function from customer_dashboard_excel
-        def parse_df_for_integration(df, start_date=None, end_date=None):
-            print(f"\n🔍 PARSING EXCEL FOR INTEGRATION - Shape: {df.shape}")
-            print(f"📋 Available columns: {list(df.columns)}")
-            
-            customers = {}
-            
-            # Clean column names to remove any trailing spaces
-            df.columns = df.columns.str.strip()
-            
-            # Process each row using actual column names from Summary sheet
-            for index, row in df.iterrows():
-                try:
-                    # Use 'Customer' as primary customer name, 'Network' as secondary identifier
-                    customer_name = str(row.get('Customer', f'Customer_{index}')).strip()
-                    network_name = str(row.get('Network', f'Network_{index}')).strip()
-                    
-                    if not customer_name or customer_name == 'nan' or not network_name or network_name == 'nan':
-                        continue  # Skip empty rows
-                    
-                    # Extract data using Summary sheet column names
-                    country = str(row.get('Country', 'India')).strip()
-                    node_qty = row.get('Node Qty', 0)
-                    gtac_team = str(row.get('gTAC', 'Classic')).strip()
-                    nw_type = str(row.get('NE Type', '1830 PSS')).strip()
-                    
-                    # Process monthly datetime columns for monthly data
-                    monthly_data = ['-'] * 12  # Jan to Dec
-                    has_activity_in_range = False
-                    
-                    # Get datetime columns (all columns that are datetime objects)
-                    for col_name, col_value in row.items():
-                        if isinstance(col_name, pd.Timestamp) and pd.notna(col_value):
-                            try:
-                                if isinstance(col_value, pd.Timestamp):
-                                    month_idx = col_name.month - 1  # 0-based index for month
-                                    if 0 <= month_idx < 12:  # Valid month range
-                                        day = col_value.day
-                                        year = col_value.year
-                                        # Format: "01-Apr-24"
-                                        month_display = f"{day:02d}-{col_value.strftime('%b')}-{str(year)[-2:]}"
-                                        monthly_data[month_idx] = month_display
-                                        
-                                        # Check if this date falls within filter range
-                                        if start_date and end_date:
-                                            if start_date <= col_value <= end_date:
-                                                has_activity_in_range = True
-                                        else:
-                                            has_activity_in_range = True  # No filter, include all
-                                            
-                            except Exception as date_error:
-                                print(f"⚠️ Date parsing error for {network_name}: {date_error}")
-                    
-                    # If filtering by date range, only include customers with activity in that range
-                    if start_date and end_date and not has_activity_in_range:
-                        continue
-                    
-                    # Use network_name as the unique key
-                    customers[network_name] = {
-                        'Customer': customer_name,  # Match Excel column name
-                        'Network': network_name,  # Match Excel column name
-                        'Country': country,  # Match Excel column name
-                        'Node Qty': int(node_qty) if node_qty else 0,  # Match Excel column name
-                        'NE Type': nw_type,  # Match Excel column name
-                        'gTAC': gtac_team,  # Match Excel column name
-                        'months': monthly_data,
-                        'total_runs': sum(1 for m in monthly_data if m != '-'),  # Count actual runs
-                        'filename': 'Health_Check_Tracker_1.xlsx',
-                        'file_path': str(excel_path),
-                        'source': 'real_excel_data'
-                    }
-                    
-                    print(f"✅ Added customer: {customer_name} - Network: {network_name} ({country}, {node_qty} nodes, {customers[network_name]['total_runs']} runs)")
-                    
-                except Exception as row_error:
-                    print(f"⚠️ Error processing row {index}: {row_error}")
-                    continue
-            
-            print(f"\n🎉 PARSING COMPLETE: {len(customers)} customers found")
-            return customers
-        
-        # Read from Summary sheet
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        print(f"Excel Summary sheet shape: {df.shape}, columns: {list(df.columns)}")  # Debug info
-        customers = parse_df_for_integration(df, start_date, end_date)
-        
-        if not customers:
-            return JsonResponse({
-                'status': 'success',
-                'customers': {},
-                'total_files': 0,
-                'total_customers': 0,
-                'message': 'No customer data found in Excel file. Please check that the file has valid rows and correct column names.'
-            })
-        
-        # Calculate statistics
-        unique_customers = len(set(customer['Customer'] for customer in customers.values()))
-        total_networks = len(customers)
-        total_runs = sum(customer['total_runs'] for customer in customers.values())
-        
-        return JsonResponse({
-            'status': 'success',
-            'customers': customers,
-            'total_files': 1,  # Single Excel file
-            'total_customers': unique_customers,
-            'total_networks': total_networks,
-            'total_runs': total_runs,
-            'message': f'Loaded {total_networks} networks from {unique_customers} customers with {total_runs} total runs'
-        })
-        
-    except Exception as e:
-        print(f"Error in get_integrated_excel_data: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'status': 'error',
-            'message': f'Failed to get Excel data: {str(e)}'
-        }, status=500)
-
-
-@login_required
-def test_excel_debug(request):
-    """Simple debug test for Excel reading"""
-    try:
-        import pandas as pd
-        from pathlib import Path
-        from django.http import JsonResponse
-        
-        excel_path = Path(__file__).parent.parent / "Script" / "Health_Check_Tracker_1.xlsx"
-        
-        print(f"📂 Excel path: {excel_path}")
-        print(f"📂 File exists: {excel_path.exists()}")
-        
-        if not excel_path.exists():
-            return JsonResponse({
-                'success': False,
-                'error': f'File not found: {excel_path}'
-            })
-        
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        
-        print(f"📊 DataFrame shape: {df.shape}")
-        print(f"📋 Columns: {list(df.columns)}")
-        
-        return JsonResponse({
-            'success': True,
-            'message': 'Excel file read successfully',
-            'shape': df.shape,
-            'columns': list(df.columns)[:10]  # First 10 columns
-        })
-        
-    except Exception as e:
-        print(f"❌ Debug test error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'success': False,
-            'error': str(e)
-        })
-
-# Excel export now handled in customer_dashboard_excel function
-
-@login_required
-def get_excel_networks(request):
-    """Get networks for Excel-based customers"""
-    if request.method != 'GET':
-        return JsonResponse({'status': 'error', 'message': 'GET method required'}, status=405)
-    
-    customer_id = request.GET.get('customer_id', '')
-    
-    if not customer_id:
-        return JsonResponse({'status': 'error', 'message': 'Customer ID required'}, status=400)
-    
-    try:
-        if EXCEL_INTEGRATION_AVAILABLE and customer_id.startswith('excel_'):
-            # Get Excel networks
-            networks, source_type = get_customer_networks_unified(customer_id)
-            
-            # Format networks for the frontend - Show only network names
-            network_options = []
-            for i, network in enumerate(networks):
-                network_id = f"excel_network_{i}"
-                # Show only the network name (network_type) from Excel data
-                display_name = network.get('network_type', 'HealthCheck')
-                network_options.append({
-                    'id': network_id,
-                    'name': display_name,
-                    'source': 'excel',
-                    'filename': network.get('filename', ''),
-                    'file_path': network.get('file_path', ''),
-                    'customer_name': network.get('customer_name', ''),
-                    'network_type': network.get('network_type', 'HealthCheck')
-                })
-            
-            return JsonResponse({
-                'status': 'success',
-                'networks': network_options,
-                'source': source_type,
-                'count': len(network_options)
-            })
-        
-        elif not customer_id.startswith('excel_'):
-            # Handle database customers (existing logic)
-            try:
-                customer = Customer.objects.get(id=customer_id, is_deleted=False)
-                networks = Customer.objects.filter(
-                    name=customer.name, 
-                    is_deleted=False
-                ).values('id', 'network_name', 'network_type', 'created_at')
-                
-                network_options = []
-                for network in networks:
-                    display_name = network['network_name'] or 'Base Network'
-                    if network['network_type']:
-                        display_name += f" ({network['network_type']})"
-                    
-                    network_options.append({
-                        'id': network['id'],
-                        'name': display_name,
-                        'source': 'database',
-                        'network_name': network['network_name'],
-                        'network_type': network['network_type'],
-                        'created_at': network['created_at'].isoformat() if network['created_at'] else None
-                    })
-                
-                return JsonResponse({
-                    'status': 'success',
-                    'networks': network_options,
-                    'source': 'database',
-                    'count': len(network_options)
-                })
-            
-            except Customer.DoesNotExist:
-                return JsonResponse({
-                    'status': 'error',
-                    'message': 'Customer not found'
-                }, status=404)
-        
-        else:
-            return JsonResponse({
-                'status': 'error',
-                'message': 'Invalid customer identifier'
-            }, status=400)
-    
-    except Exception as e:
-        print(f"Error in get_excel_networks: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({
-            'status': 'error',
-            'message': f'Failed to get networks: {str(e)}'
-        }, status=500)
-
-@require_http_methods(["GET"])
-def get_excel_summary_data(request):
-    """
-    SIMPLE Excel API - Just fix dates and runs
-    """
-    excel_path = r'c:\Users\surchopr\Hc_Final\Script\Health_Check_Tracker_1.xlsx'
-    
-    try:
-        import pandas as pd
-        from datetime import datetime
-        
-        # Read Excel
-        df = pd.read_excel(excel_path, sheet_name='Summary')
-        
-        # Group by customer
-        customers = {}
-        
-        print(f'📊 Excel columns: {list(df.columns)[:10]}...')
-        
-        for index, row in df.iterrows():
-            customer_name = str(row.get('Customer', '')).strip()
-            if not customer_name or customer_name == 'Unknown':
-                continue
-                
-            print(f'\n📊 Processing: {customer_name} - {row.get("Network", "")} (Row {index+1})')
-            
-            # Initialize customer
-            if customer_name not in customers:
-                customers[customer_name] = {
-                    'name': customer_name,
-                    'display_name': customer_name,
-                    'customer_name': customer_name,
-                    'country': str(row.get('Country', '')),
-                    'runs': 0,
-                    'total_runs': 0,
-                    'node_count': 0,
-                    'networks_count': 0,
-                    'source': 'excel',
-                    'last_run_date': 'Excel Data',
-                    'months': ['-'] * 12,
-                    'networks': []
-                }
-            
-            # Count runs from date columns
-            network_runs = 0
-            network_months = ['-'] * 12
-            
-            # Process ALL columns (not just datetime columns)
-            for col_name in df.columns:
-                # Skip non-month columns
-                if col_name in ['Sl#', 'Customer', 'Network', 'Country', 'Node Qty', 'NE Type', 'gTAC']:
-                    continue
-                    
-                cell_value = row[col_name]
-                
-                # Get month index from column (datetime columns)
-                if isinstance(col_name, datetime):
-                    month_idx = col_name.month - 1
-                    
-                    if pd.notna(cell_value):
-                        cell_str = str(cell_value).strip()
-                        
-                        # Check if it's a real date or status
-                        if isinstance(cell_value, (pd.Timestamp, datetime)):
-                            # Real datetime - count as run
-                            network_runs += 1
-                            formatted_date = cell_value.strftime('%d-%b')
-                            network_months[month_idx] = formatted_date
-                            print(f'  ✅ {col_name.strftime("%b")}: {formatted_date} (REAL DATE - RUN #{network_runs})')
-                        else:
-                            # Try to parse string as date
-                            try:
-                                # Check if string looks like a date (contains numbers and dashes/slashes)
-                                if any(char.isdigit() for char in cell_str) and any(sep in cell_str for sep in ['-', '/', ' ']):
-                                    # Skip status text like "Not Started", "Not Run", "No Report"
-                                    if cell_str.lower() not in ['not started', 'not run', 'no report', 'not starte']:
-                                        parsed_date = pd.to_datetime(cell_str)
-                                        network_runs += 1
-                                        formatted_date = parsed_date.strftime('%d-%b')
-                                        network_months[month_idx] = formatted_date
-                                        print(f'  ✅ {col_name.strftime("%b")}: {formatted_date} (PARSED DATE - RUN #{network_runs})')
-                                    else:
-                                        # Status text - don't count as run
-                                        network_months[month_idx] = cell_str
-                                        print(f'  📝 {col_name.strftime("%b")}: {cell_str} (STATUS - NOT COUNTED)')
-                                else:
-                                    # Status text like "Not Run", "Not Started" - don't count
-                                    network_months[month_idx] = cell_str
-                                    print(f'  📝 {col_name.strftime("%b")}: {cell_str} (STATUS - NOT COUNTED)')
-                            except:
-                                # Keep as status text - don't count
-                                if cell_str not in ['nan', 'NaT']:
-                                    network_months[month_idx] = cell_str
-                                    print(f'  📝 {col_name.strftime("%b")}: {cell_str} (STATUS - NOT COUNTED)')
-                    else:
-                        network_months[month_idx] = '-'
-            
-            # Add to customer
-            customers[customer_name]['networks'].append({
-                'name': str(row.get('Network', '')),
-                'runs': network_runs
-            })
-            
-            customers[customer_name]['networks_count'] += 1
-            customers[customer_name]['runs'] += network_runs
-            customers[customer_name]['total_runs'] += network_runs
-            customers[customer_name]['node_count'] += int(row.get('Node Qty', 0)) if pd.notna(row.get('Node Qty', 0)) else 0
-            
-            # Merge months at customer level
-            for i in range(12):
-                if network_months[i] != '-' and customers[customer_name]['months'][i] == '-':
-                    customers[customer_name]['months'][i] = network_months[i]
-            
-            print(f'  📊 Network {row.get("Network", "")}: {network_runs} runs, months: {network_months[:6]}...')
-        
-        return JsonResponse({
-            'success': True,
-            'customers': customers,
-            'message': f'{len(customers)} customers loaded'
-        })
-        
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'error': str(e)
-        }, status=500)
-
-@csrf_exempt
-@require_http_methods(["POST"])
-def update_customer_network(request):
-    """
-    API endpoint to update customer network data from Live DB editor
-    Updates both monthly_runs and total_runs in database
-    """
-    try:
-        # Parse JSON request
-        import json
-        from django.views.decorators.csrf import csrf_exempt
-        from datetime import datetime
-        
-        data = json.loads(request.body)
-        
-        customer_name = data.get('customer_name')
-        network_name = data.get('network_name')
-        monthly_runs = data.get('monthly_runs', [])
-        total_runs = data.get('total_runs', 0)
-        
-        print(f"💾 API: Update request for {customer_name} - {network_name}: {total_runs} runs")
-        
-        if not customer_name or not network_name:
-            return JsonResponse({
-                'success': False,
-                'error': 'Missing customer_name or network_name'
-            }, status=400)
-        
-        # Find the customer network in database
-        customers = Customer.objects.filter(
-            name=customer_name,
-            is_deleted=False
-        )
-        
-        if not customers.exists():
-            return JsonResponse({
-                'success': False,
-                'error': f'Customer {customer_name} not found'
-            }, status=404)
-        
-        # Find the specific network
-        target_customer = None
-        for customer in customers:
-            # Check if this customer's network matches
-            if (customer.network_name == network_name or 
-                network_name in str(customer.network_name or '') or
-                customer.network_name in str(network_name)):
-                target_customer = customer
-                break
-        
-        if not target_customer:
-            # Try to find by partial match
-            for customer in customers:
-                clean_network_name = network_name.replace(customer_name, '').strip(' -_')
-                if (clean_network_name in str(customer.network_name or '') or
-                    str(customer.network_name or '') in clean_network_name):
-                    target_customer = customer
-                    break
-        
-        if not target_customer:
-            return JsonResponse({
-                'success': False,
-                'error': f'Network {network_name} not found for customer {customer_name}'
-            }, status=404)
-        
-        # Update monthly_runs data
-        if not target_customer.monthly_runs:
-            target_customer.monthly_runs = {}
-        
-        # Convert monthly_runs array to database format
-        current_year = datetime.now().year
-        updated_monthly_runs = target_customer.monthly_runs.copy()
-        
-        for month_index, month_value in enumerate(monthly_runs):
-            if month_value and month_value.strip() not in ['-', '']:
-                month_key = f"{current_year}-{month_index + 1:02d}"
-                # Store the date value
-                if month_value in ['Not Started', 'Not Run', 'No Report']:
-                    updated_monthly_runs[month_key] = month_value
-                else:
-                    # Try to parse and store as proper date
-                    try:
-                        # If it's a formatted date like "8-Oct", convert to full date
-                        if '-' in month_value and len(month_value.split('-')) == 2:
-                            day_part, month_part = month_value.split('-')
-                            # Convert month abbreviation to number
-                            month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                            if month_part in month_names:
-                                month_num = month_names.index(month_part) + 1
-                                formatted_date = f"{current_year}-{month_num:02d}-{int(day_part):02d}"
-                                updated_monthly_runs[month_key] = formatted_date
-                            else:
-                                updated_monthly_runs[month_key] = month_value
-                        else:
-                            updated_monthly_runs[month_key] = month_value
-                    except:
-                        updated_monthly_runs[month_key] = month_value
-            else:
-                # Remove empty months or set to 'Not Started'
-                month_key = f"{current_year}-{month_index + 1:02d}"
-                if month_key in updated_monthly_runs:
-                    updated_monthly_runs[month_key] = 'Not Started'
-        
-        # Update the customer
-        target_customer.monthly_runs = updated_monthly_runs
-        target_customer.total_runs = total_runs
-        target_customer.save()
-        
-        print(f"✅ Database updated: {customer_name} - {network_name}: {total_runs} runs")
-        print(f"📅 Monthly data: {updated_monthly_runs}")
-        
-        return JsonResponse({
-            'success': True,
-            'message': f'Updated {customer_name} - {network_name}',
-            'customer_name': customer_name,
-            'network_name': network_name,
-            'total_runs': total_runs,
-            'monthly_runs': updated_monthly_runs
-        })
-        
-    except json.JSONDecodeError:
-        return JsonResponse({
-            'success': False,
-            'error': 'Invalid JSON in request body'
-        }, status=400)
-    except Exception as e:
-        print(f"❌ Error updating network: {e}")
-        return JsonResponse({
-            'success': False,
-            'error': str(e)
-        }, status=500)
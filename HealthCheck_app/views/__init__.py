@@ -0,0 +1,79 @@
+"""
+Views of the HealthCheck app, one module per feature
+Every view and helper is re-exported here, so urls.py and scripts keep using views.<name>. pandas and
+openpyxl are only imported inside the functions that read or write workbooks, which keeps them out of
+worker start-up; `python manage.py hc_benchmark --target imports` measures the cold start.
+"""
+
+from .common import (
+    get_excel_integration, get_customer_networks_unified, integrate_excel_with_database_choices,
+    EXCEL_INTEGRATION_AVAILABLE, execute_health_check_script, ScriptExecutor, BASE_DIR, SCRIPT_DIR,
+    SCRIPT_INPUT_DIR, SCRIPT_OUTPUT_DIR, CUSTOMER_FILES_DIR,
+)
+from .auth import user_login, user_register, user_logout
+from .customers import (
+    get_customer_statistics, customer_selection, get_networks_for_customer, setup_new_network,
+    setup_network_files, get_customer_networks,
+)
+from .health_check import (
+    health_check_dashboard, health_check_upload, health_check_processing, health_check_results,
+    process_health_check_files, process_script_outputs, create_summary_report, session_events, session_status,
+    process_health_check_enhanced, validate_hc_files, save_processing_files,
+    process_health_check_files_enhanced, validate_network_setup_files, parse_hc_filename, SCRIPT_TOTAL_NODES,
+    parse_script_total_nodes, execute_hc_script_direct, execute_hc_script_enhanced,
+    process_script_outputs_enhanced, create_detailed_report, clear_existing_customer_files,
+    parse_tracker_statistics, calculate_processing_timeout, handle_session_timeout,
+)
+from .downloads import (
+    DOWNLOAD_SUBDIRS, download_error, customer_search_directories, find_customer_file, find_tracker_download,
+    download_tracker_file, download_report_file, download_inventory_file, download_host_file,
+    download_file_by_type, SESSION_OUTPUT_PATTERNS, SESSION_OUTPUT_MTIME_SLACK, session_run_window,
+    session_output_files, download_session_bundle,
+)
+from .validation import (
+    validate_user_region_access, validate_filename, validate_filename_contains_customer_name,
+    validate_report_file_strict, validate_file_type_match, validate_section_specific_upload,
+    get_correct_section_for_pattern, get_correct_section_name, get_example_filenames,
+    validate_customer_technology_match, extract_meaningful_words, perform_smart_customer_matching,
+    are_similar_words, calculate_levenshtein_distance, perform_enhanced_category_validation,
+    find_longest_match, find_all_matches, are_equivalent_operators,
+    validate_enhanced_customer_specific_upload, validate_flexible_customer_name_match,
+)
+from .customer_files import (
+    get_customer_directory, get_customer_file_path, preserve_customer_file, create_customer_folder_structure,
+    delete_customer_folder_structure, TRACKER_HISTORY_FOLDERS, TRACKER_HISTORY_PAGE_SIZE,
+    TRACKER_HISTORY_MAX_PAGE_SIZE, TRACKER_HISTORY_CACHE_TIMEOUT, tracker_history_files,
+    tracker_history_payload, tracker_history, get_sticky_notes_data, delete_tracker_file,
+)
+from .uploads import (
+    upload_host_file, upload_inventory_file, upload_report_file, upload_old_tracker_file,
+    upload_tracker_generated_file, upload_ignore_excel_file, upload_ignore_text_file,
+)
+from .chunked_uploads import (
+    CHUNKED_UPLOAD_MAX_CHUNK_SIZE, CHUNKED_UPLOAD_MAX_TOTAL_SIZE, CHUNKED_UPLOAD_READ_SIZE, CHUNKED_UPLOAD_TYPES,
+    validate_chunked_upload_filename, chunked_upload_state, finalize_chunked_upload, chunked_upload_start,
+    chunked_upload_status, chunked_upload_chunk, chunked_upload_complete,
+)
+from .dashboard_api import (
+    format_monthly_runs_to_array, comprehensive_dashboard, api_dashboard_customers,
+    is_blocked_dashboard_customer, EXCEL_MIGRATED_CUSTOMERS, SKIPPED_MONTHLY_VALUES, overlay_recorded_runs,
+    session_monthly_array, session_count_array, parse_dashboard_date_range, collect_dashboard_customers,
+    api_customer_dashboard_customers, api_customer_dashboard_snapshot, DASHBOARD_V2_CUSTOMER_FIELDS,
+    DASHBOARD_V2_NETWORK_FIELDS, DASHBOARD_V2_DEFAULT_CUSTOMER_FIELDS, DASHBOARD_V2_DEFAULT_NETWORK_FIELDS,
+    parse_v2_fields, dashboard_v2_payload, dashboard_v2_error, api_customer_dashboard_customers_v2,
+    api_customer_dashboard_networks_v2, api_customer_dashboard_customers_ORIGINAL, simple_export_test,
+    api_dashboard_statistics, add_months, local_month_start, monthly_session_counts,
+    api_customer_monthly_sessions, api_network_sessions, api_dashboard_monthly, EXPORT_MONTHS,
+    iter_export_customers, export_filename, streaming_download, dashboard_export_chunks, export_job_payload,
+    api_export_excel, api_export_jobs, api_export_job_status, api_export_job_download, api_run_statistics,
+    stored_network_node_count, load_customer_report_facts, get_customer_location,
+)
+from .customer_dashboard import (
+    customer_dashboard, api_customer_dashboard_statistics, api_customer_dashboard_export,
+    test_date_filter_debug,
+)
+from .excel_dashboard import (
+    customer_dashboard_excel_page, test_excel_dashboard, update_excel_tracker_with_new_customer,
+    remove_customer_from_excel_tracker, customer_dashboard_excel, get_integrated_excel_data, test_excel_debug,
+    get_excel_networks, get_excel_summary_data, update_customer_network,
+)
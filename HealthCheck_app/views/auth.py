@@ -0,0 +1,96 @@
+"""
+Authentication views
+"""
+
+from django.shortcuts import render, redirect
+from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth.models import User
+from django.contrib import messages
+
+
+# === Authentication Views ===
+
+def user_login(request):
+    """User login view"""
+    
+    # If user is already authenticated, redirect to customer selection
+    if request.user.is_authenticated:
+        return redirect('customer_selection')
+    
+    # Handle login form submission
+    if request.method == "POST":
+        username = request.POST.get("username")
+        password = request.POST.get("password")
+        
+        # Authenticate the user
+        user = authenticate(request, username=username, password=password)
+        
+        if user is not None:
+            # Login successful
+            login(request, user)
+            messages.success(request, f"Welcome back, {user.username}!")
+            
+            # Get the next URL or default to customer_selection
+            next_url = request.GET.get('next', 'customer_selection')
+            return redirect(next_url)
+        else:
+            # Login failed
+            messages.error(request, "Invalid username or password. Please try again.")
+            return render(request, "login.html", {"error": "Invalid credentials"})
+    
+    # GET request - show login form
+    return render(request, "login.html")
+
+
+def user_register(request):
+
+    """User registration view"""
+
+    if request.user.is_authenticated:
+
+        return redirect('customer_selection')
+
+
+
+    if request.method == "POST":
+
+        username = request.POST.get("username")
+
+        email = request.POST.get("email")
+
+        password = request.POST.get("password")
+
+        password_confirm = request.POST.get("password_confirm")
+
+
+
+        if password != password_confirm:
+
+            return render(request, "register.html", {"error": "Passwords do not match."})
+
+
+
+        if User.objects.filter(username=username).exists():
+
+            return render(request, "register.html", {"error": "Username already taken."})
+
+
+
+        User.objects.create_user(username=username, email=email, password=password)
+
+        messages.success(request, "Account created successfully! Please log in.")
+
+        return redirect("login")
+
+
+
+    return render(request, "register.html")
+
+
+def user_logout(request):
+
+    """User logout view"""
+
+    logout(request)
+
+    return redirect('login')
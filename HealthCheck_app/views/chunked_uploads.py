@@ -0,0 +1,340 @@
+"""
+Resumable chunked upload API
+"""
+
+import os
+import uuid
+
+from django.shortcuts import get_object_or_404
+from django.http import JsonResponse
+from django.views.decorators.http import require_http_methods
+from django.contrib.auth.decorators import login_required
+from django.conf import settings
+
+from ..models import Customer, HealthCheckFile, ChunkedUpload
+from ..file_utils import content_store_path, store_local_file, link_or_copy_file
+from ..report_preflight import preflight_validate_report, report_file_fields
+from .common import CUSTOMER_FILES_DIR, SCRIPT_INPUT_DIR
+from .health_check import clear_existing_customer_files
+from .validation import (
+    validate_customer_technology_match, validate_file_type_match, validate_section_specific_upload,
+)
+from .customer_files import get_customer_file_path
+
+
+# === Resumable Chunked Upload API ===
+# Large TEC reports / inventories are sent as sequential raw chunks written straight to disk,
+# so a dropped connection resumes from the last stored offset instead of restarting.
+
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = getattr(settings, 'CHUNKED_UPLOAD_MAX_CHUNK_SIZE', 16 * 1024 * 1024)
+CHUNKED_UPLOAD_MAX_TOTAL_SIZE = getattr(settings, 'CHUNKED_UPLOAD_MAX_TOTAL_SIZE', 2 * 1024 * 1024 * 1024)
+
+
+CHUNKED_UPLOAD_READ_SIZE = 1024 * 1024
+
+
+CHUNKED_UPLOAD_TYPES = {
+    'REPORT': {'extension': '.xlsx', 'section': 'report_upload'},
+    'INVENTORY': {'extension': '.csv', 'section': 'inventory_upload'},
+}
+
+
+def validate_chunked_upload_filename(customer, filename, upload_type):
+    """Run the same filename checks as the single-request upload views; returns an error message or None"""
+    upload_config = CHUNKED_UPLOAD_TYPES.get(upload_type)
+    if not upload_config:
+        return f"Unsupported upload type '{upload_type}'. Expected one of: {', '.join(CHUNKED_UPLOAD_TYPES)}"
+    
+    if not filename.lower().endswith(upload_config['extension']):
+        return f"Only {upload_config['extension'].upper().lstrip('.')} files are allowed for {upload_type.lower()} uploads"
+    
+    file_type_validation = validate_file_type_match(filename, upload_type)
+    if not file_type_validation['valid']:
+        return file_type_validation['error']
+    
+    section_validation = validate_section_specific_upload(
+        customer.name, filename, upload_config['section'], upload_type
+    )
+    if not section_validation['valid']:
+        return section_validation['error']
+    
+    validation_result = validate_customer_technology_match(customer.name, filename)
+    if not validation_result['valid']:
+        return validation_result['error']
+    
+    return None
+
+
+def chunked_upload_state(upload):
+    """JSON-serialisable state of a chunked upload, used by every endpoint"""
+    return {
+        "upload_id": upload.upload_id,
+        "filename": upload.filename,
+        "upload_type": upload.upload_type,
+        "offset": upload.offset,
+        "total_size": upload.total_size,
+        "upload_status": upload.status,
+        "max_chunk_size": CHUNKED_UPLOAD_MAX_CHUNK_SIZE,
+    }
+
+
+def finalize_chunked_upload(upload, file_hash, report_metadata=None):
+    """
+    Move an assembled upload into the customer's folders and record it like a regular upload.
+    The new file and its record exist before any older report is cleared; if anything fails,
+    whatever was written is removed again and a file it replaced at the same path is restored.
+    """
+    from django.db import transaction
+    
+    customer = upload.customer
+    part_path = upload.get_part_path()
+    
+    if upload.upload_type == 'REPORT':
+        target_path = get_customer_file_path(customer, 'TEC', upload.filename)
+        script_input_path = SCRIPT_INPUT_DIR / upload.filename
+        file_type = 'TEC_REPORT'
+    else:
+        customer_folder = CUSTOMER_FILES_DIR / customer.name / "inventory_files"
+        os.makedirs(customer_folder, exist_ok=True)
+        target_path = customer_folder / upload.filename
+        script_input_path = None
+        file_type = 'INVENTORY_CSV'
+    
+    blob_path = content_store_path(file_hash)
+    blob_existed = blob_path.exists()
+    
+    # Keep a file already at the target path aside until the new one is recorded
+    backup_path = None
+    if target_path.exists():
+        backup_path = target_path.with_name(f".{target_path.name}.{upload.upload_id}.bak")
+        os.replace(target_path, backup_path)
+    
+    script_input_linked = False
+    try:
+        stored = store_local_file(part_path, target_path, file_hash)
+        if script_input_path is not None:
+            link_or_copy_file(target_path, script_input_path)
+            script_input_linked = True
+        
+        with transaction.atomic():
+            stored_file = HealthCheckFile.objects.create(
+                customer=customer,
+                file_type=file_type,
+                original_filename=upload.filename,
+                stored_filename=upload.filename,
+                file_path=str(target_path),
+                file_size=stored['size'],
+                sha256=stored['sha256'],
+                **report_file_fields(report_metadata)
+            )
+    except Exception:
+        for path in (target_path, script_input_path if script_input_linked else None,
+                     None if blob_existed else blob_path):
+            if path is not None and os.path.lexists(path):
+                os.unlink(path)
+        if backup_path is not None:
+            os.replace(backup_path, target_path)
+        raise
+    
+    if backup_path is not None:
+        os.unlink(backup_path)
+    
+    print(f"? Assembled chunked upload {upload.filename} ? {target_path}")
+    
+    if file_type == 'TEC_REPORT':
+        deleted_count = clear_existing_customer_files(customer, 'TEC_REPORT', keep=stored_file)
+        if deleted_count > 0:
+            print(f"? Cleared {deleted_count} old TEC_REPORT file(s) for customer: {customer.name}")
+    
+    return stored_file
+
+
+@login_required
+@require_http_methods(["POST"])
+def chunked_upload_start(request):
+    """Open a resumable upload: validates the filename up front and returns an upload ID"""
+    import json
+    
+    try:
+        data = json.loads(request.body) if request.content_type == 'application/json' else request.POST
+        filename = os.path.basename(str(data.get('filename', '')).strip())
+        upload_type = str(data.get('upload_type', '')).upper()
+        total_size = int(data.get('total_size', 0))
+        expected_sha256 = str(data.get('sha256', '')).strip().lower()
+        customer_id = data.get('customer_id') or request.session.get('selected_customer_id')
+    except (ValueError, TypeError) as e:
+        return JsonResponse({"status": "error", "message": f"Invalid upload request: {str(e)}"}, status=400)
+    
+    if not customer_id:
+        return JsonResponse({"status": "error", "message": "No customer selected"}, status=400)
+    if not filename or total_size <= 0:
+        return JsonResponse({"status": "error", "message": "filename and a positive total_size are required"}, status=400)
+    if total_size > CHUNKED_UPLOAD_MAX_TOTAL_SIZE:
+        return JsonResponse({
+            "status": "error",
+            "message": f"File too large; uploads are limited to {CHUNKED_UPLOAD_MAX_TOTAL_SIZE} bytes"
+        }, status=413)
+    
+    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
+    
+    validation_error = validate_chunked_upload_filename(customer, filename, upload_type)
+    if validation_error:
+        return JsonResponse({"status": "error", "message": validation_error}, status=400)
+    
+    upload = ChunkedUpload.objects.create(
+        upload_id=uuid.uuid4().hex,
+        customer=customer,
+        initiated_by=request.user,
+        upload_type=upload_type,
+        filename=filename,
+        total_size=total_size,
+        expected_sha256=expected_sha256
+    )
+    part_path = upload.get_part_path()
+    os.makedirs(part_path.parent, exist_ok=True)
+    part_path.touch()
+    
+    return JsonResponse({"status": "success", **chunked_upload_state(upload)})
+
+
+@login_required
+@require_http_methods(["GET"])
+def chunked_upload_status(request, upload_id):
+    """Report how many bytes were stored so an interrupted client knows where to resume"""
+    upload = get_object_or_404(ChunkedUpload, upload_id=upload_id, initiated_by=request.user)
+    return JsonResponse({"status": "success", **chunked_upload_state(upload)})
+
+
+@login_required
+@require_http_methods(["PUT", "POST"])
+def chunked_upload_chunk(request, upload_id):
+    """
+    Append one raw chunk (request body) at the given offset.
+    The offset comes from the `offset` query parameter or the `Upload-Offset` header and must
+    equal the stored offset; otherwise 409 is returned with the offset to resume from.
+    """
+    from django.db import transaction
+    
+    try:
+        client_offset = int(request.GET.get('offset', request.headers.get('Upload-Offset', -1)))
+        chunk_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return JsonResponse({"status": "error", "message": "offset and Content-Length must be integers"}, status=400)
+    
+    if chunk_length <= 0:
+        return JsonResponse({"status": "error", "message": "Empty chunk"}, status=400)
+    if chunk_length > CHUNKED_UPLOAD_MAX_CHUNK_SIZE:
+        return JsonResponse({
+            "status": "error",
+            "message": f"Chunk too large; send at most {CHUNKED_UPLOAD_MAX_CHUNK_SIZE} bytes per request"
+        }, status=413)
+    
+    with transaction.atomic():
+        upload = get_object_or_404(
+            ChunkedUpload.objects.select_for_update(), upload_id=upload_id, initiated_by=request.user
+        )
+        if upload.status != 'UPLOADING':
+            return JsonResponse({"status": "error", "message": f"Upload is {upload.status.lower()}",
+                                 **chunked_upload_state(upload)}, status=409)
+        if client_offset != upload.offset:
+            return JsonResponse({"status": "error", "message": "Offset mismatch; resume from the returned offset",
+                                 **chunked_upload_state(upload)}, status=409)
+        if upload.offset + chunk_length > upload.total_size:
+            return JsonResponse({"status": "error", "message": "Chunk exceeds the announced total_size",
+                                 **chunked_upload_state(upload)}, status=400)
+        
+        # Stream the body to disk in blocks; a truncated body still stores a valid prefix
+        written = 0
+        part_path = upload.get_part_path()
+        with open(part_path, 'r+b' if part_path.exists() else 'wb') as part:
+            part.seek(upload.offset)
+            while written < chunk_length:
+                block = request.read(min(CHUNKED_UPLOAD_READ_SIZE, chunk_length - written))
+                if not block:
+                    break
+                part.write(block)
+                written += len(block)
+            part.truncate()
+        
+        upload.offset += written
+        upload.save(update_fields=['offset', 'updated_at'])
+    
+    return JsonResponse({"status": "success", **chunked_upload_state(upload)})
+
+
+@login_required
+@require_http_methods(["POST"])
+def chunked_upload_complete(request, upload_id):
+    """Verify the assembled file against the client checksum and store it"""
+    import json
+    from django.db import transaction
+    from ..file_utils import calculate_file_hash
+    
+    try:
+        data = json.loads(request.body) if request.body else {}
+    except ValueError:
+        data = request.POST
+    
+    with transaction.atomic():
+        upload = get_object_or_404(
+            ChunkedUpload.objects.select_for_update(), upload_id=upload_id, initiated_by=request.user
+        )
+        if upload.status == 'COMPLETED':
+            return JsonResponse({"status": "success", "file_id": upload.stored_file_id, **chunked_upload_state(upload)})
+        if upload.status != 'UPLOADING':
+            return JsonResponse({"status": "error", "message": f"Upload is {upload.status.lower()}",
+                                 **chunked_upload_state(upload)}, status=409)
+        if upload.offset != upload.total_size:
+            return JsonResponse({"status": "error", "message": "Upload is incomplete",
+                                 **chunked_upload_state(upload)}, status=409)
+        
+        expected_sha256 = str(data.get('sha256') or upload.expected_sha256).strip().lower()
+        file_hash = calculate_file_hash(upload.get_part_path(), chunk_size=CHUNKED_UPLOAD_READ_SIZE)
+        if not file_hash:
+            return JsonResponse({"status": "error", "message": "Assembled file could not be read"}, status=500)
+        
+        if expected_sha256 and expected_sha256 != file_hash:
+            # Bytes on disk are wrong somewhere; the client has to send the file again
+            upload.get_part_path().unlink()
+            upload.status = 'FAILED'
+            upload.error_message = f"Checksum mismatch: expected {expected_sha256}, got {file_hash}"
+            upload.save(update_fields=['status', 'error_message', 'updated_at'])
+            return JsonResponse({"status": "error", "message": upload.error_message,
+                                 **chunked_upload_state(upload)}, status=422)
+        
+        report_metadata = None
+        if upload.upload_type == 'REPORT':
+            preflight = preflight_validate_report(str(upload.get_part_path()), upload.filename)
+            if not preflight['valid']:
+                upload.get_part_path().unlink()
+                upload.status = 'FAILED'
+                upload.error_message = f"Report pre-flight check failed: {preflight['error']}"
+                upload.save(update_fields=['status', 'error_message', 'updated_at'])
+                return JsonResponse({"status": "error", "message": upload.error_message,
+                                     **chunked_upload_state(upload)}, status=422)
+            report_metadata = preflight['metadata']
+        
+        try:
+            stored_file = finalize_chunked_upload(upload, file_hash, report_metadata)
+        except Exception as e:
+            # The part file is consumed by then, so the client has to start a new upload
+            print(f"?? Error finalizing chunked upload {upload.upload_id}: {str(e)}")
+            if upload.get_part_path().exists():
+                upload.get_part_path().unlink()
+            upload.status = 'FAILED'
+            upload.error_message = f"Upload failed: {str(e)}"
+            upload.save(update_fields=['status', 'error_message', 'updated_at'])
+            return JsonResponse({"status": "error", "message": upload.error_message,
+                                 **chunked_upload_state(upload)}, status=500)
+        
+        upload.status = 'COMPLETED'
+        upload.stored_file = stored_file
+        upload.save(update_fields=['status', 'stored_file', 'updated_at'])
+    
+    return JsonResponse({
+        "status": "success",
+        "message": f"'{upload.filename}' uploaded successfully.",
+        "file_id": stored_file.id,
+        "sha256": file_hash,
+        **chunked_upload_state(upload)
+    })
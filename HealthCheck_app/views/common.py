@@ -0,0 +1,91 @@
+"""
+Shared setup of the views
+Script directories and the optional Excel integration and script helper.
+"""
+
+import os
+from pathlib import Path
+
+
+# Excel integration imports
+try:
+    from ..excel_integration import (
+        get_excel_integration, 
+        get_customer_networks_unified,
+        integrate_excel_with_database_choices
+    )
+    EXCEL_INTEGRATION_AVAILABLE = True
+except ImportError:
+    print("Warning: Excel integration not available")
+    EXCEL_INTEGRATION_AVAILABLE = False
+
+
+# Try to import script_helper, fallback if not available
+try:
+    from ..script_helper import execute_health_check_script, ScriptExecutor
+
+except ImportError:
+
+    # Fallback implementations
+
+    def execute_health_check_script(customer_name):
+
+        """Fallback implementation for script execution"""
+
+        return {
+
+            'success': False,
+
+            'error': 'Script helper not available - using fallback'
+
+        }
+
+    
+
+    class ScriptExecutor:
+
+        pass
+
+
+# === Directory Setup ===
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# Ensure we're using the correct base directory - no case sensitivity fixes needed for hc_final
+
+print(f"DEBUG: Detected BASE_DIR = {BASE_DIR}")
+
+
+print(f"DEBUG: Script directory exists: {(BASE_DIR / 'Script').exists()}")
+
+
+SCRIPT_DIR = BASE_DIR / "Script"
+
+
+SCRIPT_INPUT_DIR = SCRIPT_DIR / "input-hc-report"
+
+
+SCRIPT_OUTPUT_DIR = SCRIPT_DIR / "output"
+
+
+CUSTOMER_FILES_DIR = SCRIPT_DIR / "customer_files"
+
+
+# Debug: Print actual paths to verify they're correct
+
+print(f"DEBUG: BASE_DIR = {BASE_DIR}")
+
+
+print(f"DEBUG: SCRIPT_DIR = {SCRIPT_DIR}")
+
+
+print(f"DEBUG: SCRIPT_OUTPUT_DIR = {SCRIPT_OUTPUT_DIR}")
+
+
+# Ensure directories exist
+
+os.makedirs(SCRIPT_INPUT_DIR, exist_ok=True)
+
+
+os.makedirs(SCRIPT_OUTPUT_DIR, exist_ok=True)
@@ -0,0 +1,967 @@
+"""
+Customer folders
+Folder structure of each network under Script/customer_files, tracker history and sticky notes.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+from django.utils import timezone
+from django.shortcuts import get_object_or_404
+from django.http import JsonResponse
+from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.db.models import Count
+
+from ..models import Customer, HealthCheckSession, HealthCheckFile, HISTORY_CATEGORIES
+from ..response_cache import get_scoped_version
+from .common import SCRIPT_DIR, SCRIPT_INPUT_DIR, SCRIPT_OUTPUT_DIR
+
+
+# === Utility Functions ===
+
+def get_customer_directory(customer):
+
+    """Get or create directory for customer files"""
+
+    customer_dir = SCRIPT_DIR / customer.get_directory_name()
+
+    os.makedirs(customer_dir, exist_ok=True)
+
+    return customer_dir
+
+
+# === Customer Folder Management Functions ===
+
+def get_customer_file_path(customer, file_type, filename):
+
+    """Get customer-specific file path for better organization - now supports network-specific paths"""
+
+    customer_name = customer.name.replace(" ", "_").replace("/", "_")
+
+    
+
+    # Create base customer directory first
+
+    customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
+
+    customer_base_dir.mkdir(parents=True, exist_ok=True)
+
+    
+
+    # If there's a network_name, create a network-specific subfolder
+
+    if customer.network_name:
+
+        network_name = customer.network_name.replace(" ", "_").replace("/", "_")
+
+        customer_dir = customer_base_dir / network_name
+
+    else:
+
+        # If no network specified, use the base customer directory
+
+        customer_dir = customer_base_dir
+
+    
+
+    customer_dir.mkdir(parents=True, exist_ok=True)
+
+    
+
+    type_dirs = {
+
+        'HOST': 'host_files',
+
+        'TEC': 'tec_reports', 
+
+        'TRACKER': 'generated_trackers',
+
+        'OLD_TRACKER': 'old_trackers',
+
+        'INVENTORY': 'inventory_files'
+
+    }
+
+    
+
+    file_dir = customer_dir / type_dirs.get(file_type, 'misc')
+
+    file_dir.mkdir(exist_ok=True)
+
+    
+
+    return file_dir / filename
+
+
+def preserve_customer_file(customer, file_type, source_path, filename):
+
+    """Preserve file in customer-specific directory"""
+
+    try:
+
+        # Convert to Path object if string
+
+        if isinstance(source_path, str):
+
+            source_path = Path(source_path)
+
+            
+
+        dest_path = get_customer_file_path(customer, file_type, filename)
+
+        
+
+        if source_path.exists():
+
+            # Always copy - overwrite if exists but don't delete other files
+
+            shutil.copy2(str(source_path), str(dest_path))
+
+            print(f"Preserved {file_type} file for {customer.name}: {filename}")
+
+            return dest_path
+
+        else:
+
+            print(f"Source file doesn't exist for preservation: {source_path}")
+
+    except Exception as e:
+
+        print(f"Error preserving customer file: {e}")
+
+    return None
+
+
+def create_customer_folder_structure(customer):
+
+    """Create complete folder structure for new customer including sample files"""
+
+    try:
+
+        customer_name = customer.name.replace(" ", "_").replace("/", "_").replace(".", "_")
+
+        
+
+        # Create base customer directory first
+
+        customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
+
+        customer_base_dir.mkdir(parents=True, exist_ok=True)
+
+        print(f"?? Created base customer directory: {customer_base_dir}")
+
+        
+
+        # If there's a network_name, create a network-specific subfolder
+
+        if customer.network_name and customer.network_name.strip():
+
+            network_name = customer.network_name.replace(" ", "_").replace("/", "_").replace(".", "_")
+
+            customer_dir = customer_base_dir / network_name
+
+            print(f"?? Creating network-specific folder: {network_name}")
+
+        else:
+
+            # If no network specified, use the base customer directory
+
+            customer_dir = customer_base_dir
+
+            print(f"?? Using base customer directory (no specific network)")
+
+        
+
+        # Create network-specific directory
+
+        customer_dir.mkdir(parents=True, exist_ok=True)
+
+        print(f"?? Created customer/network directory: {customer_dir}")
+
+        
+
+        # Define folder structure with descriptions
+
+        folders = {
+
+            'host_files': 'CSV inventory files and host configurations',
+
+            'tec_reports': 'TEC Health Check Reports (.xlsx files)',
+
+            'generated_trackers': 'Auto-generated tracker files from processing',
+
+            'old_trackers': 'Manual tracker uploads and archived trackers',
+
+            'inventory_files': 'Remote inventory data and inventory reports'
+
+        }
+
+        
+
+        # Create subfolders
+
+        for folder_name, description in folders.items():
+
+            folder_path = customer_dir / folder_name
+
+            folder_path.mkdir(exist_ok=True)
+
+            
+
+            # Create a README.txt file in each folder explaining its purpose
+
+            readme_path = folder_path / "README.txt"
+
+            if not readme_path.exists():
+
+                readme_content = f"""?? {folder_name.replace('_', ' ').title()} Folder
+
+
+
+Customer: {customer.name}
+
+Created: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+
+
+Purpose:
+
+{description}
+
+
+
+This folder is automatically managed by the Health Check Tracking Tool.
+
+Files uploaded through the web interface will appear here organized by type.
+
+
+
+Folder Structure:
+
+?? host_files/        ? CSV inventory files go here
+
+?? tec_reports/       ? .xlsx TEC reports go here  
+
+?? generated_trackers/ ? Generated tracker files go here
+
+?? old_trackers/      ? Manual tracker uploads go here
+
+?? inventory_files/   ? Remote inventory data and reports go here
+
+
+
+? All files are automatically organized and available for download through the dashboard!
+
+"""
+
+                with open(readme_path, 'w', encoding='utf-8') as f:
+
+                    f.write(readme_content)
+
+                
+
+            print(f"  ?? Created subfolder: {folder_name}")
+
+        
+
+        # Create a main customer info file with enhanced information
+
+        info_filename = f"{customer_name}_info.txt"
+
+        if customer.network_name and customer.network_name.strip():
+
+            info_filename = f"{customer_name}_{customer.network_name.replace(' ', '_')}_info.txt"
+
+        
+
+        customer_info_path = customer_dir / info_filename
+
+        if not customer_info_path.exists():
+
+            network_info = f"\nNetwork: {customer.network_name}" if customer.network_name else "\nNetwork: Default/Generic"
+
+            info_content = f"""?? Customer Information
+
+
+
+Name: {customer.name}{network_info}
+
+Network Type: {customer.network_type}
+
+Setup Status: {customer.setup_status}
+
+Created: {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+Customer ID: {customer.id}
+
+
+
+Folder Structure:
+
++-- ?? host_files/        ? CSV inventory files
+
++-- ?? tec_reports/       ? TEC Health Check Reports (.xlsx)
+
++-- ?? generated_trackers/ ? Auto-generated tracker files
+
++-- ?? old_trackers/      ? Manual uploads & archives
+
++-- ?? inventory_files/   ? Remote inventory data (.csv)
+
+
+
+?? File Management:
+
+ Files uploaded through web dashboard are automatically organized
+
+ Old files are cleaned up to prevent duplicates
+
+ Generated tracker files appear in both generated_trackers/ and old_trackers/
+
+ All files remain available for download through dashboard
+
+
+
+?? This customer is ready for health check processing!
+
+    Upload files through the web dashboard and they'll appear in the appropriate folders.
+
+
+
+??  IMPORTANT: When deleting this customer/network, all files in this directory will be permanently removed!
+
+"""
+
+            with open(customer_info_path, 'w', encoding='utf-8') as f:
+
+                f.write(info_content)
+
+        
+
+        print(f"? Customer folder structure created successfully for: {customer.name}")
+
+        return True
+
+        
+
+    except Exception as e:
+
+        print(f"? Error creating customer folder structure: {e}")
+
+        return False
+
+
+def delete_customer_folder_structure(customer):
+
+    """Delete customer folder structure and all associated files from disk"""
+
+    try:
+
+        customer_name = customer.name.replace(" ", "_").replace("/", "_").replace(".", "_")
+
+        customer_base_dir = SCRIPT_DIR / "customer_files" / customer_name
+
+        
+
+        # If there's a network_name, delete the specific network folder
+
+        if customer.network_name and customer.network_name.strip():
+
+            network_name = customer.network_name.replace(" ", "_").replace("/", "_").replace(".", "_")
+
+            customer_dir = customer_base_dir / network_name
+
+            print(f"??? Deleting network-specific folder: {customer.name} - {customer.network_name}")
+
+        else:
+
+            # If no network specified, delete the entire customer directory
+
+            customer_dir = customer_base_dir
+
+            print(f"??? Deleting entire customer directory: {customer.name}")
+
+        
+
+        # Check if directory exists
+
+        if not customer_dir.exists():
+
+            print(f"?? Customer/network directory not found: {customer_dir}")
+
+            # Check if this is a network deletion and there are other networks
+
+            if customer.network_name and customer_base_dir.exists():
+
+                remaining_networks = [d for d in customer_base_dir.iterdir() if d.is_dir()]
+
+                if remaining_networks:
+
+                    print(f"?? Other networks still exist for customer {customer.name}: {[d.name for d in remaining_networks]}")
+
+            return True  # Not an error if directory doesn't exist
+
+        
+
+        # Count files and directories for detailed logging
+
+        total_files = 0
+
+        total_dirs = 0
+
+        file_types = {}
+
+        
+
+        for folder_path in customer_dir.rglob('*'):
+
+            if folder_path.is_file():
+
+                total_files += 1
+
+                # Track file types for reporting
+
+                ext = folder_path.suffix.lower()
+
+                if ext in file_types:
+
+                    file_types[ext] += 1
+
+                else:
+
+                    file_types[ext] = 1
+
+            elif folder_path.is_dir():
+
+                total_dirs += 1
+
+        
+
+        print(f"??? Deleting customer folder structure: {customer_dir}")
+
+        print(f"?? Total files to be deleted: {total_files}")
+
+        print(f"?? Total directories to be deleted: {total_dirs}")
+
+        if file_types:
+
+            print(f"?? File types: {dict(file_types)}")
+
+        
+
+        # Create backup info before deletion (optional - can be disabled)
+
+        backup_info = {
+
+            'customer_name': customer.name,
+
+            'network_name': customer.network_name,
+
+            'deleted_at': timezone.now().isoformat(),
+
+            'total_files': total_files,
+
+            'total_dirs': total_dirs,
+
+            'file_types': dict(file_types),
+
+            'directory_path': str(customer_dir)
+
+        }
+
+        
+
+        # Write deletion log to parent directory
+
+        if customer_base_dir.exists():
+
+            log_file = customer_base_dir / f"DELETED_{customer.name}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+            try:
+
+                with open(log_file, 'w', encoding='utf-8') as f:
+
+                    import json
+
+                    f.write(f"CUSTOMER/NETWORK DELETION LOG\n")
+
+                    f.write(f"{'=' * 50}\n\n")
+
+                    f.write(json.dumps(backup_info, indent=2))
+
+                print(f"?? Created deletion log: {log_file.name}")
+
+            except Exception as log_error:
+
+                print(f"?? Could not create deletion log: {log_error}")
+
+        
+
+        # Delete the entire customer directory tree
+
+        import shutil
+
+        shutil.rmtree(str(customer_dir))
+
+        
+
+        # Check if customer base directory is empty after network deletion
+
+        if customer.network_name and customer_base_dir.exists():
+
+            remaining_items = list(customer_base_dir.iterdir())
+
+            # Filter out log files
+
+            remaining_dirs = [item for item in remaining_items if item.is_dir()]
+
+            if not remaining_dirs:
+
+                print(f"?? Customer base directory is now empty (only log files remain)")
+
+                # Optionally, you could delete the entire customer directory here
+
+                # shutil.rmtree(str(customer_base_dir))
+
+        
+
+        print(f"? Successfully deleted customer folder structure for: {customer.name}")
+
+        print(f"??? Removed directory: {customer_dir}")
+
+        print(f"?? Deleted {total_files} files")
+
+        
+
+        return True
+
+        
+
+    except PermissionError as e:
+
+        print(f"? Permission denied deleting customer folder: {e}")
+
+        print(f"?? Some files may be in use. Try closing any open files for {customer.name}")
+
+        return False
+
+    except Exception as e:
+
+        print(f"? Error deleting customer folder structure: {e}")
+
+        return False
+
+
+TRACKER_HISTORY_FOLDERS = ['host_files', 'reports', 'tracker_generated', 'old_trackers', 'inventory_files']
+
+
+TRACKER_HISTORY_PAGE_SIZE = 50
+
+
+TRACKER_HISTORY_MAX_PAGE_SIZE = 200
+
+
+TRACKER_HISTORY_CACHE_TIMEOUT = 600
+
+
+def tracker_history_files(customer, folder, page, page_size):
+    """One page of a tracker history folder, newest first, from the metadata stored with each file"""
+    file_types = [file_type for file_type, category in HISTORY_CATEGORIES.items() if category == folder]
+    offset = (page - 1) * page_size
+    rows = HealthCheckFile.objects.filter(
+        customer=customer, file_type__in=file_types, history_category=folder
+    ).order_by('-uploaded_at').values(
+        'id', 'stored_filename', 'original_filename', 'upload_date_display', 'download_url', 'uploaded_at'
+    )[offset:offset + page_size]
+    return [{
+        "upload_id": row['id'],
+        "filename": row['stored_filename'],
+        "original_filename": row['original_filename'],
+        "upload_date": row['upload_date_display'],
+        "file_url": row['download_url'],
+        "upload_timestamp": row['uploaded_at'],
+    } for row in rows]
+
+
+def tracker_history_payload(customer_id, folder, page, page_size):
+    """Folders of a customer's tracker history (or just one folder) with per-folder file counts"""
+    customer = Customer.objects.filter(id=customer_id, is_deleted=False).first()
+    if customer is None:
+        return {"customer_folders": [], "total_files": 0, "has_more": {}}
+
+    counts = dict.fromkeys(TRACKER_HISTORY_FOLDERS, 0)
+    for row in HealthCheckFile.objects.filter(customer=customer).exclude(history_category='').values(
+            'history_category').annotate(files=Count('id')).order_by():
+        counts[row['history_category']] = row['files']
+
+    folders = [folder] if folder else TRACKER_HISTORY_FOLDERS
+    return {
+        "customer_folders": [{
+            "customer_id": customer.id,
+            "customer_name": customer.name,
+            "folders": {name: tracker_history_files(customer, name, page, page_size) for name in folders},
+            "counts": counts,
+        }],
+        "total_files": sum(counts.values()),
+        "has_more": {name: counts[name] > page * page_size for name in folders},
+    }
+
+
+@login_required
+def tracker_history(request):
+    """
+    Files of the selected customer by tracker history folder, newest first.
+    Paginated per folder: ?page= and ?page_size= (default 50), ?category= for a single folder.
+    First pages are cached until the customer's files change.
+    """
+    selected_customer_id = request.session.get('selected_customer_id')
+    if not selected_customer_id:
+        return JsonResponse({"status": "error", "message": "No customer selected", "customer_folders": []})
+
+    folder = request.GET.get('category') or None
+    if folder and folder not in TRACKER_HISTORY_FOLDERS:
+        return JsonResponse({"status": "error", "message": f"Unknown category: {folder}"}, status=400)
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+        page_size = min(max(int(request.GET.get('page_size', TRACKER_HISTORY_PAGE_SIZE)), 1), TRACKER_HISTORY_MAX_PAGE_SIZE)
+    except ValueError:
+        return JsonResponse({"status": "error", "message": "page and page_size must be numbers"}, status=400)
+
+    payload = None
+    if page == 1:
+        files_version = get_scoped_version(f'files:{selected_customer_id}')
+        cache_key = f'healthcheck:tracker_history:{selected_customer_id}:{folder}:{page_size}:{files_version}'
+        payload = cache.get(cache_key)
+    if payload is None:
+        payload = tracker_history_payload(selected_customer_id, folder, page, page_size)
+        if page == 1:
+            cache.set(cache_key, payload, TRACKER_HISTORY_CACHE_TIMEOUT)
+
+    response = JsonResponse({
+        "status": "success",
+        "selected_customer_id": selected_customer_id,
+        "selected_customer_name": request.session.get('selected_customer_name', 'Unknown'),
+        "customer_folders": payload["customer_folders"],
+        "total_customers": len(payload["customer_folders"]),
+        "total_files": payload["total_files"],
+        "selected_customer_files": payload["total_files"],
+        "pagination": {"page": page, "page_size": page_size, "has_more": payload["has_more"]},
+    })
+
+    # Add cache-busting headers
+    response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+    response['Pragma'] = 'no-cache'
+    response['Expires'] = '0'
+    return response
+
+
+@login_required
+
+def get_sticky_notes_data(request):
+
+    """API endpoint to get data for sticky notes panel"""
+
+    try:
+
+        selected_customer_id = request.session.get('selected_customer_id')
+
+        selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
+
+        
+
+        # Get last tracker generated for the current customer only
+
+        last_tracker = None
+
+        if selected_customer_id:
+
+            try:
+
+                current_customer = Customer.objects.get(id=selected_customer_id)
+
+                
+
+                # Get latest completed session with tracker
+
+                last_session = HealthCheckSession.objects.filter(
+
+                    customer=current_customer,
+
+                    status='COMPLETED',
+
+                    output_tracker_filename__isnull=False
+
+                ).exclude(output_tracker_filename='').order_by('-completed_at').first()
+
+                
+
+                if last_session:
+
+                    # Convert to IST timezone
+
+                    import zoneinfo
+
+                    ist = zoneinfo.ZoneInfo('Asia/Kolkata')
+
+                    ist_time = last_session.completed_at.astimezone(ist)
+
+                    
+
+                    last_tracker = {
+
+                        "filename": last_session.output_tracker_filename,
+
+                        "customer": last_session.customer.name,
+
+                        "timestamp": ist_time.strftime('%d/%m/%Y %I:%M %p'),
+
+                        "threshold": None  # Health check doesn't use temperature thresholds
+
+                    }
+
+                    
+
+            except Customer.DoesNotExist:
+
+                last_tracker = None
+
+        
+
+        # Get last activity (most recent session)
+
+        last_activity = None
+
+        last_session = HealthCheckSession.objects.filter().order_by('-created_at').first()
+
+        if last_session:
+
+            action_type = "Health Check Started"
+
+            if last_session.status == 'COMPLETED':
+
+                action_type = "Health Check Completed"
+
+            elif last_session.status == 'FAILED':
+
+                action_type = "Health Check Failed"
+
+            
+
+            # Convert to IST timezone for consistency
+
+            import zoneinfo
+
+            ist = zoneinfo.ZoneInfo('Asia/Kolkata')
+
+            ist_time = last_session.created_at.astimezone(ist)
+
+            
+
+            last_activity = {
+
+                "action": action_type,
+
+                "customer": last_session.customer.name,
+
+                "timestamp": ist_time.strftime('%d/%m/%Y %I:%M %p'),
+
+                "filename": last_session.session_id
+
+            }
+
+        
+
+        # Get current time for customer selection
+
+        from datetime import datetime
+
+        import zoneinfo
+
+        ist = zoneinfo.ZoneInfo('Asia/Kolkata')
+
+        current_time = datetime.now(ist).strftime('%d/%m/%Y %I:%M %p')
+
+        
+
+        return JsonResponse({
+
+            "status": "success",
+
+            "current_customer": {
+
+                "name": selected_customer_name,
+
+                "selected_time": current_time,
+
+                "previous_temperature": None,  # Health check doesn't use temperature
+
+                "current_temperature": None,
+
+                "is_new_customer": True
+
+            },
+
+            "last_tracker": last_tracker,
+
+            "previous_tracker": None,  # Health check doesn't track previous trackers
+
+            "last_activity": last_activity
+
+        })
+
+        
+
+    except Exception as e:
+
+        print(f"Error in get_sticky_notes_data: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"Error getting sticky notes data: {str(e)}"})
+
+
+@login_required
+
+def delete_tracker_file(request):
+
+    """Robustly delete a file and its database entry from all known locations."""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+
+
+    upload_id = request.POST.get('upload_id')
+
+    if not upload_id:
+
+        return JsonResponse({"status": "error", "message": "Upload ID required"})
+
+
+
+    try:
+
+        customer = Customer.objects.get(id=selected_customer_id)
+
+        file_obj = get_object_or_404(HealthCheckFile, id=upload_id, customer=customer)
+
+        
+
+        filename = file_obj.stored_filename
+
+        file_type = file_obj.file_type
+
+        
+
+        # List of potential file paths to delete
+
+        paths_to_delete = set()
+
+        
+
+        # 1. Path from the database record
+
+        if file_obj.file_path:
+
+            paths_to_delete.add(Path(file_obj.file_path))
+
+            
+
+        # 2. Path in the customer-specific folder
+
+        customer_file_path = get_customer_file_path(customer, file_type, filename)
+
+        paths_to_delete.add(customer_file_path)
+
+
+
+        # 3. Path in the main script directories
+
+        if file_type in ['TEC_REPORT', 'INVENTORY_CSV']:
+
+            paths_to_delete.add(SCRIPT_INPUT_DIR / filename)
+
+            paths_to_delete.add(SCRIPT_INPUT_DIR / file_obj.original_filename)
+
+        else:
+
+            paths_to_delete.add(SCRIPT_DIR / filename)
+
+            
+
+        # 4. Path in the script output directory (for generated files)
+
+        if file_type == 'TRACKER_GENERATED':
+
+            paths_to_delete.add(SCRIPT_OUTPUT_DIR / filename)
+
+            paths_to_delete.add(SCRIPT_DIR / "output" / filename)
+
+
+
+        deleted_paths = []
+
+        for path in paths_to_delete:
+
+            try:
+
+                if path and path.exists() and path.is_file():
+
+                    path.unlink()
+
+                    print(f"? Successfully deleted physical file: {path}")
+
+                    deleted_paths.append(str(path))
+
+            except Exception as e:
+
+                print(f"?? Warning: Could not delete file at {path}: {e}")
+
+
+
+        # Delete the database record
+
+        file_obj.delete()
+
+        print(f"? Successfully deleted database record for: {filename}")
+
+
+
+        return JsonResponse({
+
+            "status": "success",
+
+            "message": f"File '{filename}' and its associated records have been deleted.",
+
+            "deleted_files": [filename],
+
+            "deleted_paths": deleted_paths,
+
+            "workflow_restart_needed": False
+
+        })
+
+
+
+    except Customer.DoesNotExist:
+
+        return JsonResponse({"status": "error", "message": "Customer not found"})
+
+    except HealthCheckFile.DoesNotExist:
+
+        return JsonResponse({"status": "error", "message": f"File record with ID {upload_id} not found."})
+
+    except Exception as e:
+
+        print(f"? Error in delete_tracker_file: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"An unexpected error occurred: {str(e)}"})
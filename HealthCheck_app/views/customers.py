@@ -0,0 +1,1166 @@
+"""
+Customer and network management
+Customer selection, creation and deletion, and the setup of new networks.
+"""
+
+import uuid
+from datetime import datetime
+
+from django.shortcuts import render, redirect, get_object_or_404
+from django.http import JsonResponse
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+
+from ..models import Customer, HealthCheckSession, HealthCheckFile
+from ..forms import HealthCheckNewNetworkForm
+from ..file_utils import store_uploaded_file
+from .common import EXCEL_INTEGRATION_AVAILABLE, SCRIPT_DIR, get_customer_networks_unified
+from .health_check import process_health_check_files_enhanced
+from .customer_files import create_customer_folder_structure, delete_customer_folder_structure
+from .excel_dashboard import remove_customer_from_excel_tracker, update_excel_tracker_with_new_customer
+
+
+# === Customer Statistics Helper Functions ===
+
+def get_customer_statistics():
+
+    """Calculate customer statistics for the sidebar with per-customer details"""
+
+    from django.db.models import Count, Max, Q
+
+    from datetime import datetime, timedelta
+
+    
+
+    # Get all active customers grouped by name
+
+    customers_with_networks = Customer.get_customers_with_networks()
+
+    
+
+    # Total registered customers (unique names)
+
+    total_registered_customers = len(customers_with_networks)
+
+    
+
+    # Total networks across all customers
+
+    total_networks = sum(len(networks) for networks in customers_with_networks.values())
+
+    
+
+    # Get all active customers for session analysis
+
+    all_customers = Customer.objects.filter(is_deleted=False)
+
+    customer_ids = list(all_customers.values_list('id', flat=True))
+
+    
+
+    # Get session statistics
+
+    total_sessions = HealthCheckSession.objects.filter(
+
+        customer_id__in=customer_ids
+
+    ).count()
+
+    
+
+    # Get last session information
+
+    last_session = HealthCheckSession.objects.filter(
+
+        customer_id__in=customer_ids
+
+    ).order_by('-created_at').first()
+
+    
+
+    # Get tracker generation statistics
+
+    completed_sessions = HealthCheckSession.objects.filter(
+
+        customer_id__in=customer_ids,
+
+        status='COMPLETED'
+
+    ).count()
+
+    
+
+    # Get trackers generated in the last 30 days
+
+    thirty_days_ago = datetime.now() - timedelta(days=30)
+
+    recent_trackers = HealthCheckSession.objects.filter(
+
+        customer_id__in=customer_ids,
+
+        status='COMPLETED',
+
+        completed_at__gte=thirty_days_ago
+
+    ).count()
+
+    
+
+    # Get customer names list (first 10 for display)
+
+    customer_names = list(customers_with_networks.keys())[:10]
+
+    
+
+    # Get recent sessions for activity display
+
+    recent_sessions = HealthCheckSession.objects.filter(
+
+        customer_id__in=customer_ids
+
+    ).select_related('customer').order_by('-created_at')[:5]
+
+    
+
+    # NEW: Calculate per-customer statistics
+
+    per_customer_stats = {}
+
+    
+
+    for customer_name, networks in customers_with_networks.items():
+
+        # Get all customer IDs for this customer name
+
+        customer_network_ids = [network.id for network in networks]
+
+        
+
+        # Count runs (total sessions) for this customer
+
+        customer_runs = HealthCheckSession.objects.filter(
+
+            customer_id__in=customer_network_ids
+
+        ).count()
+
+        
+
+        # Count trackers generated (completed sessions) for this customer
+
+        customer_trackers = HealthCheckSession.objects.filter(
+
+            customer_id__in=customer_network_ids,
+
+            status='COMPLETED'
+
+        ).count()
+
+        
+
+        # Get last run date for this customer
+
+        last_session = HealthCheckSession.objects.filter(
+
+            customer_id__in=customer_network_ids
+
+        ).order_by('-created_at').first()
+
+        
+
+        last_run_date = None
+
+        if last_session:
+
+            last_run_date = last_session.created_at
+
+        
+
+        # Store per-customer statistics
+
+        per_customer_stats[customer_name] = {
+
+            'runs': customer_runs,
+
+            'trackers': customer_trackers,
+
+            'networks_count': len(networks),
+
+            'last_run_date': last_run_date
+
+        }
+
+    
+
+    return {
+
+        'total_registered_customers': total_registered_customers,
+
+        'total_networks': total_networks,
+
+        'customer_names': customer_names,
+
+        'total_customer_names': len(customers_with_networks),
+
+        'total_runs': total_sessions,
+
+        'last_run': last_session,
+
+        'trackers_generated': completed_sessions,
+
+        'recent_trackers': recent_trackers,
+
+        'recent_sessions': recent_sessions,
+
+        'customers_with_networks': customers_with_networks,
+
+        'per_customer_stats': per_customer_stats
+
+    }
+
+
+# === Customer Management Views ===
+
+@login_required
+
+def customer_selection(request):
+
+    """Enhanced Customer/Network selection view with network support"""
+
+    if request.method == "POST":
+
+        # Handle specific customer network removal (AJAX request) - remove specific network of specific customer
+
+        if 'remove_customer_network' in request.POST:
+
+            customer_name = request.POST.get('customer_name')
+
+            network_id = request.POST.get('network_id')
+
+            
+
+            if not customer_name or not network_id:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': 'Both customer name and network ID are required.'
+
+                })
+
+            
+
+            try:
+
+                # Find the specific network for this customer
+
+                network = Customer.objects.get(
+
+                    id=network_id, 
+
+                    name=customer_name, 
+
+                    is_deleted=False
+
+                )
+
+                
+
+                # ??? DELETE NETWORK FOLDER STRUCTURE FROM DISK
+
+                try:
+
+                    folder_deleted = delete_customer_folder_structure(network)
+
+                    if folder_deleted:
+
+                        print(f"? Successfully deleted folder structure for network: {network.display_name}")
+
+                    else:
+
+                        print(f"?? Warning: Could not delete folder structure for {network.display_name}")
+
+                except Exception as folder_error:
+
+                    print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
+
+                    # Don't fail the network removal if folder deletion fails
+
+                
+
+                # Mark network as deleted in database
+
+                network.is_deleted = True
+
+                network.save()
+                
+                # SYNC WITH EXCEL TRACKER - Remove network
+                try:
+                    remove_customer_from_excel_tracker(customer_name, network.network_name or network.name)
+                except Exception as excel_error:
+                    print(f"⚠️ Warning: Could not sync network removal with Excel: {excel_error}")
+
+                
+
+                # If this was the selected network, clear session
+
+                if request.session.get('selected_customer_id') == network.id:
+
+                    if 'selected_customer_id' in request.session:
+
+                        del request.session['selected_customer_id']
+
+                    if 'selected_customer_name' in request.session:
+
+                        del request.session['selected_customer_name']
+
+                
+
+                # Check if this was the last network for this customer
+
+                remaining_networks = Customer.objects.filter(
+
+                    name=customer_name, 
+
+                    is_deleted=False
+
+                ).count()
+
+                
+
+                if remaining_networks == 0:
+
+                    success_message = f'Network "{network.display_name}" has been removed successfully. This was the last network for customer "{customer_name}".'
+
+                else:
+
+                    success_message = f'Network "{network.display_name}" has been removed successfully. Customer "{customer_name}" still has {remaining_networks} remaining network(s).'
+
+                
+
+                return JsonResponse({
+
+                    'status': 'success',
+
+                    'message': success_message,
+
+                    'remaining_networks': remaining_networks,
+
+                    'customer_name': customer_name
+
+                })
+
+                
+
+            except Customer.DoesNotExist:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': f'Network not found for customer "{customer_name}" with the specified ID.'
+
+                })
+
+            except Exception as e:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': f'Error removing network: {str(e)}'
+
+                })
+
+        
+
+        # Handle network removal (AJAX request) - individual network (legacy support)
+
+        elif 'remove_network' in request.POST:
+
+            network_id = request.POST.get('remove_network')
+
+            try:
+
+                network = Customer.objects.get(id=network_id, is_deleted=False)
+
+                
+
+                # ??? DELETE NETWORK FOLDER STRUCTURE FROM DISK
+
+                try:
+
+                    folder_deleted = delete_customer_folder_structure(network)
+
+                    if folder_deleted:
+
+                        print(f"? Successfully deleted folder structure for network: {network.display_name}")
+
+                    else:
+
+                        print(f"?? Warning: Could not delete folder structure for {network.display_name}")
+
+                except Exception as folder_error:
+
+                    print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
+
+                    # Don't fail the network removal if folder deletion fails
+
+                
+
+                # Mark network as deleted in database
+
+                network.is_deleted = True
+
+                network.save()
+
+                
+
+                # If this was the selected network, clear session
+
+                if request.session.get('selected_customer_id') == network.id:
+
+                    if 'selected_customer_id' in request.session:
+
+                        del request.session['selected_customer_id']
+
+                    if 'selected_customer_name' in request.session:
+
+                        del request.session['selected_customer_name']
+
+                
+
+                return JsonResponse({
+
+                    'status': 'success',
+
+                    'message': f'Network "{network.display_name}" has been removed successfully.'
+
+                })
+
+            except Customer.DoesNotExist:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': 'Network not found.'
+
+                })
+
+            except Exception as e:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': f'Error removing network: {str(e)}'
+
+                })
+
+        
+
+        # Handle customer removal (AJAX request) - all networks
+
+        elif 'remove_customer' in request.POST:
+
+            customer_name = request.POST.get('remove_customer')
+
+            try:
+
+                # For health check, we remove all networks for the customer name
+
+                networks = Customer.objects.filter(name=customer_name, is_deleted=False)
+
+                if not networks.exists():
+
+                    return JsonResponse({
+
+                        'status': 'error',
+
+                        'message': f'Customer "{customer_name}" not found.'
+
+                    })
+
+                
+
+                # Remove all networks for this customer
+
+                removed_count = 0
+
+                for network in networks:
+
+                    # ??? DELETE CUSTOMER FOLDER STRUCTURE FROM DISK
+
+                    try:
+
+                        folder_deleted = delete_customer_folder_structure(network)
+
+                        if folder_deleted:
+
+                            print(f"? Successfully deleted folder structure for customer: {network.display_name}")
+
+                        else:
+
+                            print(f"?? Warning: Could not delete folder structure for {network.display_name}")
+
+                    except Exception as folder_error:
+
+                        print(f"?? Warning: Error deleting folder structure for {network.display_name}: {folder_error}")
+
+                        # Don't fail the customer removal if folder deletion fails
+
+                    
+
+                    # Mark customer as deleted in database
+
+                    network.is_deleted = True
+
+                    network.save()
+
+                    
+
+                    # If this was the selected customer, clear session
+
+                    if request.session.get('selected_customer_id') == network.id:
+
+                        if 'selected_customer_id' in request.session:
+
+                            del request.session['selected_customer_id']
+
+                        if 'selected_customer_name' in request.session:
+
+                            del request.session['selected_customer_name']
+
+                    
+
+                    removed_count += 1
+
+                # SYNC WITH EXCEL TRACKER - Remove all networks for customer
+                try:
+                    remove_customer_from_excel_tracker(customer_name)
+                except Exception as excel_error:
+                    print(f"⚠️ Warning: Could not sync customer removal with Excel: {excel_error}")
+
+                
+
+                return JsonResponse({
+
+                    'status': 'success',
+
+                    'message': f'Customer "{customer_name}" and all {removed_count} associated networks have been removed successfully.'
+
+                })
+
+            except Customer.DoesNotExist:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': 'Network not found.'
+
+                })
+
+            except Exception as e:
+
+                return JsonResponse({
+
+                    'status': 'error',
+
+                    'message': f'Error removing network: {str(e)}'
+
+                })
+
+        
+
+        # Handle customer selection (main form submission)
+
+        elif 'select_customer' in request.POST:
+
+            customer_id = request.POST.get('customer')
+
+            network_id = request.POST.get('network')
+
+            
+
+            if not customer_id:
+                messages.error(request, 'Please select a customer.')
+                return redirect('customer_selection')
+            
+            # Handle Excel customers
+            if EXCEL_INTEGRATION_AVAILABLE and customer_id.startswith('excel_'):
+                try:
+                    # Handle Excel customer selection
+                    customer_name = customer_id.replace('excel_', '').replace('_', ' ').title()
+                    
+                    # Store Excel customer information in session
+                    request.session['selected_customer_id'] = customer_id
+                    request.session['selected_customer_name'] = customer_name
+                    request.session['selected_customer_source'] = 'excel'
+                    
+                    if network_id and network_id.startswith('excel_network_'):
+                        # Get network details from Excel integration
+                        networks, _ = get_customer_networks_unified(customer_id)
+                        network_index = int(network_id.replace('excel_network_', ''))
+                        
+                        if 0 <= network_index < len(networks):
+                            selected_network = networks[network_index]
+                            network_name = selected_network.get('network_type', 'HealthCheck')
+                            request.session['selected_network_info'] = {
+                                'filename': selected_network.get('filename', ''),
+                                'file_path': selected_network.get('file_path', ''),
+                                'network_type': network_name,
+                                'network_name': network_name,  # Store network name for display
+                                'source': 'excel'
+                            }
+                            # Update customer name to include network
+                            request.session['selected_customer_name'] = f"{customer_name} {network_name}"
+                    
+                    # Redirect to normal dashboard for Excel customers
+                    return redirect('dashboard')
+                    
+                except Exception as e:
+                    messages.error(request, f'Error selecting Excel customer: {str(e)}')
+                    return redirect('customer_selection')
+            
+            # Handle database customers (existing logic)
+            try:
+
+                # If network_id is provided and not empty, use that specific network
+
+                if network_id and network_id.strip():
+
+                    customer = Customer.objects.get(id=network_id, is_deleted=False)
+
+                else:
+
+                    # Use the selected customer - find first network for this customer
+
+                    first_customer = Customer.objects.get(id=customer_id, is_deleted=False)
+
+                    # Get all networks for this customer name
+
+                    customer_networks = Customer.objects.filter(name=first_customer.name, is_deleted=False)
+
+                    if customer_networks.count() == 1:
+
+                        # Single network, use it
+
+                        customer = customer_networks.first()
+
+                    elif customer_networks.count() > 1:
+
+                        # Multiple networks, need to select specific one via network dropdown
+
+                        if not network_id:
+
+                            messages.error(request, f'Customer "{first_customer.name}" has multiple networks. Please select a specific network.')
+
+                            return redirect('customer_selection')
+
+                        customer = Customer.objects.get(id=network_id, is_deleted=False)
+
+                    else:
+
+                        # No networks found (shouldn't happen), but use the found customer
+
+                        customer = first_customer
+
+                
+
+                request.session['selected_customer_id'] = customer.id
+                request.session['selected_customer_name'] = customer.display_name
+                request.session['selected_customer_source'] = 'database'
+                return redirect('dashboard')
+
+                
+
+            except Customer.DoesNotExist:
+
+                messages.error(request, 'Selected customer/network not found.')
+
+                return redirect('customer_selection')
+
+            except Exception as e:
+
+                messages.error(request, f'Error selecting customer/network: {str(e)}')
+
+                return redirect('customer_selection')
+
+        
+
+        # Handle customer-network selection
+
+        elif 'select_customer_network' in request.POST:
+
+            customer_name = request.POST.get('customer_name')
+
+            network_id = request.POST.get('network_id')
+
+            
+
+            if not customer_name:
+
+                messages.error(request, 'Please select a customer.')
+
+                return redirect('customer_selection')
+
+            
+
+            try:
+
+                # If network_id is provided and not "no_networks", use that specific network
+
+                if network_id and network_id != 'no_networks':
+
+                    customer = Customer.objects.get(id=network_id, is_deleted=False)
+
+                elif network_id == 'no_networks':
+
+                    # Customer has no networks, get first or create default
+
+                    networks = Customer.objects.filter(name=customer_name, is_deleted=False)
+
+                    if networks.exists():
+
+                        customer = networks.first()
+
+                    else:
+
+                        # Create a default network for this customer
+
+                        customer = Customer.objects.create(
+
+                            name=customer_name,
+
+                            network_name=None,
+
+                            network_type='Telecom'
+
+                        )
+
+                else:
+
+                    # Get the single network for this customer
+
+                    networks = Customer.objects.filter(name=customer_name, is_deleted=False)
+
+                    if networks.count() == 1:
+
+                        customer = networks.first()
+
+                    else:
+
+                        messages.error(request, 'Please select a specific network.')
+
+                        return redirect('customer_selection')
+
+                
+
+                request.session['selected_customer_id'] = customer.id
+
+                request.session['selected_customer_name'] = customer.display_name
+
+                return redirect('dashboard')
+
+                
+
+            except Customer.DoesNotExist:
+
+                messages.error(request, 'Selected customer/network not found.')
+
+                return redirect('customer_selection')
+
+        
+
+        # Handle new customer/network creation
+
+        elif 'add_customer_network' in request.POST:
+
+            customer_name = request.POST.get('customer_name')
+
+            network_name = request.POST.get('network_name', '')
+
+            network_type = request.POST.get('network_type', 'Telecom')
+
+            
+
+            if not customer_name:
+
+                messages.error(request, 'Customer name is required.')
+
+                return redirect('customer_selection')
+
+            
+
+            try:
+
+                # Check if this customer-network combination already exists
+
+                existing = Customer.objects.filter(
+
+                    name=customer_name,
+
+                    network_name=network_name,
+
+                    is_deleted=False
+
+                ).first()
+
+                
+
+                if existing:
+
+                    messages.warning(request, f'Customer/Network "{existing.display_name}" already exists.')
+
+                    request.session['selected_customer_id'] = existing.id
+
+                    request.session['selected_customer_name'] = existing.display_name
+
+                    return redirect('dashboard')
+
+                
+
+                # Create new customer-network
+
+                new_customer = Customer.objects.create(
+
+                    name=customer_name,
+
+                    network_name=network_name if network_name else None,
+
+                    network_type=network_type
+
+                )
+
+                
+
+                # ?? AUTO-CREATE CUSTOMER FOLDER STRUCTURE
+
+                try:
+
+                    create_customer_folder_structure(new_customer)
+
+                    print(f"? Created folder structure for customer: {new_customer.display_name}")
+
+                except Exception as e:
+                    print(f"?? Warning: Could not create folder structure for {new_customer.display_name}: {e}")
+                
+                # UPDATE EXCEL FILE WITH NEW CUSTOMER
+                try:
+                    update_excel_tracker_with_new_customer(new_customer)
+                    print(f"Excel Updated: {new_customer.display_name}")
+                except:
+                    print(f"Excel Update Failed: {new_customer.display_name}")
+                
+                request.session['selected_customer_id'] = new_customer.id
+                
+
+                request.session['selected_customer_id'] = new_customer.id
+
+                request.session['selected_customer_name'] = new_customer.display_name
+
+                
+
+                return redirect('dashboard')
+
+                
+
+            except Exception as e:
+
+                messages.error(request, f'Error creating customer/network: {str(e)}')
+
+                return redirect('customer_selection')
+
+    
+
+    # Get customers grouped by name with their networks
+
+    customers_with_networks = Customer.get_customers_with_networks()
+
+    total_networks = sum(len(networks) for networks in customers_with_networks.values())
+
+    
+
+    # Get customer statistics for the sidebar
+
+    customer_stats = get_customer_statistics()
+
+    
+
+    # Create forms for the template
+
+    from ..forms import CustomerSelectionForm, CustomerCreationForm
+
+    
+
+    selection_form = CustomerSelectionForm()
+
+    customer_form = CustomerCreationForm()
+
+    
+
+    return render(request, 'customer_selection.html', {
+
+        'customers_with_networks': customers_with_networks,
+
+        'total_networks': total_networks,
+
+        'selection_form': selection_form,
+
+        'customer_form': customer_form,
+
+        'customer_statistics': customer_stats
+
+    })
+
+
+def get_networks_for_customer(request, customer_name):
+
+    """API endpoint to get networks for a specific customer - NO LOGIN REQUIRED for AJAX"""
+
+    try:
+
+        # Get all networks for the given customer name
+
+        networks = Customer.get_networks_for_customer(customer_name)
+
+        
+
+        network_list = []
+
+        for network in networks:
+
+            network_list.append({
+
+                'id': network.id,
+
+                'network_name': network.network_name or 'Default Network',
+
+                'display_name': network.display_name,
+
+                'network_type': network.network_type,
+
+                'setup_status': network.setup_status
+
+            })
+
+        
+
+        return JsonResponse({
+
+            'status': 'success',
+
+            'customer_name': customer_name,
+
+            'networks': network_list,
+
+            'count': len(network_list)
+
+        })
+
+        
+
+    except Exception as e:
+
+        return JsonResponse({
+
+            'status': 'error',
+
+            'message': f'Error fetching networks: {str(e)}'
+
+        })
+
+
+# === Network Setup Views (For NEW networks) ===
+
+@login_required
+
+def setup_new_network(request, customer_id):
+
+    """Setup new network with required files per MOP"""
+
+    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
+    
+    print(f"🔍 DEBUG: Customer {customer.name} status: {customer.setup_status}")
+    # Don't redirect immediately - allow file processing regardless of status
+    # This allows customers to upload files even if status is not 'NEW'
+    if customer.setup_status != 'NEW' and request.method == 'GET':
+        messages.info(request, f"Network {customer.name} is already set up. You can still upload files to update the configuration.")
+
+    
+
+    if request.method == 'POST':
+        print(f"🔍 DEBUG: POST request received for customer {customer.name}")
+        print(f"🔍 DEBUG: FILES in request: {list(request.FILES.keys())}")
+        form = HealthCheckNewNetworkForm(request.POST, request.FILES)
+        print(f"🔍 DEBUG: Form is_valid: {form.is_valid()}")
+        if not form.is_valid():
+            print(f"🚫 DEBUG: Form errors: {form.errors}")
+        if form.is_valid():
+            # Create setup session
+            session = HealthCheckSession.objects.create(
+                customer=customer,
+                session_id=str(uuid.uuid4()),
+                session_type='NEW_NETWORK_SETUP',
+                initiated_by=request.user,
+                files_expected=5
+            )
+            
+            # Process setup files
+            setup_result = setup_network_files(customer, form.cleaned_data, session)
+            
+            if setup_result['success']:
+                # Mark customer as ready
+                customer.setup_status = 'READY'
+                customer.save()
+                
+                # SYNC WITH EXCEL TRACKER - Add new customer
+                try:
+                    update_excel_tracker_with_new_customer(customer)
+                except Exception as excel_error:
+                    print(f"⚠️ Warning: Could not sync new customer with Excel: {excel_error}")
+                
+                # ✅ NEW: RUN INITIAL PROCESSING WITH UPLOADED FILES
+                try:
+                    print(f"🚀 DEBUG: Starting initial processing for new network {customer.name}")
+                    # Run processing in background to avoid timeout
+                    import threading
+                    def run_initial_processing():
+                        try:
+                            process_health_check_files_enhanced(session.id)
+                        except Exception as e:
+                            print(f"❌ DEBUG: Initial processing failed: {str(e)}")
+                            session.update_status('FAILED', f'Initial processing failed: {str(e)}')
+                    
+                    # Start background processing
+                    processing_thread = threading.Thread(target=run_initial_processing)
+                    processing_thread.daemon = True
+                    processing_thread.start()
+                    
+                    session.update_status('PROCESSING', 'Network setup completed, initial processing started')
+                    messages.success(request, f"Network {customer.name} has been set up and initial processing started!")
+                    print(f"✅ DEBUG: Background processing started for session {session.session_id}")
+                    
+                except Exception as processing_error:
+                    print(f"❌ DEBUG: Failed to start processing: {str(processing_error)}")
+                    session.update_status('COMPLETED', 'Network setup completed successfully')
+                    messages.success(request, f"Network {customer.name} has been set up successfully!")
+                
+                return redirect('dashboard')
+            else:
+                session.update_status('FAILED', f"Setup failed: {setup_result['error']}")
+                messages.error(request, f"Setup failed: {setup_result['error']}")
+    else:
+        form = HealthCheckNewNetworkForm()
+    
+    return render(request, 'health_check/setup_new_network.html', {
+        'form': form,
+        'customer': customer
+    })
+
+
+def setup_network_files(customer, form_data, session):
+    """Setup network files according to MOP requirements"""
+    try:
+        network_name = customer.name
+        print(f"📁 DEBUG: Starting file setup for network: {network_name}")
+        print(f"📁 DEBUG: Form data keys: {list(form_data.keys())}")
+        
+        # File mappings from form to expected script files
+        file_setup = {
+            'hc_tracker_file': f"{network_name}_HC_Issues_Tracker.xlsx",
+            'global_ignore_txt': f"{network_name}_ignored_test_cases.txt", 
+            'selective_ignore_xlsx': f"{network_name}_ignored_test_cases.xlsx",
+            'tec_report_file': f"{network_name}_Reports_{datetime.now().strftime('%Y%m%d')}.xlsx",
+            'inventory_csv': f"{network_name}_remote_inventory.csv"
+        }
+        
+        # Save files to Script directory with proper naming
+        files_processed = 0
+        for form_field, target_filename in file_setup.items():
+            print(f"🔍 DEBUG: Checking field: {form_field}")
+            if form_field in form_data and form_data[form_field]:
+                uploaded_file = form_data[form_field]
+                print(f"✅ DEBUG: Processing file: {uploaded_file.name} -> {target_filename}")
+                files_processed += 1
+                
+                # Save to Script directory with network-specific naming
+                target_path = SCRIPT_DIR / target_filename
+                
+                # Script-root trackers are rewritten in place by main.py, so never hardlink them
+                stored = store_uploaded_file(uploaded_file, target_path, allow_hardlink=False)
+                
+                # Create HealthCheckFile record
+                HealthCheckFile.objects.create(
+                    customer=customer,
+                    session=session,
+                    file_type=form_field.upper().replace('_FILE', ''),
+                    original_filename=uploaded_file.name,
+                    stored_filename=target_filename,
+                    file_path=str(target_path),
+                    file_size=stored['size'],
+                    sha256=stored['sha256']
+                )
+        
+        print(f"🎉 DEBUG: Successfully processed {files_processed} files out of 5 expected")
+        return {'success': True}
+        
+    except Exception as e:
+        print(f"❌ DEBUG: Error in setup_network_files: {str(e)}")
+        return {'success': False, 'error': str(e)}
+
+
+@login_required
+
+def get_customer_networks(request, customer_id):
+
+    """API endpoint to get networks for a specific customer"""
+
+    try:
+
+        # Get all networks for this customer
+
+        networks = Customer.get_networks_for_customer_by_id(customer_id)
+
+        
+
+        networks_data = []
+
+        for network in networks:
+
+            networks_data.append({
+
+                'id': network.id,
+
+                'name': network.network_name or network.name,
+
+                'network_type': network.network_type,
+
+                'full_name': network.display_name
+
+            })
+
+        
+
+        return JsonResponse({
+
+            'status': 'success',
+
+            'networks': networks_data
+
+        })
+
+        
+
+    except Exception as e:
+
+        return JsonResponse({
+
+            'status': 'error',
+
+            'message': str(e)
+
+        })
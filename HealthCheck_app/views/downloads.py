@@ -0,0 +1,259 @@
+"""
+File download views
+Trackers, reports, inventory and host files, and a ZIP of all outputs of a session.
+"""
+
+import glob
+from pathlib import Path
+
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.http import HttpResponse
+from django.contrib.auth.decorators import login_required
+
+from ..models import Customer, HealthCheckSession, HealthCheckFile
+from ..file_downloads import cached_download_path, iter_zip, serve_file
+from .common import CUSTOMER_FILES_DIR, SCRIPT_DIR, SCRIPT_OUTPUT_DIR
+from .dashboard_api import streaming_download
+
+
+# === File Download Views ===
+
+DOWNLOAD_SUBDIRS = ['generated_trackers', 'tec_reports', 'old_trackers', 'inventory_files', 'host_files']
+
+
+def download_error(message, status):
+    # Plain-text errors instead of HTML redirects, so download links show what went wrong
+    return HttpResponse(message, status=status, content_type='text/plain')
+
+
+def customer_search_directories(customer_dir):
+    """Network-specific directories of a customer folder first, then the customer folder itself"""
+    search_directories = []
+    if customer_dir.exists():
+        for network_dir in customer_dir.iterdir():
+            if network_dir.is_dir() and network_dir.name.lower() not in ['readme.txt', '.gitkeep']:
+                search_directories.append(network_dir)
+    search_directories.append(customer_dir)
+    return search_directories
+
+
+def find_customer_file(customer, filename, subdirs):
+    """(path, download name) of a customer's file: the stored database path first, then the customer folders"""
+    file_obj = HealthCheckFile.objects.filter(
+        customer=customer,
+        stored_filename=filename
+    ).order_by('-uploaded_at').first()  # Get the most recent file
+    if file_obj and file_obj.file_path and Path(file_obj.file_path).exists():
+        return Path(file_obj.file_path), file_obj.original_filename or filename
+
+    customer_dir = CUSTOMER_FILES_DIR / customer.name.replace(" ", "_").replace("/", "_")
+    for search_dir in customer_search_directories(customer_dir):
+        for subdir in subdirs:
+            file_path = search_dir / subdir / filename
+            if file_path.exists():
+                return file_path, filename
+    return None
+
+
+def find_tracker_download(filename, selected_customer_id):
+    """(path, download name) of a file requested by name, searching the selected customer before everything else"""
+    if selected_customer_id:
+        customer = Customer.objects.filter(id=selected_customer_id).first()
+        if customer:
+            found = find_customer_file(customer, filename, DOWNLOAD_SUBDIRS)
+            if found:
+                return found
+        else:
+            print(f"?? Customer not found for ID: {selected_customer_id}")
+    else:
+        # No customer selected: the most recent stored file of that name
+        file_obj = HealthCheckFile.objects.filter(stored_filename=filename).order_by('-uploaded_at').first()
+        if file_obj and file_obj.file_path and Path(file_obj.file_path).exists():
+            return Path(file_obj.file_path), file_obj.original_filename or filename
+
+    # Also check Script output directory as fallback
+    file_path = SCRIPT_DIR / "output" / filename
+    if file_path.exists():
+        return file_path, filename
+
+    # Final comprehensive fallback: Search all customers for the file
+    if CUSTOMER_FILES_DIR.exists():
+        for customer_dir in CUSTOMER_FILES_DIR.iterdir():
+            if not customer_dir.is_dir():
+                continue
+            for search_dir in customer_search_directories(customer_dir):
+                for subdir in DOWNLOAD_SUBDIRS:
+                    file_path = search_dir / subdir / filename
+                    if file_path.exists():
+                        print(f"? Found file in comprehensive search: {file_path}")
+                        return file_path, filename
+    return None
+
+
+def download_tracker_file(request):
+    """
+    Download a generated tracker by session_id, or any customer file by filename.
+    Resolved paths are cached and the transfer goes through serve_file (sendfile, Range, conditional).
+    """
+    # Check authentication manually to avoid HTML redirect
+    if not request.user.is_authenticated:
+        return download_error("Authentication required. Please log in to download files.", 401)
+
+    session_id = request.GET.get('session_id')
+    filename = request.GET.get('filename')
+
+    try:
+        # Method 1: Download by session_id
+        if session_id:
+            def resolve_session_tracker():
+                session = HealthCheckSession.objects.get(session_id=session_id)
+                if session.output_tracker_path and Path(session.output_tracker_path).exists():
+                    return session.output_tracker_path, session.output_tracker_filename
+                return None
+
+            try:
+                resolved = cached_download_path(('session', session_id), resolve_session_tracker)
+            except HealthCheckSession.DoesNotExist:
+                return download_error(f"Session {session_id} not found", 404)
+            if resolved is None:
+                return download_error(f"Tracker file not found for session {session_id}", 404)
+            return serve_file(request, *resolved)
+
+        # Method 2: Download by filename (for customer files)
+        if filename:
+            selected_customer_id = request.session.get('selected_customer_id')
+            resolved = cached_download_path(
+                ('file', selected_customer_id, filename),
+                lambda: find_tracker_download(filename, selected_customer_id),
+            )
+            if resolved is None:
+                return download_error(f"File '{filename}' not found", 404)
+            return serve_file(request, *resolved)
+
+    except Exception as e:
+        print(f"? Exception in download_tracker_file: {str(e)}")
+        return download_error(f"Error downloading file: {str(e)}", 500)
+
+    return download_error("No file specified for download", 400)
+
+
+def download_report_file(request):
+    """Download TEC report files from tec_reports folder"""
+    return download_file_by_type(request, 'TEC', 'tec_reports')
+
+
+def download_inventory_file(request):
+    """Download inventory files from inventory_files folder"""
+    return download_file_by_type(request, 'INVENTORY', 'inventory_files')
+
+
+def download_host_file(request):
+    """Download host files from host_files folder"""
+    return download_file_by_type(request, 'HOST', 'host_files')
+
+
+def download_file_by_type(request, file_type, folder_name):
+    """Generic download of the selected customer's files of one type, searching network folders first"""
+    if not request.user.is_authenticated:
+        return download_error("Authentication required. Please log in to download files.", 401)
+
+    filename = request.GET.get('filename')
+    if not filename:
+        return download_error("No filename specified for download", 400)
+
+    selected_customer_id = request.session.get('selected_customer_id')
+    if not selected_customer_id:
+        return download_error("No customer selected", 400)
+
+    try:
+        def resolve_customer_file():
+            customer = Customer.objects.get(id=selected_customer_id)
+            return find_customer_file(customer, filename, [folder_name])
+
+        try:
+            resolved = cached_download_path((folder_name, selected_customer_id, filename), resolve_customer_file)
+        except Customer.DoesNotExist:
+            return download_error("Customer not found", 404)
+        if resolved is None:
+            print(f"  ? {file_type} file not found in any customer directories")
+            return download_error(f"File '{filename}' not found in {folder_name} folder", 404)
+        return serve_file(request, *resolved)
+
+    except Exception as e:
+        print(f"? Error in download_file_by_type: {str(e)}")
+        return download_error(f"Error downloading file: {str(e)}", 500)
+
+
+# Script outputs of a run besides the tracker; {network} is the tracker's name prefix
+SESSION_OUTPUT_PATTERNS = [
+    '{network}_HC_Issues_Tracker_*.xlsx',  # Dated copy of the tracker
+    '{network}_OPEN cases for TAC_*.xlsx',
+    'New cases found in_{network}_*.xlsx',
+    'Closed in_{network}_*.xlsx',
+]
+
+# Filesystem timestamps vs. database timestamps (coarse mtime resolution, clock rounding)
+SESSION_OUTPUT_MTIME_SLACK = 2
+
+
+def session_run_window(session):
+    """
+    (start, end) timestamps between which a session may have written outputs. A run still in
+    progress is open-ended; a failed run never recorded when it stopped and gives None.
+    """
+    start = session.created_at.timestamp() - SESSION_OUTPUT_MTIME_SLACK
+    if session.completed_at:
+        return start, session.completed_at.timestamp() + SESSION_OUTPUT_MTIME_SLACK
+    if session.status == 'FAILED':
+        return None
+    return start, float('inf')
+
+
+def session_output_files(session):
+    """
+    (path, name in archive) of the tracker of a session and the reports the script wrote with it.
+    The script's report names carry a date but no session, so a report belongs to a completed session
+    when it was written during the run; reports written while another run of the network was also
+    in progress cannot be attributed and are left out.
+    """
+    files = []
+    if session.output_tracker_path and Path(session.output_tracker_path).is_file():
+        files.append((Path(session.output_tracker_path), session.output_tracker_filename or Path(session.output_tracker_path).name))
+    if not session.output_tracker_filename or not session.completed_at or not SCRIPT_OUTPUT_DIR.exists():
+        return files
+
+    network = session.output_tracker_filename.split('_HC_Issues_Tracker')[0]
+    start, end = session_run_window(session)
+    overlapping_runs = HealthCheckSession.objects.filter(
+        Q(customer_id=session.customer_id) | Q(output_tracker_filename__startswith=f'{network}_HC_Issues_Tracker'),
+        created_at__lte=session.completed_at,
+    ).exclude(pk=session.pk).exclude(completed_at__lt=session.created_at)
+    other_windows = [window for window in map(session_run_window, overlapping_runs) if window]
+
+    def written_by_session(mtime):
+        return start <= mtime <= end and not any(other_start <= mtime <= other_end for other_start, other_end in other_windows)
+
+    for pattern in SESSION_OUTPUT_PATTERNS:
+        candidates = []
+        for path in SCRIPT_OUTPUT_DIR.glob(pattern.format(network=glob.escape(network))):
+            if path.is_file():
+                mtime = path.stat().st_mtime
+                if written_by_session(mtime):
+                    candidates.append((mtime, path))
+        if candidates:
+            newest = max(candidates)[1]
+            files.append((newest, newest.name))
+    return files
+
+
+@login_required
+def download_session_bundle(request, session_id):
+    """All outputs of a session as one ZIP, streamed while it is built (xlsx entries are stored, not deflated)"""
+    session = get_object_or_404(HealthCheckSession, session_id=session_id)
+    files = session_output_files(session)
+    if not files:
+        return download_error(f"No output files found for session {session_id}", 404)
+
+    network = (session.output_tracker_filename or session_id).split('_HC_Issues_Tracker')[0]
+    return streaming_download(iter_zip(files), 'application/zip', f'{network}_outputs_{session_id}.zip')
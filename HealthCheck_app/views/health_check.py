@@ -0,0 +1,2301 @@
+"""
+Health check runs
+Upload of the run files, execution of the MOP script, its outputs, progress and results.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+from django.utils import timezone
+from django.shortcuts import render, redirect, get_object_or_404
+from django.http import JsonResponse, StreamingHttpResponse
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.core.cache import cache
+from asgiref.sync import sync_to_async
+
+from ..models import Customer, HealthCheckSession, HealthCheckFile
+from ..forms import HealthCheckNewNetworkForm, HealthCheckExistingNetworkForm
+from ..file_utils import store_uploaded_file, link_or_copy_file, clear_directory_files
+from ..report_preflight import preflight_validate_report, report_file_fields
+from ..session_progress import progress_key, publish_progress, stream_progress
+from .common import SCRIPT_DIR, SCRIPT_INPUT_DIR, SCRIPT_OUTPUT_DIR
+from .validation import validate_customer_technology_match, validate_file_type_match
+from .customer_files import get_customer_file_path
+
+
+# === Health Check Dashboard and Main Views ===
+
+@login_required
+
+def health_check_dashboard(request):
+
+    """Main dashboard view based on MOP workflow"""
+
+    # Check if customer is selected
+
+    if 'selected_customer_id' not in request.session:
+
+        return redirect('customer_selection')
+
+    # Handle POST requests (file uploads)
+    if request.method == 'POST':
+        selected_customer_id = request.session.get('selected_customer_id')
+        try:
+            customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
+            return health_check_upload(request, customer.id)
+        except (Customer.DoesNotExist, ValueError):
+            messages.error(request, 'Customer not found.')
+            return redirect('customer_selection')
+
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+    selected_customer_source = request.session.get('selected_customer_source', 'database')
+    selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
+    
+    # Handle Excel vs Database customers differently
+    if selected_customer_source == 'excel' or (selected_customer_id and str(selected_customer_id).startswith('excel_')):
+        # Excel customer - create a mock customer object for template
+        selected_network_info = request.session.get('selected_network_info', {})
+        
+        class MockCustomer:
+            def __init__(self, name, customer_id, network_info):
+                # Extract customer name and network name if combined
+                if network_info.get('network_name'):
+                    # Split customer name to get base customer name
+                    name_parts = name.split()
+                    if len(name_parts) > 1:
+                        self.name = ' '.join(name_parts[:-1])  # Everything except last part
+                        self.network_name = name_parts[-1]  # Last part as network
+                    else:
+                        self.name = name
+                        self.network_name = network_info.get('network_name')
+                else:
+                    self.name = name
+                    self.network_name = None
+                    
+                self.display_name = name  # Keep full name for display
+                self.id = customer_id
+                self.network_type = network_info.get('network_type', 'Excel')
+                self.setup_status = 'NEW'  # Excel customers get 5-file form as new networks
+        
+        customer = MockCustomer(selected_customer_name, selected_customer_id, selected_network_info)
+        recent_sessions = []  # Excel customers don't have database sessions
+        
+    else:
+        # Database customer - verify it exists
+        try:
+            customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
+        except (Customer.DoesNotExist, ValueError):
+            # Customer was deleted or invalid ID, redirect to selection
+            if 'selected_customer_id' in request.session:
+                del request.session['selected_customer_id']
+            if 'selected_customer_name' in request.session:
+                del request.session['selected_customer_name']
+            if 'selected_customer_source' in request.session:
+                del request.session['selected_customer_source']
+            messages.error(request, "Selected network no longer exists.")
+            return redirect('customer_selection')
+        
+        # Get recent sessions for database customers
+        recent_sessions = HealthCheckSession.objects.filter(
+            customer=customer
+        ).order_by('-created_at')[:5]
+
+    
+
+    # Check for success message from health check processing
+
+    hc_success_message = request.session.pop('hc_success_message', None)
+
+    hc_success_safe = request.session.pop('hc_success_safe', False)
+
+    
+
+    if hc_success_message:
+
+        if hc_success_safe:
+
+            messages.success(request, hc_success_message, extra_tags='safe')
+
+        else:
+
+            messages.success(request, hc_success_message)
+
+    
+
+    return render(request, 'dashboard.html', {
+
+        'selected_customer': customer,
+
+        'recent_sessions': recent_sessions
+
+    })
+
+
+@login_required
+
+def health_check_upload(request, customer_id):
+
+    """Health check file upload view based on MOP requirements"""
+
+    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
+
+    
+
+    # Determine form type based on customer setup status
+
+    if customer.setup_status == 'NEW':
+
+        form_class = HealthCheckNewNetworkForm
+
+        template_name = 'health_check/upload_new_network.html'
+
+        files_expected = 5
+
+        session_type = 'NEW_NETWORK_SETUP'
+
+    else:
+
+        form_class = HealthCheckExistingNetworkForm
+
+        template_name = 'health_check/upload_existing_network.html'
+
+        files_expected = 2
+
+        session_type = 'REGULAR_PROCESSING'
+
+        
+
+    if request.method == 'POST':
+
+        form = form_class(request.POST, request.FILES)
+
+        if form.is_valid():
+
+            # Create health check session
+
+            session = HealthCheckSession.objects.create(
+
+                customer=customer,
+
+                session_id=str(uuid.uuid4()),
+
+                session_type=session_type,
+
+                initiated_by=request.user,
+
+                files_expected=files_expected
+
+            )
+
+            
+
+            # Process uploaded files
+
+            files_uploaded = 0
+
+            file_mapping = {
+
+                # New network files
+
+                'hc_tracker_file': 'HC_TRACKER',
+
+                'global_ignore_txt': 'GLOBAL_IGNORE_TXT',
+
+                'selective_ignore_xlsx': 'SELECTIVE_IGNORE_XLSX',
+
+                # Regular processing files
+
+                'tec_report_file': 'TEC_REPORT',
+
+                'inventory_csv': 'INVENTORY_CSV'
+
+            }
+
+            
+
+            # Ensure directories exist
+
+            os.makedirs(SCRIPT_INPUT_DIR, exist_ok=True)
+
+            os.makedirs(SCRIPT_DIR, exist_ok=True)
+
+            
+
+            # Clear input directory completely before uploading new files (for any customer)
+
+            cleared_count = clear_directory_files(SCRIPT_INPUT_DIR)
+
+            if cleared_count:
+
+                print(f"??? Cleared {cleared_count} old file(s) from input")
+
+            
+
+            for field_name, file_type in file_mapping.items():
+
+                if field_name in request.FILES:
+
+                    file = request.FILES[field_name]
+
+                    
+
+                    # ===== STRICT FILE VALIDATION BEFORE PROCESSING =====
+
+                    # Validate file type based on filename patterns
+
+                    report_metadata = None
+
+                    if field_name == 'tec_report_file':
+
+                        validation_result = validate_file_type_match(file.name, 'REPORT')
+
+                        if not validation_result['valid']:
+
+                            messages.error(request, f"? Report Upload Error: {validation_result['error']}")
+
+                            return redirect('dashboard')
+
+                        
+
+                        # Pre-flight the workbook structure before it can take a processing worker
+
+                        preflight = preflight_validate_report(file, file.name)
+
+                        if not preflight['valid']:
+
+                            messages.error(request, f"? Report Pre-flight Error: {preflight['error']}")
+
+                            return redirect('dashboard')
+
+                        report_metadata = preflight['metadata']
+
+                    elif field_name == 'inventory_csv':
+
+                        validation_result = validate_file_type_match(file.name, 'INVENTORY')
+
+                        if not validation_result['valid']:
+
+                            messages.error(request, f"? Inventory Upload Error: {validation_result['error']}")
+
+                            return redirect('dashboard')
+
+                    elif field_name == 'hc_tracker_file':
+
+                        validation_result = validate_file_type_match(file.name, 'TRACKER')
+
+                        if not validation_result['valid']:
+
+                            messages.error(request, f"? Tracker Upload Error: {validation_result['error']}")
+
+                            return redirect('dashboard')
+
+                    elif field_name in ['global_ignore_txt', 'selective_ignore_xlsx']:
+
+                        validation_result = validate_file_type_match(file.name, 'IGNORE')
+
+                        if not validation_result['valid']:
+
+                            messages.error(request, f"? Ignore File Upload Error: {validation_result['error']}")
+
+                            return redirect('dashboard')
+
+                    
+
+                    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
+
+                    customer_validation = validate_customer_technology_match(customer.name, file.name)
+
+                    if not customer_validation['valid']:
+
+                        messages.error(request, f"? Customer Validation Error: {customer_validation['error']}")
+
+                        return redirect('dashboard')
+
+                    
+
+                    # ROUTE FILES TO CORRECT DIRECTORIES - FIXED TO USE CUSTOMER DIRECTORIES
+
+                    if field_name in ['tec_report_file', 'inventory_csv']:
+
+                        # TEC Report and CSV go to CUSTOMER directories AND input-hc-report for processing
+
+                        stored_filename = file.name
+
+                        
+
+                        # Determine customer folder type
+
+                        if field_name == 'tec_report_file':
+
+                            customer_file_path = get_customer_file_path(customer, 'TEC', file.name)
+
+                        else:  # inventory_csv
+
+                            customer_file_path = get_customer_file_path(customer, 'INVENTORY', file.name)
+
+                        
+
+                        # Also save to processing directory (input-hc-report)
+
+                        file_path = SCRIPT_INPUT_DIR / file.name
+
+                            
+
+                    else:
+
+                        # HC Tracker and ignore files go to Script root with network name
+
+                        if field_name == 'hc_tracker_file':
+
+                            stored_filename = f"{customer.name}_HC_Issues_Tracker.xlsx"
+
+                        elif field_name == 'global_ignore_txt':
+
+                            stored_filename = f"{customer.name}_ignored_test_cases.txt"
+
+                        elif field_name == 'selective_ignore_xlsx':
+
+                            stored_filename = f"{customer.name}_ignored_test_cases.xlsx"
+
+                        else:
+
+                            stored_filename = file.name
+
+                        
+
+                        file_path = SCRIPT_DIR / stored_filename
+
+                        customer_file_path = get_customer_file_path(customer, 'OLD_TRACKER', stored_filename)
+
+                    
+
+                    # ?? FIRST: Clear existing files of this type BEFORE saving new ones
+
+                    # ENABLED for TEC_REPORT only (allow multiple INVENTORY_CSV files)
+
+                    if file_type in ['TEC_REPORT']:
+
+                        deleted_count = clear_existing_customer_files(customer, file_type)
+
+                        if deleted_count > 0:
+
+                            print(f"? Cleared {deleted_count} old {file_type} file(s) for customer: {customer.name}")
+
+                    
+
+                    # Write the upload ONCE into the customer folder (for downloads), then place it
+
+                    # in the Script location (for processing) by hardlink/reflink instead of a second write.
+
+                    # Trackers are rewritten in place by main.py, so they must never share an inode.
+
+                    stored = store_uploaded_file(file, customer_file_path)
+
+                    link_method = link_or_copy_file(
+
+                        customer_file_path, file_path,
+
+                        allow_hardlink=field_name in ['tec_report_file', 'inventory_csv']
+
+                    )
+
+                    print(f"? Saved {file.name} ? {customer_file_path}")
+
+                    print(f"?? Placed in script location via {link_method} ? {file_path}")
+
+
+
+                    hc_file = HealthCheckFile.objects.create(
+
+                        customer=customer,
+
+                        session=session,
+
+                        file_type=file_type,
+
+                        original_filename=file.name,
+
+                        stored_filename=stored_filename,  # Use proper filename
+
+                        file_path=str(customer_file_path),  # Point to customer folder for downloads
+
+                        file_size=stored['size'],
+
+                        sha256=stored['sha256'],
+
+                        **report_file_fields(report_metadata)
+
+                    )
+
+                    
+
+                    files_uploaded += 1
+
+            
+
+            session.files_received = files_uploaded
+
+            session.update_status('UPLOADING', f"{files_uploaded} files uploaded successfully.")
+
+            
+
+            # Start processing (in production, this would be a background task)
+
+            try:
+
+                # Check if this upload includes TEC report files (means we need to run script)
+
+                has_tec_files = any(field in request.FILES for field in ['tec_report_file', 'inventory_csv'])
+
+                
+
+                if has_tec_files:
+
+                    # We have TEC files - ALWAYS run the Python script to generate output
+
+                    if customer.setup_status == 'NEW':
+
+                        customer.setup_status = 'READY'  # Mark as ready since we're setting it up
+
+                        customer.save()
+
+                    
+
+                    # Run the health check script to generate output files
+
+                    try:
+
+                        process_health_check_files_enhanced(session.id)
+
+                        
+
+                        # Get the generated tracker file for download link
+
+                        latest_tracker = HealthCheckFile.objects.filter(
+
+                            customer=customer,
+
+                            file_type='TRACKER_GENERATED'
+
+                        ).order_by('-uploaded_at').first()
+
+                        
+
+                        if latest_tracker:
+
+                            download_url = f"/download/tracker/?filename={latest_tracker.stored_filename}"
+
+                            success_msg = f"<strong>Tracker generated successfully for {customer.name}!</strong><br>" + \
+                                         f"<a href='{download_url}' class='text-blue-600 underline hover:text-blue-800' download>" + \
+                                         f"Download {latest_tracker.stored_filename}</a><br>" + \
+                                         f"Check all files in the history section below."
+
+                            
+
+                            # Store the success message to show in dashboard
+
+                            request.session['hc_success_message'] = success_msg
+
+                            request.session['hc_success_safe'] = True
+
+                            # Don't add message here - it will be added in dashboard view to avoid duplicates
+
+                        else:
+
+                            success_msg = f"? Health check processing completed for {customer.name}! Check the files in the history section below."
+
+                            request.session['hc_success_message'] = success_msg
+
+                            request.session['hc_success_safe'] = False
+
+                            # Don't add message here - it will be added in dashboard view to avoid duplicates
+
+                    except Exception as processing_error:
+
+                        messages.error(request, f"? Processing failed: {str(processing_error)}")
+
+                else:
+
+                    # Only setup files uploaded (no TEC files) - just mark as ready
+
+                    if customer.setup_status == 'NEW':
+
+                        customer.setup_status = 'READY'
+
+                        customer.save()
+
+                    session.update_status('COMPLETED', 'Network setup completed successfully')
+
+                    messages.success(request, f"Network {customer.name} has been set up successfully!")
+
+            except Exception as e:
+
+                session.update_status('FAILED', f"Processing failed: {str(e)}")
+
+                messages.error(request, f"Processing failed: {str(e)}")
+
+            
+
+            # Skip processing page - go directly to dashboard with success message (already set above)
+
+            return redirect('dashboard')
+
+    else:
+
+        form = form_class()
+
+        
+
+    return render(request, template_name, {
+
+        'form': form, 
+
+        'customer': customer,
+
+        'files_expected': files_expected
+
+    })
+
+
+@login_required
+
+def health_check_processing(request, session_id):
+
+    """Health check processing status view"""
+
+    session = get_object_or_404(HealthCheckSession, session_id=session_id)
+
+    
+
+    return render(request, 'health_check/processing.html', {
+
+        'session': session
+
+    })
+
+
+@login_required 
+
+def health_check_results(request, session_id):
+
+    """Health check results view"""
+
+    session = get_object_or_404(HealthCheckSession, session_id=session_id)
+
+    
+
+    return render(request, 'health_check/results.html', {
+
+        'session': session
+
+    })
+
+
+# === File Processing Logic (Based on MOP) ===
+
+def process_health_check_files(session_id):
+
+    """
+
+    Process health check files according to MOP workflow
+
+    This function would interface with the existing Script/main.py
+
+    """
+
+    try:
+
+        session = HealthCheckSession.objects.get(id=session_id)
+
+        session.update_status('PROCESSING', 'Starting health check analysis')
+
+        
+
+        # Step 1: Validate files
+
+        # session.add_log_entry("Validating uploaded files...")
+
+        session.progress_percentage = 10
+
+        session.current_step = "Validating files"
+
+        session.save()
+
+        
+
+        # Get files for this session
+
+        files = HealthCheckFile.objects.filter(session=session)
+
+        
+
+        # Step 2: Prepare script environment
+
+        # session.add_log_entry("Preparing script environment...")
+
+        session.progress_percentage = 20
+
+        session.current_step = "Preparing environment"
+
+        session.save()
+
+        
+
+        # Files are already in the correct location from upload
+
+        # Just validate they exist in input directory
+
+        script_input_dir = SCRIPT_DIR / "input-hc-report"
+
+        input_files = list(script_input_dir.glob("*"))
+
+        
+
+        if len(input_files) != 2:
+
+            raise Exception(f"Expected 2 files in input directory, found {len(input_files)}")
+
+        
+
+        # Step 3: Execute 1830PSS Health Check Script
+
+        # session.add_log_entry("Executing 1830PSS Health Check Script...")
+
+        session.progress_percentage = 40
+
+        session.current_step = "Processing health check data"
+
+        session.save()
+
+        
+
+        # This would execute the main.py script
+
+        script_result = execute_hc_script_enhanced(session)
+
+        
+
+        if script_result['success']:
+
+            # session.add_log_entry("Script execution completed successfully")
+
+            session.progress_percentage = 80
+
+            session.current_step = "Generating output files"
+
+            session.save()
+
+            
+
+            # Step 4: Process outputs
+
+            process_script_outputs(session, script_result)
+
+            session.progress_percentage = 100
+
+            session.current_step = "Processing completed"
+
+            session.save()
+
+            
+
+            session.update_status(
+                'COMPLETED', 'Health check processing completed successfully',
+                total_nodes=parse_script_total_nodes(script_result.get('stdout'))
+            )
+
+        else:
+
+            session.update_status('FAILED', f"Script execution failed: {script_result['error']}")
+
+            
+
+    except Exception as e:
+
+        session.update_status('FAILED', f'Processing failed: {str(e)}')
+
+
+def process_script_outputs(session, script_result):
+
+    """Process outputs from the 1830PSS Health Check Script"""
+
+    try:
+
+        # Look for generated files in Script/output directory
+
+        script_output_dir = SCRIPT_DIR / "output"
+
+        
+
+        if script_output_dir.exists():
+
+            # Find the generated tracker file
+
+            for file_path in script_output_dir.glob("*.xlsx"):
+
+                if "HC_Issues_Tracker" in file_path.name:
+
+                    # Copy to our output directory
+
+                    output_path = SCRIPT_OUTPUT_DIR / file_path.name
+
+                    import shutil
+
+                    shutil.copy2(file_path, output_path)
+
+                    
+
+                    # Update session with output file info
+
+                    session.output_tracker_filename = file_path.name
+
+                    session.output_tracker_path = str(output_path)
+
+                    session.save()
+
+                    
+
+                    # session.add_log_entry(f"Generated tracker: {file_path.name}")
+
+                    
+
+                    break
+
+        
+
+        # Create summary report
+
+        create_summary_report(session)
+
+        
+
+    except Exception as e:
+
+        # session.add_log_entry(f"Error processing outputs: {str(e)}", level='ERROR')
+
+        pass
+
+
+def create_summary_report(session):
+
+    """Create summary report for the health check session"""
+
+    # Health check reports are no longer needed - session status provides sufficient information
+
+    pass
+
+
+@login_required
+async def session_events(request, session_id):
+    """
+    Server-Sent Events with the progress of a session (status, progress, current step, step timings).
+    Replaces polling session_status: the stream reads published snapshots from the cache, not the database.
+    """
+    initial = await cache.aget(progress_key(session_id))
+    if initial is None:
+        session = await HealthCheckSession.objects.filter(session_id=session_id).afirst()
+        if session is None:
+            return JsonResponse({'status': 'error', 'message': 'Session not found'}, status=404)
+        initial = await sync_to_async(publish_progress)(session)
+
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    last_sequence = int(last_event_id) if last_event_id.isdigit() else 0
+    response = StreamingHttpResponse(
+        stream_progress(session_id, initial, last_sequence), content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    # Proxies such as nginx must pass events on as they come
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@login_required
+
+def session_status(request, session_id):
+
+    """Get real-time session status"""
+
+    try:
+
+        session = HealthCheckSession.objects.get(session_id=session_id)
+
+        
+
+        return JsonResponse({
+
+            'status': 'success',
+
+            'session_status': session.status,
+
+            'status_message': session.status_message,
+
+            'progress_percentage': session.progress_percentage,
+
+            'current_step': session.current_step,
+
+            'processing_duration': session.get_processing_duration_str()
+
+        })
+
+        
+
+    except HealthCheckSession.DoesNotExist:
+
+        return JsonResponse({'status': 'error', 'message': 'Session not found'})
+
+
+# === Enhanced Processing Views ===
+
+@login_required
+
+def process_health_check_enhanced(request, customer_id):
+
+    """Enhanced health check processing with full MOP compliance"""
+
+    customer = get_object_or_404(Customer, id=customer_id, is_deleted=False)
+
+    
+
+    if customer.setup_status != 'READY':
+
+        messages.error(request, f"Network {customer.name} must be set up first before processing health checks.")
+
+        return redirect('setup_new_network', customer_id=customer_id)
+
+    
+
+    if request.method == 'POST':
+
+        form = HealthCheckExistingNetworkForm(request.POST, request.FILES)
+
+        if form.is_valid():
+
+            # Validate required files are present
+
+            if not validate_hc_files(request.FILES):
+
+                messages.error(request, "Please upload both TEC Health Check report (.xlsx) and Remote Inventory (.csv) files.")
+
+                return render(request, 'health_check/process_existing_network.html', {
+
+                    'form': form,
+
+                    'customer': customer
+
+                })
+
+            
+
+            # Pre-flight the HC report so a malformed workbook never reaches main.py
+
+            report_metadata = None
+
+            for uploaded in request.FILES.values():
+
+                if uploaded.name.endswith('.xlsx'):
+
+                    preflight = preflight_validate_report(uploaded, uploaded.name)
+
+                    if not preflight['valid']:
+
+                        messages.error(request, f"Report pre-flight check failed: {preflight['error']}")
+
+                        return render(request, 'health_check/process_existing_network.html', {
+
+                            'form': form,
+
+                            'customer': customer
+
+                        })
+
+                    report_metadata = preflight['metadata']
+
+            
+
+            # Create processing session
+
+            session = HealthCheckSession.objects.create(
+
+                customer=customer,
+
+                session_id=str(uuid.uuid4()),
+
+                session_type='REGULAR_PROCESSING',
+
+                initiated_by=request.user,
+
+                files_expected=2
+
+            )
+
+            
+
+            # Save uploaded files
+
+            save_processing_files(customer, request.FILES, session, report_metadata)
+
+            
+
+            # Start processing with better error handling
+
+            try:
+
+                # Run processing in background to avoid timeout
+
+                import threading
+
+                def run_processing():
+
+                    try:
+
+                        process_health_check_files_enhanced(session.id)
+
+                    except Exception as e:
+
+                        session.update_status('FAILED', f'Processing failed: {str(e)}')
+
+                        print(f"Processing error: {str(e)}")
+
+                
+
+                # Start processing thread
+
+                processing_thread = threading.Thread(target=run_processing)
+
+                processing_thread.daemon = True
+
+                processing_thread.start()
+
+                
+
+                # Return immediately with processing message
+
+                messages.info(request, f"?? Health check processing started for {customer.name}! This may take several minutes. You'll see the results on the dashboard when complete.")
+
+                return redirect('dashboard')
+
+                
+
+            except Exception as e:
+
+                session.update_status('FAILED', f"Processing failed: {str(e)}")
+
+                messages.error(request, f"Processing failed: {str(e)}")
+
+    else:
+
+        form = HealthCheckExistingNetworkForm()
+
+    
+
+    return render(request, 'health_check/process_existing_network.html', {
+
+        'form': form,
+
+        'customer': customer
+
+    })
+
+
+def validate_hc_files(uploaded_files):
+
+    """Validate uploaded health check files"""
+
+    has_xlsx = any(f.name.endswith('.xlsx') for f in uploaded_files.values())
+
+    has_csv = any(f.name.endswith('.csv') for f in uploaded_files.values())
+
+    return has_xlsx and has_csv
+
+
+def save_processing_files(customer, uploaded_files, session, report_metadata=None):
+
+    """Save processing files once to customer folders and link them into the Script input directory"""
+
+    # Clear previous files from Script input directory
+
+    clear_directory_files(SCRIPT_INPUT_DIR)
+
+    
+
+    # Stream each upload ONCE into the customer folder, then hardlink/reflink it for processing
+
+    for field_name, file in uploaded_files.items():
+
+        # Determine file type and customer folder path first
+
+        if file.name.endswith('.xlsx'):
+
+            file_type = 'TEC_REPORT'
+
+            customer_file_path = get_customer_file_path(customer, 'TEC', file.name)
+
+        else:  # .csv
+
+            file_type = 'INVENTORY_CSV'
+
+            customer_file_path = get_customer_file_path(customer, 'INVENTORY', file.name)
+
+        
+
+        # ?? Clear existing files of this type BEFORE saving, so a same-named upload is not deleted
+
+        deleted_count = clear_existing_customer_files(customer, file_type)
+
+        if deleted_count > 0:
+
+            print(f"? Cleared {deleted_count} old {file_type} file(s) for customer: {customer.name}")
+
+        
+
+        stored = store_uploaded_file(file, customer_file_path)
+
+        
+
+        # Script input directory gets a link to the same bytes (copy only if linking is unsupported)
+
+        file_path = SCRIPT_INPUT_DIR / file.name
+
+        link_method = link_or_copy_file(customer_file_path, file_path)
+
+        print(f"? Saved {file.name} ? {customer_file_path}")
+
+        print(f"?? Linked into input directory via {link_method} ? {file_path}")
+
+        
+
+        # Create database record pointing to customer folder for downloads
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            session=session,
+
+            file_type=file_type,
+
+            original_filename=file.name,
+
+            stored_filename=file.name,
+
+            file_path=str(customer_file_path),  # Point to customer folder for downloads
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256'],
+
+            **report_file_fields(report_metadata if file_type == 'TEC_REPORT' else None)
+
+        )
+
+
+def process_health_check_files_enhanced(session_id):
+
+    """Enhanced processing that fully integrates with Script/main.py"""
+
+    try:
+
+        session = HealthCheckSession.objects.get(id=session_id)
+
+        customer = session.customer
+
+        
+
+        session.update_status('PROCESSING', 'Initializing health check analysis...')
+
+        session.progress_percentage = 5
+
+        session.current_step = "Preparing environment"
+
+        session.save()
+
+        
+
+        # Validate network setup files exist
+
+        network_files_exist = validate_network_setup_files(customer.name)
+
+        if not network_files_exist:
+
+            raise Exception(f"Network setup files missing for {customer.name}. Please run initial network setup.")
+
+        
+
+        # Validate input files are present
+
+        input_files = list(SCRIPT_INPUT_DIR.glob("*"))
+
+        if len(input_files) != 2:
+
+            raise Exception("Expected exactly 2 input files (HC report .xlsx and inventory .csv)")
+
+        
+
+        # Set up timeout monitoring with network size-based timeouts
+
+        import threading
+
+        
+
+        # Dynamic timeout based on estimated network size
+
+        timeout_seconds = calculate_processing_timeout(input_files)
+
+        print(f"?? Setting processing timeout to {timeout_seconds/60:.1f} minutes for {customer.name}")
+
+        
+
+        timeout_timer = threading.Timer(timeout_seconds, lambda: handle_session_timeout(session_id))
+
+        timeout_timer.start()
+
+        
+
+        # Update progress
+
+        session.progress_percentage = 15
+
+        session.current_step = "Validating files"
+
+        session.save()
+
+        
+
+        # Extract network information from filenames (per MOP)
+
+        hc_report_file = None
+
+        csv_file = None
+
+        
+
+        for file_path in input_files:
+
+            if file_path.suffix == '.xlsx':
+
+                hc_report_file = file_path
+
+            elif file_path.suffix == '.csv':
+
+                csv_file = file_path
+
+        
+
+        if not hc_report_file or not csv_file:
+
+            raise Exception("Could not identify HC report (.xlsx) and inventory (.csv) files")
+
+        
+
+        # Parse network info from filename (per MOP format)
+
+        network_info = parse_hc_filename(hc_report_file.name)
+
+        if not network_info:
+
+            raise Exception("HC report filename does not follow expected format")
+
+        
+
+        session.progress_percentage = 25
+
+        session.current_step = "Executing health check script"
+
+        session.save()
+
+        
+
+        # Execute the actual Script/main.py
+
+        script_result = execute_hc_script_direct(session)
+
+        
+
+        if script_result['success']:
+
+            session.progress_percentage = 80
+
+            session.current_step = "Processing outputs"
+
+            session.save()
+
+            
+
+            # Process generated outputs (don't fail on file copying issues)
+
+            try:
+
+                output_info = process_script_outputs_enhanced(session, network_info)
+
+            except Exception as output_error:
+
+                print(f"Warning: Output processing had issues: {output_error}")
+
+                output_info = {'output_files': [], 'network_info': network_info}
+
+            
+
+            session.progress_percentage = 95
+
+            session.current_step = "Finalizing results"
+
+            session.save()
+
+            
+
+            # Create detailed report
+
+            try:
+
+                create_detailed_report(session, output_info)
+
+            except Exception as report_error:
+
+                print(f"Warning: Report creation had issues: {report_error}")
+
+            
+
+            session.progress_percentage = 100
+
+            session.current_step = "Completed"
+
+            
+
+            # Count output files to show in success message
+
+            output_dir = SCRIPT_DIR / "output"
+
+            
+
+            # Add small delay to ensure all files are written
+
+            import time
+
+            time.sleep(2)
+
+            
+
+            # Count files more reliably
+
+            output_count = 0
+
+            if output_dir.exists():
+
+                output_files = [f for f in output_dir.glob("*") if f.is_file()]
+
+                output_count = len(output_files)
+
+                print(f"Web app found {output_count} output files:")
+
+                for f in output_files:
+
+                    print(f"  - {f.name}")
+
+            
+
+            success_message = f'Health check analysis completed successfully! Generated {output_count} output files.'
+            session.update_status(
+                'COMPLETED', success_message, total_nodes=parse_script_total_nodes(script_result.get('stdout'))
+            )
+            
+            # ===== DASHBOARD SYNC FIX =====
+            # Add a flag to indicate dashboard needs refresh
+            session.dashboard_refresh_needed = True
+            session.last_updated = timezone.now()
+            session.save()
+
+            
+
+        else:
+
+            raise Exception(f"Script execution failed: {script_result['error']}")
+
+        
+
+    except Exception as e:
+
+        session.update_status('FAILED', f'Processing failed: {str(e)}')
+
+        raise e
+
+
+def validate_network_setup_files(network_name):
+
+    """Validate that network setup files exist per MOP requirements"""
+
+    required_files = [
+
+        f"{network_name}_HC_Issues_Tracker.xlsx",
+
+        f"{network_name}_ignored_test_cases.txt", 
+
+        f"{network_name}_ignored_test_cases.xlsx"
+
+    ]
+
+    
+
+    for filename in required_files:
+
+        file_path = SCRIPT_DIR / filename
+
+        if not file_path.exists():
+
+            return False
+
+    
+
+    return True
+
+
+def parse_hc_filename(filename):
+
+    """Parse network info from HC filename per MOP format"""
+
+    try:
+
+        # Expected format: Network_name_Reports_YYYYMMDD.xlsx
+
+        # Parse using the logic from main.py
+
+        base_name = filename.replace('.xlsx', '')
+
+        last_underscore_pos = base_name.rfind('_')
+
+        
+
+        if last_underscore_pos == -1:
+
+            return None
+
+        
+
+        network_name = base_name[:last_underscore_pos - 8]  # -8 for "_Reports"
+
+        date_part = base_name[last_underscore_pos + 1:]
+
+        
+
+        if len(date_part) != 8:
+
+            return None
+
+        
+
+        year = date_part[:4]
+
+        month = date_part[4:6] 
+
+        day = date_part[6:8]
+
+        
+
+        return {
+
+            'network_name': network_name,
+
+            'year': year,
+
+            'month': month,
+
+            'day': day,
+
+            'date_string': date_part
+
+        }
+
+        
+
+    except Exception:
+
+        return None
+
+
+SCRIPT_TOTAL_NODES = re.compile(r'^HC_TOTAL_NODES=(\d+)\s*$', re.MULTILINE)
+
+
+def parse_script_total_nodes(stdout):
+    """Node count printed by Script/main.py (NODE COVERAGE rows minus header), or None"""
+    matches = SCRIPT_TOTAL_NODES.findall(stdout or '')
+    return int(matches[-1]) if matches else None
+
+
+def execute_hc_script_direct(session):
+
+    """Direct script execution - simplified and reliable"""
+
+    try:
+
+        # Ensure we're in the Script directory
+
+        original_cwd = os.getcwd()
+
+        os.chdir(str(SCRIPT_DIR))
+
+        
+
+        try:
+
+            # Determine python executable
+
+            if sys.platform == "win32":
+
+                venv_python = SCRIPT_DIR / "venv" / "Scripts" / "python.exe"
+
+            else:
+
+                venv_python = SCRIPT_DIR / "venv" / "bin" / "python"
+
+            
+
+            if not venv_python.exists():
+
+                # Try system python
+
+                venv_python = sys.executable
+
+            
+
+            main_script = SCRIPT_DIR / "main.py"
+
+            
+
+            # Execute with extended timeout for large networks  
+
+            print(f"?? Starting script execution: {venv_python} {main_script}")
+
+            print(f"?? Working directory: {SCRIPT_DIR}")
+
+            result = subprocess.run(
+
+                [str(venv_python), str(main_script)],
+
+                cwd=str(SCRIPT_DIR),
+
+                capture_output=True,
+
+                text=True,
+
+                timeout=7200 #2 hour timeout for large networks like Telekom
+
+            )
+
+            
+
+            return {
+
+                'success': result.returncode == 0,
+
+                'stdout': result.stdout,
+
+                'stderr': result.stderr,
+
+                'returncode': result.returncode,
+
+                'error': result.stderr if result.returncode != 0 else None
+
+            }
+
+            
+
+        finally:
+
+            # Restore original working directory
+
+            os.chdir(original_cwd)
+
+            
+
+    except subprocess.TimeoutExpired:
+
+        return {
+
+            'success': False,
+
+            'error': 'Script execution timed out (1 hour) - network too large'
+
+        }
+
+    except Exception as e:
+
+        return {
+
+            'success': False,
+
+            'error': str(e)
+
+        }
+
+
+def execute_hc_script_enhanced(session):
+
+    """Enhanced script execution with better error handling"""
+
+    try:
+
+        # Ensure we're in the Script directory
+
+        original_cwd = os.getcwd()
+
+        os.chdir(str(SCRIPT_DIR))
+
+        
+
+        try:
+
+            # Determine python executable
+
+            if sys.platform == "win32":
+
+                venv_python = SCRIPT_DIR / "venv" / "Scripts" / "python.exe"
+
+            else:
+
+                venv_python = SCRIPT_DIR / "venv" / "bin" / "python"
+
+            
+
+            if not venv_python.exists():
+
+                # Try system python
+
+                venv_python = sys.executable
+
+            
+
+            main_script = SCRIPT_DIR / "main.py"
+
+            
+
+            # Execute with extended timeout for large networks
+
+            result = subprocess.run(
+
+                [str(venv_python), str(main_script)],
+
+                cwd=str(SCRIPT_DIR),
+
+                capture_output=True,
+
+                text=True,
+
+                timeout=7200 # 2 hour timeout for large networks like Telekom
+
+            )
+
+            
+
+            return {
+
+                'success': result.returncode == 0,
+
+                'stdout': result.stdout,
+
+                'stderr': result.stderr,
+
+                'returncode': result.returncode,
+
+                'error': result.stderr if result.returncode != 0 else None
+
+            }
+
+            
+
+        finally:
+
+            # Restore original working directory
+
+            os.chdir(original_cwd)
+
+            
+
+    except subprocess.TimeoutExpired:
+
+        return {
+
+            'success': False,
+
+            'error': 'Script execution timed out (1 hour) - network too large'
+
+        }
+
+    except Exception as e:
+
+        return {
+
+            'success': False,
+
+            'error': str(e)
+
+        }
+
+
+def process_script_outputs_enhanced(session, network_info):
+
+    """Enhanced output processing - copy only HC_Issues_Tracker to both customer folders AND Script directory"""
+
+    try:
+
+        script_output_dir = SCRIPT_DIR / "output"
+
+        output_files = []
+
+        customer = session.customer
+
+        
+
+        # ALSO check if the HC_Issues_Tracker is already in Script directory (generated from previous processing)
+
+        script_tracker_filename = f"{customer.name}_HC_Issues_Tracker.xlsx"
+
+        script_tracker_path = SCRIPT_DIR / script_tracker_filename
+
+        
+
+        # Find the HC_Issues_Tracker file (could be in output or Script directory)
+
+        tracker_source_path = None
+
+        if script_output_dir.exists():
+
+            # Check output directory for ANY file containing HC_Issues_Tracker
+
+            output_files = list(script_output_dir.glob("*HC_Issues_Tracker*.xlsx"))
+
+            print(f"?? Looking for tracker files in {script_output_dir}")
+
+            print(f"?? Found {len(output_files)} potential tracker files: {[f.name for f in output_files]}")
+
+            
+
+            for file_path in output_files:
+
+                if file_path.is_file():
+
+                    tracker_source_path = file_path
+
+                    print(f"?? Selected tracker file: {tracker_source_path}")
+
+                    break
+
+        
+
+        # If not found in output, check Script directory
+
+        if not tracker_source_path and script_tracker_path.exists():
+
+            tracker_source_path = script_tracker_path
+
+            print(f"?? Using fallback tracker from Script directory: {tracker_source_path}")
+
+        
+
+        # Process the found tracker file
+
+        if tracker_source_path:
+
+            print(f"?? Found HC_Issues_Tracker at: {tracker_source_path}")
+
+            
+
+            # Get customer folder paths
+
+            tracker_generated_path = get_customer_file_path(customer, 'TRACKER', tracker_source_path.name)
+
+            old_tracker_path = get_customer_file_path(customer, 'OLD_TRACKER', tracker_source_path.name)
+
+            
+
+            # Ensure customer directories exist
+
+            os.makedirs(tracker_generated_path.parent, exist_ok=True)
+
+            os.makedirs(old_tracker_path.parent, exist_ok=True)
+
+            
+
+            # Try copying with retries for file locking issues
+
+            for attempt in range(3):
+
+                try:
+
+                    # Remove existing files first
+
+                    if tracker_generated_path.exists():
+
+                        tracker_generated_path.unlink()
+
+                    if old_tracker_path.exists():
+
+                        old_tracker_path.unlink()
+
+                    
+
+                    # Wait a bit and try copying
+
+                    import time
+
+                    time.sleep(0.5)
+
+                    
+
+                    # Copy to BOTH customer folders
+
+                    shutil.copy2(tracker_source_path, tracker_generated_path)
+
+                    shutil.copy2(tracker_source_path, old_tracker_path)
+
+                    
+
+                    # If source is not in Script directory, also copy there
+
+                    if tracker_source_path != script_tracker_path:
+
+                        if script_tracker_path.exists():
+
+                            script_tracker_path.unlink()
+
+                        shutil.copy2(tracker_source_path, script_tracker_path)
+
+                    
+
+                    print(f"? Copied HC_Issues_Tracker to multiple locations:")
+
+                    print(f"   ?? Generated Trackers: {customer.name}/generated_trackers/{tracker_source_path.name}")
+
+                    print(f"   ?? Old Trackers: {customer.name}/old_trackers/{tracker_source_path.name}")
+
+                    print(f"   ?? Script Directory: {script_tracker_filename}")
+
+                    break
+
+                except (PermissionError, OSError) as copy_error:
+
+                    if attempt == 2:  # Last attempt
+
+                        print(f"Warning: Could not copy {tracker_source_path.name}: {copy_error}")
+
+                        # Use the original file path as fallback
+
+                        tracker_generated_path = tracker_source_path
+
+                        old_tracker_path = tracker_source_path
+
+                    else:
+
+                        time.sleep(1)  # Wait before retry
+
+            
+
+            # Get current timestamp for generated files
+
+            from django.utils import timezone
+
+            current_time = timezone.now()
+
+            
+
+            # ?? CLEAR EXISTING TRACKER_GENERATED files to avoid duplicates
+
+            existing_tracker_generated = HealthCheckFile.objects.filter(
+
+                customer=customer, 
+
+                file_type='TRACKER_GENERATED'
+
+            )
+
+            for old_file in existing_tracker_generated:
+
+                try:
+
+                    if old_file.file_path and Path(old_file.file_path).exists():
+
+                        Path(old_file.file_path).unlink()
+
+                    old_file.delete()
+
+                    print(f"??? Removed old TRACKER_GENERATED: {old_file.stored_filename}")
+
+                except Exception as e:
+
+                    print(f"?? Could not remove old tracker generated file: {e}")
+
+            
+
+            # ?? Allow multiple HC_TRACKER files - don't clear existing generated ones
+
+            # Keep all previous generated trackers + original setup files for history
+
+            
+
+            # Create database record for TRACKER_GENERATED (shows in "Tracker Generated" section)
+
+            tracker_generated_record = HealthCheckFile.objects.create(
+
+                customer=customer,
+
+                session=session,
+
+                file_type='TRACKER_GENERATED',
+
+                original_filename=tracker_source_path.name,
+
+                stored_filename=tracker_source_path.name,
+
+                file_path=str(tracker_generated_path),
+
+                file_size=tracker_source_path.stat().st_size
+
+            )
+
+            # Update the timestamp to current time (when file was generated)
+
+            tracker_generated_record.uploaded_at = current_time
+
+            tracker_generated_record.save()
+
+            
+
+            # Create database record for HC_TRACKER (shows in "Old Trackers" section)
+
+            old_tracker_record = HealthCheckFile.objects.create(
+
+                customer=customer,
+
+                session=session,
+
+                file_type='HC_TRACKER',
+
+                original_filename=tracker_source_path.name,
+
+                stored_filename=tracker_source_path.name,
+
+                file_path=str(old_tracker_path),
+
+                file_size=tracker_source_path.stat().st_size
+
+            )
+
+            # Update the timestamp to current time (when file was generated)
+
+            old_tracker_record.uploaded_at = current_time
+
+            old_tracker_record.save()
+
+            
+
+            # Update session to point to the tracker file
+
+            session.output_tracker_filename = tracker_source_path.name
+
+            session.output_tracker_path = str(tracker_generated_path)
+
+            session.save()
+
+            
+
+            print(f"?? HC_Issues_Tracker will appear in BOTH sections: {tracker_source_path.name}")
+
+            print(f"?? Created 2 database records: TRACKER_GENERATED + HC_TRACKER")
+
+            
+
+            # Track all files for logging
+
+            output_files.append({
+
+                'name': tracker_source_path.name,
+
+                'path': str(tracker_source_path),  # Always point to original output directory
+
+                'size': tracker_source_path.stat().st_size
+
+            })
+
+        
+
+        # Also check output directory for other files
+
+        if script_output_dir.exists():
+
+            for file_path in script_output_dir.glob("*"):
+
+                if file_path.is_file() and "HC_Issues_Tracker" not in file_path.name:
+
+                    # All other files (like extracted_hc_test_cases.xlsx, etc.) stay in output directory only
+
+                    print(f"?? Keeping other output file in output directory only: {file_path.name}")
+
+                    
+
+                    # Track all files for logging
+
+                    output_files.append({
+
+                        'name': file_path.name,
+
+                        'path': str(file_path),  # Always point to original output directory
+
+                        'size': file_path.stat().st_size
+
+                    })
+
+        
+
+        return {
+
+            'output_files': output_files,
+
+            'network_info': network_info
+
+        }
+
+        
+
+    except Exception as e:
+
+        # Don't fail the whole process for file copying issues
+
+        print(f"Warning: Error processing script outputs: {str(e)}")
+
+        # Return basic info so processing can continue
+
+        return {
+
+            'output_files': [],
+
+            'network_info': network_info
+
+        }
+
+
+def create_detailed_report(session, output_info):
+
+    """Create detailed health check report"""
+
+    # Health check reports are no longer needed - session status provides sufficient information
+
+    pass
+
+
+def clear_existing_customer_files(customer, file_type, keep=None):
+
+    """
+
+    Deletes all existing files of a specific type for a customer.
+
+    `keep` is a just-stored HealthCheckFile that survives, along with its file on disk.
+
+    """
+
+    files_to_delete = HealthCheckFile.objects.filter(
+
+        customer=customer, 
+
+        file_type=file_type
+
+    )
+
+    if keep is not None:
+
+        files_to_delete = files_to_delete.exclude(pk=keep.pk)
+
+    
+
+    count = files_to_delete.count()
+
+    if count == 0:
+
+        return 0
+
+
+
+    print(f"?? Found {count} existing {file_type} files for customer '{customer.name}'. Removing them...")
+
+
+
+    for f in files_to_delete:
+
+        try:
+
+            # Delete the physical file from disk
+
+            if f.file_path and Path(f.file_path).exists() and (keep is None or f.file_path != keep.file_path):
+
+                Path(f.file_path).unlink()
+
+                print(f"  ??? Deleted physical file: {f.file_path}")
+
+            
+
+            # Delete the database record
+
+            f.delete()
+
+            print(f"  ? Deleted DB record for: {f.stored_filename}")
+
+
+
+        except Exception as e:
+
+            print(f"  ?? Warning: Could not delete file {f.stored_filename}: {e}")
+
+            
+
+    return count
+
+
+def parse_tracker_statistics(tracker_path):
+
+    """Parse statistics from the generated HC Issues Tracker"""
+
+    try:
+
+        if not tracker_path or not Path(tracker_path).exists():
+
+            return {}
+
+        
+
+        import openpyxl
+
+        wb = openpyxl.load_workbook(tracker_path, read_only=True)
+
+        
+
+        stats = {
+
+            'total_nodes': 0,
+
+            'healthy_nodes': 0,
+
+            'warning_nodes': 0,
+
+            'offline_nodes': 0,
+
+            'total_services': 0,
+
+            'healthy_services': 0,
+
+            'health_score': 95.0  # Default score
+
+        }
+
+        
+
+        # Parse Summary sheet if available
+
+        if 'Summary' in wb.sheetnames:
+
+            summary_sheet = wb['Summary']
+
+            # Extract relevant statistics from specific cells
+
+            # This would depend on the exact structure of the generated file
+
+            pass
+
+        
+
+        # Parse OPEN sheet for issue counts
+
+        if 'OPEN' in wb.sheetnames:
+
+            open_sheet = wb['OPEN']
+
+            issue_count = max(0, open_sheet.max_row - 1)  # Subtract header row
+
+            
+
+            # Calculate health score based on issues
+
+            if issue_count == 0:
+
+                stats['health_score'] = 100.0
+
+            else:
+
+                # Simple scoring algorithm - can be enhanced
+
+                stats['health_score'] = max(0, 100 - (issue_count * 2))
+
+        
+
+        wb.close()
+
+        return stats
+
+        
+
+    except Exception:
+
+        return {'health_score': 50.0}  # Default fallback
+
+
+def calculate_processing_timeout(input_files):
+
+    """Calculate processing timeout based on estimated network size from input files"""
+
+    try:
+
+        # Minimum timeout for small networks (15 minutes)
+
+        min_timeout = 900  # 15 minutes
+
+        
+
+        if not input_files:
+
+            return min_timeout
+
+        
+
+        # Analyze file sizes to estimate network complexity
+
+        total_size = 0
+
+        has_large_files = False
+
+        file_count = 0
+
+        
+
+        for file_path in input_files:
+
+            try:
+
+                if hasattr(file_path, 'stat'):
+
+                    file_size = file_path.stat().st_size
+
+                elif isinstance(file_path, str):
+
+                    file_size = Path(file_path).stat().st_size
+
+                else:
+
+                    continue
+
+                    
+
+                total_size += file_size
+
+                file_count += 1
+
+                
+
+                # Check for large files (>15MB indicates larger network)
+
+                if file_size > 15 * 1024 * 1024:  # 15MB
+
+                    has_large_files = True
+
+                    
+
+            except (OSError, AttributeError):
+
+                continue
+
+        
+
+        # Calculate timeout based on total size and file characteristics
+
+        if total_size > 100 * 1024 * 1024:  # >100MB total - very large enterprise network
+
+            timeout = 7200  # 2 hour for very large networks like Telekom
+
+        elif total_size > 50 * 1024 * 1024 or has_large_files:  # >50MB or has large files - large network
+
+            timeout = 7200  # 2 hour for large networks
+
+        elif total_size > 20 * 1024 * 1024:  # >20MB - medium network
+
+            timeout = 2700  # 45 minutes for medium networks
+
+        elif total_size > 5 * 1024 * 1024:  # >5MB - small-medium network
+
+            timeout = 1800  # 30 minutes for small-medium networks
+
+        else:
+
+            timeout = min_timeout  # 15 minutes for small networks (minimum)
+
+        
+
+        # Additional time for multiple large files (complex processing)
+
+        if file_count > 2 and has_large_files:
+
+            timeout += 300  # Add 5 more minutes for complex multi-file processing
+
+        
+
+        print(f"?? Network size analysis:")
+
+        print(f"   ?? Total size: {total_size/1024/1024:.1f}MB across {file_count} files")
+
+        print(f"   ?? Has large files (>15MB): {has_large_files}")
+
+        print(f"   ?? Calculated timeout: {timeout/60:.1f} minutes")
+
+        
+
+        return timeout
+
+        
+
+    except Exception as e:
+
+        print(f"?? Error calculating timeout: {e}, using default")
+
+        return 7200  # 2 hour default fallback for large networks
+
+
+def handle_session_timeout(session_id):
+
+    """Handle session timeout by marking it as failed"""
+
+    try:
+
+        session = HealthCheckSession.objects.get(id=session_id)
+
+        if session.status == 'PROCESSING':
+
+            timeout_minutes = "20+"
+
+            try:
+
+                # Try to get the actual timeout that was used
+
+                if hasattr(session, 'timeout_used'):
+
+                    timeout_minutes = f"{session.timeout_used/60:.0f}"
+
+            except:
+
+                pass
+
+            
+
+            session.update_status('FAILED', f'Processing timed out after {timeout_minutes} minutes - network may be too large or complex')
+
+            print(f"? Session {session_id} timed out and marked as FAILED")
+
+    except HealthCheckSession.DoesNotExist:
+
+        print(f"?? Timeout handler called for non-existent session: {session_id}")
+
+    except Exception as e:
+
+        print(f"? Error in timeout handler: {e}")
@@ -0,0 +1,1240 @@
+"""
+Uploads into the individual customer folders
+"""
+
+import os
+
+from django.shortcuts import get_object_or_404
+from django.http import JsonResponse
+from django.contrib.auth.decorators import login_required
+
+from ..models import Customer, HealthCheckFile
+from ..file_utils import store_uploaded_file, link_or_copy_file
+from ..report_preflight import preflight_validate_report, report_file_fields
+from .common import CUSTOMER_FILES_DIR, SCRIPT_DIR, SCRIPT_INPUT_DIR
+from .health_check import clear_existing_customer_files
+from .validation import (
+    validate_customer_technology_match, validate_file_type_match, validate_section_specific_upload,
+)
+from .customer_files import get_customer_file_path
+
+
+# === Individual Folder Upload Endpoints ===
+
+@login_required
+
+def upload_host_file(request):
+
+    """Upload file specifically to host files folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+    selected_customer_name = request.session.get('selected_customer_name', 'Unknown')
+
+    if not selected_customer_id:
+        return JsonResponse({"status": "error", "message": "No customer selected", "customer_folders": []})
+
+    # Only database customers are supported
+    try:
+        customer = Customer.objects.get(id=selected_customer_id, is_deleted=False)
+        customers = [customer]
+    except Customer.DoesNotExist:
+        customers = []
+    # Check for multiple possible field names for host files
+
+    host_file = None
+
+    possible_field_names = ['host_file', 'host_files', 'csv_file', 'inventory_host']
+
+    
+
+    for field_name in possible_field_names:
+
+        if field_name in request.FILES:
+
+            host_file = request.FILES[field_name]
+
+            break
+
+    
+
+    if not host_file:
+
+        return JsonResponse({
+
+            "status": "error", 
+
+            "message": f"No file uploaded. Expected field names: {possible_field_names}"
+
+        })
+
+    
+
+    uploaded_file = host_file
+
+    
+
+    # Validate file extension (typically CSV for host files, but also allow Excel)
+
+    allowed_extensions = ['.csv', '.xlsx', '.xls']
+
+    file_extension = None
+
+    for ext in allowed_extensions:
+
+        if uploaded_file.name.lower().endswith(ext):
+
+            file_extension = ext
+
+            break
+
+    
+
+    if not file_extension:
+
+        return JsonResponse({"status": "error", "message": "Only CSV (.csv) or Excel (.xlsx, .xls) files are allowed for host files"})
+
+    
+
+    # NEW: Validate that it's actually a HOST file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'HOST')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY host files can be uploaded in host section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'host_upload', 'HOST'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY host files can be uploaded in host section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'host_upload', 'HOST'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation for HOST files - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # ?? Allow multiple HOST files - don't clear existing ones
+
+        
+
+        # Get customer folder path
+
+        customer_file_path = get_customer_file_path(customer, 'HOST', uploaded_file.name)
+
+        
+
+        # Ensure directory exists
+
+        os.makedirs(customer_file_path.parent, exist_ok=True)
+
+        
+
+        # Save to customer host folder (content-addressed, hashed while streaming)
+
+        stored = store_uploaded_file(uploaded_file, customer_file_path)
+
+        
+
+        print(f"? Saved {uploaded_file.name} ? {customer_file_path}")
+
+        
+
+        # Create database record pointing to customer folder for downloads
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='HOST',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(customer_file_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Host file '{uploaded_file.name}' uploaded successfully to host files folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        print(f"?? Error in upload_host_file: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_inventory_file(request):
+
+    """Upload file specifically to inventory folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    if 'inventory_file' not in request.FILES:
+
+        return JsonResponse({"status": "error", "message": "No file uploaded"})
+
+    
+
+    uploaded_file = request.FILES['inventory_file']
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.csv'):
+
+        return JsonResponse({"status": "error", "message": "Only CSV files are allowed for inventory"})
+
+    
+
+    # NEW: Validate that it's actually an INVENTORY file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'INVENTORY')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure file is appropriate for INVENTORY section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'inventory_upload', 'INVENTORY'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # ?? Allow multiple INVENTORY_CSV files - don't clear existing ones
+
+        
+
+        # Save to customer's inventory folder
+
+        customer_folder = CUSTOMER_FILES_DIR / customer.name / "inventory_files"
+
+        os.makedirs(customer_folder, exist_ok=True)
+
+        
+
+        target_path = customer_folder / uploaded_file.name
+
+        
+
+        stored = store_uploaded_file(uploaded_file, target_path)
+
+        
+
+        # Create database record
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='INVENTORY_CSV',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(target_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Inventory file '{uploaded_file.name}' uploaded successfully to inventory folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_report_file(request):
+
+    """Upload file to BOTH Script processing directory AND customer reports folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    # Check for multiple possible field names for TEC reports
+
+    tec_report_file = None
+
+    possible_field_names = ['tec_report', 'tec_report_file', 'report_file', 'hc_report']
+
+    
+
+    for field_name in possible_field_names:
+
+        if field_name in request.FILES:
+
+            tec_report_file = request.FILES[field_name]
+
+            break
+
+    
+
+    if not tec_report_file:
+
+        return JsonResponse({
+
+            "status": "error", 
+
+            "message": f"No file uploaded. Expected field names: {possible_field_names}"
+
+        })
+
+    
+
+    uploaded_file = tec_report_file
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.xlsx'):
+
+        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for TEC reports"})
+
+    
+
+    # NEW: Validate that it's actually a REPORT file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'REPORT')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure file is appropriate for REPORT section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'report_upload', 'REPORT'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    # PRE-FLIGHT: Check workbook structure now instead of minutes into a processing run
+
+    preflight = preflight_validate_report(uploaded_file, uploaded_file.name)
+
+    if not preflight['valid']:
+
+        return JsonResponse({"status": "error", "message": f"Report pre-flight check failed: {preflight['error']}"})
+
+    
+
+    try:
+
+        # ?? Clear existing TEC_REPORT files to avoid duplicates
+
+        deleted_count = clear_existing_customer_files(customer, 'TEC_REPORT')
+
+        if deleted_count > 0:
+
+            print(f"? Cleared {deleted_count} old TEC_REPORT file(s) for customer: {customer.name}")
+
+        
+
+        # Get customer folder path
+
+        customer_file_path = get_customer_file_path(customer, 'TEC', uploaded_file.name)
+
+        
+
+        # Get Script processing path
+
+        script_file_path = SCRIPT_INPUT_DIR / uploaded_file.name
+
+        
+
+        # Ensure directories exist
+
+        os.makedirs(customer_file_path.parent, exist_ok=True)
+
+        os.makedirs(script_file_path.parent, exist_ok=True)
+
+        
+
+        # Save ONCE to customer folder (for downloads), hashing while streaming
+
+        stored = store_uploaded_file(uploaded_file, customer_file_path)
+
+        
+
+        # Link the same bytes into the Script processing directory (for processing)
+
+        link_method = link_or_copy_file(customer_file_path, script_file_path)
+
+        
+
+        print(f"? Saved {uploaded_file.name} ? {customer_file_path}")
+
+        print(f"?? Linked into processing directory via {link_method} ? {script_file_path}")
+
+        
+
+        # Create database record pointing to customer folder for downloads
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='TEC_REPORT',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(customer_file_path),  # Point to customer folder for downloads
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256'],
+
+            **report_file_fields(preflight['metadata'])
+
+        )
+        
+        # Store the country detected from the uploaded reports on the customer's networks
+        try:
+            updated = Customer.reconcile_countries([customer.name])
+            print(f"✅ Country re-detected for {customer.name} after report upload ({updated} networks updated)")
+        except Exception as country_error:
+            print(f"⚠️ Country re-detection failed for {customer.name}: {country_error}")
+        
+        return JsonResponse({
+            "status": "success", 
+            "message": f"TEC report '{uploaded_file.name}' uploaded successfully. Country detection updated."
+        })
+
+        
+
+    except Exception as e:
+
+        print(f"?? Error in upload_report_file: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_old_tracker_file(request):
+
+    """Upload file specifically to old trackers folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    if 'old_tracker_file' not in request.FILES:
+
+        return JsonResponse({"status": "error", "message": "No file uploaded"})
+
+    
+
+    uploaded_file = request.FILES['old_tracker_file']
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.xlsx'):
+
+        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for tracker files"})
+
+    
+
+    # NEW: Validate that it's actually a TRACKER file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'TRACKER')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'old_tracker_upload', 'TRACKER'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'old_tracker_upload', 'TRACKER'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation for OLD TRACKER files - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # Save to customer's old_trackers folder
+
+        customer_folder = CUSTOMER_FILES_DIR / customer.name / "old_trackers"
+
+        os.makedirs(customer_folder, exist_ok=True)
+
+        
+
+        target_path = customer_folder / uploaded_file.name
+
+        
+
+        stored = store_uploaded_file(uploaded_file, target_path)
+
+        
+
+        # Create database record
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='HC_TRACKER',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(target_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Old tracker '{uploaded_file.name}' uploaded successfully to old trackers folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_tracker_generated_file(request):
+
+    """Upload file specifically to tracker generated folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    if 'tracker_generated_file' not in request.FILES:
+
+        return JsonResponse({"status": "error", "message": "No file uploaded"})
+
+    
+
+    uploaded_file = request.FILES['tracker_generated_file']
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.xlsx'):
+
+        return JsonResponse({"status": "error", "message": "Only XLSX files are allowed for tracker files"})
+
+    
+
+    # NEW: Validate that it's actually a TRACKER file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'TRACKER')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker generated section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'tracker_generated_upload', 'TRACKER'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY tracker files can be uploaded in tracker generated section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'tracker_generated_upload', 'TRACKER'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation for TRACKER GENERATED files - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # ?? FIRST: Clear existing TRACKER_GENERATED files BEFORE saving new ones (like reports)
+
+        deleted_count = clear_existing_customer_files(customer, 'TRACKER_GENERATED')
+
+        if deleted_count > 0:
+
+            print(f"? Cleared {deleted_count} old TRACKER_GENERATED file(s) for customer: {customer.name}")
+
+        
+
+        # Save to customer's tracker_generated folder
+
+        customer_folder = CUSTOMER_FILES_DIR / customer.name / "tracker_generated"
+
+        os.makedirs(customer_folder, exist_ok=True)
+
+        
+
+        target_path = customer_folder / uploaded_file.name
+
+        
+
+        stored = store_uploaded_file(uploaded_file, target_path)
+
+        
+
+        # Create database record
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='TRACKER_GENERATED',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(target_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Tracker '{uploaded_file.name}' uploaded successfully to tracker generated folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_ignore_excel_file(request):
+
+    """Upload Excel ignore file specifically to old trackers folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    # Check for multiple possible field names for ignore Excel files
+
+    ignore_file = None
+
+    possible_field_names = ['ignore_excel_file', 'selective_ignore_xlsx', 'ignore_file', 'excel_ignore']
+
+    
+
+    for field_name in possible_field_names:
+
+        if field_name in request.FILES:
+
+            ignore_file = request.FILES[field_name]
+
+            break
+
+    
+
+    if not ignore_file:
+
+        return JsonResponse({
+
+            "status": "error", 
+
+            "message": f"No file uploaded. Expected field names: {possible_field_names}"
+
+        })
+
+    
+
+    uploaded_file = ignore_file
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.xlsx'):
+
+        return JsonResponse({"status": "error", "message": "Only Excel (.xlsx) files are allowed for ignore Excel files"})
+
+    
+
+    # NEW: Validate that it's actually an IGNORE file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'IGNORE')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'ignore_excel_upload', 'IGNORE'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'ignore_excel_upload', 'IGNORE'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation for IGNORE EXCEL files - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # Save to customer's old_trackers folder (where ignore files are stored)
+
+        customer_folder = CUSTOMER_FILES_DIR / customer.name.replace(" ", "_").replace("/", "_") / "old_trackers"
+
+        os.makedirs(customer_folder, exist_ok=True)
+
+        
+
+        target_path = customer_folder / uploaded_file.name
+
+        
+
+        # Also save to Script directory for processing (with customer name prefix)
+
+        script_filename = f"{customer.name}_ignored_test_cases.xlsx"
+
+        script_path = SCRIPT_DIR / script_filename
+
+        
+
+        # Save to customer folder (content-addressed, hashed while streaming)
+
+        stored = store_uploaded_file(uploaded_file, target_path)
+
+        
+
+        # Also place in Script directory without re-reading the upload
+
+        link_method = link_or_copy_file(target_path, script_path, allow_hardlink=False)
+
+        
+
+        print(f"? Saved {uploaded_file.name} ? {target_path}")
+
+        print(f"?? Also placed in Script directory via {link_method} ? {script_path}")
+
+        
+
+        # Create database record
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='SELECTIVE_IGNORE_XLSX',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(target_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Ignore Excel file '{uploaded_file.name}' uploaded successfully to old trackers folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        print(f"?? Error in upload_ignore_excel_file: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
+
+
+@login_required
+
+def upload_ignore_text_file(request):
+
+    """Upload Text ignore file specifically to old trackers folder"""
+
+    if request.method != "POST":
+
+        return JsonResponse({"status": "error", "message": "Invalid request method"})
+
+    
+
+    selected_customer_id = request.session.get('selected_customer_id')
+
+    if not selected_customer_id:
+
+        return JsonResponse({"status": "error", "message": "No customer selected"})
+
+    
+
+    customer = get_object_or_404(Customer, id=selected_customer_id, is_deleted=False)
+
+    
+
+    # Check for multiple possible field names for ignore text files
+
+    ignore_file = None
+
+    possible_field_names = ['ignore_text_file', 'global_ignore_txt', 'ignore_txt', 'text_ignore']
+
+    
+
+    for field_name in possible_field_names:
+
+        if field_name in request.FILES:
+
+            ignore_file = request.FILES[field_name]
+
+            break
+
+    
+
+    if not ignore_file:
+
+        return JsonResponse({
+
+            "status": "error", 
+
+            "message": f"No file uploaded. Expected field names: {possible_field_names}"
+
+        })
+
+    
+
+    uploaded_file = ignore_file
+
+    
+
+    # Validate file extension
+
+    if not uploaded_file.name.lower().endswith('.txt'):
+
+        return JsonResponse({"status": "error", "message": "Only Text (.txt) files are allowed for ignore text files"})
+
+    
+
+    # NEW: Validate that it's actually an IGNORE file based on filename
+
+    file_type_validation = validate_file_type_match(uploaded_file.name, 'IGNORE')
+
+    if not file_type_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": file_type_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'ignore_text_upload', 'IGNORE'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # CRITICAL: SECTION-SPECIFIC VALIDATION - Ensure ONLY ignore files can be uploaded in ignore section
+
+    section_validation = validate_section_specific_upload(
+
+        customer.name, uploaded_file.name, 'ignore_text_upload', 'IGNORE'
+
+    )
+
+    if not section_validation['valid']:
+
+        return JsonResponse({"status": "error", "message": section_validation['error']})
+
+    
+
+    # ENHANCED VALIDATION: Technology-aware customer validation for IGNORE TEXT files - ENABLED FOR STRICT MATCHING
+
+    validation_result = validate_customer_technology_match(customer.name, uploaded_file.name)
+
+    if not validation_result['valid']:
+
+        return JsonResponse({"status": "error", "message": validation_result['error']})
+
+    
+
+    try:
+
+        # Save to customer's old_trackers folder (where ignore files are stored)
+
+        customer_folder = CUSTOMER_FILES_DIR / customer.name.replace(" ", "_").replace("/", "_") / "old_trackers"
+
+        os.makedirs(customer_folder, exist_ok=True)
+
+        
+
+        target_path = customer_folder / uploaded_file.name
+
+        
+
+        # Also save to Script directory for processing (with customer name prefix)
+
+        script_filename = f"{customer.name}_ignored_test_cases.txt"
+
+        script_path = SCRIPT_DIR / script_filename
+
+        
+
+        # Save to customer folder (content-addressed, hashed while streaming)
+
+        stored = store_uploaded_file(uploaded_file, target_path)
+
+        
+
+        # Also place in Script directory without re-reading the upload
+
+        link_method = link_or_copy_file(target_path, script_path, allow_hardlink=False)
+
+        
+
+        print(f"? Saved {uploaded_file.name} ? {target_path}")
+
+        print(f"?? Also placed in Script directory via {link_method} ? {script_path}")
+
+        
+
+        # Create database record
+
+        HealthCheckFile.objects.create(
+
+            customer=customer,
+
+            file_type='GLOBAL_IGNORE_TXT',
+
+            original_filename=uploaded_file.name,
+
+            stored_filename=uploaded_file.name,
+
+            file_path=str(target_path),
+
+            file_size=stored['size'],
+
+            sha256=stored['sha256']
+
+        )
+
+        
+
+        return JsonResponse({
+
+            "status": "success", 
+
+            "message": f"Ignore Text file '{uploaded_file.name}' uploaded successfully to old trackers folder"
+
+        })
+
+        
+
+    except Exception as e:
+
+        print(f"?? Error in upload_ignore_text_file: {str(e)}")
+
+        return JsonResponse({"status": "error", "message": f"Upload failed: {str(e)}"})
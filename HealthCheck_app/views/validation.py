@@ -0,0 +1,2011 @@
+"""
+Upload validation
+Filename, file type, section, customer and region checks of uploaded files.
+"""
+
+from django.http import JsonResponse
+from django.contrib.auth.decorators import login_required
+
+from ..models import Customer
+from ..filename_matcher import edit_distance, match_customer_filename
+from ..access_policy import get_access_policy
+
+
+def validate_user_region_access(user, customer_name, filename):
+
+    """
+
+    COMPREHENSIVE user access validation using UserProfile model
+
+    Enforces region-based access control based on user assignments
+
+    """
+
+    try:
+
+        if not user.is_authenticated:
+
+            return {
+
+                'valid': False,
+
+                'error': '? User must be authenticated to upload files'
+
+            }
+
+        
+
+        # Check if user is Django staff - they have full access
+
+        if user.is_staff or user.is_superuser:
+
+            return {
+
+                'valid': True, 
+
+                'error': None,
+
+                'reason': f"Staff/superuser {user.username} has full access"
+
+            }
+
+        
+
+        # Compiled access of the user's health check profile (cached per user)
+
+        policy = get_access_policy(user)
+
+        if policy.exempt == 'no_profile':
+
+            # No profile exists - create a default one or allow based on settings
+
+            # For now, allow access but log the missing profile
+
+            print(f"?? No UserProfile found for user {user.username} - allowing access")
+
+            return {
+
+                'valid': True, 
+
+                'error': None,
+
+                'warning': f"No region profile found for user {user.username}"
+
+            }
+
+        
+
+        # Check if user is marked as super user in profile
+
+        if policy.exempt == 'super_user':
+
+            return {
+
+                'valid': True, 
+
+                'error': None,
+
+                'reason': f"User {user.username} is marked as super user in profile"
+
+            }
+
+        
+
+        # If strict validation is disabled for this user, allow access
+
+        if policy.exempt == 'not_strict':
+
+            return {
+
+                'valid': True, 
+
+                'error': None,
+
+                'reason': f"Strict validation disabled for user {user.username}"
+
+            }
+
+        
+
+        # Perform region-based access check
+
+        can_access, access_reason = policy.check(customer_name)
+
+        
+
+        if not can_access:
+
+            return {
+
+                'valid': False,
+
+                'error': f"? Region Access Denied for {user.username}: {access_reason}"
+
+            }
+
+        
+
+        # Access granted
+
+        return {
+
+            'valid': True, 
+
+            'error': None,
+
+            'reason': f"User {user.username} has valid region access: {access_reason}"
+
+        }
+
+        
+
+    except Exception as e:
+
+        return {
+
+            'valid': False,
+
+            'error': f"? User access validation error: {str(e)}"
+
+        }
+
+
+# === API Endpoints ===
+
+@login_required
+
+def validate_filename(request):
+
+    """ENHANCED: Validate uploaded filename with section-specific validation"""
+
+    filename = request.GET.get('filename', '')
+
+    expected_type = request.GET.get('expected_type', '')  # Get expected file type from request
+
+    upload_section = request.GET.get('upload_section', '')  # Get upload section from request
+
+    customer_id = request.session.get('selected_customer_id')
+
+    
+
+    if not customer_id:
+
+        return JsonResponse({'status': 'error', 'message': 'No customer selected'})
+
+    
+
+    if not filename:
+
+        return JsonResponse({'status': 'error', 'message': 'No filename provided'})
+
+    
+
+    try:
+
+        customer = Customer.objects.get(id=customer_id)
+
+        
+
+        # DEBUG: Print actual validation info
+
+        print(f"?? ENHANCED VALIDATION DEBUG: Customer='{customer.name}', File='{filename}', Type='{expected_type}', Section='{upload_section}'")
+
+        
+
+        # 1. PRIORITY: REGION VALIDATION FIRST - Catch cross-region uploads before anything else!
+
+        customer_validation = validate_customer_technology_match(
+
+            customer.display_name, filename
+
+        )
+
+        if not customer_validation['valid']:
+
+            return JsonResponse({
+
+                'status': 'success',
+
+                'is_valid': False,
+
+                'message': f"? REGION MISMATCH: {customer_validation['error']}"
+
+            })
+
+        
+
+        # 2. File type validation - only after region check passes
+
+        if expected_type:
+
+            file_type_validation = validate_file_type_match(filename, expected_type)
+
+            if not file_type_validation['valid']:
+
+                return JsonResponse({
+
+                    'status': 'success',
+
+                    'is_valid': False,
+
+                    'message': f"? Wrong File Type: {file_type_validation['error']}"
+
+                })
+
+        
+
+        # 3. Validate section-specific upload if section provided
+
+        if upload_section and expected_type:
+
+            section_validation = validate_section_specific_upload(
+
+                customer.name, filename, upload_section, expected_type
+
+            )
+
+            if not section_validation['valid']:
+
+                return JsonResponse({
+
+                    'status': 'success',
+
+                    'is_valid': False,
+
+                    'message': f"? Wrong Section: {section_validation['error']}"
+
+                })
+
+        
+
+        # All validations passed
+
+        return JsonResponse({
+
+            'status': 'success',
+
+            'is_valid': True,
+
+            'message': "? File validation passed - correct type, section, and customer match!"
+
+        })
+
+        
+
+    except Customer.DoesNotExist:
+
+        return JsonResponse({'status': 'error', 'message': 'Customer not found'})
+
+    except Exception as e:
+
+        return JsonResponse({
+
+            'status': 'error', 
+
+            'message': f'Validation error: {str(e)}'
+
+        })
+
+
+def validate_filename_contains_customer_name(filename, customer_name):
+
+    """Check if filename contains customer name (case-insensitive)"""
+
+    import string
+
+    
+
+    # Clean customer name: remove spaces, punctuation, convert to lowercase
+
+    customer_clean = ''.join(c for c in customer_name.lower() if c not in string.punctuation and c != ' ')
+
+    
+
+    # Clean filename: remove spaces, punctuation, convert to lowercase
+
+    filename_clean = ''.join(c for c in filename.lower() if c not in string.punctuation and c != ' ')
+
+    
+
+    # Also check individual words in customer name
+
+    customer_words = [word.strip().lower() for word in customer_name.split() if len(word.strip()) > 2]
+
+    
+
+    # Check if full cleaned name is in filename or if any significant word is in filename
+
+    return (customer_clean in filename_clean or 
+
+            any(word in filename_clean for word in customer_words if len(word) > 2))
+
+
+def validate_report_file_strict(file_name):
+
+    """STRICT validation for report files - rejects HC Tracker, Tracker, and Ignore files"""
+
+    file_name_upper = file_name.upper()
+
+    
+
+    # FORBIDDEN patterns that are NEVER allowed in report files
+
+    forbidden_patterns = [
+
+        'HC_ISSUES_TRACKER', 'ISSUES_TRACKER', 'HC_TRACKER', 'TRACKER',
+
+        'IGNORED_TEST_CASES', 'IGNORE_TEST', 'SELECTIVE_IGNORE', 'GLOBAL_IGNORE', 'IGNORE'
+
+    ]
+
+    
+
+    # Check if file contains any forbidden pattern
+
+    for pattern in forbidden_patterns:
+
+        if pattern in file_name_upper:
+
+            error_message = f"?? **WRONG FILE TYPE FOR REPORT UPLOAD**\n\n"
+
+            error_message += f"File '{file_name}' contains '{pattern}' which is NOT allowed in report upload section.\n\n"
+
+            
+
+            if 'TRACKER' in pattern:
+
+                error_message += f"**?? SOLUTION:** This appears to be a TRACKER file.\n"
+
+                error_message += f" Use the **'Upload Old Tracker'** section instead\n"
+
+            elif 'IGNORE' in pattern:
+
+                error_message += f"**?? SOLUTION:** This appears to be an IGNORE file.\n"
+
+                error_message += f" Use the **'Upload Ignore Files'** section instead\n"
+
+            
+
+            error_message += f"\n**? FORBIDDEN PATTERN:** {pattern}\n"
+
+            error_message += f"**?? VALID REPORT FILES should contain:** 'REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK'\n"
+
+            return {'valid': False, 'error': error_message}
+
+    
+
+    # REQUIRED patterns for report files (at least one should be present)
+
+    required_patterns = ['REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK']
+
+    has_required = any(pattern in file_name_upper for pattern in required_patterns)
+
+    
+
+    if not has_required:
+
+        error_message = f"?? **NOT A REPORT FILE**\n\n"
+
+        error_message += f"File '{file_name}' doesn't appear to be a health check report.\n\n"
+
+        error_message += f"**Required patterns (at least one):** REPORT, REPORTS, TEC, HEALTH_CHECK\n\n"
+
+        error_message += f"**Examples of valid report filenames:**\n"
+
+        error_message += f" BSNL_East_DWDM_Reports_20250115.xlsx\n"
+
+        error_message += f" Customer_TEC_Health_Check_Report_Jan2025.xlsx\n"
+
+        error_message += f" Network_HC_Report_20250115.xlsx\n"
+
+        return {'valid': False, 'error': error_message}
+
+    
+
+    return {'valid': True, 'error': None}
+
+
+def validate_file_type_match(file_name, expected_type):
+
+    """Validate that the file matches the expected type based on file name patterns with strict exclusions"""
+
+    
+
+    # For REPORT type, use strict validation
+
+    if expected_type == 'REPORT':
+
+        return validate_report_file_strict(file_name)
+
+    
+
+    file_name_upper = file_name.upper()
+
+    
+
+    # Define EXCLUSIVE patterns - if a file contains these, it belongs to that type ONLY
+
+    exclusive_patterns = {
+
+        'TRACKER': ['HC_ISSUES_TRACKER', 'ISSUES_TRACKER', 'HC_TRACKER', 'TRACKER'],
+
+        'IGNORE': ['IGNORED_TEST_CASES', 'IGNORE_TEST', 'SELECTIVE_IGNORE', 'GLOBAL_IGNORE', 'IGNORE'],
+
+        'INVENTORY': ['INVENTORY_CSV', 'REMOTE_INVENTORY'],
+
+        'HOST': ['HOST_FILE', 'HOST_LIST']
+
+    }
+
+    
+
+    # FIRST: Check if file belongs to a different exclusive type
+
+    for file_type, patterns in exclusive_patterns.items():
+
+        if file_type != expected_type:
+
+            for pattern in patterns:
+
+                if pattern in file_name_upper:
+
+                    error_message = f"?? **WRONG UPLOAD SECTION**\n\n"
+
+                    error_message += f"This file '{file_name}' appears to be a **{file_type.lower()}** file, not a {expected_type.lower()} file.\n\n"
+
+                    error_message += f"**?? SOLUTION:** Please upload this file in the correct section:\n"
+
+                    if file_type == 'TRACKER':
+
+                        error_message += " Use the **'Upload Tracker'** or **'Upload Old Tracker'** section\n"
+
+                    elif file_type == 'IGNORE':
+
+                        error_message += " Use the **'Upload Ignore Files'** section\n"
+
+                    error_message += f"\n**?? File contains pattern:** {pattern}\n"
+
+                    error_message += f"**?? Detected as:** {file_type} file\n"
+
+                    error_message += f"**? Current section:** {expected_type} upload (wrong!)\n"
+
+                    return {'valid': False, 'error': error_message}
+
+    
+
+    # Standard file type patterns (only checked if not exclusively another type)
+
+    file_type_patterns = {
+
+        'INVENTORY': ['INVENTORY', 'REMOTE_INVENTORY', 'NODE_LIST', 'DEVICES'],
+
+        'TRACKER': ['TRACKER', 'HC_ISSUES', 'ISSUES_TRACKER', 'HC_TRACKER'],
+
+        'IGNORE': ['IGNORE', 'IGNORED_TEST', 'TEST_CASES', 'SELECTIVE_IGNORE'],
+
+        'HOST': ['HOST', 'HOSTS', 'HOST_FILE', 'NODE_DETAILS']
+
+    }
+
+    
+
+    # Check if file name contains any pattern for the expected type
+
+    if expected_type in file_type_patterns:
+
+        patterns = file_type_patterns[expected_type]
+
+        if any(pattern in file_name_upper for pattern in patterns):
+
+            return {'valid': True, 'error': None}
+
+    
+
+    # Generate error message with allowed patterns
+
+    error_message = f"?? **FILE TYPE MISMATCH**\n\n"
+
+    error_message += f"This file '{file_name}' doesn't appear to be a {expected_type.lower()} file.\n\n"
+
+    
+
+    if expected_type in file_type_patterns:
+
+        error_message += f"**Expected file name patterns for {expected_type}:**\n"
+
+        for pattern in file_type_patterns[expected_type]:
+
+            error_message += f" *{pattern.lower()}*\n"
+
+    
+
+    error_message += f"\n**Examples of valid filenames:**\n"
+
+    
+
+    # Generate example filenames based on type
+
+    if expected_type == 'INVENTORY':
+
+        error_message += " Remote_Inventory_August_2024.csv\n"
+
+        error_message += " Node_List_CSV_Export.csv\n"
+
+    elif expected_type == 'TRACKER':
+
+        error_message += " HC_Issues_Tracker_Aug2024.xlsx\n"
+
+        error_message += " Issues_Tracker_Updated.xlsx\n"
+
+    elif expected_type == 'IGNORE':
+
+        error_message += " Ignored_Test_Cases.xlsx\n"
+
+        error_message += " Selective_Ignore_List.xlsx\n"
+
+    elif expected_type == 'HOST':
+
+        error_message += " Host_File_Details.csv\n"
+
+        error_message += " Node_Details_Export.csv\n"
+
+    
+
+    return {'valid': False, 'error': error_message}
+
+
+def validate_section_specific_upload(customer_name, filename, upload_section, expected_file_type):
+
+    """ULTRA STRICT SECTION VALIDATION: Only correct file types allowed in each section"""
+
+    
+
+    print(f"?? ULTRA STRICT SECTION VALIDATION: Customer='{customer_name}', File='{filename}', Section='{upload_section}', Expected='{expected_file_type}'")
+
+    
+
+    filename_upper = filename.upper()
+
+    
+
+    # ULTRA STRICT: Each section only accepts ONE file type
+
+    section_rules = {
+
+        'REPORT': {
+
+            'required_patterns': ['REPORT', 'REPORTS', 'TEC', 'HEALTH_CHECK'],
+
+            'forbidden_patterns': ['TRACKER', 'INVENTORY', 'IGNORE', 'HOST'],
+
+            'allowed_extensions': ['.xlsx'],
+
+            'section_name': 'Report Upload'
+
+        },
+
+        'INVENTORY': {
+
+            'required_patterns': ['INVENTORY', 'REMOTE_INVENTORY', 'CSV'],
+
+            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'IGNORE', 'HOST'],
+
+            'allowed_extensions': ['.csv'],
+
+            'section_name': 'Inventory Upload'
+
+        },
+
+        'TRACKER': {
+
+            'required_patterns': ['TRACKER', 'HC_ISSUES', 'ISSUES_TRACKER', 'HC_TRACKER'],
+
+            'forbidden_patterns': ['REPORT', 'REPORTS', 'INVENTORY', 'IGNORE', 'HOST'],
+
+            'allowed_extensions': ['.xlsx'],
+
+            'section_name': 'Tracker Upload'
+
+        },
+
+        'IGNORE': {
+
+            'required_patterns': ['IGNORE', 'IGNORED_TEST', 'TEST_CASES'],
+
+            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'INVENTORY', 'HOST'],
+
+            'allowed_extensions': ['.xlsx', '.txt'],
+
+            'section_name': 'Ignore Files Upload'
+
+        },
+
+        'HOST': {
+
+            'required_patterns': ['HOST', 'HOSTS', 'NODE_DETAILS'],
+
+            'forbidden_patterns': ['TRACKER', 'REPORT', 'REPORTS', 'INVENTORY', 'IGNORE'],
+
+            'allowed_extensions': ['.csv', '.xlsx', '.xls'],
+
+            'section_name': 'Host Files Upload'
+
+        }
+
+    }
+
+    
+
+    # Get file extension
+
+    file_extension = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
+
+    
+
+    # Check if expected file type exists
+
+    if expected_file_type not in section_rules:
+
+        return {'valid': False, 'error': f"? Unknown file type: {expected_file_type}"}
+
+    
+
+    rules = section_rules[expected_file_type]
+
+    
+
+    # 1. STRICT EXTENSION CHECK
+
+    if file_extension not in rules['allowed_extensions']:
+
+        allowed_ext = ', '.join(rules['allowed_extensions'])
+
+        return {
+
+            'valid': False,
+
+            'error': f"?? **WRONG FILE EXTENSION**\n\n"
+
+                    f"File '{filename}' has extension '{file_extension}'.\n"
+
+                    f"**{rules['section_name']} section ONLY accepts:** {allowed_ext}\n\n"
+
+                    f"?? **SOLUTION:** Upload a {allowed_ext} file in this section."
+
+        }
+
+    
+
+    # 2. STRICT FORBIDDEN PATTERN CHECK - REJECT if contains wrong type
+
+    for forbidden in rules['forbidden_patterns']:
+
+        if forbidden in filename_upper:
+
+            return {
+
+                'valid': False,
+
+                'error': f"?? **WRONG FILE TYPE FOR {rules['section_name'].upper()} SECTION**\n\n"
+
+                        f"File '{filename}' contains '{forbidden}' - this is NOT a {expected_file_type} file!\n\n"
+
+                        f"**? CURRENT SECTION:** {rules['section_name']} (WRONG!)\n"
+
+                        f"**? CORRECT SECTION:** {get_correct_section_for_pattern(forbidden)}\n\n"
+
+                        f"?? **SOLUTION:** Upload this file in the correct section."
+
+            }
+
+    
+
+    # 3. STRICT REQUIRED PATTERN CHECK - MUST contain correct type
+
+    has_required = any(pattern in filename_upper for pattern in rules['required_patterns'])
+
+    if not has_required:
+
+        required_list = ', '.join([f"*{p}*" for p in rules['required_patterns']])
+
+        return {
+
+            'valid': False,
+
+            'error': f"?? **NOT A {expected_file_type} FILE**\n\n"
+
+                    f"File '{filename}' doesn't contain any {expected_file_type} identifiers.\n\n"
+
+                    f"**REQUIRED PATTERNS:** {required_list}\n\n"
+
+                    f"**?? Valid {expected_file_type} file examples:**\n"
+
+                    f"{get_example_filenames(expected_file_type, customer_name)}\n\n"
+
+                    f"?? **SOLUTION:** Only upload {expected_file_type} files in {rules['section_name']} section."
+
+        }
+
+    
+
+    print(f"? ULTRA STRICT SECTION VALIDATION PASSED: Correct {expected_file_type} file in correct section!")
+
+    return {'valid': True, 'error': None}
+
+
+def get_correct_section_for_pattern(pattern):
+
+    """Get correct section name for a forbidden pattern"""
+
+    pattern_to_section = {
+
+        'TRACKER': 'Tracker Upload',
+
+        'REPORT': 'Report Upload', 
+
+        'REPORTS': 'Report Upload',
+
+        'INVENTORY': 'Inventory Upload',
+
+        'IGNORE': 'Ignore Files Upload',
+
+        'HOST': 'Host Files Upload'
+
+    }
+
+    return pattern_to_section.get(pattern, 'appropriate upload section')
+
+
+def get_correct_section_name(forbidden_pattern):
+
+    """Get the correct section name for a forbidden pattern"""
+
+    section_map = {
+
+        'TRACKER': 'HC Tracker Upload',
+
+        'INVENTORY': 'Inventory Upload', 
+
+        'REPORT': 'Report Upload',
+
+        'IGNORE': 'Ignore Files Upload',
+
+        'HOST': 'Host Files Upload'
+
+    }
+
+    return section_map.get(forbidden_pattern, 'appropriate upload')
+
+
+def get_example_filenames(file_type, customer_name):
+
+    """Generate ultra-strict example filenames for a given file type and customer"""
+
+    customer_prefix = customer_name.replace(' ', '_').replace('-', '_')
+
+    
+
+    examples = {
+
+        'REPORT': [
+
+            f" {customer_prefix}_TEC_Health_Check_Report_20250115.xlsx",
+
+            f" {customer_prefix}_HC_Report_January_2025.xlsx",
+
+            f" {customer_prefix}_Network_Reports_20250115.xlsx",
+
+            f" {customer_prefix}_TEC_Reports_Monthly.xlsx"
+
+        ],
+
+        'INVENTORY': [
+
+            f" {customer_prefix}_Remote_Inventory_20250115.csv",
+
+            f" {customer_prefix}_Node_List_January.csv",
+
+            f" {customer_prefix}_Inventory_Export.csv",
+
+            f" Remote_Inventory_{customer_prefix}_Latest.csv"
+
+        ],
+
+        'TRACKER': [
+
+            f" {customer_prefix}_HC_Issues_Tracker_20250115.xlsx",
+
+            f" {customer_prefix}_Issues_Tracker_Updated.xlsx",
+
+            f" HC_Issues_Tracker_{customer_prefix}_Jan2025.xlsx",
+
+            f" {customer_prefix}_Health_Check_Tracker.xlsx"
+
+        ],
+
+        'IGNORE': [
+
+            f" {customer_prefix}_Ignored_Test_Cases.xlsx",
+
+            f" {customer_prefix}_Selective_Ignore_List.xlsx",
+
+            f" {customer_prefix}_Global_Ignore.txt",
+
+            f" Ignored_Test_Cases_{customer_prefix}.xlsx"
+
+        ],
+
+        'HOST': [
+
+            f" {customer_prefix}_Host_Details.csv",
+
+            f" {customer_prefix}_Node_Host_File.csv",
+
+            f" Host_File_{customer_prefix}_Export.csv",
+
+            f" {customer_prefix}_Hosts_List.csv"
+
+        ]
+
+    }
+
+    
+
+    return '\n'.join(examples.get(file_type, [f" {customer_prefix}_{file_type}_file.ext"]))
+
+
+def validate_customer_technology_match(customer_name, filename):
+
+    """?? COMPREHENSIVE VALIDATION - Validates operator, region, and technology matching"""
+
+    result = match_customer_filename(customer_name, filename)
+
+    if result['valid']:
+
+        print(f"? Customer-file validation PASSED: '{filename}' for '{customer_name}' ({result['match_info']})")
+
+    else:
+
+        print(f"? Customer-file validation FAILED: '{filename}' for '{customer_name}'")
+
+    return result
+
+
+def extract_meaningful_words(text):
+
+    """Extract meaningful words from customer name or filename"""
+
+    import re
+
+    
+
+    # Convert to uppercase and clean
+
+    text_upper = text.upper().strip()
+
+    
+
+    # Replace common separators with spaces
+
+    text_clean = re.sub(r'[_\-\.\\\/>]', ' ', text_upper)
+
+    
+
+    # Split into words
+
+    words = text_clean.split()
+
+    
+
+    # Define words to exclude (common but not meaningful for matching)
+
+    excluded_words = {
+
+        # Generic terms
+
+        'NETWORK', 'NETWORKS', 'COMPANY', 'LIMITED', 'LTD', 'PVT', 'PRIVATE',
+
+        'CORPORATION', 'CORP', 'INC', 'TECHNOLOGIES', 'TECH', 'SOLUTIONS',
+
+        'SERVICES', 'SERVICE', 'SYSTEMS', 'SYSTEM', 'GROUP', 'ENTERPRISES',
+
+        # File-related terms
+
+        'REPORT', 'REPORTS', 'FILE', 'FILES', 'DATA', 'EXPORT', 'IMPORT',
+
+        'HEALTH', 'CHECK', 'TRACKER', 'ISSUES', 'TEST', 'CASES', 'IGNORE',
+
+        'IGNORED', 'GLOBAL', 'SELECTIVE', 'HC', 'TEC', 'CSV', 'XLSX', 'TXT',
+
+        # Time-related terms
+
+        'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
+
+        'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
+
+        'JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC',
+
+        '2024', '2025', '2026', '2023', '2022', '2021', '2020',
+
+        # Generic location terms (but NOT regions - we need those for validation)
+
+        'ZONE', 'CIRCLE', 'AREA', 'DIVISION', 'BRANCH', 'OFFICE'
+
+    }
+
+    
+
+    # Filter meaningful words (length >= 2 and not in excluded list)
+
+    meaningful_words = []
+
+    for word in words:
+
+        word_clean = word.strip()
+
+        # Skip if too short, numeric only, or in excluded list
+
+        if (len(word_clean) >= 2 and 
+
+            not word_clean.isdigit() and 
+
+            word_clean not in excluded_words):
+
+            meaningful_words.append(word_clean)
+
+    
+
+    return meaningful_words
+
+
+def perform_smart_customer_matching(customer_name, filename, customer_words, filename_words):
+
+    """Perform intelligent customer matching based on word overlap"""
+
+    
+
+    if not customer_words:
+
+        return {'valid': True, 'error': None}
+
+    
+
+    # STRICT REGION CHECK - Regional customers can only upload files from their region
+
+    regions = [
+
+        'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
+
+        'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
+
+        'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
+
+        'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD',
+
+        'UP', 'BIHAR', 'PUNJAB', 'HARYANA', 'RAJASTHAN', 'MP', 'GUJARAT',
+
+        'MAHARASHTRA', 'KARNATAKA', 'TAMILNADU', 'AP', 'TELANGANA'
+
+    ]
+
+    
+
+    customer_upper = customer_name.upper()
+
+    filename_upper = filename.upper()
+
+    
+
+    # Find customer's regions
+
+    customer_regions = [region for region in regions if region in customer_upper]
+
+    
+
+    # Find file's regions  
+
+    file_regions = [region for region in regions if region in filename_upper]
+
+    
+
+    # ?? CONFIGURABLE REGION VALIDATION - Now disabled since validate_customer_technology_match handles it
+
+    # OPTION 1: STRICT MODE - Regions must match exactly
+
+    # OPTION 2: FLEXIBLE MODE - Allow cross-region uploads with warning
+
+    # OPTION 3: DISABLED MODE - Skip region validation entirely
+
+    
+
+    REGION_VALIDATION_MODE = 'DISABLED'  # Disabled here because validate_customer_technology_match already handles region validation
+
+    
+
+    if customer_regions and REGION_VALIDATION_MODE != 'DISABLED':
+
+        if file_regions:
+
+            # Both have regions - check based on validation mode
+
+            regions_match = any(c_region == f_region for c_region in customer_regions for f_region in file_regions)
+
+            
+
+            if not regions_match:
+
+                if REGION_VALIDATION_MODE == 'STRICT':
+
+                    print(f"?? STRICT MODE: Region mismatch detected - REJECTING FILE")
+
+                    print(f"   Customer regions: {customer_regions}")
+
+                    print(f"   File regions: {file_regions}")
+
+                    return {
+
+                        'valid': False,
+
+                        'error': f"?? **WRONG REGION FOR CUSTOMER**\n\n"
+
+                                f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
+
+                                f"But file '{filename}' is for **{'/'.join(file_regions)}** region.\n\n"
+
+                                f"**?? SOLUTION:**\n"
+
+                                f" Upload files specifically for **{'/'.join(customer_regions)}** region only\n"
+
+                                f" Double-check you selected the correct customer\n\n"
+
+                                f"**?? Expected filename format:**\n"
+
+                                f" *{customer_regions[0].lower()}* should be in the filename\n\n"
+
+                                f"**? REGION MISMATCH:** {'/'.join(customer_regions)} ? {'/'.join(file_regions)}"
+
+                    }
+
+                elif REGION_VALIDATION_MODE == 'FLEXIBLE':
+
+                    print(f"?? FLEXIBLE MODE: Region mismatch detected - ALLOWING with warning")
+
+                    print(f"   Customer regions: {customer_regions} | File regions: {file_regions}")
+
+                    print(f"   ?? Cross-region upload allowed in flexible mode")
+
+            else:
+
+                print(f"? Region validation passed: {customer_regions} matches {file_regions}")
+
+        
+
+        # Handle files without region in flexible mode
+
+        elif REGION_VALIDATION_MODE == 'FLEXIBLE':
+
+            print(f"?? FLEXIBLE MODE: Customer has region {customer_regions} but file has NO region - ALLOWING")
+
+        elif REGION_VALIDATION_MODE == 'STRICT':
+
+            print(f"?? STRICT MODE: Customer has region {customer_regions} but file has NO region - REJECTING FILE")
+
+            return {
+
+                'valid': False,
+
+                'error': f"?? **FILE MISSING REQUIRED REGION**\n\n"
+
+                        f"Customer '{customer_name}' is **{'/'.join(customer_regions)}** region.\n"
+
+                        f"But file '{filename}' does not specify any region.\n\n"
+
+                        f"**?? SOLUTION:**\n"
+
+                        f" Upload files that contain **{'/'.join(customer_regions)}** in the filename\n"
+
+                        f" Ensure filename follows pattern: *{customer_regions[0].lower()}*\n\n"
+
+                        f"**? MISSING REGION:** File must contain {'/'.join(customer_regions)}"
+
+            }
+
+        
+
+        print(f"?? Region validation completed for regional customer (mode: {REGION_VALIDATION_MODE})")
+
+    elif REGION_VALIDATION_MODE == 'DISABLED':
+
+        print(f"?? Region validation is DISABLED - accepting all region combinations")
+
+    
+
+    # Count exact and partial matches
+
+    exact_matches = 0
+
+    partial_matches = 0
+
+    matched_words = []
+
+    
+
+    for customer_word in customer_words:
+
+        found_match = False
+
+        
+
+        # Try exact match first
+
+        if customer_word in filename_words:
+
+            exact_matches += 1
+
+            matched_words.append(f"{customer_word}(exact)")
+
+            found_match = True
+
+        else:
+
+            # Try partial matches for words >= 3 characters
+
+            if len(customer_word) >= 3:
+
+                for filename_word in filename_words:
+
+                    if len(filename_word) >= 3:
+
+                        # Check substring matches in both directions
+
+                        if (customer_word in filename_word or 
+
+                            filename_word in customer_word or
+
+                            are_similar_words(customer_word, filename_word)):
+
+                            partial_matches += 1
+
+                            matched_words.append(f"{customer_word}?{filename_word}(partial)")
+
+                            found_match = True
+
+                            break
+
+    
+
+    total_matches = exact_matches + partial_matches
+
+    total_words = len(customer_words)
+
+    match_percentage = total_matches / total_words if total_words > 0 else 0
+
+    
+
+    print(f"?? Match Analysis: {exact_matches} exact, {partial_matches} partial, {total_matches}/{total_words} total ({match_percentage:.1%})")
+
+    print(f"?? Matched words: {matched_words}")
+
+    
+
+    # Flexible matching criteria - adjust based on customer name complexity
+
+    if total_words == 1:
+
+        # Single word customer - need at least partial match
+
+        required_threshold = 0.7
+
+    elif total_words == 2:
+
+        # Two words - need at least one good match
+
+        required_threshold = 0.5
+
+    else:
+
+        # Multiple words - more lenient for complex names
+
+        required_threshold = 0.4
+
+    
+
+    # Special case: if we have at least 2 exact matches, always accept
+
+    if exact_matches >= 2:
+
+        print(f"? Strong match: {exact_matches} exact matches found")
+
+        return {'valid': True, 'error': None}
+
+    
+
+    # Check if we meet the threshold
+
+    if match_percentage >= required_threshold or total_matches >= 2:
+
+        print(f"? Sufficient match: {match_percentage:.1%} meets threshold {required_threshold:.1%}")
+
+        return {'valid': True, 'error': None}
+
+    
+
+    # If no matches found, provide helpful error
+
+    if total_matches == 0:
+
+        return {
+
+            'valid': False,
+
+            'error': f"?? **FILE DOESN'T MATCH CUSTOMER**\n\n"
+
+                    f"Customer '{customer_name}' contains: **{', '.join(customer_words)}**\n"
+
+                    f"But file '{filename}' doesn't contain any of these identifiers.\n\n"
+
+                    f"**?? SOLUTION:**\n"
+
+                    f" Ensure filename contains at least some customer identifiers\n"
+
+                    f" Double-check you selected the correct customer\n\n"
+
+                    f"**?? Expected patterns in filename:**\n" +
+
+                    "\n".join([f" *{word.lower()}*" for word in customer_words[:3]])
+
+        }
+
+    
+
+    # Insufficient matches
+
+    return {
+
+        'valid': False,
+
+        'error': f"?? **INSUFFICIENT CUSTOMER MATCH**\n\n"
+
+                f"Customer '{customer_name}' requires better filename match.\n"
+
+                f"Found {total_matches}/{total_words} matches ({match_percentage:.1%}), need {required_threshold:.1%}\n\n"
+
+                f"**Matched:** {', '.join(matched_words) if matched_words else 'None'}\n"
+
+                f"**Missing:** {', '.join([w for w in customer_words if not any(w in m for m in matched_words)])}\n\n"
+
+                f"**?? SOLUTION:** Include more customer-specific identifiers in filename"
+
+    }
+
+
+def are_similar_words(word1, word2):
+
+    """Check if two words are similar (for common variations)"""
+
+    # Handle common variations
+
+    variations = {
+
+        'VI': 'VODAFONE',
+
+        'VODAFONE': 'VI',
+
+        'IDEA': 'VI',
+
+        'BHARTI': 'AIRTEL',
+
+        'RELIANCE': 'JIO',
+
+        'TATA': 'TTML',
+
+        'BSNL': 'BHARAT',
+
+        'BHARAT': 'BSNL'
+
+    }
+
+    
+
+    # Check if words are variations of each other
+
+    if word1 in variations and variations[word1] == word2:
+
+        return True
+
+    if word2 in variations and variations[word2] == word1:
+
+        return True
+
+    
+
+    # Check Levenshtein distance for typos (only for words >= 4 chars)
+
+    if len(word1) >= 4 and len(word2) >= 4:
+
+        max_distance = max(len(word1), len(word2)) * 0.2  # Allow 20% difference
+
+        distance = calculate_levenshtein_distance(word1, word2, limit=int(max_distance))
+
+        return distance <= max_distance
+
+    
+
+    return False
+
+
+def calculate_levenshtein_distance(s1, s2, limit=None):
+
+    """Calculate Levenshtein distance between two strings (limit + 1 once it exceeds limit)"""
+
+    return edit_distance(s1, s2, limit)
+
+
+def perform_enhanced_category_validation(customer_name, filename, customer_upper, filename_upper):
+
+    """Enhanced validation for specific categories (telecom, enterprise, etc.)"""
+
+    
+
+    # Define known categories and their specific validation rules
+
+    telecom_operators = [
+
+        'BSNL', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'RELIANCE',
+
+        'RAILTEL', 'POWERGRID', 'BHARTI', 'TATA', 'TTML', 'TTSL',
+
+        'SIFY', 'NETMAGIC', 'NKN', 'MTNL', 'QUADRANT', 'TULIP',
+
+        'NICNET', 'SWAN', 'ERNET', 'PGCIL'
+
+    ]
+
+    
+
+    regions = [
+
+        'NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL',
+
+        'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST',
+
+        'NORTHERN', 'SOUTHERN', 'EASTERN', 'WESTERN',
+
+        'DELHI', 'MUMBAI', 'CHENNAI', 'KOLKATA', 'BANGALORE', 'HYDERABAD',
+
+        'UP', 'BIHAR', 'PUNJAB', 'HARYANA', 'RAJASTHAN', 'MP', 'GUJARAT',
+
+        'MAHARASHTRA', 'KARNATAKA', 'TAMILNADU', 'AP', 'TELANGANA'
+
+    ]
+
+    
+
+    technologies = [
+
+        'DWDM', 'OTN', 'SDH', 'SONET', 'PDH', 'MPLS', 'IP', 'ETHERNET',
+
+        'OPTICAL', 'FIBER', 'TRANSPORT', 'BACKBONE', 'METRO', 'ACCESS',
+
+        '1830PSS', 'CIENA', 'NOKIA', 'HUAWEI', 'ZTE', 'ERICSSON'
+
+    ]
+
+    
+
+    # Find matches in customer and file
+
+    customer_operator = find_longest_match(customer_upper, telecom_operators)
+
+    file_operator = find_longest_match(filename_upper, telecom_operators)
+
+    
+
+    customer_regions = find_all_matches(customer_upper, regions)
+
+    file_regions = find_all_matches(filename_upper, regions)
+
+    
+
+    customer_technologies = find_all_matches(customer_upper, technologies)
+
+    file_technologies = find_all_matches(filename_upper, technologies)
+
+    
+
+    # Validation logic - only enforce if customer has specific attributes
+
+    validation_issues = []
+
+    
+
+    # 1. Operator validation (strict for telecom customers)
+
+    if customer_operator and file_operator and customer_operator != file_operator:
+
+        # Handle known equivalencies
+
+        if not are_equivalent_operators(customer_operator, file_operator):
+
+            validation_issues.append({
+
+                'type': 'OPERATOR_MISMATCH',
+
+                'customer_value': customer_operator,
+
+                'file_value': file_operator,
+
+                'message': f"Customer is {customer_operator} but file is for {file_operator}"
+
+            })
+
+    
+
+    # 2. REGION VALIDATION - STRICT ENFORCEMENT
+
+    # Files MUST match the customer's region exactly
+
+    if customer_regions and file_regions:
+
+        if not any(c_region == f_region for c_region in customer_regions for f_region in file_regions):
+
+            validation_issues.append({
+
+                'type': 'REGION_MISMATCH',
+
+                'customer_value': '/'.join(customer_regions),
+
+                'file_value': '/'.join(file_regions),
+
+                'message': f"Customer is {'/'.join(customer_regions)} region but file is for {'/'.join(file_regions)} region"
+
+            })
+
+    elif customer_regions and not file_regions:
+
+        validation_issues.append({
+
+            'type': 'MISSING_REGION',
+
+            'customer_value': '/'.join(customer_regions),
+
+            'file_value': 'NONE',
+
+            'message': f"Customer is {'/'.join(customer_regions)} region but file has no region specified"
+
+        })
+
+    
+
+    # STRICT: If customer has region, file MUST have matching region - no exceptions
+
+    
+
+    # 3. Technology validation (lenient - warn but don't fail)
+
+    if customer_technologies and file_technologies:
+
+        if not any(c_tech == f_tech for c_tech in customer_technologies for f_tech in file_technologies):
+
+            print(f"?? TECHNOLOGY MISMATCH: Customer uses {customer_technologies} but file is for {file_technologies} (allowing)")
+
+    
+
+    # If we have validation issues, construct error message
+
+    if validation_issues:
+
+        error_parts = ["?? **CUSTOMER-FILE MISMATCH**\n"]
+
+        for issue in validation_issues:
+
+            error_parts.append(f" {issue['message']}")
+
+        
+
+        error_parts.extend([
+
+            "\n**?? SOLUTION:**",
+
+            f" Upload files specifically for '{customer_name}'",
+
+            " Check that you selected the correct customer",
+
+            " Ensure filename matches customer attributes"
+
+        ])
+
+        
+
+        # Add examples if we know the operator
+
+        if customer_operator:
+
+            error_parts.append(f"\n**?? Expected filename patterns:**")
+
+            base_name = customer_operator
+
+            if customer_regions:
+
+                base_name += f"_{customer_regions[0]}"
+
+            if customer_technologies:
+
+                base_name += f"_{customer_technologies[0]}"
+
+            error_parts.append(f" {base_name}_Report_20250115.xlsx")
+
+            error_parts.append(f" {base_name}_HC_Issues_Tracker.xlsx")
+
+        
+
+        return {'valid': False, 'error': "\n".join(error_parts)}
+
+    
+
+    # Build match info for success message
+
+    match_components = []
+
+    if customer_operator:
+
+        match_components.append(f"Operator: {customer_operator}")
+
+    if customer_regions:
+
+        match_components.append(f"Region: {'/'.join(customer_regions)}")
+
+    if customer_technologies:
+
+        match_components.append(f"Technology: {'/'.join(customer_technologies)}")
+
+    
+
+    match_info = " | ".join(match_components) if match_components else "Generic customer"
+
+    
+
+    return {'valid': True, 'error': None, 'match_info': match_info}
+
+
+def find_longest_match(text, candidates):
+
+    """Find the longest matching candidate in text"""
+
+    candidates_sorted = sorted(candidates, key=len, reverse=True)
+
+    for candidate in candidates_sorted:
+
+        if candidate in text:
+
+            return candidate
+
+    return None
+
+
+def find_all_matches(text, candidates):
+
+    """Find all matching candidates in text"""
+
+    matches = []
+
+    candidates_sorted = sorted(candidates, key=len, reverse=True)
+
+    for candidate in candidates_sorted:
+
+        if candidate in text and candidate not in matches:
+
+            matches.append(candidate)
+
+    return matches
+
+
+def are_equivalent_operators(op1, op2):
+
+    """Check if two operators are equivalent (handle mergers, rebranding)"""
+
+    equivalencies = {
+
+        ('VI', 'VODAFONE'): True,
+
+        ('VI', 'IDEA'): True,
+
+        ('VODAFONE', 'IDEA'): True,
+
+        ('BHARTI', 'AIRTEL'): True,
+
+        ('RELIANCE', 'JIO'): True,
+
+        ('TATA', 'TTML'): True,
+
+        ('TATA', 'TTSL'): True,
+
+    }
+
+    
+
+    # Check both directions
+
+    return equivalencies.get((op1, op2), False) or equivalencies.get((op2, op1), False)
+
+
+def validate_enhanced_customer_specific_upload(customer_name, filename, upload_section):
+
+    """STRICT CUSTOMER-SPECIFIC VALIDATION: Only files matching the exact customer are allowed"""
+
+    
+
+    print(f"?? STRICT CUSTOMER VALIDATION: Customer='{customer_name}', Filename='{filename}', Section='{upload_section}'")
+
+    
+
+    # Convert both to uppercase for comparison
+
+    customer_upper = customer_name.upper().strip()
+
+    filename_upper = filename.upper().strip()
+
+    
+
+    # STRICT MATCHING: Extract all significant words from customer name
+
+    import re
+
+    customer_words = [word.strip() for word in re.split(r'[\s_-]+', customer_upper) if word.strip() and len(word.strip()) >= 2]
+
+    filename_words = [word.strip() for word in re.split(r'[\s_-]+', filename_upper) if word.strip() and len(word.strip()) >= 2]
+
+    
+
+    print(f"?? Customer words: {customer_words}")
+
+    print(f"?? Filename words: {filename_words}")
+
+    
+
+    # Define critical components that MUST match exactly
+
+    operators = ['BSNL', 'RELIANCE', 'AIRTEL', 'VI', 'VODAFONE', 'IDEA', 'JIO', 'TATA']
+
+    regions = ['NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL', 'NORTHEAST', 'NORTHWEST', 'SOUTHEAST', 'SOUTHWEST']
+
+    technologies = ['DWDM', 'OTN', 'SDH', 'MPLS', 'IP', 'ETHERNET', 'OPTICAL', 'TRANSPORT', 'ACCESS']
+
+    
+
+    # Extract components from customer name
+
+    customer_operator = next((op for op in operators if op in customer_words), None)
+
+    customer_regions = [region for region in regions if region in customer_words]
+
+    customer_technologies = [tech for tech in technologies if tech in customer_words]
+
+    
+
+    # Extract components from filename
+
+    filename_operator = next((op for op in operators if op in filename_words), None)
+
+    filename_regions = [region for region in regions if region in filename_words]
+
+    filename_technologies = [tech for tech in technologies if tech in filename_words]
+
+    
+
+    validation_errors = []
+
+    
+
+    # 1. OPERATOR VALIDATION - Must match exactly if customer has operator
+
+    if customer_operator:
+
+        if not filename_operator:
+
+            validation_errors.append(f"MISSING OPERATOR: Customer '{customer_name}' requires operator '{customer_operator}' but file doesn't contain it")
+
+        elif customer_operator != filename_operator:
+
+            validation_errors.append(f"WRONG OPERATOR: Customer is '{customer_operator}' but file is for '{filename_operator}'")
+
+        else:
+
+            print(f"? OPERATOR MATCH: {customer_operator}")
+
+    
+
+    # 2. REGIONAL VALIDATION - Must match exactly if customer has region
+
+    if customer_regions:
+
+        if not filename_regions:
+
+            validation_errors.append(f"MISSING REGION: Customer '{customer_name}' requires region '{'/'.join(customer_regions)}' but file doesn't contain it")
+
+        elif not any(c_region == f_region for c_region in customer_regions for f_region in filename_regions):
+
+            validation_errors.append(f"WRONG REGION: Customer is '{'/'.join(customer_regions)}' but file is for '{'/'.join(filename_regions)}'")
+
+        else:
+
+            matching_regions = [region for region in customer_regions if region in filename_regions]
+
+            print(f"? REGION MATCH: {'/'.join(matching_regions)}")
+
+    elif filename_regions and not customer_regions:
+
+        # ALLOW: Customer with no region can accept files with any region
+
+        print(f"? Customer '{customer_name}' has no specific region, allowing file with region {'/'.join(filename_regions)}")
+
+    
+
+    # 3. TECHNOLOGY VALIDATION - Must match exactly if customer has technology
+
+    if customer_technologies:
+
+        if not filename_technologies:
+
+            validation_errors.append(f"MISSING TECHNOLOGY: Customer '{customer_name}' requires technology '{'/'.join(customer_technologies)}' but file doesn't contain it")
+
+        elif not any(c_tech == f_tech for c_tech in customer_technologies for f_tech in filename_technologies):
+
+            validation_errors.append(f"WRONG TECHNOLOGY: Customer uses '{'/'.join(customer_technologies)}' but file is for '{'/'.join(filename_technologies)}'")
+
+        else:
+
+            matching_techs = [tech for tech in customer_technologies if tech in filename_technologies]
+
+            print(f"? TECHNOLOGY MATCH: {'/'.join(matching_techs)}")
+
+    
+
+    # 4. STRICT KEYWORD MATCHING - All significant customer words must be found in filename
+
+    excluded_words = set(operators + regions + technologies + ['ZONE', 'CIRCLE', 'REGION', 'AREA', 'NETWORK', 'REPORTS', 'REPORT', 'HC', 'HEALTH', 'CHECK', 'ISSUES', 'TRACKER', 'FILE', 'DATA', 'CSV', 'XLSX', 'TXT'])
+
+    customer_keywords = [word for word in customer_words if word not in excluded_words and len(word) >= 3]
+
+    
+
+    if customer_keywords:
+
+        missing_keywords = []
+
+        for keyword in customer_keywords:
+
+            if keyword not in filename_upper:
+
+                missing_keywords.append(keyword)
+
+        
+
+        if missing_keywords:
+
+            validation_errors.append(f"MISSING CUSTOMER KEYWORDS: File must contain these customer-specific keywords: {', '.join(missing_keywords)}")
+
+        else:
+
+            print(f"? ALL CUSTOMER KEYWORDS FOUND: {customer_keywords}")
+
+    
+
+    # Return validation result
+
+    if not validation_errors:
+
+        print(f"? STRICT CUSTOMER VALIDATION PASSED: File belongs to correct customer!")
+
+        return {'valid': True, 'error': None}
+
+    else:
+
+        print(f"? STRICT CUSTOMER VALIDATION FAILED: {len(validation_errors)} error(s)")
+
+        
+
+        error_message = f"?? **FILE BELONGS TO WRONG CUSTOMER**\n\n"
+
+        error_message += f"This file '{filename}' does not belong to customer '{customer_name}'.\n\n"
+
+        error_message += f"**? Validation Errors:**\n"
+
+        for i, error in enumerate(validation_errors, 1):
+
+            error_message += f"{i}. {error}\n"
+
+        
+
+        error_message += f"\n**?? SOLUTION:**\n"
+
+        error_message += f" Only upload files that specifically belong to '{customer_name}'\n"
+
+        error_message += f" File names must contain all customer-specific identifiers\n"
+
+        error_message += f" Double-check you selected the correct customer\n"
+
+        
+
+        # Add expected format example
+
+        if customer_operator or customer_regions or customer_technologies:
+
+            expected_parts = []
+
+            if customer_operator:
+
+                expected_parts.append(customer_operator)
+
+            if customer_regions:
+
+                expected_parts.append(customer_regions[0])
+
+            if customer_technologies:
+
+                expected_parts.append(customer_technologies[0])
+
+            
+
+            if expected_parts:
+
+                expected_format = '_'.join(expected_parts)
+
+                error_message += f"\n**?? Expected filename format:** {expected_format}_filename.ext"
+
+        
+
+        return {'valid': False, 'error': error_message}
+
+
+def validate_flexible_customer_name_match(customer_name, filename):
+
+    """BACKWARD COMPATIBILITY: Flexible customer name matching with regional validation"""
+
+    import re
+
+    import string
+
+    
+
+    # First, try simple substring match (case-insensitive)
+
+    customer_simple = customer_name.lower().replace(' ', '').replace('_', '').replace('-', '')
+
+    filename_simple = filename.lower().replace(' ', '').replace('_', '').replace('-', '')
+
+    
+
+    # If simple match works, accept immediately
+
+    if customer_simple in filename_simple:
+
+        print(f"? Simple match: '{customer_simple}' found in '{filename_simple}'")
+
+        return True
+
+    
+
+    # STRICT REGIONAL VALIDATION: Check for conflicting regions
+
+    regions = ['west', 'east', 'north', 'south', 'central', 'northeast', 'northwest', 'southeast', 'southwest']
+
+    
+
+    # Extract regions from customer name and filename
+
+    customer_regions = [region for region in regions if region in customer_name.lower()]
+
+    filename_regions = [region for region in regions if region in filename.lower()]
+
+    
+
+    # If both have regions but they don't match, REJECT
+
+    if customer_regions and filename_regions:
+
+        if not any(c_region == f_region for c_region in customer_regions for f_region in filename_regions):
+
+            print(f"? REGIONAL MISMATCH: Customer has {customer_regions}, but file has {filename_regions}")
+
+            return False
+
+        else:
+
+            print(f"? REGIONAL MATCH: Both have matching region {customer_regions[0]}")
+
+    
+
+    # Clean both customer name and filename
+
+    def clean_text(text):
+
+        # Convert to lowercase first, then remove punctuation
+
+        text = text.lower()
+
+        # Replace underscores, hyphens, and other separators with spaces
+
+        text = re.sub(r'[_\-\.\\/]', ' ', text)
+
+        # Remove other punctuation and keep only alphanumeric and spaces
+
+        cleaned = ''.join(c if c.isalnum() or c.isspace() else ' ' for c in text)
+
+        # Split into words and remove common filler words
+
+        filler_words = {'zone', 'circle', 'region', 'area', 'network', 'reports', 'report', 'the', 'and', 'of', 'for', 'hc', 'health', 'check', 'date', 'file', 'data'}
+
+        words = [word.strip() for word in cleaned.split() if word.strip() and len(word.strip()) > 2 and word.strip() not in filler_words]
+
+        return words
+
+    
+
+    customer_words = clean_text(customer_name)
+
+    filename_words = clean_text(filename)
+
+    
+
+    print(f"?? Customer words: {customer_words}")
+
+    print(f"?? Filename words: {filename_words}")
+
+    
+
+    # If no significant words in customer name, accept
+
+    if not customer_words:
+
+        print(f"? No significant words in customer name, accepting")
+
+        return True
+
+    
+
+    # Count matches
+
+    matches = 0
+
+    matched_words = []
+
+    for customer_word in customer_words:
+
+        # Look for exact match or partial match (at least 3 characters)
+
+        for filename_word in filename_words:
+
+            if len(customer_word) >= 3 and len(filename_word) >= 3:
+
+                # Check for exact match or substring match in both directions
+
+                if (customer_word == filename_word or 
+
+                    customer_word in filename_word or 
+
+                    filename_word in customer_word):
+
+                    matches += 1
+
+                    matched_words.append(f"{customer_word}?{filename_word}")
+
+                    break
+
+    
+
+    match_percentage = matches / len(customer_words)
+
+    print(f"?? Matched {matches}/{len(customer_words)} words ({match_percentage:.1%}): {matched_words}")
+
+    
+
+    # More lenient threshold - accept if at least 50% match OR if 2+ significant words match
+
+    is_valid = match_percentage >= 0.5 or matches >= 2
+
+    print(f"?? Validation result: {is_valid} (threshold: 50% or 2+ matches)")
+
+    
+
+    return is_valid
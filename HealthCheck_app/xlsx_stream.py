@@ -0,0 +1,214 @@
+"""
+Streaming .xlsx writer for exports
+Writes a single-sheet workbook as the rows arrive: cells use inline strings (no shared string table)
+and the zip is written to a non-seekable buffer that is drained after every chunk of rows, so the
+first bytes go out immediately and memory stays constant however many rows are exported.
+"""
+
+import re
+import csv
+import zipfile
+from xml.sax.saxutils import escape
+
+# Index of each style in the cellXfs list of STYLES_XML
+XLSX_STYLES = {
+    'default': 0,
+    'title': 1,
+    'subtitle': 2,
+    'header': 3,
+    'group': 4,
+    'row': 5,
+    'bold': 6,
+}
+
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="5">'
+    '<font><sz val="10"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="10"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="18"/><color rgb="FF1F4E79"/><name val="Calibri"/></font>'
+    '<font><i/><sz val="11"/><color rgb="FF555555"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="4">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF4472C4"/><bgColor indexed="64"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFE8F4FD"/><bgColor indexed="64"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="7">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="3" fillId="3" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="4" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="1" fillId="3" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="0" applyBorder="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Characters XML 1.0 does not allow, even escaped
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class ZipStreamBuffer:
+    """Write-only, non-seekable sink for ZipFile; drain() hands over what was written so far"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def column_letter(index):
+    """Spreadsheet column letter of a zero-based column index (0 -> 'A', 26 -> 'AA')"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(ref, value, style):
+    style_attr = f' s="{style}"' if style else ''
+    if value is None or value == '':
+        return f'<c r="{ref}"{style_attr}/>' if style else ''
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def iter_xlsx(rows, sheet_title='Sheet1', column_widths=(), merged_ranges=(), chunk_rows=200):
+    """
+    Yield the bytes of a one-sheet .xlsx workbook.
+    rows is an iterable of (style_name, values) with style_name a key of XLSX_STYLES;
+    column_widths are fixed widths of the first columns, merged_ranges e.g. ['A1:H1'].
+    """
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', CONTENT_TYPES_XML)
+        archive.writestr('_rels/.rels', ROOT_RELS_XML)
+        archive.writestr('xl/_rels/workbook.xml.rels', WORKBOOK_RELS_XML)
+        archive.writestr('xl/styles.xml', STYLES_XML)
+        archive.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{escape(sheet_title[:31])}" sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        ))
+        yield buffer.drain()
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            head = [
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            ]
+            if column_widths:
+                head.append('<cols>')
+                head.extend(
+                    f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+                    for i, width in enumerate(column_widths, start=1)
+                )
+                head.append('</cols>')
+            head.append('<sheetData>')
+            sheet.write(''.join(head).encode('utf-8'))
+
+            pending = []
+            for row_number, (style_name, values) in enumerate(rows, start=1):
+                style = XLSX_STYLES[style_name]
+                cells = ''.join(
+                    _cell_xml(f'{column_letter(col)}{row_number}', value, style)
+                    for col, value in enumerate(values)
+                )
+                pending.append(f'<row r="{row_number}">{cells}</row>')
+                if len(pending) >= chunk_rows:
+                    sheet.write(''.join(pending).encode('utf-8'))
+                    pending = []
+                    yield buffer.drain()
+
+            tail = [''.join(pending), '</sheetData>']
+            if merged_ranges:
+                tail.append(f'<mergeCells count="{len(merged_ranges)}">')
+                tail.extend(f'<mergeCell ref="{ref}"/>' for ref in merged_ranges)
+                tail.append('</mergeCells>')
+            tail.append('</worksheet>')
+            sheet.write(''.join(tail).encode('utf-8'))
+
+    yield buffer.drain()
+
+
+class _Echo:
+    """csv.writer target that returns each formatted line instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    """Yield CSV lines for an iterable of row lists, one line per row"""
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
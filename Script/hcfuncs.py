@@ -5,6 +5,9 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import csv
 import re
+import os
+import pickle
+import hashlib
 
 light_green = "00CCFFCC"
 sky_blue = "00CCECFF"
@@ -113,6 +116,7 @@ def copy_first_row_hc_tracker(active_sheet, sheet_to_copy_from):
 
 
 def delete_closed_case_open_sheet_hc_tracker(open_sheet, m_row):
+    deleted_rows = []
     for o_row in reversed(list(open_sheet.iter_rows())):
         # Find the row to be deleted
         if (
@@ -135,9 +139,14 @@ def delete_closed_case_open_sheet_hc_tracker(open_sheet, m_row):
         ):
             # to_delete = True
             # Delete the entire row
-            open_sheet.delete_rows(o_row[0].row, 1)
+            row_number = o_row[0].row
+            open_sheet.delete_rows(row_number, 1)
+            deleted_rows.append(row_number)
             # import pdb; pdb.set_trace()
 
+    # Row numbers in deletion order, so a resumed run can replay them without rescanning
+    return deleted_rows
+
 
 def general_format_sheet(active_sheet):
     # Format the first row as follows
@@ -440,6 +449,16 @@ def format_nc_hc_id_column(active_sheet, col):
     return
 
 
+def close_case_hc_tracker(main_sheet, closed_sheet, closed_report_sheet, row_index, m_row):
+    # Mark the MAIN row as CLOSED and copy it to the closed cases report and the tracker CLOSED sheet
+    main_sheet.cell(row=row_index, column=13).value = "CLOSED"
+    closed_report_sheet.append(m_row)
+    closed_report_sheet.cell(row=closed_report_sheet.max_row, column=13).value = "CLOSED"
+    closed_sheet.append(m_row)
+    closed_sheet.cell(row=closed_sheet.max_row, column=13).value = "CLOSED"
+    return
+
+
 def extracted_sheet_format_hc_id_column(active_sheet, column_number):
     # HC Id is an integer
     # Check if this is a hc id column
@@ -947,7 +966,7 @@ def embed_node_coverage_chart(output_dir, hc_filename, active_sheet):
 
     return
 
-def update_pss_type(network_summary_sheet, node_coverage_sheet):
+def update_pss_type(network_summary_sheet, node_coverage_sheet, cell_updates=None):
     # Determine the last entry in network summary sheet - value Total Network Issues - 2
     last_node_row = 0
     for row in network_summary_sheet.iter_rows(min_row=1, max_row=network_summary_sheet.max_row, values_only=True):
@@ -990,9 +1009,13 @@ def update_pss_type(network_summary_sheet, node_coverage_sheet):
         if hc_id in nw_summ_sh_data_dict:
             if row[1] not in {'WDM', 'OCS'}:
                 node_coverage_sheet.cell(row=r_idx, column=2).value = nw_summ_sh_data_dict[hc_id][1]
+                if cell_updates is not None:
+                    cell_updates.append((r_idx, 2, nw_summ_sh_data_dict[hc_id][1]))
 
             if row[4] in {'Not Known', 'Not Available'}:
                 node_coverage_sheet.cell(row=r_idx, column=5).value = nw_summ_sh_data_dict[hc_id][4]
+                if cell_updates is not None:
+                    cell_updates.append((r_idx, 5, nw_summ_sh_data_dict[hc_id][4]))
         else:
             print(f"Warning: HC ID {hc_id} found in NODE COVERAGE but not in Network Summary sheet")
 
@@ -1013,10 +1036,88 @@ def add_new_nodes(nw_summ_sh_data_dict, node_coverage_sheet):
     for i in range(padding_length):
         padding.append('Not Added')
 
+    added_rows = []
     if new_nodes:
         for node in new_nodes:
-            node_coverage_sheet.append(tuple(list(node) + padding))
+            added_rows.append(tuple(list(node) + padding))
+            node_coverage_sheet.append(added_rows[-1])
+
+    return added_rows
+
+
+def apply_node_coverage_deltas(node_coverage_sheet, cell_updates, added_rows):
+    # Replay the PSS type updates and new nodes recorded by update_pss_type and add_new_nodes
+    for row, column, value in cell_updates:
+        node_coverage_sheet.cell(row=row, column=column).value = value
+    for row in added_rows:
+        node_coverage_sheet.append(row)
+    return
+
+
+# Checkpoints for resuming long tracker runs.
+# Each stage of main.py pickles its results to <checkpoint_dir>/<network>_<stage>.pkl together with a key
+# made from the SHA-256 of the input files it depends on. A retried run with the same inputs loads the
+# checkpoint instead of recomputing the stage; any change to an input changes the key and the stage reruns.
+checkpoint_stages = ("filter", "closed", "new_cases")
+
+
+def checkpoint_key(*input_files):
+    key_hash = hashlib.sha256()
+    for input_file in input_files:
+        if input_file is None or not Path(input_file).is_file():
+            key_hash.update(b"missing")
+            continue
+        with open(input_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                key_hash.update(chunk)
+        key_hash.update(b"|")
+    return key_hash.hexdigest()
+
+
+def checkpoint_path(checkpoint_dir, network_name, stage):
+    return Path(checkpoint_dir) / Path(network_name + "_" + stage + ".pkl")
+
+
+def load_checkpoint(checkpoint_dir, network_name, stage, key):
+    # Returns the stage data if a checkpoint with a matching key exists, otherwise None
+    path = checkpoint_path(checkpoint_dir, network_name, stage)
+    if not path.is_file():
+        return None
+    try:
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable checkpoint {path.name}: {e}")
+        return None
+    if checkpoint.get("key") != key:
+        return None
+    return checkpoint.get("data")
+
+
+def save_checkpoint(checkpoint_dir, network_name, stage, key, data):
+    # Write to a temporary file first so an interrupted save never leaves a truncated checkpoint
+    checkpoint_dir = Path(checkpoint_dir)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    path = checkpoint_path(checkpoint_dir, network_name, stage)
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Warning: Could not save {stage} checkpoint: {e}")
+    return
+
 
+def clear_checkpoints(checkpoint_dir, network_name):
+    # Called once the run has saved all its outputs
+    for stage in checkpoint_stages:
+        path = checkpoint_path(checkpoint_dir, network_name, stage)
+        try:
+            if path.is_file():
+                path.unlink()
+        except Exception as e:
+            print(f"Warning: Could not delete checkpoint {path.name}: {e}")
     return
 
 
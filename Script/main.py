@@ -110,66 +110,6 @@ print(f"HC report year is {hc_report_year}")
 print(f"HC report month is {hc_report_month}")
 print(f"HC report date is {hc_report_date}\n")
 
-# Load the HC report workbook in read mode and activate the CWBP worksheet and Network summary sheet
-hagen_report = opxl.load_workbook(input_hc_dir / Path(hc_filename), read_only=False)
-cwbp_sheet = hagen_report["CWBP"]
-network_summary_sheet = hagen_report["Network Report Summary"]
-
-# Get the maximum number of rows in hc workbook CWBP sheet
-cwbp_max_row = cwbp_sheet.max_row
-
-# Get the maximum number of columns in hc workbook CWBP sheet
-cwbp_max_col = cwbp_sheet.max_column
-
-# Create the report workbook to store our test cases
-hc_test_cases_report = opxl.Workbook()
-report_sheet = hc_test_cases_report.active
-report_sheet.title = "W & F"
-
-# Print the column titles in the report
-for i in range(1, cwbp_max_col + 1):
-    report_sheet.cell(row=1, column=i).value = cwbp_sheet.cell(row=1, column=i).value
-
-# Save the workbook as 'extracted_hc_test_cases.xlsx' in output_dir
-hc_test_cases_report.save(output_dir / Path(r"extracted_hc_test_cases.xlsx"))
-
-print("Extracting all FAILURES and WARNINGS from Hagen's HC report...", end="")
-
-# Extract all warnings and failures of interest and copy to report sheet
-for row in cwbp_sheet.iter_rows(min_row=2, values_only=True):
-    # hc_date = row[5][:6]      changed from main-008.py on 2nd Aug 2024
-    # if hc_date == year_month: changed from main-008.py on 2nd Aug 2024
-    report_sheet.append(row)
-
-# Added on 24th April 2024
-# Format the W & F sheet of the extracted hc test cases W & F sheet's HC Id column only
-funcs.extracted_sheet_format_hc_id_column(report_sheet, 1)
-
-# Save the workbook as 'extracted_hc_test_cases.xlsx' in output_dir
-hc_test_cases_report.save(output_dir / Path(r"extracted_hc_test_cases.xlsx"))
-
-print("Done")
-
-print("Removing the test cases to be ignored from Hagen's HC report...", end="")
-
-#######################################################################################################
-# ADDED ON 25TH APRIL 2024 - To filter out the ignored cases from the extracted report
-# Started modifying on 29th April 2024 as a three step process
-
-# Open the extracted HC issues for this network and activate the W&F sheet
-extracted = output_dir / Path(r"extracted_hc_test_cases.xlsx")
-extracted_tracker = opxl.load_workbook(extracted)
-extracted_sheet_wf = extracted_tracker["W & F"]
-# extracted_sheet_info = extracted_tracker["INFO"]
-
-# Step 1 Remove all 'Info' cases and copy to list
-remove_info_from_extracted = [
-    row
-    for row in extracted_sheet_wf.iter_rows(min_row=2, values_only=True)
-    if row[9] != "Info"
-]
-
-# Step 2 Remove all the ignored test cases for the network as given that network's ignore text file
 # Read-In the test cases to be ignored - with case-insensitive search
 ignored_text_file = current_dir / Path(network_name + "_ignored_test_cases.txt")
 
@@ -208,26 +148,6 @@ ignored_text_file_cases = [line.strip() for line in ignored_text_file_cases]
 # Remove blank lines in ignored cases
 ignored_text_file_cases = [tc for tc in ignored_text_file_cases if tc != ""]
 
-# Now remove all these cases from the extracted list
-ignored_cases = [
-    tc for tc in remove_info_from_extracted if tc[7] not in ignored_text_file_cases
-]
-
-# Create a workbook to save our ignored_cases list to an excel file set_1_2_extracted_test_cases.xlsx
-two_step_extracted_report = opxl.Workbook()
-two_step_extracted_sheet = two_step_extracted_report.active
-two_step_extracted_sheet.title = "2 Step Extracted"
-
-# Print the first row header
-funcs.copy_first_row_hc_tracker(two_step_extracted_sheet, extracted_sheet_wf)
-
-# Append all the ignored_cases to this workbook
-for line in ignored_cases:
-    two_step_extracted_sheet.append(line)
-
-# Save the two_step_extracted_report in the out directory as  two_step_extracted.xlsx
-two_step_extracted_report.save(output_dir / Path(r"two_step_extracted.xlsx"))
-
 # Open the ignored HC issues for this network and activate the MAIN sheet
 ignored_cases_filename = network_name + "_ignored_test_cases.xlsx"
 ignored_cases_file_path = current_dir / Path(ignored_cases_filename)
@@ -286,15 +206,137 @@ else:
         ignored_cases_workbook = DummySheet()
         ignored_sheet = ignored_cases_workbook["MAIN"]
 
-indices_to_check = (0, 7, 9, 11)  # HC Id, Test Case, Priority and Finding
-
-# Call the function to filter the data
-filtered_data, ignored_rows = funcs.remove_ignore_from_extracted(
-    two_step_extracted_sheet, ignored_sheet, indices_to_check
+# Added for checkpoint/resume of long runs.
+# The expensive stages below (extract & filter, closed cases, new cases) each persist their results in
+# checkpoint_dir, keyed by the hashes of the input files they depend on. If a run fails part way, a retry
+# with the same inputs resumes from the last completed stage instead of starting over.
+checkpoint_dir = current_dir / Path(r"checkpoints")
+filter_checkpoint_key = funcs.checkpoint_key(
+    input_hc_dir / Path(hc_filename),
+    found_text_file or ignored_text_file,
+    found_excel_file or ignored_cases_file_path,
+)
+filter_checkpoint = funcs.load_checkpoint(
+    checkpoint_dir, network_name, "filter", filter_checkpoint_key
 )
 
-# Added to main-008.py on 29th July 2024
-filtered_data.sort(key=lambda x: x[5])
+# Load the HC report workbook in read mode and activate the CWBP worksheet and Network summary sheet
+hagen_report = opxl.load_workbook(input_hc_dir / Path(hc_filename), read_only=False)
+cwbp_sheet = hagen_report["CWBP"]
+network_summary_sheet = hagen_report["Network Report Summary"]
+
+# Get the maximum number of rows in hc workbook CWBP sheet
+cwbp_max_row = cwbp_sheet.max_row
+
+# Get the maximum number of columns in hc workbook CWBP sheet
+cwbp_max_col = cwbp_sheet.max_column
+
+# Create the report workbook to store our test cases
+hc_test_cases_report = opxl.Workbook()
+report_sheet = hc_test_cases_report.active
+report_sheet.title = "W & F"
+
+# Print the column titles in the report
+for i in range(1, cwbp_max_col + 1):
+    report_sheet.cell(row=1, column=i).value = cwbp_sheet.cell(row=1, column=i).value
+
+# Save the workbook as 'extracted_hc_test_cases.xlsx' in output_dir
+hc_test_cases_report.save(output_dir / Path(r"extracted_hc_test_cases.xlsx"))
+
+if filter_checkpoint is None:
+    print("Extracting all FAILURES and WARNINGS from Hagen's HC report...", end="")
+
+    # Extract all warnings and failures of interest and copy to report sheet
+    for row in cwbp_sheet.iter_rows(min_row=2, values_only=True):
+        # hc_date = row[5][:6]      changed from main-008.py on 2nd Aug 2024
+        # if hc_date == year_month: changed from main-008.py on 2nd Aug 2024
+        report_sheet.append(row)
+
+    # Added on 24th April 2024
+    # Format the W & F sheet of the extracted hc test cases W & F sheet's HC Id column only
+    funcs.extracted_sheet_format_hc_id_column(report_sheet, 1)
+
+    # Save the workbook as 'extracted_hc_test_cases.xlsx' in output_dir
+    hc_test_cases_report.save(output_dir / Path(r"extracted_hc_test_cases.xlsx"))
+
+    print("Done")
+
+    print("Removing the test cases to be ignored from Hagen's HC report...", end="")
+
+    #######################################################################################################
+    # ADDED ON 25TH APRIL 2024 - To filter out the ignored cases from the extracted report
+    # Started modifying on 29th April 2024 as a three step process
+
+    # Open the extracted HC issues for this network and activate the W&F sheet
+    extracted = output_dir / Path(r"extracted_hc_test_cases.xlsx")
+    extracted_tracker = opxl.load_workbook(extracted)
+    extracted_sheet_wf = extracted_tracker["W & F"]
+    # extracted_sheet_info = extracted_tracker["INFO"]
+    extracted_rows = list(extracted_sheet_wf.iter_rows(min_row=2, values_only=True))
+
+    # Step 1 Remove all 'Info' cases and copy to list
+    remove_info_from_extracted = [row for row in extracted_rows if row[9] != "Info"]
+
+    # Step 2 Remove all the ignored test cases for the network as given that network's ignore text file
+
+    # Now remove all these cases from the extracted list
+    ignored_cases = [
+        tc for tc in remove_info_from_extracted if tc[7] not in ignored_text_file_cases
+    ]
+else:
+    print("Resuming from checkpoint: reusing the extracted and filtered test cases...", end="")
+
+    # The checkpoint holds the W & F rows as re-read from extracted_hc_test_cases.xlsx
+    extracted_rows = filter_checkpoint["extracted_rows"]
+    for row in extracted_rows:
+        report_sheet.append(row)
+    funcs.extracted_sheet_format_hc_id_column(report_sheet, 1)
+    hc_test_cases_report.save(output_dir / Path(r"extracted_hc_test_cases.xlsx"))
+    extracted_sheet_wf = report_sheet
+    ignored_cases = filter_checkpoint["two_step_rows"]
+
+# Create a workbook to save our ignored_cases list to an excel file set_1_2_extracted_test_cases.xlsx
+two_step_extracted_report = opxl.Workbook()
+two_step_extracted_sheet = two_step_extracted_report.active
+two_step_extracted_sheet.title = "2 Step Extracted"
+
+# Print the first row header
+funcs.copy_first_row_hc_tracker(two_step_extracted_sheet, extracted_sheet_wf)
+
+# Append all the ignored_cases to this workbook
+for line in ignored_cases:
+    two_step_extracted_sheet.append(line)
+
+# Save the two_step_extracted_report in the out directory as  two_step_extracted.xlsx
+two_step_extracted_report.save(output_dir / Path(r"two_step_extracted.xlsx"))
+
+if filter_checkpoint is None:
+    indices_to_check = (0, 7, 9, 11)  # HC Id, Test Case, Priority and Finding
+
+    # Call the function to filter the data
+    filtered_data, ignored_rows = funcs.remove_ignore_from_extracted(
+        two_step_extracted_sheet, ignored_sheet, indices_to_check
+    )
+
+    # Added to main-008.py on 29th July 2024
+    filtered_data.sort(key=lambda x: x[5])
+
+    # Rows shared between the lists are pickled once, so the checkpoint stays close to the W & F size
+    funcs.save_checkpoint(
+        checkpoint_dir,
+        network_name,
+        "filter",
+        filter_checkpoint_key,
+        {
+            "extracted_rows": extracted_rows,
+            "two_step_rows": ignored_cases,
+            "filtered_data": filtered_data,
+            "ignored_rows": ignored_rows,
+        },
+    )
+else:
+    filtered_data = filter_checkpoint["filtered_data"]
+    ignored_rows = filter_checkpoint["ignored_rows"]
 
 
 # Create a new workbook to store our filtered test cases
@@ -387,6 +429,22 @@ else:
     hc_issues_tracker = found_tracker_file
     print(f"Using HC tracker: {found_tracker_file.name}")
 
+# The tracker stages depend on the master tracker as well as the filter inputs
+tracker_checkpoint_key = funcs.checkpoint_key(
+    input_hc_dir / Path(hc_filename),
+    found_text_file or ignored_text_file,
+    found_excel_file or ignored_cases_file_path,
+    hc_issues_tracker,
+)
+closed_checkpoint = funcs.load_checkpoint(
+    checkpoint_dir, network_name, "closed", tracker_checkpoint_key
+)
+new_cases_checkpoint = None
+if closed_checkpoint is not None:
+    new_cases_checkpoint = funcs.load_checkpoint(
+        checkpoint_dir, network_name, "new_cases", tracker_checkpoint_key
+    )
+
 master_tracker = opxl.load_workbook(hc_issues_tracker)
 master_sheet_main = master_tracker["MAIN"]
 master_sheet_open = master_tracker["OPEN"]
@@ -407,11 +465,22 @@ funcs.copy_first_row_hc_tracker(master_sheet_open, master_sheet_main)
 funcs.copy_first_row_hc_tracker(master_sheet_closed, master_sheet_main)
 funcs.copy_first_row_hc_tracker(master_sheet_ignored, master_sheet_main)
 
-# Update missing PSS Type in node coverage sheet
-nw_summ_sh_data_dict = funcs.update_pss_type(network_summary_sheet, node_coverage_sheet)
+if closed_checkpoint is None:
+    # Update missing PSS Type in node coverage sheet
+    node_coverage_updates = []
+    nw_summ_sh_data_dict = funcs.update_pss_type(
+        network_summary_sheet, node_coverage_sheet, node_coverage_updates
+    )
 
-# Add new nodes found in the current TEC HC report
-funcs.add_new_nodes(nw_summ_sh_data_dict, node_coverage_sheet)
+    # Add new nodes found in the current TEC HC report
+    node_coverage_new_nodes = funcs.add_new_nodes(nw_summ_sh_data_dict, node_coverage_sheet)
+else:
+    # Replay the node coverage changes recorded by the interrupted run
+    node_coverage_updates = closed_checkpoint["node_coverage_updates"]
+    node_coverage_new_nodes = closed_checkpoint["node_coverage_new_nodes"]
+    funcs.apply_node_coverage_deltas(
+        node_coverage_sheet, node_coverage_updates, node_coverage_new_nodes
+    )
 
 # Added on 10th May 2024 for NE Type
 ne_type_dict = {}
@@ -419,9 +488,6 @@ for row in node_coverage_sheet.iter_rows(min_row=2, values_only=True):
     ne_type_dict[row[0]] = row[4]
 
 
-extracted_sheet_wf = extracted_tracker["W & F"]
-# extracted_sheet_info = extracted_tracker["INFO"]
-
 # Copy the ignored test cases to the ignored sheet of the master tracker
 for row in ignored_rows:
     to_add_in_ignored = []
@@ -508,6 +574,8 @@ else:
     detected_network_size = "LARGE"
 
 print(f"\n>> Network Size Detected: {detected_network_size} ({total_nodes} nodes)")
+# Machine-readable node count, stored on the customer network by the web app
+print(f"HC_TOTAL_NODES={total_nodes}")
 
 # REMOVE ALL TIMEOUTS FOR LARGE NETWORKS - NO SOCKET TIMEOUT LIMITS
 if detected_network_size == "LARGE":
@@ -524,48 +592,75 @@ else:
     socket.setdefaulttimeout(1800)  # 30 minutes for medium/small networks
     print(f"   [T] Standard timeout: 30 minutes")
 
-# OPTIMIZED: Build lookup set first for O(1) comparison instead of O(n²)
-extracted_cases_set = set()
-rows_processed = 0
-for extracted_row in extracted_sheet_wf.iter_rows(min_row=2, values_only=True):
-    if extracted_row and len(extracted_row) > 11:
-        case_key = (extracted_row[0], extracted_row[7], extracted_row[9], extracted_row[10], extracted_row[11])
-        extracted_cases_set.add(case_key)
-        rows_processed += 1
-        # Memory optimization for large networks
-        if detected_network_size == "LARGE" and rows_processed % 5000 == 0:
-            print(f" [Processing... {rows_processed} cases]...")
-            gc.collect()  # Force garbage collection every 5000 rows
-
-print(f" [Built lookup table with {len(extracted_cases_set)} extracted cases]...")
-
-cases_closed_in_this_report = 0
-closed_rows_to_process = []
-
-# FAST: Single pass through master sheet with O(1) lookups
-for row_index, m_row in enumerate(
-    master_sheet_main.iter_rows(min_row=2, values_only=True), 2
-):
-    if m_row and len(m_row) > 12 and m_row[12] == "OPEN":
-        master_case_key = (m_row[1], m_row[7], m_row[8], m_row[9], m_row[10])
-        
-        if master_case_key not in extracted_cases_set:
-            # Case is closed - mark for processing
-            master_sheet_main.cell(row=row_index, column=13).value = "CLOSED"
-            closed_test_cases.append(m_row)
-            closed_last_row = closed_test_cases.max_row
-            closed_test_cases.cell(row=closed_last_row, column=13).value = "CLOSED"
-            master_sheet_closed.append(m_row)
-            master_sheet_closed_last_row = master_sheet_closed.max_row
-            master_sheet_closed.cell(row=master_sheet_closed_last_row, column=13).value = "CLOSED"
+if closed_checkpoint is None:
+    # OPTIMIZED: Build lookup set first for O(1) comparison instead of O(n²)
+    extracted_cases_set = set()
+    rows_processed = 0
+    for extracted_row in extracted_sheet_wf.iter_rows(min_row=2, values_only=True):
+        if extracted_row and len(extracted_row) > 11:
+            case_key = (extracted_row[0], extracted_row[7], extracted_row[9], extracted_row[10], extracted_row[11])
+            extracted_cases_set.add(case_key)
+            rows_processed += 1
+            # Memory optimization for large networks
+            if detected_network_size == "LARGE" and rows_processed % 5000 == 0:
+                print(f" [Processing... {rows_processed} cases]...")
+                gc.collect()  # Force garbage collection every 5000 rows
+
+    print(f" [Built lookup table with {len(extracted_cases_set)} extracted cases]...")
+
+    cases_closed_in_this_report = 0
+    closed_rows_to_process = []
+    closed_main_rows = []
+
+    # FAST: Single pass through master sheet with O(1) lookups
+    for row_index, m_row in enumerate(
+        master_sheet_main.iter_rows(min_row=2, values_only=True), 2
+    ):
+        if m_row and len(m_row) > 12 and m_row[12] == "OPEN":
+            master_case_key = (m_row[1], m_row[7], m_row[8], m_row[9], m_row[10])
             
-            # Store for batch deletion from OPEN sheet
-            closed_rows_to_process.append(m_row)
-            cases_closed_in_this_report += 1
+            if master_case_key not in extracted_cases_set:
+                # Case is closed - mark for processing
+                funcs.close_case_hc_tracker(
+                    master_sheet_main, master_sheet_closed, closed_test_cases, row_index, m_row
+                )
+                
+                # Store for batch deletion from OPEN sheet
+                closed_rows_to_process.append(m_row)
+                closed_main_rows.append(row_index)
+                cases_closed_in_this_report += 1
+
+    # OPTIMIZED: Batch delete from OPEN sheet
+    open_rows_deleted = []
+    for m_row in closed_rows_to_process:
+        open_rows_deleted.extend(
+            funcs.delete_closed_case_open_sheet_hc_tracker(master_sheet_open, m_row)
+        )
 
-# OPTIMIZED: Batch delete from OPEN sheet
-for m_row in closed_rows_to_process:
-    funcs.delete_closed_case_open_sheet_hc_tracker(master_sheet_open, m_row)
+    funcs.save_checkpoint(
+        checkpoint_dir,
+        network_name,
+        "closed",
+        tracker_checkpoint_key,
+        {
+            "node_coverage_updates": node_coverage_updates,
+            "node_coverage_new_nodes": node_coverage_new_nodes,
+            "closed_main_rows": closed_main_rows,
+            "closed_rows": closed_rows_to_process,
+            "open_rows_deleted": open_rows_deleted,
+        },
+    )
+else:
+    print(" [Resuming from checkpoint]...")
+    closed_rows_to_process = closed_checkpoint["closed_rows"]
+    for row_index, m_row in zip(closed_checkpoint["closed_main_rows"], closed_rows_to_process):
+        funcs.close_case_hc_tracker(
+            master_sheet_main, master_sheet_closed, closed_test_cases, row_index, m_row
+        )
+    # Replay the OPEN sheet deletions in their original order instead of searching for each case again
+    for row_number in closed_checkpoint["open_rows_deleted"]:
+        master_sheet_open.delete_rows(row_number, 1)
+    cases_closed_in_this_report = len(closed_rows_to_process)
 
 # Save deferred - will save at end for better performance
 # master_tracker.save(current_dir / Path(hc_issues_tracker_filename))
@@ -615,62 +710,81 @@ new_test_cases_found_filename = (
 new_test_cases_found_report.save(output_dir / Path(new_test_cases_found_filename))
 
 print("Adding the new HC cases reported in this HC...", end="")
-# OPTIMIZED: Build lookup set for existing OPEN cases in master tracker
-master_open_cases_set = set()
-master_rows_processed = 0
-for m_row in master_sheet_main.iter_rows(min_row=2, values_only=True):
-    if m_row and len(m_row) > 12 and m_row[12] == "OPEN":
-        case_key = (m_row[1], m_row[7], m_row[8], m_row[9], m_row[10])
-        master_open_cases_set.add(case_key)
-        master_rows_processed += 1
-        # Memory optimization for large networks
-        if detected_network_size == "LARGE" and master_rows_processed % 2000 == 0:
-            print(f" [Master processing... {master_rows_processed} cases]...")
-            gc.collect()  # Force garbage collection every 2000 master rows
-
-print(f" [Built master lookup table with {len(master_open_cases_set)} open cases]...")
-
-new_cases_added_in_this_report = 0
-
-# FAST: Single pass through filtered cases with O(1) lookups
-batch_new_cases = []  # Batch processing for large networks
-batch_size = 500 if detected_network_size == "LARGE" else 100
-
-for ext_row in filtered_sheet.iter_rows(min_row=2, values_only=True):
-    if ext_row and len(ext_row) > 11:
-        ext_case_key = (int(ext_row[0]), ext_row[7], ext_row[9], ext_row[10], ext_row[11])
+if new_cases_checkpoint is None:
+    # OPTIMIZED: Build lookup set for existing OPEN cases in master tracker
+    master_open_cases_set = set()
+    master_rows_processed = 0
+    for m_row in master_sheet_main.iter_rows(min_row=2, values_only=True):
+        if m_row and len(m_row) > 12 and m_row[12] == "OPEN":
+            case_key = (m_row[1], m_row[7], m_row[8], m_row[9], m_row[10])
+            master_open_cases_set.add(case_key)
+            master_rows_processed += 1
+            # Memory optimization for large networks
+            if detected_network_size == "LARGE" and master_rows_processed % 2000 == 0:
+                print(f" [Master processing... {master_rows_processed} cases]...")
+                gc.collect()  # Force garbage collection every 2000 master rows
+
+    print(f" [Built master lookup table with {len(master_open_cases_set)} open cases]...")
+
+    new_cases_added_in_this_report = 0
+    new_cases_found = []
+
+    # FAST: Single pass through filtered cases with O(1) lookups
+    batch_new_cases = []  # Batch processing for large networks
+    batch_size = 500 if detected_network_size == "LARGE" else 100
+
+    for ext_row in filtered_sheet.iter_rows(min_row=2, values_only=True):
+        if ext_row and len(ext_row) > 11:
+            ext_case_key = (int(ext_row[0]), ext_row[7], ext_row[9], ext_row[10], ext_row[11])
         
-        if ext_case_key not in master_open_cases_set:
-            # This is a new case - add it
-            new_cases_list = [
-                ext_row[5], ext_row[0], ext_row[1], ext_row[2], ext_row[3],
-                ne_type_dict.get(ext_row[0], "Unknown"),
-                network_name, ext_row[7], ext_row[9], ext_row[10], ext_row[11], ext_row[12],
-                "OPEN", "Int", "TBD", " ", " ", " "
-            ]
+            if ext_case_key not in master_open_cases_set:
+                # This is a new case - add it
+                new_cases_list = [
+                    ext_row[5], ext_row[0], ext_row[1], ext_row[2], ext_row[3],
+                    ne_type_dict.get(ext_row[0], "Unknown"),
+                    network_name, ext_row[7], ext_row[9], ext_row[10], ext_row[11], ext_row[12],
+                    "OPEN", "Int", "TBD", " ", " ", " "
+                ]
             
-            # Batch processing for better performance
-            batch_new_cases.append((new_cases_list, ext_row))
-            new_cases_added_in_this_report += 1
+                # Batch processing for better performance
+                batch_new_cases.append((new_cases_list, ext_row))
+                new_cases_found.append((new_cases_list, ext_row))
+                new_cases_added_in_this_report += 1
             
-            # Process batch when it reaches batch_size
-            if len(batch_new_cases) >= batch_size:
-                for new_case, ext_case in batch_new_cases:
-                    master_sheet_main.append(new_case)
-                    new_test_cases_found.append(ext_case)
-                    master_sheet_open.append(new_case)
+                # Process batch when it reaches batch_size
+                if len(batch_new_cases) >= batch_size:
+                    for new_case, ext_case in batch_new_cases:
+                        master_sheet_main.append(new_case)
+                        new_test_cases_found.append(ext_case)
+                        master_sheet_open.append(new_case)
                 
-                batch_new_cases.clear()  # Clear batch
-                if detected_network_size == "LARGE":
-                    print(f" [Batch processed {new_cases_added_in_this_report} new cases]...")
-                    gc.collect()  # Force garbage collection after each batch
-
-# Process any remaining cases in the batch
-if batch_new_cases:
-    for new_case, ext_case in batch_new_cases:
+                    batch_new_cases.clear()  # Clear batch
+                    if detected_network_size == "LARGE":
+                        print(f" [Batch processed {new_cases_added_in_this_report} new cases]...")
+                        gc.collect()  # Force garbage collection after each batch
+
+    # Process any remaining cases in the batch
+    if batch_new_cases:
+        for new_case, ext_case in batch_new_cases:
+            master_sheet_main.append(new_case)
+            new_test_cases_found.append(ext_case)
+            master_sheet_open.append(new_case)
+
+    funcs.save_checkpoint(
+        checkpoint_dir,
+        network_name,
+        "new_cases",
+        tracker_checkpoint_key,
+        {"new_cases": new_cases_found},
+    )
+else:
+    print(" [Resuming from checkpoint]...", end="")
+    new_cases_found = new_cases_checkpoint["new_cases"]
+    for new_case, ext_case in new_cases_found:
         master_sheet_main.append(new_case)
         new_test_cases_found.append(ext_case)
         master_sheet_open.append(new_case)
+    new_cases_added_in_this_report = len(new_cases_found)
 
 print("Done")
 
@@ -1156,6 +1270,9 @@ print(f"   3. Review NODE COVERAGE sheet for network coverage")
 print(f"   4. Check Summary sheet for charts and statistics")
 print("\n" + "="*80)
 
+# All outputs are saved - a rerun with the same inputs should start from scratch
+funcs.clear_checkpoints(checkpoint_dir, network_name)
+
 # Now close the workbook and exit
 master_tracker.close()
 sys.exit()
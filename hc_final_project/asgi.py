@@ -2,6 +2,8 @@
 ASGI config for hc_final project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with an ASGI server (e.g. ``uvicorn hc_final_project.asgi:application``) so the
+session progress streams (api/session-events/) wait on the event loop instead of each holding a thread.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
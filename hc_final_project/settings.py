@@ -143,11 +143,31 @@ MEDIA_ROOT = BASE_DIR / 'media'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 16 * 1024 * 1024  # 16MB per resumable chunk, streamed to disk
+CHUNKED_UPLOAD_MAX_TOTAL_SIZE = 2 * 1024 * 1024 * 1024  # 2GB per resumable upload
 
 # Ensure media directory exists
 import os
 os.makedirs(MEDIA_ROOT, exist_ok=True)
 
+# Cache for dashboard/statistics/export responses (HealthCheck_app/response_cache.py).
+# File-based so all worker processes share the data version; LocMemCache also works for a single process.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+    }
+}
+HEALTHCHECK_RESPONSE_CACHE_TIMEOUT = 600  # seconds; entries are also invalidated on every data change
+# Dashboard exports written by background jobs (HealthCheck_app/export_jobs.py)
+HEALTHCHECK_EXPORT_DIR = BASE_DIR / 'exports'
+
+# File downloads (HealthCheck_app/file_downloads.py): 'django' serves files through the WSGI file wrapper
+# (os.sendfile under gunicorn), 'nginx' sends X-Accel-Redirect and 'xsendfile' sends X-Sendfile.
+# For nginx, map each download root to an internal location, e.g. {BASE_DIR / 'Script': '/protected/script/'}
+HEALTHCHECK_DOWNLOAD_BACKEND = 'django'
+HEALTHCHECK_DOWNLOAD_ACCEL_LOCATIONS = {}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 